@@ -1,12 +1,15 @@
-from typing import Literal
+from typing import Literal, Optional
 
-from instructor import AsyncInstructor
 from langgraph.constants import END, START
 from langgraph.graph.state import CompiledStateGraph, StateGraph
 
+from ...checkpointing.sqlite_store import SQLiteNodeOutputStore, checkpoint_node
 from ...components.discovery import (
+    create_detect_changes_single_source_node,
     create_discovery_input_node,
     create_generate_findings_single_source_node,
+    create_generate_incremental_findings_single_source_node,
+    create_generate_key_profile_single_source_node,
     create_generate_stats_single_source_node,
 )
 from ...components.discovery.state import (
@@ -14,13 +17,19 @@ from ...components.discovery.state import (
     DiscoverySingleSourceMainState,
     DiscoverySingleSourceOutputState,
 )
+from ...llm import LLMClientLike, ModelLike, as_llm_client
 
 
 def create_discovery_agent(
-    llm_client: AsyncInstructor, model: str
+    llm_client: LLMClientLike,
+    model: ModelLike,
+    checkpoint_store: Optional[SQLiteNodeOutputStore] = None,
 ) -> CompiledStateGraph:
     """
     Create a discovery agent that will generate a graph data model from a single source.
+    If a `checkpoint_store` is provided, node outputs are stored for runs invoked with a `run_id` and reused when the run is resumed.
+    If the input contains the previous run's discovery, table schema and stats, the previous discovery is reused and only
+    the changed columns are discovered again.
     """
 
     graph = StateGraph(
@@ -29,24 +38,83 @@ def create_discovery_agent(
         output=DiscoverySingleSourceOutputState,
     )
 
+    # one client for every node, so they share its connection pool and stats
+    client = as_llm_client(llm_client)
     generate_stats = create_generate_stats_single_source_node()
+    generate_key_profile = create_generate_key_profile_single_source_node()
+    detect_changes = create_detect_changes_single_source_node()
     generate_findings = create_generate_findings_single_source_node(
-        llm_client=llm_client, model=model
+        llm_client=client, model=model
+    )
+    generate_incremental_findings = (
+        create_generate_incremental_findings_single_source_node(
+            llm_client=client, model=model
+        )
     )
     discovery_input = create_discovery_input_node()
 
-    graph.add_node("discovery_input", discovery_input)
-    graph.add_node("generate_stats", generate_stats)
-    graph.add_node("generate_findings", generate_findings)
+    graph.add_node(
+        "discovery_input",
+        checkpoint_node(
+            discovery_input,
+            "discovery_agent.discovery_input",
+            checkpoint_store,
+        ),
+    )
+    graph.add_node(
+        "generate_stats",
+        checkpoint_node(
+            generate_stats,
+            "discovery_agent.generate_stats",
+            checkpoint_store,
+        ),
+    )
+    graph.add_node(
+        "generate_key_profile",
+        checkpoint_node(
+            generate_key_profile,
+            "discovery_agent.generate_key_profile",
+            checkpoint_store,
+        ),
+    )
+    graph.add_node("detect_changes", detect_changes)
+    graph.add_node(
+        "generate_findings",
+        checkpoint_node(
+            generate_findings,
+            "discovery_agent.generate_findings",
+            checkpoint_store,
+        ),
+    )
+
+    graph.add_node(
+        "generate_incremental_findings",
+        checkpoint_node(
+            generate_incremental_findings,
+            "discovery_agent.generate_incremental_findings",
+            checkpoint_store,
+        ),
+    )
 
     graph.add_edge(START, "discovery_input")
     graph.add_conditional_edges(
         "discovery_input",
         discovery_router,
-        {"generate_stats": "generate_stats", "generate_findings": "generate_findings"},
+        {"generate_stats": "generate_stats", "generate_findings": "detect_changes"},
+    )
+    graph.add_edge("generate_stats", "generate_key_profile")
+    graph.add_edge("generate_key_profile", "detect_changes")
+    graph.add_conditional_edges(
+        "detect_changes",
+        detect_changes_router,
+        {
+            "generate_findings": "generate_findings",
+            "generate_incremental_findings": "generate_incremental_findings",
+            END: END,
+        },
     )
-    graph.add_edge("generate_stats", "generate_findings")
     graph.add_edge("generate_findings", END)
+    graph.add_edge("generate_incremental_findings", END)
     return graph.compile()
 
 
@@ -64,3 +132,19 @@ def discovery_router(
             return "generate_findings"
         case _:
             raise ValueError("__end__")
+
+
+def detect_changes_router(
+    state: DiscoverySingleSourceMainState,
+) -> Literal["generate_findings", "generate_incremental_findings", "__end__"]:
+    """
+    Route the discovery agent after change detection.
+    """
+
+    match state.get("next_discovery_action"):
+        case "generate_findings":
+            return "generate_findings"
+        case "generate_incremental_findings":
+            return "generate_incremental_findings"
+        case _:
+            return "__end__"
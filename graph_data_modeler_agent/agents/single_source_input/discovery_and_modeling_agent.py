@@ -1,24 +1,39 @@
-from instructor import AsyncInstructor
+from typing import List, Literal, Optional
+
 from langgraph.graph import END, START
 from langgraph.graph.state import CompiledStateGraph, StateGraph
 
+from ...checkpointing.sqlite_store import SQLiteNodeOutputStore
+from ...components.data_model_updater import (
+    create_reuse_data_model_single_source_node,
+)
 from ...components.state import (
     SingleSourceInputState,
     SingleSourceMainState,
     SingleSourceOutputState,
 )
+from ...llm import LLMClientLike, ModelLike, as_llm_client
 from .discovery_agent import create_discovery_agent
 from .modeling_agent import create_data_modeler_agent
+from .modeling_update_agent import create_data_modeler_update_agent
 
 
 def create_discovery_and_modeling_agent(
-    discovery_llm_client: AsyncInstructor,
-    modeling_llm_client: AsyncInstructor,
-    discovery_model: str,
-    modeling_model: str,
+    discovery_llm_client: LLMClientLike,
+    modeling_llm_client: LLMClientLike,
+    discovery_model: ModelLike,
+    modeling_model: ModelLike,
+    checkpoint_store: Optional[SQLiteNodeOutputStore] = None,
+    candidate_temperatures: Optional[List[float]] = None,
 ) -> CompiledStateGraph:
     """
     Create a discovery and modeling agent that will generate a graph data model from a single source.
+    If a `checkpoint_store` is provided, node outputs are stored for runs invoked with a `run_id` and reused when the run is resumed.
+    If `candidate_temperatures` are provided, one data model candidate per temperature is generated concurrently and the best one is kept.
+    If the input contains the outputs of a previous run, including `previous_data_model`, the previous discovery and
+    data model are reused. Only changed columns are discovered again and passed to the data modeler update agent.
+    If more than half of the columns changed or the previous data model is invalid for the changed table, the data
+    model is generated again.
     """
 
     graph = StateGraph(
@@ -27,18 +42,89 @@ def create_discovery_and_modeling_agent(
         output=SingleSourceOutputState,
     )
 
+    # the clients are wrapped once, so the nodes of every sub agent share them
+    discovery_client = as_llm_client(discovery_llm_client)
+    modeling_client = (
+        discovery_client
+        if modeling_llm_client is discovery_llm_client
+        else as_llm_client(modeling_llm_client)
+    )
+
     graph.add_node(
         "discovery_agent",
-        create_discovery_agent(discovery_llm_client, discovery_model),
+        create_discovery_agent(discovery_client, discovery_model, checkpoint_store),
     )
 
     graph.add_node(
         "data_modeler_agent",
-        create_data_modeler_agent(modeling_llm_client, modeling_model),
+        create_data_modeler_agent(
+            modeling_client,
+            modeling_model,
+            checkpoint_store,
+            candidate_temperatures,
+        ),
+    )
+
+    graph.add_node("reuse_data_model", create_reuse_data_model_single_source_node())
+
+    graph.add_node(
+        "data_modeler_update_agent",
+        create_data_modeler_update_agent(
+            modeling_client, modeling_model, checkpoint_store
+        ),
     )
 
     graph.add_edge(START, "discovery_agent")
-    graph.add_edge("discovery_agent", "data_modeler_agent")
+    graph.add_conditional_edges(
+        "discovery_agent",
+        incremental_modeling_router,
+        {
+            "data_modeler_agent": "data_modeler_agent",
+            "reuse_data_model": "reuse_data_model",
+        },
+    )
     graph.add_edge("data_modeler_agent", END)
+    graph.add_conditional_edges(
+        "reuse_data_model",
+        reused_data_model_router,
+        {
+            "data_modeler_agent": "data_modeler_agent",
+            "data_modeler_update_agent": "data_modeler_update_agent",
+            END: END,
+        },
+    )
+    graph.add_edge("data_modeler_update_agent", END)
 
     return graph.compile()
+
+
+def incremental_modeling_router(
+    state: SingleSourceMainState,
+) -> Literal["data_modeler_agent", "reuse_data_model"]:
+    """
+    Route to the previous data model when the table changes were detected against a previous run.
+    """
+
+    if (
+        state.get("previous_data_model") is not None
+        and state.get("table_changes") is not None
+    ):
+        return "reuse_data_model"
+    return "data_modeler_agent"
+
+
+def reused_data_model_router(
+    state: SingleSourceMainState,
+) -> Literal["data_modeler_agent", "data_modeler_update_agent", "__end__"]:
+    """
+    Route to the data modeler update agent if columns were added or changed since the previous run.
+    Route to the data modeler agent if the previous data model could not be reused.
+    """
+
+    match state.get("next_action"):
+        case "data_modeler_agent":
+            return "data_modeler_agent"
+        case "data_modeler_update_agent":
+            return "data_modeler_update_agent"
+        case _:
+            return "__end__"
@@ -1,25 +1,42 @@
-from instructor import AsyncInstructor
+from typing import List, Optional
+
 from langgraph.graph import END, START
 from langgraph.graph.state import CompiledStateGraph, StateGraph
 
+from ...checkpointing.sqlite_store import SQLiteNodeOutputStore
+from ...components.data_model_updater import (
+    create_reuse_data_model_single_source_node,
+)
 from ...components.state import (
     SingleSourceInputState,
     SingleSourceMainState,
     SingleSourceOutputState,
 )
+from ...llm import LLMClientLike, ModelLike, as_llm_client
 from .discovery_agent import create_discovery_agent
+from .discovery_and_modeling_agent import (
+    incremental_modeling_router,
+    reused_data_model_router,
+)
 from .modeling_agent import create_data_modeler_agent
 from .modeling_update_agent import create_data_modeler_update_agent
 
 
 def create_discovery_and_modeling_with_iteration_agent(
-    discovery_llm_client: AsyncInstructor,
-    modeling_llm_client: AsyncInstructor,
-    discovery_model: str,
-    modeling_model: str,
+    discovery_llm_client: LLMClientLike,
+    modeling_llm_client: LLMClientLike,
+    discovery_model: ModelLike,
+    modeling_model: ModelLike,
+    checkpoint_store: Optional[SQLiteNodeOutputStore] = None,
+    candidate_temperatures: Optional[List[float]] = None,
 ) -> CompiledStateGraph:
     """
     Create a discovery and modeling agent that will generate a graph data model from a single source.
+    If a `checkpoint_store` is provided, node outputs are stored for runs invoked with a `run_id` and reused when the run is resumed.
+    If `candidate_temperatures` are provided, one data model candidate per temperature is generated concurrently and the best one is kept.
+    If the input contains the outputs of a previous run, including `previous_data_model`, the previous discovery and
+    data model are reused. Only changed columns are discovered again and passed to the data modeler update agent.
+    The models can be `ModelRouter`s, which pick a small or large model for each call by the complexity of the table.
     """
 
     graph = StateGraph(
@@ -28,24 +45,61 @@ def create_discovery_and_modeling_with_iteration_agent(
         output=SingleSourceOutputState,
     )
 
+    # the clients are wrapped once, so the nodes of every sub agent share them
+    discovery_client = as_llm_client(discovery_llm_client)
+    modeling_client = (
+        discovery_client
+        if modeling_llm_client is discovery_llm_client
+        else as_llm_client(modeling_llm_client)
+    )
+
     graph.add_node(
         "discovery_agent",
-        create_discovery_agent(discovery_llm_client, discovery_model),
+        create_discovery_agent(discovery_client, discovery_model, checkpoint_store),
     )
 
     graph.add_node(
         "data_modeler_agent",
-        create_data_modeler_agent(modeling_llm_client, modeling_model),
+        create_data_modeler_agent(
+            modeling_client,
+            modeling_model,
+            checkpoint_store,
+            candidate_temperatures,
+        ),
     )
 
     graph.add_node(
         "data_modeler_update_agent",
-        create_data_modeler_update_agent(modeling_llm_client, modeling_model),
+        create_data_modeler_update_agent(
+            modeling_client, modeling_model, checkpoint_store
+        ),
     )
 
+    graph.add_node("reuse_data_model", create_reuse_data_model_single_source_node())
+
     graph.add_edge(START, "discovery_agent")
-    graph.add_edge("discovery_agent", "data_modeler_agent")
-    graph.add_conditional_edges("data_modeler_agent", no_model_router, {"data_modeler_update_agent": "data_modeler_update_agent"})
+    graph.add_conditional_edges(
+        "discovery_agent",
+        incremental_modeling_router,
+        {
+            "data_modeler_agent": "data_modeler_agent",
+            "reuse_data_model": "reuse_data_model",
+        },
+    )
+    graph.add_conditional_edges(
+        "reuse_data_model",
+        reused_data_model_router,
+        {
+            "data_modeler_agent": "data_modeler_agent",
+            "data_modeler_update_agent": "data_modeler_update_agent",
+            END: END,
+        },
+    )
+    graph.add_conditional_edges(
+        "data_modeler_agent",
+        no_model_router,
+        {"data_modeler_update_agent": "data_modeler_update_agent", END: END},
+    )
     graph.add_edge("data_modeler_update_agent", END)
 
     return graph.compile()
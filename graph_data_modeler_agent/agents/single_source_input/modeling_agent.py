@@ -1,9 +1,9 @@
-from typing import Literal
+from typing import List, Literal, Optional
 
-from instructor import AsyncInstructor
 from langgraph.constants import END, START
 from langgraph.graph.state import CompiledStateGraph, StateGraph
 
+from ...checkpointing.sqlite_store import SQLiteNodeOutputStore, checkpoint_node
 from ...components.data_modeler import (
     create_data_modeler_error_handler_node,
     create_generate_data_model_single_source_node,
@@ -14,13 +14,19 @@ from ...components.data_modeler.state import (
     DataModelerSingleSourceMainState,
     DataModelerSingleSourceOutputState,
 )
+from ...llm import LLMClientLike, ModelLike, as_llm_client
 
 
 def create_data_modeler_agent(
-    llm_client: AsyncInstructor, model: str
+    llm_client: LLMClientLike,
+    model: ModelLike,
+    checkpoint_store: Optional[SQLiteNodeOutputStore] = None,
+    candidate_temperatures: Optional[List[float]] = None,
 ) -> CompiledStateGraph:
     """
     Create a discovery agent that will generate a graph data model from a single source.
+    If a `checkpoint_store` is provided, node outputs are stored for runs invoked with a `run_id` and reused when the run is resumed.
+    If `candidate_temperatures` are provided, one data model candidate per temperature is generated concurrently and the best one is kept.
     """
 
     graph = StateGraph(
@@ -29,17 +35,42 @@ def create_data_modeler_agent(
         output=DataModelerSingleSourceOutputState,
     )
 
+    # one client for every node, so they share its connection pool and stats
+    client = as_llm_client(llm_client)
     generate_nodes = create_generate_nodes_single_source_node(
-        llm_client=llm_client, model=model
+        llm_client=client, model=model
     )
     generate_data_model = create_generate_data_model_single_source_node(
-        llm_client=llm_client, model=model
+        llm_client=client,
+        model=model,
+        candidate_temperatures=candidate_temperatures,
     )
     data_modeler_error_handler = create_data_modeler_error_handler_node()
 
-    graph.add_node("generate_nodes", generate_nodes)
-    graph.add_node("generate_data_model", generate_data_model)
-    graph.add_node("data_modeler_error_handler", data_modeler_error_handler)
+    graph.add_node(
+        "generate_nodes",
+        checkpoint_node(
+            generate_nodes,
+            "data_modeler_agent.generate_nodes",
+            checkpoint_store,
+        ),
+    )
+    graph.add_node(
+        "generate_data_model",
+        checkpoint_node(
+            generate_data_model,
+            "data_modeler_agent.generate_data_model",
+            checkpoint_store,
+        ),
+    )
+    graph.add_node(
+        "data_modeler_error_handler",
+        checkpoint_node(
+            data_modeler_error_handler,
+            "data_modeler_agent.data_modeler_error_handler",
+            checkpoint_store,
+        ),
+    )
     graph.add_edge(START, "generate_nodes")
     graph.add_conditional_edges(
         "generate_nodes",
@@ -1,9 +1,9 @@
-from typing import Literal
+from typing import Optional
 
-from instructor import AsyncInstructor
 from langgraph.constants import END, START
 from langgraph.graph.state import CompiledStateGraph, StateGraph
 
+from ...checkpointing.sqlite_store import SQLiteNodeOutputStore, checkpoint_node
 from ...components.data_model_updater import (
     create_update_data_model_single_source_node,
     create_brainstorm_updates_single_source_node,
@@ -13,13 +13,17 @@ from ...components.data_model_updater.state import (
     DataModelUpdaterSingleSourceMainState,
     DataModelUpdaterSingleSourceOutputState,
 )
+from ...llm import LLMClientLike, ModelLike, as_llm_client
 
 
 def create_data_modeler_update_agent(
-    llm_client: AsyncInstructor, model: str
+    llm_client: LLMClientLike,
+    model: ModelLike,
+    checkpoint_store: Optional[SQLiteNodeOutputStore] = None,
 ) -> CompiledStateGraph:
     """
     Create a data modeler update agent that will update a graph data model from a single source.
+    If a `checkpoint_store` is provided, node outputs are stored for runs invoked with a `run_id` and reused when the run is resumed.
     """
 
     graph = StateGraph(
@@ -28,15 +32,31 @@ def create_data_modeler_update_agent(
         output=DataModelUpdaterSingleSourceOutputState,
     )
 
+    # one client for every node, so they share its connection pool and stats
+    client = as_llm_client(llm_client)
     brainstorm_updates_node = create_brainstorm_updates_single_source_node(
-        llm_client=llm_client, model=model
+        llm_client=client, model=model
     )
     update_data_model = create_update_data_model_single_source_node(
-        llm_client=llm_client, model=model
+        llm_client=client, model=model
     )
 
-    graph.add_node("brainstorm_updates", brainstorm_updates_node)
-    graph.add_node("update_data_model", update_data_model)
+    graph.add_node(
+        "brainstorm_updates",
+        checkpoint_node(
+            brainstorm_updates_node,
+            "data_modeler_update_agent.brainstorm_updates",
+            checkpoint_store,
+        ),
+    )
+    graph.add_node(
+        "update_data_model",
+        checkpoint_node(
+            update_data_model,
+            "data_modeler_update_agent.update_data_model",
+            checkpoint_store,
+        ),
+    )
     graph.add_edge(START, "brainstorm_updates")
     graph.add_edge("brainstorm_updates", "update_data_model")
     graph.add_edge("update_data_model", END)
@@ -0,0 +1,10 @@
+from .detection import ColumnShift, TableChanges, detect_table_changes
+from .reuse import lost_key_labels, update_data_model
+
+__all__ = [
+    "ColumnShift",
+    "TableChanges",
+    "detect_table_changes",
+    "lost_key_labels",
+    "update_data_model",
+]
@@ -0,0 +1,309 @@
+"""
+Detect changes to a source table between runs.
+
+The table schema and `TableStats` of the previous run are compared with the current ones to find added, dropped,
+renamed and redefined columns and columns whose distribution shifted. A dropped column and an added column are a
+rename when they have the same dtype and nearly the same statistics. Distribution shifts are scored per column:
+
+* the change in null rate for every column
+* the largest change of a percentile, in previous standard deviations, for numeric columns
+* the total variation distance between the shares of the most frequent values for categorical columns
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from ..data_dictionary.table_schema import TableSchema
+from ..profiling.table_stats import (
+    CategoricalColumnStats,
+    NumericColumnStats,
+    TableStats,
+)
+
+
+class ColumnShift(BaseModel):
+    """
+    A significant change in the distribution of a column.
+
+    Attributes
+    ----------
+    column : str
+        The column name.
+    metric : str
+        The statistic that changed. One of "dtype", "null_rate", "percentiles" or "top_values".
+    score : float
+        The size of the change. 1.0 for a dtype change.
+    """
+
+    column: str
+    metric: str
+    score: float
+
+
+class TableChanges(BaseModel):
+    """
+    The changes to a table between two runs.
+
+    Attributes
+    ----------
+    added_columns : List[str]
+        The columns only in the current table.
+    dropped_columns : List[str]
+        The columns only in the previous table.
+    renamed_columns : Dict[str, str]
+        A mapping of previous to current column name.
+    modified_columns : List[str]
+        The columns whose table schema definition changed, such as their description or key flags.
+    shifted_columns : List[ColumnShift]
+        The columns whose distribution shifted significantly.
+    """
+
+    added_columns: List[str] = list()
+    dropped_columns: List[str] = list()
+    renamed_columns: Dict[str, str] = dict()
+    modified_columns: List[str] = list()
+    shifted_columns: List[ColumnShift] = list()
+
+    @property
+    def affected_columns(self) -> List[str]:
+        """
+        The current columns that need to be discovered and modeled again, in order of first mention.
+        Renamed columns are not affected, since only their name changed.
+        """
+
+        columns = [
+            *self.added_columns,
+            *self.modified_columns,
+            *[s.column for s in self.shifted_columns],
+        ]
+        return list(dict.fromkeys(columns))
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether the table changed at all."""
+
+        return bool(
+            self.added_columns
+            or self.dropped_columns
+            or self.renamed_columns
+            or self.modified_columns
+            or self.shifted_columns
+        )
+
+
+def detect_table_changes(
+    previous_table_schema: TableSchema,
+    table_schema: TableSchema,
+    previous_stats: Optional[TableStats] = None,
+    stats: Optional[TableStats] = None,
+    shift_threshold: float = 0.5,
+    null_rate_threshold: float = 0.1,
+    rename_threshold: float = 0.9,
+) -> TableChanges:
+    """
+    Detect the changes to a table between the previous and the current run.
+    Renames and distribution shifts are only detected when the stats of both runs are provided.
+
+    Parameters
+    ----------
+    previous_table_schema : TableSchema
+        The table schema of the previous run.
+    table_schema : TableSchema
+        The current table schema.
+    previous_stats : Optional[TableStats], optional
+        The stats of the previous run, by default None
+    stats : Optional[TableStats], optional
+        The current stats, by default None
+    shift_threshold : float, optional
+        The min score of a numeric or categorical distribution shift, by default 0.5
+    null_rate_threshold : float, optional
+        The min change in the fraction of null values that is a shift, by default 0.1
+    rename_threshold : float, optional
+        The min similarity of a dropped and an added column for them to be a rename, by default 0.9
+
+    Returns
+    -------
+    TableChanges
+        The changes.
+    """
+
+    previous_columns = previous_table_schema.columns_dict
+    current_columns = table_schema.columns_dict
+    added = [c for c in table_schema.column_names if c not in previous_columns]
+    dropped = [
+        c for c in previous_table_schema.column_names if c not in current_columns
+    ]
+    modified = [
+        c
+        for c in table_schema.column_names
+        if c in previous_columns
+        and previous_columns[c].model_dump(exclude={"name"})
+        != current_columns[c].model_dump(exclude={"name"})
+    ]
+
+    renamed: Dict[str, str] = dict()
+    shifted: List[ColumnShift] = list()
+    if previous_stats is not None and stats is not None:
+        previous_profiles = _column_profiles(previous_stats)
+        current_profiles = _column_profiles(stats)
+        renamed = _match_renames(
+            [c for c in dropped if c in previous_profiles],
+            [c for c in added if c in current_profiles],
+            previous_profiles,
+            current_profiles,
+            rename_threshold,
+        )
+        for c in table_schema.column_names:
+            if c in previous_profiles and c in current_profiles:
+                shift = _column_shift(
+                    c,
+                    previous_profiles[c],
+                    current_profiles[c],
+                    shift_threshold,
+                    null_rate_threshold,
+                )
+                if shift is not None:
+                    shifted.append(shift)
+
+    return TableChanges(
+        added_columns=[c for c in added if c not in renamed.values()],
+        dropped_columns=[c for c in dropped if c not in renamed],
+        renamed_columns=renamed,
+        modified_columns=modified,
+        shifted_columns=shifted,
+    )
+
+
+# the dtype, null rate and numeric or categorical stats of a column
+_ColumnProfile = Tuple[
+    str, float, Optional[NumericColumnStats], Optional[CategoricalColumnStats]
+]
+
+
+def _column_profiles(stats: TableStats) -> Dict[str, _ColumnProfile]:
+    """Collect the stats of each column."""
+
+    numeric = {n.name: n for n in stats.numeric}
+    categorical = {c.name: c for c in stats.categorical}
+    return {
+        c.name: (
+            c.dtype,
+            1 - c.non_null_count / stats.row_count if stats.row_count else 0.0,
+            numeric.get(c.name),
+            categorical.get(c.name),
+        )
+        for c in stats.columns
+    }
+
+
+def _column_shift(
+    column: str,
+    previous: _ColumnProfile,
+    current: _ColumnProfile,
+    shift_threshold: float,
+    null_rate_threshold: float,
+) -> Optional[ColumnShift]:
+    """The most significant shift of a column, or None if its distribution did not shift."""
+
+    if previous[0] != current[0]:
+        return ColumnShift(column=column, metric="dtype", score=1.0)
+
+    null_rate_change = abs(current[1] - previous[1])
+    if null_rate_change >= null_rate_threshold:
+        return ColumnShift(column=column, metric="null_rate", score=null_rate_change)
+
+    if previous[2] is not None and current[2] is not None:
+        score = _percentile_shift(previous[2], current[2])
+        metric = "percentiles"
+    elif previous[3] is not None and current[3] is not None:
+        score = _top_values_distance(previous[3], current[3])
+        metric = "top_values"
+    else:
+        return None
+
+    if score >= shift_threshold:
+        return ColumnShift(column=column, metric=metric, score=score)
+    return None
+
+
+def _percentile_shift(
+    previous: NumericColumnStats, current: NumericColumnStats
+) -> float:
+    """The largest change of a percentile or the mean, in previous standard deviations."""
+
+    scale = previous.std or max(abs(previous.mean or 0.0), 1.0)
+    pairs = [
+        (previous.mean, current.mean),
+        *zip(previous.percentiles, current.percentiles),
+    ]
+    changes = [abs(c - p) / scale for p, c in pairs if p is not None and c is not None]
+    if not changes:
+        # a column that gained or lost all its values shifted entirely
+        return 0.0 if previous.count == current.count else 1.0
+    return max(changes)
+
+
+def _top_values_distance(
+    previous: CategoricalColumnStats, current: CategoricalColumnStats
+) -> float:
+    """
+    The total variation distance between the shares of the most frequent values.
+    The values outside of either top values are pooled as one remaining share.
+    """
+
+    if not previous.count or not current.count:
+        return 0.0 if previous.count == current.count else 1.0
+
+    previous_shares = {v: n / previous.count for v, n in previous.top_values}
+    current_shares = {v: n / current.count for v, n in current.top_values}
+    values = set(previous_shares) | set(current_shares)
+    distance = sum(
+        abs(previous_shares.get(v, 0.0) - current_shares.get(v, 0.0)) for v in values
+    )
+    remaining = abs(
+        (1 - sum(previous_shares.values())) - (1 - sum(current_shares.values()))
+    )
+    return min((distance + remaining) / 2, 1.0)
+
+
+def _match_renames(
+    dropped: List[str],
+    added: List[str],
+    previous_profiles: Dict[str, _ColumnProfile],
+    current_profiles: Dict[str, _ColumnProfile],
+    rename_threshold: float,
+) -> Dict[str, str]:
+    """Pair dropped and added columns with matching stats, most similar pairs first."""
+
+    scored = list()
+    for d in dropped:
+        for a in added:
+            similarity = _similarity(previous_profiles[d], current_profiles[a])
+            if similarity >= rename_threshold:
+                scored.append((similarity, d, a))
+
+    renamed: Dict[str, str] = dict()
+    for _, d, a in sorted(scored, key=lambda s: -s[0]):
+        if d not in renamed and a not in renamed.values():
+            renamed[d] = a
+    return renamed
+
+
+def _similarity(previous: _ColumnProfile, current: _ColumnProfile) -> float:
+    """The similarity of two columns' stats, between 0.0 and 1.0. Columns with different dtypes are not similar."""
+
+    if previous[0] != current[0]:
+        return 0.0
+    if previous[2] is not None and current[2] is not None:
+        return max(1.0 - _percentile_shift(previous[2], current[2]), 0.0)
+    if previous[3] is not None and current[3] is not None:
+        previous_values = {v for v, _ in previous[3].top_values}
+        current_values = {v for v, _ in current[3].top_values}
+        if not previous_values or not current_values:
+            return 0.0
+        overlap = len(previous_values & current_values) / len(
+            previous_values | current_values
+        )
+        return overlap * (1.0 - _top_values_distance(previous[3], current[3]))
+    return 0.0
@@ -0,0 +1,109 @@
+"""
+Reuse the data model of a previous run for a changed table.
+
+Properties of renamed columns are remapped and properties of dropped columns are removed, so only the columns in
+`TableChanges.affected_columns` need to be modeled again. A node whose key column was dropped can't be identified
+anymore, so it is removed with its relationships and its remaining columns must be modeled again.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from ..data_model.core.data_model import DataModel
+from ..data_model.core.property import Property
+from .detection import TableChanges
+
+
+def update_data_model(
+    data_model: DataModel,
+    changes: TableChanges,
+    context: Optional[Dict[str, Any]] = None,
+) -> DataModel:
+    """
+    Update a previous data model for a changed table.
+    Properties of renamed columns are mapped to the new column name and properties of dropped columns are removed.
+    Nodes left without properties or without their key property are removed with their relationships.
+    The updated data model is validated again.
+
+    Parameters
+    ----------
+    data_model : DataModel
+        The data model of the previous run.
+    changes : TableChanges
+        The changes to the table.
+    context : Optional[Dict[str, Any]], optional
+        The validation context of the changed table, by default None
+
+    Returns
+    -------
+    DataModel
+        A new data model.
+
+    Raises
+    ------
+    ValidationError
+        If the updated data model is invalid.
+    """
+
+    res = data_model.model_copy(deep=True)
+    lost_keys = set(lost_key_labels(data_model, changes))
+    for node in res.nodes:
+        node.properties = _update_properties(node.properties, changes)
+    for relationship in res.relationships:
+        relationship.properties = _update_properties(relationship.properties, changes)
+
+    res.nodes = [n for n in res.nodes if n.properties and n.label not in lost_keys]
+    labels = set(res.node_labels)
+    res.relationships = [
+        r for r in res.relationships if r.source in labels and r.target in labels
+    ]
+    return DataModel.model_validate(res.model_dump(), context=context)
+
+
+def lost_key_labels(data_model: DataModel, changes: TableChanges) -> List[str]:
+    """
+    Find the nodes that lose their key property to dropped columns, while other properties remain.
+    The remaining columns of these nodes are not modeled by the updated data model.
+
+    Parameters
+    ----------
+    data_model : DataModel
+        The data model of the previous run.
+    changes : TableChanges
+        The changes to the table.
+
+    Returns
+    -------
+    List[str]
+        The node labels.
+    """
+
+    dropped = set(changes.dropped_columns)
+    return [
+        n.label
+        for n in data_model.nodes
+        if n.unique_properties
+        and all(p.column_mapping in dropped for p in n.unique_properties)
+        and not all(p.column_mapping in dropped for p in n.properties)
+    ]
+
+
+def _update_properties(
+    properties: List[Property], changes: TableChanges
+) -> List[Property]:
+    """Rename and remove the properties of changed columns."""
+
+    dropped = set(changes.dropped_columns)
+    res = list()
+    for p in properties:
+        if p.column_mapping in dropped:
+            continue
+        alias: Optional[str] = p.alias
+        if alias in dropped:
+            alias = None
+        elif alias is not None:
+            alias = changes.renamed_columns.get(alias, alias)
+        column_mapping = changes.renamed_columns.get(p.column_mapping, p.column_mapping)
+        if column_mapping != p.column_mapping or alias != p.alias:
+            p = p.model_copy(update={"column_mapping": column_mapping, "alias": alias})
+        res.append(p)
+    return res
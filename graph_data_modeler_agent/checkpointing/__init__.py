@@ -0,0 +1,11 @@
+from .serialization import dumps, hash_state, loads
+from .sqlite_store import SQLiteNodeOutputStore, checkpoint_node, create_run_config
+
+__all__ = [
+    "SQLiteNodeOutputStore",
+    "checkpoint_node",
+    "create_run_config",
+    "dumps",
+    "hash_state",
+    "loads",
+]
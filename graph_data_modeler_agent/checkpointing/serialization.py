@@ -0,0 +1,158 @@
+"""
+Serialization and hashing of agent states and node outputs.
+
+Node outputs are pickled and compressed, which round trips `DataModel`, `DiscoveryResponse`, `TableSchema` and
+`TableStats` exactly, without validating them again.
+States are hashed from a canonical JSON encoding instead, so that memoized values held by the models and the order
+of dictionary keys do not change the hash. DataFrames are hashed by their values with pandas' vectorized row hashing,
+numpy arrays by their bytes and a `DataSource` by its file's size and modification time. numpy scalars are encoded as
+the equal Python values. Any other value is hashed by its pickled bytes.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import zlib
+from typing import Any, Mapping
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from ..data_source.data_source import DataSource
+
+_COMPRESSION_LEVEL: int = 6
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compressed bytes.
+
+    Parameters
+    ----------
+    obj : Any
+        A picklable object, such as a node output.
+
+    Returns
+    -------
+    bytes
+        The serialized object.
+    """
+
+    return zlib.compress(
+        pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), _COMPRESSION_LEVEL
+    )
+
+
+def loads(data: bytes) -> Any:
+    """
+    Deserialize an object serialized with `dumps`. Only load trusted data, since objects are unpickled.
+
+    Parameters
+    ----------
+    data : bytes
+        The serialized object.
+
+    Returns
+    -------
+    Any
+        The object.
+    """
+
+    return pickle.loads(zlib.decompress(data))
+
+
+def hash_state(state: Mapping[str, Any]) -> str:
+    """
+    Hash the content of an agent state.
+
+    Parameters
+    ----------
+    state : Mapping[str, Any]
+        The state.
+
+    Returns
+    -------
+    str
+        The sha256 hex digest.
+
+    Raises
+    ------
+    TypeError
+        If the state contains a value that can't be encoded or pickled.
+    """
+
+    encoded = json.dumps(
+        _canonical(dict(state)), sort_keys=True, separators=(",", ":")
+    ).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _canonical(obj: Any) -> Any:
+    """Encode an object as JSON compatible values that only depend on its content."""
+
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, np.generic):
+        return _canonical(obj.item())
+    if isinstance(obj, DataSource):
+        stat = os.stat(obj.file_path)
+        return {
+            "__data_source__": obj.model_dump(mode="json"),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+    if isinstance(obj, BaseModel):
+        return {
+            "__model__": f"{type(obj).__module__}.{type(obj).__qualname__}",
+            "data": obj.model_dump(mode="json"),
+        }
+    if isinstance(obj, pd.DataFrame):
+        return {"__dataframe__": _hash_dataframe(obj)}
+    if isinstance(obj, pd.Series):
+        return {"__dataframe__": _hash_dataframe(obj.to_frame())}
+    if isinstance(obj, Mapping):
+        return {str(k): _canonical(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        values = [_canonical(v) for v in obj]
+        if isinstance(obj, (set, frozenset)):
+            values.sort(key=lambda v: json.dumps(v, sort_keys=True))
+        return values
+    if isinstance(obj, np.ndarray) and obj.dtype != object:
+        return {"__ndarray__": _hash_ndarray(obj)}
+    if isinstance(obj, pd.Index) or (isinstance(obj, np.ndarray) and obj.ndim == 1):
+        return {"__dataframe__": _hash_dataframe(pd.DataFrame({"values": obj}))}
+    try:
+        pickled = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        raise TypeError(
+            f"Unable to hash a state value of type {type(obj).__name__}."
+        ) from e
+    return {
+        "__pickle__": f"{type(obj).__module__}.{type(obj).__qualname__}",
+        "sha256": hashlib.sha256(pickled).hexdigest(),
+    }
+
+
+def _hash_dataframe(df: pd.DataFrame) -> str:
+    """Hash the values, index, columns and dtypes of a DataFrame."""
+
+    digest = hashlib.sha256()
+    digest.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode())
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    except TypeError:
+        # unhashable values, such as lists
+        row_hashes = pd.util.hash_pandas_object(df.astype(str), index=True).to_numpy()
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+
+def _hash_ndarray(array: np.ndarray) -> str:
+    """Hash the dtype, shape and values of a numpy array without Python objects."""
+
+    digest = hashlib.sha256()
+    digest.update(f"{array.dtype.str}{array.shape}".encode())
+    digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
@@ -0,0 +1,211 @@
+"""
+A local SQLite store of node outputs for resuming agent runs.
+
+Outputs are keyed by run id, node name and a hash of the node's input state. When a run is invoked again with the
+same run id, checkpointed nodes whose input is unchanged return their stored output instead of running, so completed
+LLM calls are not repeated. Tables in a batch share a run id and are told apart by their input hash.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
+
+from langchain_core.runnables import RunnableConfig
+
+from .serialization import dumps, hash_state, loads
+
+NodeFunction = Callable[[Any], Coroutine[Any, Any, Dict[str, Any]]]
+CheckpointedNodeFunction = Callable[
+    [Any, RunnableConfig], Coroutine[Any, Any, Dict[str, Any]]
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS node_outputs (
+    run_id TEXT NOT NULL,
+    node TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    output BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (run_id, node, input_hash)
+)
+"""
+
+
+class SQLiteNodeOutputStore:
+    """
+    Node outputs stored in a SQLite database.
+
+    Parameters
+    ----------
+    database : str, optional
+        The database file location, by default ":memory:"
+    """
+
+    def __init__(self, database: str = ":memory:") -> None:
+        self.database = database
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database, check_same_thread=False)
+        with self._lock, self._connection:
+            if database != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(_SCHEMA)
+
+    def get(self, run_id: str, node: str, input_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a stored node output.
+
+        Parameters
+        ----------
+        run_id : str
+            The run id.
+        node : str
+            The node name.
+        input_hash : str
+            The hash of the node's input state.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The output, or None if it isn't stored.
+        """
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT output FROM node_outputs WHERE run_id = ? AND node = ? AND input_hash = ?",
+                (run_id, node, input_hash),
+            ).fetchone()
+        return None if row is None else loads(row[0])
+
+    def put(
+        self, run_id: str, node: str, input_hash: str, output: Dict[str, Any]
+    ) -> None:
+        """
+        Store a node output, replacing any output stored under the same key.
+
+        Parameters
+        ----------
+        run_id : str
+            The run id.
+        node : str
+            The node name.
+        input_hash : str
+            The hash of the node's input state.
+        output : Dict[str, Any]
+            The output.
+        """
+
+        data = dumps(output)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO node_outputs VALUES (?, ?, ?, ?, ?)",
+                (run_id, node, input_hash, data, time.time()),
+            )
+
+    def completed_nodes(self, run_id: str) -> List[Tuple[str, str]]:
+        """
+        List the nodes with a stored output in a run.
+
+        Parameters
+        ----------
+        run_id : str
+            The run id.
+
+        Returns
+        -------
+        List[Tuple[str, str]]
+            The (node name, input hash) pairs, in completion order.
+        """
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT node, input_hash FROM node_outputs WHERE run_id = ? ORDER BY created_at",
+                (run_id,),
+            ).fetchall()
+        return [(node, input_hash) for node, input_hash in rows]
+
+    def delete_run(self, run_id: str) -> None:
+        """
+        Delete the stored outputs of a run.
+
+        Parameters
+        ----------
+        run_id : str
+            The run id.
+        """
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM node_outputs WHERE run_id = ?", (run_id,)
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        self._connection.close()
+
+    def __enter__(self) -> "SQLiteNodeOutputStore":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def checkpoint_node(
+    node: NodeFunction, name: str, store: Optional[SQLiteNodeOutputStore]
+) -> Union[NodeFunction, CheckpointedNodeFunction]:
+    """
+    Wrap a node function so its output is stored and reused when a run is resumed.
+    The node is only checkpointed when the run config contains a `run_id` in `configurable`.
+
+    Parameters
+    ----------
+    node : NodeFunction
+        The async node function.
+    name : str
+        A name for the node that is unique among checkpointed nodes, such as "discovery_agent.generate_findings".
+    store : Optional[SQLiteNodeOutputStore]
+        The store. If None, the node is returned unchanged.
+
+    Returns
+    -------
+    Union[NodeFunction, CheckpointedNodeFunction]
+        The checkpointed node function, which also takes the run config.
+    """
+
+    if store is None:
+        return node
+
+    async def checkpointed_node(state: Any, config: RunnableConfig) -> Dict[str, Any]:
+        run_id = (config.get("configurable") or dict()).get("run_id")
+        if run_id is None:
+            return await node(state)
+
+        input_hash = hash_state(state)
+        output = store.get(run_id=run_id, node=name, input_hash=input_hash)
+        if output is None:
+            output = await node(state)
+            store.put(run_id=run_id, node=name, input_hash=input_hash, output=output)
+        return output
+
+    checkpointed_node.__name__ = getattr(node, "__name__", name)
+    return checkpointed_node
+
+
+def create_run_config(run_id: str) -> RunnableConfig:
+    """
+    Create the config to start or resume a checkpointed run.
+    Invoking an agent again with the same run id skips the checkpointed nodes that already completed.
+
+    Parameters
+    ----------
+    run_id : str
+        The run id.
+
+    Returns
+    -------
+    RunnableConfig
+        The config to pass to `ainvoke`.
+    """
+
+    return {"configurable": {"run_id": run_id}}
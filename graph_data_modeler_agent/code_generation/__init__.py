@@ -0,0 +1,92 @@
+from .bulk_import import (
+    BulkImportExporter,
+    BulkImportFiles,
+    BulkImportGroup,
+    format_import_values,
+)
+from .cypher import (
+    CASTING_FUNCTIONS,
+    IngestionMethod,
+    cast_value,
+    generate_constraints_key,
+    generate_match_node_clause,
+    generate_match_same_node_labels_clause,
+    generate_merge_node_clause_standard,
+    generate_merge_node_load_csv_clause,
+    generate_merge_relationship_clause_standard,
+    generate_merge_relationship_load_csv_clause,
+    generate_node_key_constraint,
+    generate_relationship_key_constraint,
+    generate_relationship_match_clauses,
+    generate_relationship_unique_constraint,
+    generate_set_property,
+    generate_set_unique_property,
+    generate_unique_constraint,
+    get_endpoint_key_mappings,
+    quote_identifier,
+)
+from .ingestion_generator import (
+    IngestionGenerator,
+    IngestionStatement,
+    iter_row_batches,
+    iter_statement_chunks,
+    load_data,
+    to_parameter_rows,
+)
+from .loader import (
+    LoadReport,
+    LoadStats,
+    Neo4jLoader,
+    is_transient_error,
+    run_with_retries,
+)
+from .preflight import (
+    PreflightReport,
+    PreflightViolation,
+    cast_failures,
+    run_preflight_checks,
+)
+from .scheduling import assign_endpoint_buckets, schedule_relationship_rows
+
+__all__ = [
+    "BulkImportExporter",
+    "BulkImportFiles",
+    "BulkImportGroup",
+    "CASTING_FUNCTIONS",
+    "IngestionGenerator",
+    "IngestionMethod",
+    "IngestionStatement",
+    "LoadReport",
+    "LoadStats",
+    "Neo4jLoader",
+    "PreflightReport",
+    "PreflightViolation",
+    "assign_endpoint_buckets",
+    "cast_failures",
+    "cast_value",
+    "format_import_values",
+    "generate_constraints_key",
+    "generate_match_node_clause",
+    "generate_match_same_node_labels_clause",
+    "generate_merge_node_clause_standard",
+    "generate_merge_node_load_csv_clause",
+    "generate_merge_relationship_clause_standard",
+    "generate_merge_relationship_load_csv_clause",
+    "generate_node_key_constraint",
+    "generate_relationship_key_constraint",
+    "generate_relationship_match_clauses",
+    "generate_relationship_unique_constraint",
+    "generate_set_property",
+    "generate_set_unique_property",
+    "generate_unique_constraint",
+    "get_endpoint_key_mappings",
+    "is_transient_error",
+    "iter_row_batches",
+    "iter_statement_chunks",
+    "load_data",
+    "quote_identifier",
+    "run_preflight_checks",
+    "run_with_retries",
+    "schedule_relationship_rows",
+    "to_parameter_rows",
+]
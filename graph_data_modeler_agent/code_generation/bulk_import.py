@@ -0,0 +1,596 @@
+"""
+Export source files as `neo4j-admin database import` CSV files according to a `DataModel`.
+
+Offline bulk import is much faster than transactional MERGE for initial loads, but it requires each node to appear
+once. The export runs in two passes with bounded memory:
+
+1. Each source file is streamed in chunks, in a process per file. The node and relationship rows of each chunk are
+   typed, given their import IDs and appended to spill files, partitioned by a hash of the node ID or relationship
+   endpoints.
+2. Each partition is deduplicated in a process per partition and written as a headerless data file. Equal IDs are
+   always in the same partition, so a partition holds all duplicates of its nodes, and memory is bounded by the
+   partition size instead of the number of distinct nodes.
+
+Nodes are deduplicated on their key properties and relationships on their endpoints and key properties, matching the
+MERGE statements of `IngestionGenerator`, and the first row of a node or relationship is kept. Each label is an ID
+space, and the `:ID` column holds the node key values as strings, so keys that are both the key column of one file
+and an alias column of another file resolve to the same node. The header files declare the import type of each
+property from its Neo4j type.
+"""
+
+import os
+import re
+import shlex
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from ..data_model.core.data_model import DataModel
+from ..data_model.core.property import Property
+from ..data_source.data_source import DataSource
+from ..resources import TYPES_MAP_NEO4J_TO_ADMIN_IMPORT
+from .cypher import get_endpoint_key_mappings
+from .scheduling import normalize_key_column
+
+# joins the values of a composite key into a single ID
+_KEY_SEPARATOR = "\x1f"
+_ID_COLUMN = ":ID"
+_START_ID_COLUMN = ":START_ID"
+_END_ID_COLUMN = ":END_ID"
+
+T = TypeVar("T")
+
+
+class BulkImportGroup(BaseModel):
+    """
+    The import files of a node label or a relationship.
+
+    Attributes
+    ----------
+    name : str
+        The node label or relationship pattern.
+    label_or_type : str
+        The node label or relationship type.
+    header_file : str
+        The header file path.
+    data_files : List[str]
+        The headerless data file paths.
+    count : int
+        The number of distinct nodes or relationships.
+    """
+
+    name: str
+    label_or_type: str
+    header_file: str
+    data_files: List[str]
+    count: int
+
+
+class BulkImportFiles(BaseModel):
+    """
+    The files exported for `neo4j-admin database import`.
+
+    Attributes
+    ----------
+    nodes : List[BulkImportGroup]
+        The files per node label.
+    relationships : List[BulkImportGroup]
+        The files per relationship.
+    """
+
+    nodes: List[BulkImportGroup]
+    relationships: List[BulkImportGroup]
+
+    def import_command(
+        self, database: str = "neo4j", neo4j_admin: str = "neo4j-admin"
+    ) -> str:
+        """
+        Generate the `neo4j-admin database import full` command that imports the files.
+        Relationships whose endpoint nodes don't exist are skipped.
+
+        Parameters
+        ----------
+        database : str, optional
+            The database to create, by default "neo4j"
+        neo4j_admin : str, optional
+            The `neo4j-admin` executable, by default "neo4j-admin"
+
+        Returns
+        -------
+        str
+            The command.
+        """
+
+        # rows whose endpoint nodes don't exist are skipped, as the MATCH of a MERGE statement would
+        arguments = [
+            neo4j_admin,
+            "database",
+            "import",
+            "full",
+            "--skip-bad-relationships=true",
+        ]
+        for flag, groups in [
+            ("--nodes", self.nodes),
+            ("--relationships", self.relationships),
+        ]:
+            arguments.extend(
+                [
+                    f"{flag}={g.label_or_type}="
+                    + ",".join([g.header_file, *g.data_files])
+                    for g in groups
+                    if g.data_files
+                ]
+            )
+        arguments.append(database)
+        return " ".join([shlex.quote(a) for a in arguments])
+
+
+class _PropertySpec(BaseModel):
+    """A header property and the column it is read from, if the entity has it."""
+
+    name: str
+    type: str
+    column: Optional[str]
+
+
+class _NodeSpec(BaseModel):
+    """The columns a node of a source file is exported from."""
+
+    group: int
+    key_columns: List[str]
+    properties: List[_PropertySpec]
+
+
+class _RelationshipSpec(BaseModel):
+    """The columns a relationship of a source file is exported from."""
+
+    group: int
+    source_key_columns: List[str]
+    target_key_columns: List[str]
+    key_properties: List[str]
+    properties: List[_PropertySpec]
+
+
+class BulkImportExporter:
+    """
+    Export source files as `neo4j-admin database import` CSV files according to a data model.
+
+    Parameters
+    ----------
+    data_model : DataModel
+        The data model.
+    output_dir : str
+        The directory of the exported files. It is created if it doesn't exist.
+    csv_name : str, optional
+        The file of nodes and relationships whose `source_name` is the default "file", by default ""
+    num_partitions : int, optional
+        The number of partitions per node label and relationship. Each partition is deduplicated in memory, so more
+        partitions use less memory. By default 16
+    chunk_size : int, optional
+        The number of rows read from a source file at a time, by default 100,000
+    max_workers : Optional[int], optional
+        The max number of processes. 1 exports in the current process. By default None, which uses the CPU count.
+    """
+
+    def __init__(
+        self,
+        data_model: DataModel,
+        output_dir: str,
+        csv_name: str = "",
+        num_partitions: int = 16,
+        chunk_size: int = 100_000,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.data_model = data_model
+        self.output_dir = output_dir
+        self.csv_name = csv_name
+        self.num_partitions = num_partitions
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+
+    def export(
+        self, data: Dict[str, Union[pd.DataFrame, DataSource]]
+    ) -> BulkImportFiles:
+        """
+        Export the nodes and relationships of the data model.
+
+        Parameters
+        ----------
+        data : Dict[str, Union[pd.DataFrame, DataSource]]
+            A mapping of file name to data. Use `csv_name` for nodes and relationships with the default "file" source
+            name. `DataSource` inputs are streamed.
+
+        Returns
+        -------
+        BulkImportFiles
+            The exported files.
+        """
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        node_groups, node_headers = self._node_groups()
+        relationship_headers = self._relationship_headers()
+
+        with tempfile.TemporaryDirectory(dir=self.output_dir) as spill_dir:
+            spill_tasks = [
+                (
+                    data[source],
+                    specs[0],
+                    specs[1],
+                    os.path.join(spill_dir, str(i)),
+                    self.num_partitions,
+                    self.chunk_size,
+                )
+                for i, (source, specs) in enumerate(self._source_specs().items())
+            ]
+            _map(_spill_source, spill_tasks, self.max_workers)
+
+            # nodes are unique by ID, and relationships by endpoints and key properties
+            dedupe_positions = {
+                "nodes": [(label, [0]) for label in node_groups],
+                "relationships": [
+                    (str(rel), [0, 1, *[2 + i for i in _key_positions(rel.properties)]])
+                    for rel in self.data_model.relationships
+                ],
+            }
+            spill_dirs = [t[3] for t in spill_tasks]
+            merge_tasks = [
+                (
+                    spill_dirs,
+                    kind,
+                    group,
+                    partition,
+                    positions,
+                    self._data_file(name, partition),
+                )
+                for kind, groups in dedupe_positions.items()
+                for group, (name, positions) in enumerate(groups)
+                for partition in range(self.num_partitions)
+            ]
+            counts = _map(_merge_partition, merge_tasks, self.max_workers)
+
+        files: Dict[Tuple[str, int], List[str]] = dict()
+        totals: Dict[Tuple[str, int], int] = dict()
+        for task, count in zip(merge_tasks, counts):
+            key = (task[1], task[2])
+            totals[key] = totals.get(key, 0) + count
+            if count:
+                files.setdefault(key, list()).append(task[5])
+
+        nodes = list()
+        for group, (label, header) in enumerate(zip(node_groups, node_headers)):
+            nodes.append(
+                BulkImportGroup(
+                    name=label,
+                    label_or_type=label,
+                    header_file=self._write_header(label, header),
+                    data_files=files.get(("nodes", group), list()),
+                    count=totals.get(("nodes", group), 0),
+                )
+            )
+
+        relationships = list()
+        for group, (rel, header) in enumerate(
+            zip(self.data_model.relationships, relationship_headers)
+        ):
+            relationships.append(
+                BulkImportGroup(
+                    name=str(rel),
+                    label_or_type=rel.type,
+                    header_file=self._write_header(str(rel), header),
+                    data_files=files.get(("relationships", group), list()),
+                    count=totals.get(("relationships", group), 0),
+                )
+            )
+
+        return BulkImportFiles(nodes=nodes, relationships=relationships)
+
+    def _node_groups(self) -> Tuple[Dict[str, List[_PropertySpec]], List[List[str]]]:
+        """
+        The header properties of each node label and the header columns. Nodes with the same label in different files
+        share an ID space and a header with the properties of all of them.
+        """
+
+        groups: Dict[str, Dict[str, Property]] = dict()
+        for node in self.data_model.nodes:
+            properties = groups.setdefault(node.label, dict())
+            for p in node.properties:
+                properties.setdefault(p.name, p)
+
+        specs = {
+            label: [
+                _PropertySpec(name=p.name, type=p.type, column=None)
+                for p in properties.values()
+            ]
+            for label, properties in groups.items()
+        }
+        headers = [
+            [f"{_ID_COLUMN}({label})", *[_header_column(p) for p in properties]]
+            for label, properties in specs.items()
+        ]
+        return specs, headers
+
+    def _relationship_headers(self) -> List[List[str]]:
+        """The header columns of each relationship."""
+
+        return [
+            [
+                f"{_START_ID_COLUMN}({rel.source})",
+                f"{_END_ID_COLUMN}({rel.target})",
+                *[
+                    _header_column(_PropertySpec(name=p.name, type=p.type, column=None))
+                    for p in rel.properties
+                ],
+            ]
+            for rel in self.data_model.relationships
+        ]
+
+    def _source_specs(
+        self,
+    ) -> Dict[str, Tuple[List[_NodeSpec], List[_RelationshipSpec]]]:
+        """The nodes and relationships exported from each source file."""
+
+        node_groups, _ = self._node_groups()
+        labels = list(node_groups)
+        specs: Dict[str, Tuple[List[_NodeSpec], List[_RelationshipSpec]]] = dict()
+        for node in self.data_model.nodes:
+            columns = {p.name: p.column_mapping for p in node.properties}
+            specs.setdefault(self._source_file(node.source_name), (list(), list()))[
+                0
+            ].append(
+                _NodeSpec(
+                    group=labels.index(node.label),
+                    key_columns=[p.column_mapping for p in node.node_keys],
+                    properties=[
+                        p.model_copy(update={"column": columns.get(p.name)})
+                        for p in node_groups[node.label]
+                    ],
+                )
+            )
+
+        nodes = self.data_model.node_dict
+        for group, rel in enumerate(self.data_model.relationships):
+            source_mapping, target_mapping = get_endpoint_key_mappings(
+                nodes[rel.source], nodes[rel.target], rel
+            )
+            specs.setdefault(self._source_file(rel.source_name), (list(), list()))[
+                1
+            ].append(
+                _RelationshipSpec(
+                    group=group,
+                    source_key_columns=list(source_mapping.values()),
+                    target_key_columns=list(target_mapping.values()),
+                    key_properties=[p.name for p in rel.relationship_keys],
+                    properties=[
+                        _PropertySpec(name=p.name, type=p.type, column=p.column_mapping)
+                        for p in rel.properties
+                    ],
+                )
+            )
+        return specs
+
+    def _source_file(self, source_name: str) -> str:
+        """The file of a node or relationship source name."""
+
+        return self.csv_name if source_name == "file" else source_name
+
+    def _data_file(self, name: str, partition: int) -> str:
+        """The path of a data file."""
+
+        return os.path.join(
+            self.output_dir, f"{_file_stem(name)}_part{partition:03d}.csv"
+        )
+
+    def _write_header(self, name: str, header: List[str]) -> str:
+        """Write a header file and return its path."""
+
+        path = os.path.join(self.output_dir, f"{_file_stem(name)}_header.csv")
+        pd.DataFrame(columns=header).to_csv(path, index=False)
+        return path
+
+
+def format_import_values(column: pd.Series, neo4j_type: str) -> pd.Series:
+    """
+    Convert values to their `neo4j-admin database import` form, as the Cypher casting functions of
+    `IngestionGenerator` would. Integers are truncated, booleans are "true" or "false" and values that can't be
+    converted are missing.
+
+    Parameters
+    ----------
+    column : pd.Series
+        The values.
+    neo4j_type : str
+        The Neo4j type of the property.
+
+    Returns
+    -------
+    pd.Series
+        The converted values.
+    """
+
+    match neo4j_type:
+        case "INTEGER":
+            values = pd.to_numeric(column, errors="coerce")
+            return np.trunc(values.where(np.isfinite(values))).astype("Int64")
+        case "FLOAT":
+            return pd.to_numeric(column, errors="coerce")
+        case "BOOLEAN":
+            values = column.astype(str).str.strip().str.lower()
+            return values.where(values.isin(["true", "false"])).where(column.notna())
+        case _:
+            return column
+
+
+def _key_positions(properties: List[Property]) -> List[int]:
+    """The positions of the key properties."""
+
+    return [i for i, p in enumerate(properties) if p.is_key]
+
+
+def _header_column(prop: _PropertySpec) -> str:
+    """The header column of a property, such as "age:long"."""
+
+    return f"{prop.name}:{TYPES_MAP_NEO4J_TO_ADMIN_IMPORT.get(prop.type, 'string')}"
+
+
+def _file_stem(name: str) -> str:
+    """A file name for a node label or relationship pattern, such as "Person_KNOWS_Person"."""
+
+    return "_".join(re.findall(r"[0-9A-Za-z]+", name))
+
+
+def _import_ids(data: pd.DataFrame, key_columns: List[str]) -> pd.Series:
+    """The import ID of each row from its node key values. Rows with a missing key value have no ID."""
+
+    keys = [normalize_key_column(data[c]) for c in key_columns]
+    ids = keys[0]
+    for key in keys[1:]:
+        ids = ids.str.cat(key, sep=_KEY_SEPARATOR)
+    return ids
+
+
+def _spill_source(
+    data: Union[pd.DataFrame, DataSource],
+    nodes: List[_NodeSpec],
+    relationships: List[_RelationshipSpec],
+    spill_dir: str,
+    num_partitions: int,
+    chunk_size: int,
+) -> None:
+    """Stream a source file and append its typed node and relationship rows to partitioned spill files."""
+
+    if isinstance(data, DataSource):
+        columns = [
+            *[c for n in nodes for c in n.key_columns],
+            *[c for r in relationships for c in r.source_key_columns],
+            *[c for r in relationships for c in r.target_key_columns],
+            *[p.column for n in nodes for p in n.properties],
+            *[p.column for r in relationships for p in r.properties],
+        ]
+        chunks = data.iter_chunks(
+            chunk_size=chunk_size, columns=[c for c in columns if c is not None]
+        )
+    else:
+        chunks = (
+            data.iloc[start : start + chunk_size]
+            for start in range(0, len(data), chunk_size)
+        )
+
+    for chunk in chunks:
+        for node in nodes:
+            rows = pd.DataFrame(
+                {
+                    _ID_COLUMN: _import_ids(chunk, node.key_columns),
+                    **_property_values(chunk, node.properties),
+                },
+                index=chunk.index,
+            )
+            rows = rows[rows[_ID_COLUMN].notna()].drop_duplicates(_ID_COLUMN)
+            _append_partitions(
+                rows, [_ID_COLUMN], spill_dir, "nodes", node.group, num_partitions
+            )
+
+        for rel in relationships:
+            rows = pd.DataFrame(
+                {
+                    _START_ID_COLUMN: _import_ids(chunk, rel.source_key_columns),
+                    _END_ID_COLUMN: _import_ids(chunk, rel.target_key_columns),
+                    **_property_values(chunk, rel.properties),
+                },
+                index=chunk.index,
+            )
+            rows = rows[
+                rows[_START_ID_COLUMN].notna() & rows[_END_ID_COLUMN].notna()
+            ].drop_duplicates([_START_ID_COLUMN, _END_ID_COLUMN, *rel.key_properties])
+            _append_partitions(
+                rows,
+                [_START_ID_COLUMN, _END_ID_COLUMN],
+                spill_dir,
+                "relationships",
+                rel.group,
+                num_partitions,
+            )
+
+
+def _property_values(
+    data: pd.DataFrame, properties: List[_PropertySpec]
+) -> Dict[str, pd.Series]:
+    """The typed values of each property. Properties without a column are missing."""
+
+    return {
+        p.name: (
+            format_import_values(data[p.column], p.type)
+            if p.column is not None and p.column in data.columns
+            else pd.Series(np.nan, index=data.index, dtype=object)
+        )
+        for p in properties
+    }
+
+
+def _append_partitions(
+    rows: pd.DataFrame,
+    partition_columns: List[str],
+    spill_dir: str,
+    kind: str,
+    group: int,
+    num_partitions: int,
+) -> None:
+    """Append rows to the spill files of their partitions."""
+
+    if rows.empty:
+        return
+
+    hashes = pd.util.hash_pandas_object(rows[partition_columns], index=False)
+    partitions = (hashes.to_numpy() % np.uint64(num_partitions)).astype(np.int64)
+    for partition in np.unique(partitions):
+        path = _spill_file(spill_dir, kind, group, int(partition))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        rows[partitions == partition].to_csv(path, mode="a", header=False, index=False)
+
+
+def _spill_file(spill_dir: str, kind: str, group: int, partition: int) -> str:
+    """The spill file of a partition."""
+
+    return os.path.join(spill_dir, kind, str(group), f"{partition}.csv")
+
+
+def _merge_partition(
+    spill_dirs: List[str],
+    kind: str,
+    group: int,
+    partition: int,
+    dedupe_positions: List[int],
+    output_file: str,
+) -> int:
+    """
+    Deduplicate the spill files of a partition, in source file order, into a headerless data file.
+    Returns the number of rows written.
+    """
+
+    paths = [_spill_file(d, kind, group, partition) for d in spill_dirs]
+    frames = [
+        pd.read_csv(p, header=None, dtype=str, keep_default_na=False)
+        for p in paths
+        if os.path.exists(p)
+    ]
+    if not frames:
+        return 0
+
+    rows = pd.concat(frames, ignore_index=True).drop_duplicates(dedupe_positions)
+    rows.to_csv(output_file, header=False, index=False)
+    return len(rows)
+
+
+def _map(
+    func: Callable[..., T], tasks: List[Tuple[Any, ...]], max_workers: Optional[int]
+) -> List[T]:
+    """Run tasks in parallel processes, or in the current process when `max_workers` is 1 or there is one task."""
+
+    if max_workers == 1 or len(tasks) <= 1:
+        return [func(*t) for t in tasks]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, *zip(*tasks)))
@@ -0,0 +1,547 @@
+"""
+Cypher clauses for ingesting tabular data into a graph described by a `DataModel`.
+
+Nodes are merged on their key properties and relationships match their endpoints on the endpoint nodes' key
+properties, so every MERGE and MATCH is backed by the constraints generated here. Rows are either sent as batched
+parameters, `WITH $dict.rows AS rows UNWIND rows AS row`, or read with `LOAD CSV` in `CALL { } IN TRANSACTIONS`.
+Values are cast to the property's Neo4j type with null-safe functions, such as `toIntegerOrNull`.
+Labels, relationship types, property names, columns and constraint names are quoted with backticks, so names with
+spaces or reserved words are valid identifiers.
+"""
+
+from typing import Dict, List, Literal, Optional, Tuple, Union
+
+from ..data_model.core.node import Node
+from ..data_model.core.relationship import Relationship
+
+IngestionMethod = Literal["api", "browser"]
+
+# null-safe Cypher functions that convert a value to a Neo4j type
+CASTING_FUNCTIONS: Dict[str, str] = {
+    "INTEGER": "toIntegerOrNull",
+    "FLOAT": "toFloatOrNull",
+    "BOOLEAN": "toBooleanOrNull",
+    "DATE": "date",
+    "LOCAL DATETIME": "localdatetime",
+    "ZONED DATETIME": "datetime",
+    "LOCAL TIME": "localtime",
+    "ZONED TIME": "time",
+    "DURATION": "duration",
+}
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quote a Cypher identifier with backticks. Backticks in the name are escaped by doubling them.
+
+    Parameters
+    ----------
+    name : str
+        The label, relationship type, property name, column or constraint name.
+
+    Returns
+    -------
+    str
+        The quoted identifier, such as "`first name`".
+    """
+
+    escaped = name.replace("`", "``")
+    return f"`{escaped}`"
+
+
+def generate_constraints_key(
+    label_or_type: str, unique_property_keys: List[str]
+) -> str:
+    """
+    Generate the name of a constraint.
+
+    Parameters
+    ----------
+    label_or_type : str
+        The node label or relationship type.
+    unique_property_keys : List[str]
+        The constrained property names.
+
+    Returns
+    -------
+    str
+        The constraint name, such as "person_name".
+    """
+
+    return "_".join([label_or_type.lower(), *[k.lower() for k in unique_property_keys]])
+
+
+def generate_unique_constraint(node_label: str, unique_property: str) -> str:
+    """
+    Generate a node property uniqueness constraint.
+
+    Parameters
+    ----------
+    node_label : str
+        The node label.
+    unique_property : str
+        The unique property name.
+
+    Returns
+    -------
+    str
+        The constraint statement.
+    """
+
+    constraint_key = quote_identifier(
+        generate_constraints_key(node_label, [unique_property])
+    )
+    return f"CREATE CONSTRAINT {constraint_key} IF NOT EXISTS FOR (n:{quote_identifier(node_label)}) REQUIRE n.{quote_identifier(unique_property)} IS UNIQUE;\n"
+
+
+def generate_relationship_unique_constraint(
+    relationship_type: str, unique_property: str
+) -> str:
+    """
+    Generate a relationship property uniqueness constraint.
+
+    Parameters
+    ----------
+    relationship_type : str
+        The relationship type.
+    unique_property : str
+        The unique property name.
+
+    Returns
+    -------
+    str
+        The constraint statement.
+    """
+
+    constraint_key = quote_identifier(
+        generate_constraints_key(relationship_type, [unique_property])
+    )
+    return f"CREATE CONSTRAINT {constraint_key} IF NOT EXISTS FOR ()-[r:{quote_identifier(relationship_type)}]-() REQUIRE r.{quote_identifier(unique_property)} IS UNIQUE;\n"
+
+
+def generate_node_key_constraint(label: str, unique_properties: List[str]) -> str:
+    """
+    Generate a node key constraint over one or more properties. Node keys require Neo4j Enterprise Edition.
+
+    Parameters
+    ----------
+    label : str
+        The node label.
+    unique_properties : List[str]
+        The node key property names.
+
+    Returns
+    -------
+    str
+        The constraint statement.
+    """
+
+    constraint_key = quote_identifier(
+        generate_constraints_key(label, unique_properties)
+    )
+    properties = ", ".join([f"n.{quote_identifier(p)}" for p in unique_properties])
+    return f"CREATE CONSTRAINT {constraint_key} IF NOT EXISTS FOR (n:{quote_identifier(label)}) REQUIRE ({properties}) IS NODE KEY;\n"
+
+
+def generate_relationship_key_constraint(
+    relationship_type: str, unique_properties: List[str]
+) -> str:
+    """
+    Generate a relationship key constraint over one or more properties. Relationship keys require Neo4j Enterprise Edition.
+
+    Parameters
+    ----------
+    relationship_type : str
+        The relationship type.
+    unique_properties : List[str]
+        The relationship key property names.
+
+    Returns
+    -------
+    str
+        The constraint statement.
+    """
+
+    constraint_key = quote_identifier(
+        generate_constraints_key(relationship_type, unique_properties)
+    )
+    properties = ", ".join([f"r.{quote_identifier(p)}" for p in unique_properties])
+    return f"CREATE CONSTRAINT {constraint_key} IF NOT EXISTS FOR ()-[r:{quote_identifier(relationship_type)}]-() REQUIRE ({properties}) IS RELATIONSHIP KEY;\n"
+
+
+def cast_value(column: str, neo4j_type: str) -> str:
+    """
+    Generate the expression that reads a column from `row` as a Neo4j type.
+    Strings and types without a casting function are read as is.
+
+    Parameters
+    ----------
+    column : str
+        The column name.
+    neo4j_type : str
+        The Neo4j type of the property.
+
+    Returns
+    -------
+    str
+        The expression, such as "toIntegerOrNull(row.`age`)".
+    """
+
+    value = f"row.{quote_identifier(column)}"
+    function = CASTING_FUNCTIONS.get(neo4j_type)
+    return f"{function}({value})" if function is not None else value
+
+
+def generate_set_unique_property(
+    key_mapping: Dict[str, str], property_types: Dict[str, str]
+) -> str:
+    """
+    Generate the key properties of a MERGE or MATCH pattern.
+
+    Parameters
+    ----------
+    key_mapping : Dict[str, str]
+        A mapping of key property names to columns, such as `Node.node_key_mapping`.
+    property_types : Dict[str, str]
+        A mapping of property names to Neo4j types.
+
+    Returns
+    -------
+    str
+        The key properties, such as "`name`: row.`name`".
+    """
+
+    return ", ".join(
+        [
+            f"{quote_identifier(p)}: {cast_value(c, property_types.get(p, 'STRING'))}"
+            for p, c in key_mapping.items()
+        ]
+    )
+
+
+def generate_set_property(
+    property_mapping: Dict[str, str], property_types: Dict[str, str]
+) -> str:
+    """
+    Generate the SET clause of the non key properties.
+
+    Parameters
+    ----------
+    property_mapping : Dict[str, str]
+        A mapping of property names to columns, such as `Node.nonunique_properties_mapping_for_set_clause`.
+    property_types : Dict[str, str]
+        A mapping of property names to Neo4j types.
+
+    Returns
+    -------
+    str
+        The SET clause, or an empty string if there are no properties.
+    """
+
+    if not property_mapping:
+        return ""
+
+    return "SET " + ", ".join(
+        [
+            f"n.{quote_identifier(p)} = {cast_value(c, property_types.get(p, 'STRING'))}"
+            for p, c in property_mapping.items()
+        ]
+    )
+
+
+def generate_match_node_clause(
+    node: Node, variable: str = "n", key_mapping: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Generate a MATCH clause for a node on its key properties.
+
+    Parameters
+    ----------
+    node : Node
+        The node.
+    variable : str, optional
+        The node variable, by default "n"
+    key_mapping : Optional[Dict[str, str]], optional
+        A mapping of key property names to columns, by default None, which uses `Node.node_key_mapping`
+
+    Returns
+    -------
+    str
+        The MATCH clause.
+    """
+
+    keys = generate_set_unique_property(
+        key_mapping if key_mapping is not None else node.node_key_mapping,
+        _property_types(node),
+    )
+    return f"MATCH ({variable}:{quote_identifier(node.label)} {{{keys}}})"
+
+
+def generate_match_same_node_labels_clause(node: Node) -> str:
+    """
+    Generate the MATCH clauses of a relationship between two nodes with the same label.
+    The source node is matched on the key columns and the target node on the key aliases.
+
+    Parameters
+    ----------
+    node : Node
+        The node at both ends of the relationship.
+
+    Returns
+    -------
+    str
+        The source and target MATCH clauses.
+    """
+
+    return (
+        generate_match_node_clause(node, "source")
+        + "\n"
+        + generate_match_node_clause(node, "target", _alias_key_mapping(node))
+    )
+
+
+def generate_merge_node_clause_standard(node: Node) -> str:
+    """
+    Generate a statement that merges a node from the batched rows in the `$dict.rows` parameter.
+
+    Parameters
+    ----------
+    node : Node
+        The node.
+
+    Returns
+    -------
+    str
+        The statement.
+    """
+
+    property_types = _property_types(node)
+    keys = generate_set_unique_property(node.node_key_mapping, property_types)
+    set_clause = generate_set_property(
+        node.nonunique_properties_mapping_for_set_clause, property_types
+    )
+    return f"""WITH $dict.rows AS rows
+UNWIND rows AS row
+MERGE (n:{quote_identifier(node.label)} {{{keys}}})
+{set_clause}"""
+
+
+def generate_merge_node_load_csv_clause(
+    node: Node,
+    csv_name: str,
+    method: IngestionMethod = "api",
+    batch_size: int = 100,
+) -> str:
+    """
+    Generate a statement that merges a node from a CSV file with `LOAD CSV`, committing every `batch_size` rows.
+
+    Parameters
+    ----------
+    node : Node
+        The node.
+    csv_name : str
+        The CSV file name in the Neo4j import directory.
+    method : IngestionMethod, optional
+        "browser" prefixes the statement with `:auto` to run in Neo4j Browser, by default "api"
+    batch_size : int, optional
+        The number of rows per transaction, by default 100
+
+    Returns
+    -------
+    str
+        The statement.
+    """
+
+    property_types = _property_types(node)
+    keys = generate_set_unique_property(node.node_key_mapping, property_types)
+    set_clause = generate_set_property(
+        node.nonunique_properties_mapping_for_set_clause, property_types
+    )
+    return f"""{_method_prefix(method)}LOAD CSV WITH HEADERS FROM 'file:///{csv_name}' as row
+CALL {{
+    WITH row
+    MERGE (n:{quote_identifier(node.label)} {{{keys}}})
+    {set_clause}
+}} IN TRANSACTIONS OF {batch_size} ROWS;
+"""
+
+
+def generate_relationship_match_clauses(
+    source_node: Node, target_node: Node, relationship: Relationship
+) -> str:
+    """
+    Generate the MATCH clauses of a relationship's source and target nodes.
+    An endpoint node from a different file than the relationship is matched on its key aliases.
+
+    Parameters
+    ----------
+    source_node : Node
+        The source node.
+    target_node : Node
+        The target node.
+    relationship : Relationship
+        The relationship.
+
+    Returns
+    -------
+    str
+        The source and target MATCH clauses.
+    """
+
+    source_mapping, target_mapping = get_endpoint_key_mappings(
+        source_node, target_node, relationship
+    )
+    return (
+        generate_match_node_clause(source_node, "source", source_mapping)
+        + "\n"
+        + generate_match_node_clause(target_node, "target", target_mapping)
+    )
+
+
+def get_endpoint_key_mappings(
+    source_node: Node, target_node: Node, relationship: Relationship
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Map the key properties of a relationship's source and target nodes to the columns they are matched on.
+    An endpoint node from a different file than the relationship is matched on its key aliases, and so is the target
+    of a relationship between two nodes with the same label.
+
+    Parameters
+    ----------
+    source_node : Node
+        The source node.
+    target_node : Node
+        The target node.
+    relationship : Relationship
+        The relationship.
+
+    Returns
+    -------
+    Tuple[Dict[str, str], Dict[str, str]]
+        The source and target key property to column mappings.
+    """
+
+    if source_node.label == target_node.label:
+        return source_node.node_key_mapping, _alias_key_mapping(target_node)
+
+    return tuple(  # type: ignore[return-value]
+        (
+            node.node_key_mapping
+            if node.source_name == relationship.source_name
+            else _alias_key_mapping(node)
+        )
+        for node in (source_node, target_node)
+    )
+
+
+def generate_merge_relationship_clause_standard(
+    source_node: Node, target_node: Node, relationship: Relationship
+) -> str:
+    """
+    Generate a statement that merges a relationship from the batched rows in the `$dict.rows` parameter.
+
+    Parameters
+    ----------
+    source_node : Node
+        The source node.
+    target_node : Node
+        The target node.
+    relationship : Relationship
+        The relationship.
+
+    Returns
+    -------
+    str
+        The statement.
+    """
+
+    match_clauses = generate_relationship_match_clauses(
+        source_node, target_node, relationship
+    )
+    return f"""WITH $dict.rows AS rows
+UNWIND rows as row
+{match_clauses}
+{_merge_relationship_clause(relationship)}
+{_relationship_set_clause(relationship)}"""
+
+
+def generate_merge_relationship_load_csv_clause(
+    source_node: Node,
+    target_node: Node,
+    relationship: Relationship,
+    csv_name: str,
+    method: IngestionMethod = "api",
+    batch_size: int = 100,
+) -> str:
+    """
+    Generate a statement that merges a relationship from a CSV file with `LOAD CSV`, committing every `batch_size` rows.
+
+    Parameters
+    ----------
+    source_node : Node
+        The source node.
+    target_node : Node
+        The target node.
+    relationship : Relationship
+        The relationship.
+    csv_name : str
+        The CSV file name in the Neo4j import directory.
+    method : IngestionMethod, optional
+        "browser" prefixes the statement with `:auto` to run in Neo4j Browser, by default "api"
+    batch_size : int, optional
+        The number of rows per transaction, by default 100
+
+    Returns
+    -------
+    str
+        The statement.
+    """
+
+    match_clauses = generate_relationship_match_clauses(
+        source_node, target_node, relationship
+    ).replace("\n", "\n    ")
+    return f"""{_method_prefix(method)}LOAD CSV WITH HEADERS FROM 'file:///{csv_name}' as row
+CALL {{
+    WITH row
+    {match_clauses}
+    {_merge_relationship_clause(relationship)}
+    {_relationship_set_clause(relationship)}
+}} IN TRANSACTIONS OF {batch_size} ROWS;
+"""
+
+
+def _property_types(entity: Union[Node, Relationship]) -> Dict[str, str]:
+    """Map the property names of a node or relationship to their Neo4j types."""
+
+    return {p.name: p.type for p in entity.properties}
+
+
+def _alias_key_mapping(node: Node) -> Dict[str, str]:
+    """Map the key properties of a node to their aliases, or their columns if they have no alias."""
+
+    return {p.name: p.alias or p.column_mapping for p in node.node_keys}
+
+
+def _merge_relationship_clause(relationship: Relationship) -> str:
+    """The MERGE clause of a relationship, on its key properties if it has any."""
+
+    keys = generate_set_unique_property(
+        relationship.relationship_key_mapping, _property_types(relationship)
+    )
+    keys = f" {{{keys}}}" if keys else ""
+    return f"MERGE (source)-[n:{quote_identifier(relationship.type)}{keys}]->(target)"
+
+
+def _relationship_set_clause(relationship: Relationship) -> str:
+    """The SET clause of a relationship's non key properties."""
+
+    return generate_set_property(
+        relationship.nonunique_properties_mapping_for_set_clause,
+        _property_types(relationship),
+    )
+
+
+def _method_prefix(method: IngestionMethod) -> str:
+    """The prefix that runs a statement with `CALL { } IN TRANSACTIONS` in Neo4j Browser."""
+
+    return ":auto " if method == "browser" else ""
@@ -0,0 +1,448 @@
+"""
+Generate the Cypher that ingests tabular data into the graph described by a `DataModel`.
+
+Constraints are created first, so that each node MERGE and endpoint MATCH is an index lookup. Nodes are merged before
+relationships, and each statement has its own batch size. Statements with more properties write more values per row,
+so their batches hold fewer rows to keep transactions a similar size, and relationship batches are smaller again since
+each row locks two nodes.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+from pydantic import BaseModel
+
+from ..data_model.core.data_model import DataModel
+from ..data_model.core.node import Node
+from ..data_model.core.relationship import Relationship
+from ..data_source.data_source import DataSource
+from .cypher import (
+    IngestionMethod,
+    generate_constraints_key,
+    generate_merge_node_clause_standard,
+    generate_merge_node_load_csv_clause,
+    generate_merge_relationship_clause_standard,
+    generate_merge_relationship_load_csv_clause,
+    generate_node_key_constraint,
+    generate_relationship_key_constraint,
+    generate_relationship_unique_constraint,
+    generate_unique_constraint,
+    get_endpoint_key_mappings,
+)
+
+# relationship rows lock their source and target nodes, so relationship batches are smaller
+_RELATIONSHIP_BATCH_DIVISOR: int = 4
+
+
+class IngestionStatement(BaseModel):
+    """
+    A batched ingestion statement.
+
+    Attributes
+    ----------
+    name : str
+        The node label or relationship pattern the statement ingests.
+    label_or_type : str
+        The node label or relationship type.
+    cypher : str
+        The statement. Rows are passed in the `$dict.rows` parameter.
+    columns : List[str]
+        The columns the statement reads from each row.
+    source_name : str
+        The file the rows are read from.
+    batch_size : int
+        The number of rows per transaction.
+    source_key_columns : List[str]
+        The columns a relationship statement matches its source node keys on. Empty for node statements.
+    target_key_columns : List[str]
+        The columns a relationship statement matches its target node keys on. Empty for node statements.
+    same_endpoint_label : bool
+        Whether the source and target nodes of a relationship statement have the same label.
+    """
+
+    name: str
+    label_or_type: str
+    cypher: str
+    columns: List[str]
+    source_name: str
+    batch_size: int
+    source_key_columns: List[str] = list()
+    target_key_columns: List[str] = list()
+    same_endpoint_label: bool = False
+
+
+class IngestionGenerator:
+    """
+    Generate the Cypher that ingests data into the graph described by a data model.
+
+    Parameters
+    ----------
+    data_model : DataModel
+        The data model.
+    csv_name : str, optional
+        The CSV file of nodes and relationships whose `source_name` is the default "file", by default ""
+    file_directory : str, optional
+        The directory of the CSV files, relative to the Neo4j import directory, by default ""
+    method : IngestionMethod, optional
+        "browser" prefixes `LOAD CSV` statements with `:auto` to run in Neo4j Browser, by default "api"
+    max_batch_size : int, optional
+        The max number of rows per transaction, by default 10,000
+    min_batch_size : int, optional
+        The min number of rows per transaction, by default 100
+    max_values_per_batch : int, optional
+        The number of values written per transaction that batch sizes target, by default 100,000
+    use_key_constraints : bool, optional
+        Whether nodes and relationships with several key properties get a single node or relationship key constraint,
+        which requires Neo4j Enterprise Edition. Otherwise each key property gets a uniqueness constraint. By default False
+    """
+
+    def __init__(
+        self,
+        data_model: DataModel,
+        csv_name: str = "",
+        file_directory: str = "",
+        method: IngestionMethod = "api",
+        max_batch_size: int = 10_000,
+        min_batch_size: int = 100,
+        max_values_per_batch: int = 100_000,
+        use_key_constraints: bool = False,
+    ) -> None:
+        self.data_model = data_model
+        self.csv_name = csv_name
+        self.file_directory = file_directory
+        self.method = method
+        self.max_batch_size = max_batch_size
+        self.min_batch_size = min_batch_size
+        self.max_values_per_batch = max_values_per_batch
+        self.use_key_constraints = use_key_constraints
+
+    def generate_constraints(self) -> Dict[str, str]:
+        """
+        Generate the constraints of the node and relationship keys.
+
+        Returns
+        -------
+        Dict[str, str]
+            A mapping of constraint name to statement, nodes first.
+        """
+
+        constraints: Dict[str, str] = dict()
+        for node in self.data_model.nodes:
+            keys = [p.name for p in node.node_keys]
+            if self.use_key_constraints and len(keys) > 1:
+                constraints[generate_constraints_key(node.label, keys)] = (
+                    generate_node_key_constraint(node.label, keys)
+                )
+            else:
+                for k in keys:
+                    constraints[generate_constraints_key(node.label, [k])] = (
+                        generate_unique_constraint(node.label, k)
+                    )
+
+        for rel in self.data_model.relationships:
+            keys = [p.name for p in rel.relationship_keys]
+            if self.use_key_constraints and len(keys) > 1:
+                constraints[generate_constraints_key(rel.type, keys)] = (
+                    generate_relationship_key_constraint(rel.type, keys)
+                )
+            else:
+                for k in keys:
+                    constraints[generate_constraints_key(rel.type, [k])] = (
+                        generate_relationship_unique_constraint(rel.type, k)
+                    )
+
+        return constraints
+
+    def generate_node_statements(self) -> List[IngestionStatement]:
+        """
+        Generate the batched MERGE statements of the nodes.
+
+        Returns
+        -------
+        List[IngestionStatement]
+            A statement per node.
+        """
+
+        return [
+            IngestionStatement(
+                name=node.label,
+                label_or_type=node.label,
+                cypher=generate_merge_node_clause_standard(node),
+                columns=_node_columns(node),
+                source_name=node.source_name,
+                batch_size=self.batch_size(len(node.properties)),
+            )
+            for node in self.data_model.nodes
+        ]
+
+    def generate_relationship_statements(self) -> List[IngestionStatement]:
+        """
+        Generate the batched MERGE statements of the relationships.
+
+        Returns
+        -------
+        List[IngestionStatement]
+            A statement per relationship.
+        """
+
+        statements = list()
+        for rel in self.data_model.relationships:
+            source_node, target_node = self._endpoints(rel)
+            source_mapping, target_mapping = get_endpoint_key_mappings(
+                source_node, target_node, rel
+            )
+            columns = _relationship_columns(source_node, target_node, rel)
+            statements.append(
+                IngestionStatement(
+                    name=str(rel),
+                    label_or_type=rel.type,
+                    cypher=generate_merge_relationship_clause_standard(
+                        source_node, target_node, rel
+                    ),
+                    columns=columns,
+                    source_name=rel.source_name,
+                    batch_size=self.batch_size(len(columns), relationship=True),
+                    source_key_columns=list(source_mapping.values()),
+                    target_key_columns=list(target_mapping.values()),
+                    same_endpoint_label=source_node.label == target_node.label,
+                )
+            )
+        return statements
+
+    def generate_load_csv_string(self) -> str:
+        """
+        Generate a script of the constraints and `LOAD CSV` statements of the nodes and relationships.
+
+        Returns
+        -------
+        str
+            The script.
+        """
+
+        statements = list(self.generate_constraints().values())
+        for node in self.data_model.nodes:
+            statements.append(
+                generate_merge_node_load_csv_clause(
+                    node,
+                    self._csv_path(node.source_name),
+                    method=self.method,
+                    batch_size=self.batch_size(len(node.properties)),
+                )
+            )
+        for rel in self.data_model.relationships:
+            source_node, target_node = self._endpoints(rel)
+            statements.append(
+                generate_merge_relationship_load_csv_clause(
+                    source_node,
+                    target_node,
+                    rel,
+                    self._csv_path(rel.source_name),
+                    method=self.method,
+                    batch_size=self.batch_size(
+                        len(_relationship_columns(source_node, target_node, rel)),
+                        relationship=True,
+                    ),
+                )
+            )
+        return "\n".join(statements)
+
+    def batch_size(self, value_count: int, relationship: bool = False) -> int:
+        """
+        The number of rows per transaction of a statement that writes `value_count` values per row.
+
+        Parameters
+        ----------
+        value_count : int
+            The number of values read from each row.
+        relationship : bool, optional
+            Whether the statement merges relationships, by default False
+
+        Returns
+        -------
+        int
+            The batch size.
+        """
+
+        size = self.max_values_per_batch // max(value_count, 1)
+        if relationship:
+            size //= _RELATIONSHIP_BATCH_DIVISOR
+        return max(self.min_batch_size, min(size, self.max_batch_size))
+
+    def source_file(self, source_name: str) -> str:
+        """
+        The file of a node or relationship source name. The default "file" source name is the generator's `csv_name`.
+
+        Parameters
+        ----------
+        source_name : str
+            The source name.
+
+        Returns
+        -------
+        str
+            The file name.
+        """
+
+        return self.csv_name if source_name == "file" else source_name
+
+    def _endpoints(self, relationship: Relationship) -> Tuple[Node, Node]:
+        """The source and target nodes of a relationship."""
+
+        nodes = self.data_model.node_dict
+        return nodes[relationship.source], nodes[relationship.target]
+
+    def _csv_path(self, source_name: str) -> str:
+        """The path of a source file relative to the Neo4j import directory."""
+
+        return f"{self.file_directory}{self.source_file(source_name)}"
+
+
+def iter_row_batches(
+    data: Union[pd.DataFrame, DataSource], statement: IngestionStatement
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Split the rows of a DataFrame or `DataSource` into the parameter batches of a statement.
+    Only the columns the statement reads are kept, and missing values are sent as null.
+    A `DataSource` is streamed a batch at a time.
+
+    Parameters
+    ----------
+    data : Union[pd.DataFrame, DataSource]
+        The data.
+    statement : IngestionStatement
+        The statement.
+
+    Yields
+    ------
+    List[Dict[str, Any]]
+        A batch of rows.
+    """
+
+    for chunk in iter_statement_chunks(data, statement):
+        yield to_parameter_rows(chunk)
+
+
+def iter_statement_chunks(
+    data: Union[pd.DataFrame, DataSource],
+    statement: IngestionStatement,
+    chunk_size: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read the columns of a statement from a DataFrame or `DataSource` in chunks. A `DataSource` is streamed.
+
+    Parameters
+    ----------
+    data : Union[pd.DataFrame, DataSource]
+        The data.
+    statement : IngestionStatement
+        The statement.
+    chunk_size : Optional[int], optional
+        The number of rows per chunk, by default None, which uses the statement's batch size
+
+    Yields
+    ------
+    pd.DataFrame
+        The chunks, with only the columns the statement reads.
+    """
+
+    chunk_size = chunk_size or statement.batch_size
+    if isinstance(data, DataSource):
+        chunks = data.iter_chunks(chunk_size=chunk_size, columns=statement.columns)
+    else:
+        chunks = (
+            data.iloc[start : start + chunk_size]
+            for start in range(0, len(data), chunk_size)
+        )
+
+    for chunk in chunks:
+        yield chunk[[c for c in statement.columns if c in chunk.columns]]
+
+
+def to_parameter_rows(data: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert rows to the `$dict.rows` parameter of a statement. Missing values are sent as null.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The rows.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        A dictionary per row.
+    """
+
+    rows: List[Dict[str, Any]] = (
+        data.astype(object).where(data.notna(), None).to_dict("records")
+    )
+    return rows
+
+
+def load_data(
+    driver: Any,
+    generator: IngestionGenerator,
+    data: Dict[str, Union[pd.DataFrame, DataSource]],
+    database: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Create the constraints and ingest data with the batched statements of an `IngestionGenerator`.
+
+    Parameters
+    ----------
+    driver : Any
+        A Neo4j driver, or any object with an equivalent `execute_query` method.
+    generator : IngestionGenerator
+        The generator.
+    data : Dict[str, Union[pd.DataFrame, DataSource]]
+        A mapping of file name to data. Use the generator's `csv_name` for nodes and relationships with the default
+        "file" source name.
+    database : Optional[str], optional
+        The database, by default None, which uses the default database
+
+    Returns
+    -------
+    Dict[str, int]
+        The number of rows sent per statement name.
+    """
+
+    for constraint in generator.generate_constraints().values():
+        driver.execute_query(constraint, database_=database)
+
+    rows: Dict[str, int] = dict()
+    for statement in [
+        *generator.generate_node_statements(),
+        *generator.generate_relationship_statements(),
+    ]:
+        rows[statement.name] = 0
+        source = generator.source_file(statement.source_name)
+        for batch in iter_row_batches(data[source], statement):
+            driver.execute_query(
+                statement.cypher,
+                parameters_={"dict": {"rows": batch}},
+                database_=database,
+            )
+            rows[statement.name] += len(batch)
+    return rows
+
+
+def _node_columns(node: Node) -> List[str]:
+    """The columns a node statement reads."""
+
+    return list(dict.fromkeys([p.column_mapping for p in node.properties]))
+
+
+def _relationship_columns(
+    source_node: Node, target_node: Node, relationship: Relationship
+) -> List[str]:
+    """The columns a relationship statement reads: the endpoint keys and the relationship properties."""
+
+    source_mapping, target_mapping = get_endpoint_key_mappings(
+        source_node, target_node, relationship
+    )
+    columns = [
+        *source_mapping.values(),
+        *target_mapping.values(),
+        *[p.column_mapping for p in relationship.properties],
+    ]
+    return list(dict.fromkeys(columns))
@@ -0,0 +1,397 @@
+"""
+Load data into Neo4j with the statements of an `IngestionGenerator`.
+
+Constraints are created first. Node statements are then run in parallel, one task per label, on a bounded pool of
+worker threads that each open a session per batch from the driver's connection pool. Statements of the same label run
+in the same task, since concurrent MERGEs on one label contend for the same constraint index entries. Relationships
+are loaded after all nodes, so every endpoint MATCH finds its node. Relationship rows are partitioned by their endpoint
+node keys with `schedule_relationship_rows()`, so the partitions loaded concurrently never lock the same nodes. Rows
+are streamed and each batch is its own transaction, which is retried with exponential backoff and jitter when it fails
+with a transient error.
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import pandas as pd
+from pydantic import BaseModel
+
+from ..data_source.data_source import DataSource
+from .ingestion_generator import (
+    IngestionGenerator,
+    IngestionStatement,
+    iter_statement_chunks,
+    to_parameter_rows,
+)
+from .scheduling import schedule_relationship_rows
+
+# the names of the neo4j driver errors that are safe to retry, for errors without an `is_retryable()` method
+_TRANSIENT_ERROR_NAMES = {
+    "TransientError",
+    "ServiceUnavailable",
+    "SessionExpired",
+    "IncompleteCommit",
+}
+
+
+class LoadStats(BaseModel):
+    """
+    The load statistics of a node label or relationship type.
+
+    Attributes
+    ----------
+    name : str
+        The node label or relationship type.
+    rows : int
+        The number of rows loaded.
+    batches : int
+        The number of batches loaded.
+    retries : int
+        The number of batches retried after a transient error.
+    seconds : float
+        The time spent loading.
+    """
+
+    name: str
+    rows: int = 0
+    batches: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """The number of rows loaded per second."""
+
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class LoadReport(BaseModel):
+    """
+    The load statistics of a data model.
+
+    Attributes
+    ----------
+    nodes : Dict[str, LoadStats]
+        The statistics per node label.
+    relationships : Dict[str, LoadStats]
+        The statistics per relationship type.
+    seconds : float
+        The total time spent loading, including the constraints.
+    """
+
+    nodes: Dict[str, LoadStats]
+    relationships: Dict[str, LoadStats]
+    seconds: float
+
+    @property
+    def rows(self) -> int:
+        """The total number of rows loaded."""
+
+        return sum(s.rows for s in [*self.nodes.values(), *self.relationships.values()])
+
+    @property
+    def rows_per_second(self) -> float:
+        """The number of rows loaded per second over the whole load."""
+
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        lines = [
+            f"Loaded {self.rows:,} rows in {self.seconds:.2f}s ({self.rows_per_second:,.0f} rows/sec)"
+        ]
+        for title, stats in [
+            ("Nodes", self.nodes),
+            ("Relationships", self.relationships),
+        ]:
+            lines.append(f"{title}:")
+            lines.extend(
+                [
+                    f"* {s.name}: {s.rows:,} rows, {s.batches} batches, {s.retries} retries, {s.rows_per_second:,.0f} rows/sec"
+                    for s in stats.values()
+                ]
+            )
+        return "\n".join(lines)
+
+
+class Neo4jLoader:
+    """
+    Load data into Neo4j in parallel batches.
+
+    Parameters
+    ----------
+    driver : Any
+        A Neo4j driver, or any object with an equivalent `session()` method whose sessions `run()` queries.
+        The driver's `max_connection_pool_size` should be at least `max_workers`.
+    generator : IngestionGenerator
+        The generator of the constraints and statements.
+    database : Optional[str], optional
+        The database, by default None, which uses the default database
+    max_workers : int, optional
+        The max number of concurrent sessions, by default 4
+    max_retries : int, optional
+        The max number of times a batch is retried after a transient error, by default 5
+    retry_delay : float, optional
+        The base delay in seconds between retries, doubled after each retry, by default 0.1
+    max_retry_delay : float, optional
+        The max delay in seconds between retries, by default 5.0
+    relationship_buckets : Optional[int], optional
+        The number of endpoint buckets relationship rows are partitioned into. Up to this many relationship
+        partitions load concurrently, and 1 loads relationships serially. By default None, which uses `max_workers`
+    """
+
+    def __init__(
+        self,
+        driver: Any,
+        generator: IngestionGenerator,
+        database: Optional[str] = None,
+        max_workers: int = 4,
+        max_retries: int = 5,
+        retry_delay: float = 0.1,
+        max_retry_delay: float = 5.0,
+        relationship_buckets: Optional[int] = None,
+    ) -> None:
+        self.driver = driver
+        self.generator = generator
+        self.database = database
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.relationship_buckets = relationship_buckets or max_workers
+
+    def load(self, data: Dict[str, Union[pd.DataFrame, DataSource]]) -> LoadReport:
+        """
+        Create the constraints, then load the nodes and the relationships.
+
+        Parameters
+        ----------
+        data : Dict[str, Union[pd.DataFrame, DataSource]]
+            A mapping of file name to data. Use the generator's `csv_name` for nodes and relationships with the
+            default "file" source name.
+
+        Returns
+        -------
+        LoadReport
+            The load statistics.
+        """
+
+        start = time.perf_counter()
+        self.create_constraints()
+        nodes = self.load_nodes(data)
+        relationships = self.load_relationships(data)
+        return LoadReport(
+            nodes=nodes,
+            relationships=relationships,
+            seconds=time.perf_counter() - start,
+        )
+
+    def create_constraints(self) -> None:
+        """Create the constraints of the node and relationship keys."""
+
+        for constraint in self.generator.generate_constraints().values():
+            self._run(constraint, None)
+
+    def load_nodes(
+        self, data: Dict[str, Union[pd.DataFrame, DataSource]]
+    ) -> Dict[str, LoadStats]:
+        """
+        Load the nodes, with the labels in parallel.
+
+        Parameters
+        ----------
+        data : Dict[str, Union[pd.DataFrame, DataSource]]
+            A mapping of file name to data.
+
+        Returns
+        -------
+        Dict[str, LoadStats]
+            The statistics per node label.
+        """
+
+        groups = _group_statements(self.generator.generate_node_statements())
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                label: executor.submit(self._load_statements, label, statements, data)
+                for label, statements in groups.items()
+            }
+            return {label: future.result() for label, future in futures.items()}
+
+    def load_relationships(
+        self, data: Dict[str, Union[pd.DataFrame, DataSource]]
+    ) -> Dict[str, LoadStats]:
+        """
+        Load the relationships, one statement at a time. Their endpoint nodes must be loaded.
+        The rows of each statement are read in chunks of a batch per partition. Each chunk is partitioned by endpoint
+        node keys into rounds, and the partitions of a round load in parallel.
+
+        Parameters
+        ----------
+        data : Dict[str, Union[pd.DataFrame, DataSource]]
+            A mapping of file name to data.
+
+        Returns
+        -------
+        Dict[str, LoadStats]
+            The statistics per relationship type.
+        """
+
+        stats: Dict[str, LoadStats] = dict()
+        buckets = self.relationship_buckets
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for statement in self.generator.generate_relationship_statements():
+                rel_stats = stats.setdefault(
+                    statement.label_or_type, LoadStats(name=statement.label_or_type)
+                )
+                start = time.perf_counter()
+                source = data[self.generator.source_file(statement.source_name)]
+                for chunk in iter_statement_chunks(
+                    source, statement, chunk_size=statement.batch_size * buckets**2
+                ):
+                    for partitions in schedule_relationship_rows(
+                        chunk,
+                        statement.source_key_columns,
+                        statement.target_key_columns,
+                        buckets,
+                        same_label=statement.same_endpoint_label,
+                    ):
+                        for partition_stats in executor.map(
+                            lambda p: self._load_rows(statement, p), partitions
+                        ):
+                            _add_stats(rel_stats, partition_stats)
+                rel_stats.seconds += time.perf_counter() - start
+        return stats
+
+    def _load_statements(
+        self,
+        name: str,
+        statements: List[IngestionStatement],
+        data: Dict[str, Union[pd.DataFrame, DataSource]],
+    ) -> LoadStats:
+        """Load the batches of statements one after another."""
+
+        stats = LoadStats(name=name)
+        start = time.perf_counter()
+        for statement in statements:
+            source = data[self.generator.source_file(statement.source_name)]
+            for chunk in iter_statement_chunks(source, statement):
+                _add_stats(stats, self._load_rows(statement, chunk))
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    def _load_rows(
+        self, statement: IngestionStatement, rows: pd.DataFrame
+    ) -> LoadStats:
+        """Load rows in batches of the statement's batch size, one after another. The stats are not timed."""
+
+        stats = LoadStats(name=statement.label_or_type)
+        for start in range(0, len(rows), statement.batch_size):
+            batch = to_parameter_rows(rows.iloc[start : start + statement.batch_size])
+            stats.retries += self._run(statement.cypher, {"dict": {"rows": batch}})
+            stats.rows += len(batch)
+            stats.batches += 1
+        return stats
+
+    def _run(self, query: str, parameters: Optional[Dict[str, Any]]) -> int:
+        """Run a query in its own transaction, retrying transient errors. Returns the number of retries."""
+
+        return run_with_retries(
+            lambda: self._run_once(query, parameters),
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+            max_retry_delay=self.max_retry_delay,
+        )
+
+    def _run_once(self, query: str, parameters: Optional[Dict[str, Any]]) -> None:
+        """Run a query in a new session from the driver's connection pool."""
+
+        with self.driver.session(database=self.database) as session:
+            session.run(query, parameters).consume()
+
+
+def run_with_retries(
+    func: Callable[[], Any],
+    max_retries: int = 5,
+    retry_delay: float = 0.1,
+    max_retry_delay: float = 5.0,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """
+    Call a function, retrying it with exponential backoff and full jitter when it raises a transient error.
+
+    Parameters
+    ----------
+    func : Callable[[], Any]
+        The function.
+    max_retries : int, optional
+        The max number of retries, by default 5
+    retry_delay : float, optional
+        The base delay in seconds, doubled after each retry, by default 0.1
+    max_retry_delay : float, optional
+        The max delay in seconds, by default 5.0
+    sleep : Callable[[float], None], optional
+        The function that waits, by default `time.sleep`
+
+    Returns
+    -------
+    int
+        The number of retries.
+
+    Raises
+    ------
+    Exception
+        The last error, if it is not transient or the function still fails after `max_retries` retries.
+    """
+
+    for attempt in range(max_retries + 1):
+        try:
+            func()
+            return attempt
+        except Exception as e:
+            if attempt == max_retries or not is_transient_error(e):
+                raise
+            sleep(random.uniform(0, min(max_retry_delay, retry_delay * 2**attempt)))
+    return max_retries
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Whether a driver error is transient, so the failed transaction can be retried.
+
+    Parameters
+    ----------
+    error : Exception
+        The error.
+
+    Returns
+    -------
+    bool
+        Whether the error is transient.
+    """
+
+    is_retryable = getattr(error, "is_retryable", None)
+    if callable(is_retryable):
+        return bool(is_retryable())
+    return type(error).__name__ in _TRANSIENT_ERROR_NAMES or str(
+        getattr(error, "code", "")
+    ).startswith("Neo.TransientError")
+
+
+def _add_stats(stats: LoadStats, other: LoadStats) -> None:
+    """Add the row, batch and retry counts of `other` to `stats`."""
+
+    stats.rows += other.rows
+    stats.batches += other.batches
+    stats.retries += other.retries
+
+
+def _group_statements(
+    statements: List[IngestionStatement],
+) -> Dict[str, List[IngestionStatement]]:
+    """Group statements by node label or relationship type, in order of first appearance."""
+
+    groups: Dict[str, List[IngestionStatement]] = dict()
+    for statement in statements:
+        groups.setdefault(statement.label_or_type, list()).append(statement)
+    return groups
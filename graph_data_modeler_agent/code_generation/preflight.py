@@ -0,0 +1,516 @@
+"""
+Pre-flight data quality checks of source data against a `DataModel`, before it is loaded.
+
+Sources are streamed in chunks and each check is vectorized over a chunk, so tables larger than memory can be checked.
+Node keys are tracked as 64-bit hashes of their values in sorted arrays, which use 8 bytes per distinct key, or 16
+bytes when their property values are also tracked. The checks are:
+
+* `missing_column`: a column mapped by the data model is not in its source.
+* `null_key`: a row has a missing node key value, so its node can't be merged.
+* `duplicate_key`: a node key appears with different property values, so it doesn't identify a single node and later
+  rows would overwrite the properties of earlier rows. Rows repeating a key with the same values, as in denormalized
+  files, are not violations.
+* `invalid_type`: a value can't be cast to its property's Neo4j type, so it would be stored as null.
+* `missing_endpoint`: a relationship row has an endpoint key without a node, so the relationship would not be created.
+  Null endpoint keys are not violations, since relationships are optional.
+
+Node keys are collected from all sources before relationship endpoints are checked, so the sources of relationships
+are read twice.
+"""
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from ..data_model.core.data_model import DataModel
+from ..data_model.core.node import Node
+from ..data_model.core.relationship import Relationship
+from ..data_source.data_source import DataSource
+from .bulk_import import format_import_values
+from .cypher import get_endpoint_key_mappings
+from .ingestion_generator import to_parameter_rows
+from .scheduling import normalize_key_column
+
+PreflightCheck = Literal[
+    "missing_column", "null_key", "duplicate_key", "invalid_type", "missing_endpoint"
+]
+
+# a DataFrame, a file path, a `DataSource`, or chunks. A function returning chunks can be read more than once
+PreflightSource = Union[
+    pd.DataFrame,
+    str,
+    DataSource,
+    Iterable[pd.DataFrame],
+    Callable[[], Iterable[pd.DataFrame]],
+]
+
+_TEMPORAL_TYPES = {
+    "DATE",
+    "LOCAL DATETIME",
+    "ZONED DATETIME",
+    "LOCAL TIME",
+    "ZONED TIME",
+    "DURATION",
+}
+
+
+class PreflightViolation(BaseModel):
+    """
+    A data quality violation.
+
+    Attributes
+    ----------
+    check : PreflightCheck
+        The failed check.
+    entity : str
+        The node label or relationship pattern.
+    source_name : str
+        The source file.
+    columns : List[str]
+        The checked columns.
+    count : int
+        The number of violating rows.
+    samples : List[Dict[str, Any]]
+        Some violating rows, with their position in the source as `row` and their values of `columns`.
+    """
+
+    check: PreflightCheck
+    entity: str
+    source_name: str
+    columns: List[str]
+    count: int
+    samples: List[Dict[str, Any]] = list()
+
+    def __str__(self) -> str:
+        return f"{self.check}: {self.entity} in {self.source_name} ({', '.join(self.columns)}): {self.count:,} rows"
+
+
+class PreflightReport(BaseModel):
+    """
+    The result of the pre-flight checks.
+
+    Attributes
+    ----------
+    violations : List[PreflightViolation]
+        The violations, in check order.
+    rows_checked : Dict[str, int]
+        The number of rows read per source file.
+    """
+
+    violations: List[PreflightViolation]
+    rows_checked: Dict[str, int]
+
+    @property
+    def passed(self) -> bool:
+        """Whether there are no violations."""
+
+        return not self.violations
+
+    def __str__(self) -> str:
+        rows = sum(self.rows_checked.values())
+        if self.passed:
+            return f"Passed: {rows:,} rows in {len(self.rows_checked)} sources"
+        return "\n".join(
+            [
+                f"Failed: {len(self.violations)} violations in {rows:,} rows",
+                *[f"* {v}" for v in self.violations],
+            ]
+        )
+
+
+def run_preflight_checks(
+    data_model: DataModel,
+    data: Dict[str, PreflightSource],
+    csv_name: str = "",
+    chunk_size: int = 100_000,
+    sample_size: int = 5,
+) -> PreflightReport:
+    """
+    Check that source data can be loaded as the data model describes.
+
+    Parameters
+    ----------
+    data_model : DataModel
+        The data model.
+    data : Dict[str, PreflightSource]
+        A mapping of file name to a DataFrame, file path, `DataSource`, chunks or a function returning chunks.
+        The sources of relationships are read twice, so they can't be one-time iterators.
+        Use `csv_name` for nodes and relationships with the default "file" source name.
+    csv_name : str, optional
+        The file of nodes and relationships whose `source_name` is the default "file", by default ""
+    chunk_size : int, optional
+        The number of rows read at a time from DataFrames and files, by default 100,000
+    sample_size : int, optional
+        The max number of samples per violation, by default 5
+
+    Returns
+    -------
+    PreflightReport
+        The violations.
+
+    Raises
+    ------
+    ValueError
+        If the source of a node or relationship is not in `data`, or the source of a relationship is a one-time iterator.
+    """
+
+    def source_file(source_name: str) -> str:
+        return csv_name if source_name == "file" else source_name
+
+    nodes: Dict[str, List[Node]] = dict()
+    relationships: Dict[str, List[Relationship]] = dict()
+    for node in data_model.nodes:
+        nodes.setdefault(source_file(node.source_name), list()).append(node)
+    for rel in data_model.relationships:
+        relationships.setdefault(source_file(rel.source_name), list()).append(rel)
+
+    missing_sources = sorted((set(nodes) | set(relationships)) - set(data))
+    if missing_sources:
+        raise ValueError(
+            f"The data model reads the sources {missing_sources}, which are not in the data {sorted(data)}."
+        )
+
+    for source in relationships:
+        if isinstance(data[source], Iterator):
+            raise ValueError(
+                f"The source {source} has relationships and is read twice. Provide a function that returns its chunks instead of an iterator."
+            )
+
+    violations: Dict[Tuple[str, str, str, Tuple[str, ...]], PreflightViolation] = dict()
+    label_keys = {label: _HashIndex() for label in data_model.node_labels}
+    # the property values of each key, per label and property names, so conflicts are found across sources
+    label_values: Dict[Tuple[str, Tuple[str, ...]], _HashIndex] = dict()
+    rows_checked: Dict[str, int] = dict()
+
+    def record(
+        check: PreflightCheck,
+        entity: str,
+        source: str,
+        chunk: pd.DataFrame,
+        columns: List[str],
+        mask: np.ndarray,
+    ) -> None:
+        count = int(mask.sum())
+        if not count:
+            return
+        violation = violations.setdefault(
+            (check, entity, source, tuple(columns)),
+            PreflightViolation(
+                check=check,
+                entity=entity,
+                source_name=source,
+                columns=columns,
+                count=0,
+            ),
+        )
+        violation.count += count
+        remaining = sample_size - len(violation.samples)
+        if remaining > 0:
+            samples = chunk.loc[mask, columns].iloc[:remaining]
+            violation.samples.extend(
+                [
+                    {"row": int(row), **values}
+                    for row, values in zip(samples.index, to_parameter_rows(samples))
+                ]
+            )
+
+    # first pass: node keys, property types and the node key sets of each label
+    for source in sorted(set(nodes) | set(relationships)):
+        source_nodes = nodes.get(source, list())
+        source_rels = relationships.get(source, list())
+        columns = _model_columns(source_nodes, source_rels, data_model)
+        rows_checked[source] = 0
+        missing_columns: List[str] = list()
+        for chunk in _iter_chunks(data[source], columns, chunk_size):
+            rows_checked[source] += len(chunk)
+            missing_columns = [c for c in columns if c not in chunk.columns]
+            chunk = chunk.reindex(columns=columns)
+
+            for node in source_nodes:
+                key_columns = [p.column_mapping for p in node.node_keys]
+                if not key_columns:
+                    continue
+                null_keys = chunk[key_columns].isna().any(axis=1).to_numpy()
+                record("null_key", node.label, source, chunk, key_columns, null_keys)
+
+                keyed = chunk[~null_keys]
+                key_hashes = _hash_rows(keyed, key_columns)
+                label_keys[node.label].add(key_hashes)
+
+                value_properties = sorted(
+                    node.nonunique_properties, key=lambda p: p.name
+                )
+                value_columns = [p.column_mapping for p in value_properties]
+                if value_columns:
+                    values = label_values.setdefault(
+                        (node.label, tuple(p.name for p in value_properties)),
+                        _HashIndex(),
+                    )
+                    conflicts = values.add_conflicts(
+                        key_hashes, _hash_rows(keyed, value_columns)
+                    )
+                    record(
+                        "duplicate_key",
+                        node.label,
+                        source,
+                        keyed,
+                        [*key_columns, *value_columns],
+                        conflicts,
+                    )
+
+            for entity, properties in [
+                *[(n.label, n.properties) for n in source_nodes],
+                *[(str(r), r.properties) for r in source_rels],
+            ]:
+                for p in properties:
+                    invalid = cast_failures(chunk[p.column_mapping], p.type)
+                    record(
+                        "invalid_type",
+                        entity,
+                        source,
+                        chunk,
+                        [p.column_mapping],
+                        invalid,
+                    )
+
+        for entity, entity_columns in [
+            *[(n.label, _model_columns([n], list(), data_model)) for n in source_nodes],
+            *[(str(r), _model_columns(list(), [r], data_model)) for r in source_rels],
+        ]:
+            for column in [c for c in entity_columns if c in missing_columns]:
+                violations[("missing_column", entity, source, (column,))] = (
+                    PreflightViolation(
+                        check="missing_column",
+                        entity=entity,
+                        source_name=source,
+                        columns=[column],
+                        count=rows_checked[source],
+                    )
+                )
+
+    # second pass: relationship endpoints
+    node_dict = data_model.node_dict
+    for source, source_rels in sorted(relationships.items()):
+        columns = _model_columns(list(), source_rels, data_model)
+        for chunk in _iter_chunks(data[source], columns, chunk_size):
+            chunk = chunk.reindex(columns=columns)
+            for rel in source_rels:
+                endpoint_mappings = get_endpoint_key_mappings(
+                    node_dict[rel.source], node_dict[rel.target], rel
+                )
+                for label, mapping in zip([rel.source, rel.target], endpoint_mappings):
+                    key_columns = list(mapping.values())
+                    if not key_columns:
+                        continue
+                    keyed = chunk[chunk[key_columns].notna().all(axis=1).to_numpy()]
+                    missing = ~label_keys[label].contains(
+                        _hash_rows(keyed, key_columns)
+                    )
+                    record(
+                        "missing_endpoint",
+                        str(rel),
+                        source,
+                        keyed,
+                        key_columns,
+                        missing,
+                    )
+
+    return PreflightReport(
+        violations=list(violations.values()), rows_checked=rows_checked
+    )
+
+
+def cast_failures(column: pd.Series, neo4j_type: str) -> np.ndarray:
+    """
+    Find the values that can't be cast to a Neo4j type, so they would be stored as null.
+
+    Parameters
+    ----------
+    column : pd.Series
+        The values.
+    neo4j_type : str
+        The Neo4j type of the property.
+
+    Returns
+    -------
+    np.ndarray
+        Whether each value is present and fails to cast.
+    """
+
+    if neo4j_type in {"INTEGER", "FLOAT", "BOOLEAN"}:
+        if neo4j_type != "BOOLEAN" and pd.api.types.is_numeric_dtype(column):
+            return np.zeros(len(column), dtype=bool)
+        cast = format_import_values(column, neo4j_type)
+    elif neo4j_type in _TEMPORAL_TYPES:
+        if not (
+            pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column)
+        ):
+            return np.zeros(len(column), dtype=bool)
+        values = column.astype(str).where(column.notna())
+        if neo4j_type == "DURATION":
+            cast = pd.to_timedelta(values, errors="coerce")
+        elif neo4j_type in {"LOCAL TIME", "ZONED TIME"}:
+            cast = _parse_times(values)
+        else:
+            # values with different offsets only parse together when converted to UTC
+            cast = pd.to_datetime(values, errors="coerce", format="ISO8601", utc=True)
+    else:
+        return np.zeros(len(column), dtype=bool)
+
+    return np.asarray(column.notna() & pd.Series(cast, index=column.index).isna())
+
+
+def _parse_times(values: pd.Series) -> pd.Series:
+    """Parse times of day, such as "12:30:00" or "12:30:00+01:00". Invalid times are missing."""
+
+    times = pd.to_timedelta(
+        values.str.replace(r"(Z|[+-]\d{2}:?\d{2})$", "", regex=True), errors="coerce"
+    )
+    return times.where(times < pd.Timedelta(days=1))
+
+
+def _model_columns(
+    nodes: List[Node], relationships: List[Relationship], data_model: DataModel
+) -> List[str]:
+    """The columns of a source that the data model reads."""
+
+    node_dict = data_model.node_dict
+    columns = [p.column_mapping for n in nodes for p in n.properties]
+    for rel in relationships:
+        for mapping in get_endpoint_key_mappings(
+            node_dict[rel.source], node_dict[rel.target], rel
+        ):
+            columns.extend(mapping.values())
+        columns.extend([p.column_mapping for p in rel.properties])
+    return list(dict.fromkeys(columns))
+
+
+def _iter_chunks(
+    source: PreflightSource, columns: List[str], chunk_size: int
+) -> Iterator[pd.DataFrame]:
+    """Read a source in chunks, indexed by row position."""
+
+    if isinstance(source, str):
+        source = DataSource(file_path=source)
+
+    if isinstance(source, DataSource):
+        chunks: Iterable[pd.DataFrame] = source.iter_chunks(
+            chunk_size=chunk_size, columns=columns
+        )
+    elif isinstance(source, pd.DataFrame):
+        chunks = (
+            source.iloc[start : start + chunk_size]
+            for start in range(0, len(source), chunk_size)
+        )
+    elif callable(source):
+        chunks = source()
+    else:
+        chunks = source
+
+    position = 0
+    for chunk in chunks:
+        chunk = chunk[[c for c in chunk.columns if c in set(columns)]]
+        chunk.index = pd.RangeIndex(position, position + len(chunk))
+        position += len(chunk)
+        yield chunk
+
+
+def _hash_rows(data: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """Hash the values of some columns of each row. Values are hashed by their string form."""
+
+    if not len(data):
+        return np.zeros(0, dtype=np.uint64)
+    keys = pd.DataFrame(
+        {i: normalize_key_column(data[c]) for i, c in enumerate(columns)},
+        index=data.index,
+    )
+    # keys are mostly distinct, so hashing each value is faster than hashing categories
+    return np.asarray(pd.util.hash_pandas_object(keys, index=False, categorize=False))
+
+
+class _HashIndex:
+    """
+    A set of 64-bit hashes, each with an optional 64-bit value, stored in sorted arrays.
+    Added hashes form a new array, and arrays of similar sizes are merged, so adding n hashes takes O(n log n) time
+    and a lookup searches O(log n) arrays.
+    """
+
+    def __init__(self) -> None:
+        self._levels: List[Tuple[np.ndarray, np.ndarray]] = list()
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Whether each hash is in the set."""
+
+        return self._lookup(hashes)[0]
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add hashes to the set."""
+
+        unique = np.unique(hashes)
+        unique = unique[~self.contains(unique)]
+        self._insert(unique, np.zeros(len(unique), dtype=np.uint64))
+
+    def add_conflicts(self, hashes: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """
+        Add hashes with values, keeping the first value of each hash.
+        Returns whether each hash already has a different value, in the set or earlier in `hashes`.
+        """
+
+        if not len(hashes):
+            return np.zeros(0, dtype=bool)
+
+        first = pd.DataFrame({"h": hashes, "v": values}).drop_duplicates("h")
+        found, stored = self._lookup(hashes)
+        chunk_values = first["v"].to_numpy()[pd.Index(first["h"]).get_indexer(hashes)]
+        expected = np.where(found, stored, chunk_values)
+
+        new = ~self._lookup(first["h"].to_numpy())[0]
+        self._insert(first["h"].to_numpy()[new], first["v"].to_numpy()[new])
+        return np.asarray(values != expected)
+
+    def _lookup(self, hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Whether each hash is in the set, and its value. Hashes are searched in sorted order, which is cache friendly."""
+
+        order = np.argsort(hashes)
+        sorted_hashes = hashes[order]
+        sorted_found = np.zeros(len(hashes), dtype=bool)
+        sorted_values = np.zeros(len(hashes), dtype=np.uint64)
+        for keys, level_values in self._levels:
+            positions = np.minimum(np.searchsorted(keys, sorted_hashes), len(keys) - 1)
+            hit = ~sorted_found & (keys[positions] == sorted_hashes)
+            sorted_values[hit] = level_values[positions[hit]]
+            sorted_found |= hit
+
+        found = np.empty(len(hashes), dtype=bool)
+        values = np.empty(len(hashes), dtype=np.uint64)
+        found[order] = sorted_found
+        values[order] = sorted_values
+        return found, values
+
+    def _insert(self, hashes: np.ndarray, values: np.ndarray) -> None:
+        """Insert hashes that are not in the set."""
+
+        if not len(hashes):
+            return
+        order = np.argsort(hashes)
+        self._levels.append((hashes[order], values[order]))
+        while len(self._levels) > 1 and len(self._levels[-2][0]) <= 2 * len(
+            self._levels[-1][0]
+        ):
+            (keys_a, values_a), (keys_b, values_b) = self._levels[-2:]
+            keys = np.concatenate([keys_a, keys_b])
+            merged_values = np.concatenate([values_a, values_b])
+            order = np.argsort(keys, kind="stable")
+            self._levels[-2:] = [(keys[order], merged_values[order])]
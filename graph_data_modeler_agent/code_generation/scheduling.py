@@ -0,0 +1,154 @@
+"""
+Schedule relationship rows so that concurrent transactions never lock the same nodes.
+
+Merging a relationship locks its source and target nodes, so parallel relationship batches that share nodes wait on
+each other and can deadlock. Rows are partitioned by a hash of their source and target node keys into `n` source
+buckets and `n` target buckets, giving an `n` x `n` grid of partitions. The partitions are run in `n` rounds, where
+partition `(s, t)` runs in round `(s + t) % n`. Within a round, each source bucket and each target bucket is in exactly
+one partition, so the partitions touch disjoint nodes and can run concurrently.
+
+When both endpoints have the same label, a node can be the source of one row and the target of another, so partitions
+`(s, t)` and `(t, s)` touch the same nodes. They fall in the same round and are merged, which keeps the partitions of a
+round disjoint.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def assign_endpoint_buckets(
+    data: pd.DataFrame,
+    source_columns: List[str],
+    target_columns: List[str],
+    num_buckets: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assign each row to a source bucket and a target bucket by the hash of its endpoint node keys.
+    Equal keys are assigned the same bucket whichever columns they are in, so a node matched on its key column in one
+    row and on an alias column in another row is always in the same bucket.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The relationship rows.
+    source_columns : List[str]
+        The columns of the source node keys, in key order.
+    target_columns : List[str]
+        The columns of the target node keys, in key order.
+    num_buckets : int
+        The number of buckets per endpoint.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The source and target bucket of each row.
+    """
+
+    return (
+        _hash_buckets(data, source_columns, num_buckets),
+        _hash_buckets(data, target_columns, num_buckets),
+    )
+
+
+def schedule_relationship_rows(
+    data: pd.DataFrame,
+    source_columns: List[str],
+    target_columns: List[str],
+    num_buckets: int,
+    same_label: bool = False,
+) -> List[List[pd.DataFrame]]:
+    """
+    Partition relationship rows into rounds of partitions that touch disjoint nodes.
+    Rounds must run one after another, while the partitions of a round can run concurrently.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The relationship rows.
+    source_columns : List[str]
+        The columns of the source node keys, in key order.
+    target_columns : List[str]
+        The columns of the target node keys, in key order.
+    num_buckets : int
+        The number of buckets per endpoint, which is also the number of rounds and the max number of partitions per
+        round. One bucket schedules all rows in a single partition.
+    same_label : bool, optional
+        Whether the source and target nodes have the same label, by default False
+
+    Returns
+    -------
+    List[List[pd.DataFrame]]
+        The non empty partitions of each round. Partitions keep the row order of `data`.
+    """
+
+    if num_buckets <= 1 or len(data) == 0:
+        return [[data]] if len(data) else list()
+
+    source_buckets, target_buckets = assign_endpoint_buckets(
+        data, source_columns, target_columns, num_buckets
+    )
+    if same_label:
+        source_buckets, target_buckets = (
+            np.minimum(source_buckets, target_buckets),
+            np.maximum(source_buckets, target_buckets),
+        )
+
+    cells = source_buckets * num_buckets + target_buckets
+    rounds: Dict[int, List[pd.DataFrame]] = dict()
+    for cell, positions in _group_positions(cells).items():
+        source, target = divmod(cell, num_buckets)
+        rounds.setdefault((source + target) % num_buckets, list()).append(
+            data.iloc[positions]
+        )
+    return [rounds[r] for r in sorted(rounds)]
+
+
+def _hash_buckets(
+    data: pd.DataFrame, columns: List[str], num_buckets: int
+) -> np.ndarray:
+    """Hash the key columns of each row into a bucket. Values are hashed by their string form."""
+
+    keys = pd.DataFrame(
+        {i: normalize_key_column(data[c]) for i, c in enumerate(columns)},
+        index=data.index,
+    )
+    hashes = np.asarray(pd.util.hash_pandas_object(keys, index=False))
+    return (hashes % np.uint64(num_buckets)).astype(np.int64)
+
+
+def normalize_key_column(column: pd.Series) -> pd.Series:
+    """
+    Convert key values to strings, so the same key is identical in columns of different dtypes.
+    Whole floats are converted as integers, since integer columns with missing values are read as floats.
+    Each value is converted on its own, so a key gets the same string in every chunk of a column.
+
+    Parameters
+    ----------
+    column : pd.Series
+        The key values.
+
+    Returns
+    -------
+    pd.Series
+        The key values as strings. Missing values stay missing.
+    """
+
+    strings = column.astype(str)
+    if pd.api.types.is_float_dtype(column):
+        # whole floats within the int64 range
+        whole = column.eq(column.round()) & column.abs().lt(2**63)
+        if whole.any():
+            strings = strings.mask(whole, column[whole].astype(np.int64).astype(str))
+    return strings.where(column.notna())
+
+
+def _group_positions(labels: np.ndarray) -> Dict[int, np.ndarray]:
+    """Group the positions of an integer array by value, in order of value. Positions keep their order."""
+
+    order = np.argsort(labels, kind="stable")
+    values, starts = np.unique(labels[order], return_index=True)
+    return {
+        int(v): positions for v, positions in zip(values, np.split(order, starts[1:]))
+    }
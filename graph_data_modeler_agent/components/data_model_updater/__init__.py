@@ -1,4 +1,9 @@
 from .brainstorm_updates import create_brainstorm_updates_single_source_node
+from .reuse_data_model import create_reuse_data_model_single_source_node
 from .update_data_model import create_update_data_model_single_source_node
 
-__all__ = ["create_brainstorm_updates_single_source_node", "create_update_data_model_single_source_node"]
+__all__ = [
+    "create_brainstorm_updates_single_source_node",
+    "create_reuse_data_model_single_source_node",
+    "create_update_data_model_single_source_node",
+]
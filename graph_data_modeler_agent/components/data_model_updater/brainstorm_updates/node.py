@@ -1,6 +1,11 @@
 from typing import Any, Callable, Coroutine
 
-from instructor import AsyncInstructor
+from graph_data_modeler_agent.llm import (
+    LLMClientLike,
+    ModelLike,
+    as_llm_client,
+    create_routed,
+)
 
 from ..state import DataModelUpdaterSingleSourceMainState
 from .models import DataModelUpdaterBrainstormResponse
@@ -8,12 +13,14 @@ from .prompts import create_brainstorm_updates_to_data_model_messages
 from ..models import UpdateDataModelContext
 
 def create_brainstorm_updates_single_source_node(
-    llm_client: AsyncInstructor, model: str, max_retries: int = 3
+    llm_client: LLMClientLike, model: ModelLike, max_retries: int = 3
 ) -> Callable[[DataModelUpdaterSingleSourceMainState], Coroutine[Any, Any, dict[str, Any]]]:
     """
     Create the brainstorm updates to the data model node.
     """
 
+    client = as_llm_client(llm_client)
+
     async def brainstorm_updates_to_data_model(
         state: DataModelUpdaterSingleSourceMainState,
     ) -> dict[str, Any]:
@@ -35,8 +42,11 @@ def create_brainstorm_updates_single_source_node(
         )
         messages = create_brainstorm_updates_to_data_model_messages(state, context)
 
-        response = await llm_client.chat.completions.create(
-            model=model,
+        response = await create_routed(
+            client,
+            model,
+            "brainstorm_updates",
+            state["table_schema"],
             response_model=DataModelUpdaterBrainstormResponse,
             messages=messages,
             max_retries=max_retries,
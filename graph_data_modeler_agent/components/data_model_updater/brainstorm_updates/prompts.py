@@ -1,4 +1,8 @@
-from ....data_dictionary.data_dictionary import TableSchema
+from typing import Optional
+
+from ....change_detection.detection import TableChanges
+from ...encoding import DATA_MODEL_NOTATION, encode_data_model
+from ...prompts import PromptSection, assemble_messages, create_table_context_sections
 from ..models import UpdateDataModelContext
 from ..state import DataModelUpdaterSingleSourceMainState
 from ...data_modeler.generate_data_model.prompts import _format_rules
@@ -11,62 +15,46 @@ def create_brainstorm_updates_to_data_model_messages(
     Create the messages for the brainstorm updates to the data model node.
     """
 
-    system_message = "You are a professional graph data modeler. You are a core member of a team that will transform relational table data into a graph data model."
-
-    user_message = """I would like you to brainstorm updates to a graph data model based on this provided information. 
-This suggestions should satisfy the use cases and rules provided. 
-Only information from the provided columns may be used to update the data model.
-
----
-
-**Valid Columns**
-{valid_columns}
-
-**Column Descriptions**
-{column_descriptions}
-
-**Data Model**
-{data_model}
-
---- 
-
-Focus on the following use cases!
-**Use Cases**
-{use_cases}
-
-**Rules**
-{rules}
-
-
-What nodes or relationships should be added?
+    sections = [
+        PromptSection(
+            title="Data Model",
+            content=f"{DATA_MODEL_NOTATION}\n{encode_data_model(state['data_model'])}",
+        )
+    ]
+    changed_columns = _format_changed_columns(state.get("table_changes"))
+    if changed_columns:
+        sections.append(PromptSection(title="Changed Columns", content=changed_columns))
+    sections.append(PromptSection(title="Rules", content=_format_rules(context)))
+
+    return assemble_messages(
+        create_table_context_sections(
+            state["table_schema"],
+            state.get("use_cases", "No use cases provided."),
+            state["discovery"].summary,
+        ),
+        task="""I would like you to brainstorm updates to a graph data model based on this provided information. 
+This suggestions should satisfy the use cases and rules provided. Focus on the use cases!
+Only information from the provided columns may be used to update the data model.""",
+        sections=sections,
+        closing="""What nodes or relationships should be added?
 What nodes or relationships should be removed?
 How can the this model be improved?
-Suggested Updates:
-"""
-
-    return [
-        {"role": "system", "content": system_message},
-        {
-            "role": "user",
-            "content": user_message.format(
-                rules=_format_rules(context),
-                valid_columns=state["table_schema"].column_names,
-                column_descriptions=_format_table_schema(state["table_schema"]),
-                use_cases=state.get("use_cases", "No use cases provided."),
-                data_model=state["data_model"].get_schema(),
-               
-            ),
-        },
-    ]
+Suggested Updates:""",
+    )
 
 
-def _format_table_schema(table_schema: TableSchema) -> str:
+def _format_changed_columns(table_changes: Optional[TableChanges]) -> str:
     """
-    Format the table schema for the user message.
+    Format the changed columns for the user message. Empty if the whole table should be considered.
     """
 
-    return "\n".join(
-        [f"* {c}: {table_schema.get_description(c)}" for c in table_schema.column_names]
+    if table_changes is None or not table_changes.affected_columns:
+        return ""
+
+    return (
+        "The data model was created before these columns were added or changed. "
+        "Only suggest updates for these columns and keep the rest of the data model.\n"
+        + "\n".join([f"* {c}" for c in table_changes.affected_columns])
     )
 
 
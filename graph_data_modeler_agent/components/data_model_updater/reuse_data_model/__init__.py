@@ -0,0 +1,3 @@
+from .node import create_reuse_data_model_single_source_node
+
+__all__ = ["create_reuse_data_model_single_source_node"]
@@ -0,0 +1,71 @@
+from typing import Any, Callable, Coroutine, Dict
+
+from pydantic import ValidationError
+
+from ....change_detection.reuse import lost_key_labels, update_data_model
+from ...state import SingleSourceMainState
+
+
+def create_reuse_data_model_single_source_node() -> (
+    Callable[[SingleSourceMainState], Coroutine[Any, Any, dict[str, Any]]]
+):
+    """
+    Create the reuse data model node.
+    """
+
+    async def reuse_data_model_single_source(
+        state: SingleSourceMainState,
+    ) -> dict[str, Any]:
+        """
+        Reuse the previous data model for a changed table. Renamed columns are remapped and dropped columns are removed,
+        so only the affected columns are left for the data model updater.
+        If a node lost its key column or the updated data model is invalid, the table is modeled again.
+        """
+
+        previous_data_model = state.get("previous_data_model")
+        changes = state.get("table_changes")
+        if previous_data_model is None or changes is None:
+            return {"next_action": "data_modeler_agent", "steps": ["reuse_data_model"]}
+
+        table_schema = state["table_schema"]
+        # the validation context of the data model updater
+        context: Dict[str, Any] = {
+            "table_schema": table_schema,
+            "valid_columns": table_schema.column_names,
+            "allow_duplicate_column_mappings": False,
+            "table_column_listings": {table_schema.name: table_schema.column_names},
+            "enforce_uniqueness": True,
+            "apply_neo4j_naming_conventions": True,
+            "allow_parallel_relationships": False,
+            "allow_relationships_between_same_node_label": True,
+            "valid_sources": [table_schema.name],
+        }
+
+        lost_keys = lost_key_labels(previous_data_model, changes)
+        if lost_keys:
+            return {
+                "errors": [
+                    f"The key columns of {', '.join(lost_keys)} were dropped. The data model is generated again."
+                ],
+                "next_action": "data_modeler_agent",
+                "steps": ["reuse_data_model"],
+            }
+
+        try:
+            data_model = update_data_model(previous_data_model, changes, context)
+        except ValidationError as e:
+            return {
+                "errors": [str(e)],
+                "next_action": "data_modeler_agent",
+                "steps": ["reuse_data_model"],
+            }
+
+        return {
+            "data_model": data_model,
+            "next_action": (
+                "data_modeler_update_agent" if changes.affected_columns else "__end__"
+            ),
+            "steps": ["reuse_data_model"],
+        }
+
+    return reuse_data_model_single_source
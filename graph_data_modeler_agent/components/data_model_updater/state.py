@@ -1,8 +1,9 @@
 from operator import add
-from typing import Annotated, List, TypedDict
+from typing import Annotated, List, Optional, TypedDict
 
 from pydantic import Field
 
+from ...change_detection.detection import TableChanges
 from ...data_dictionary.data_dictionary import TableSchema
 from ...data_model.core.data_model import DataModel
 from .brainstorm_updates.models import DataModelUpdaterBrainstormResponse
@@ -26,6 +27,10 @@ class DataModelUpdaterSingleSourceInputState(TypedDict):
         ..., description="The discovery of the data."
     )
     additional_context: str = Field(..., description="Additional context.")
+    table_changes: Optional[TableChanges] = Field(
+        None,
+        description="The changes to the table since the data model was created. If provided, only the affected columns are considered.",
+    )
     data_model_updater_steps: Annotated[List[str], add] = Field(
         ..., description="The data model updater steps."
     )
@@ -43,6 +48,7 @@ class DataModelUpdaterSingleSourceMainState(TypedDict):
     use_cases: List[str]
     discovery: DiscoveryResponse
     additional_context: str
+    table_changes: Optional[TableChanges]
     data_model_updater_steps: Annotated[List[str], add]
     next_data_model_updater_action: str
 
@@ -1,10 +1,15 @@
 import json
 from typing import Any, Callable, Coroutine
 
-from instructor import AsyncInstructor
 from instructor.exceptions import InstructorRetryException
 
 from graph_data_modeler_agent.data_model.core.data_model import DataModel
+from graph_data_modeler_agent.llm import (
+    LLMClientLike,
+    ModelLike,
+    as_llm_client,
+    create_routed,
+)
 
 from ..models import UpdateDataModelContext
 from ..state import DataModelUpdaterSingleSourceMainState
@@ -12,12 +17,14 @@ from .prompts import create_update_data_model_single_source_messages
 
 
 def create_update_data_model_single_source_node(
-    llm_client: AsyncInstructor, model: str
+    llm_client: LLMClientLike, model: ModelLike
 ) -> Callable[[DataModelUpdaterSingleSourceMainState], Coroutine[Any, Any, dict[str, Any]]]:
     """
     Create the update data model node.
     """
 
+    client = as_llm_client(llm_client)
+
     async def update_data_model_single_source(
         state: DataModelUpdaterSingleSourceMainState,
     ) -> dict[str, Any]:
@@ -47,8 +54,11 @@ def create_update_data_model_single_source_node(
         response = None
 
         try:
-            response = await llm_client.chat.completions.create(
-                model=model,
+            response = await create_routed(
+                client,
+                model,
+                "update_data_model",
+                state["table_schema"],
                 response_model=DataModel,
                 messages=messages,
                 context=context,
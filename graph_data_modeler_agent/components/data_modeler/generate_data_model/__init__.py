@@ -1,3 +1,17 @@
+from .candidates import (
+    CandidateScorer,
+    DataModelCandidate,
+    generate_data_model_candidates,
+    score_data_model_candidate,
+    validate_data_model_candidate,
+)
 from .node import create_generate_data_model_single_source_node
 
-__all__ = ["create_generate_data_model_single_source_node"]
+__all__ = [
+    "CandidateScorer",
+    "DataModelCandidate",
+    "create_generate_data_model_single_source_node",
+    "generate_data_model_candidates",
+    "score_data_model_candidate",
+    "validate_data_model_candidate",
+]
@@ -0,0 +1,240 @@
+"""
+Generate several data model candidates concurrently and select the best one locally.
+
+A single data model generation that fails validation is retried by instructor, one round-trip after another, so a hard
+table can take up to four sequential calls. Instead, one candidate per temperature is requested concurrently, each with
+a single attempt. Every candidate is validated locally against the `GenerateDataModelContext` and scored, and the
+candidate with the highest score is used. The wall-clock cost is the slowest of one round-trip per candidate.
+
+The default score prefers candidates with fewer validation errors, then candidates that map more of the valid columns.
+"""
+
+import asyncio
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from instructor.exceptions import InstructorRetryException
+from pydantic import BaseModel, ValidationError
+
+from graph_data_modeler_agent.data_dictionary.table_schema import TableSchema
+from graph_data_modeler_agent.data_model.core.data_model import DataModel
+from graph_data_modeler_agent.data_model.core.node import Node
+from graph_data_modeler_agent.data_model.core.relationship import Relationship
+from graph_data_modeler_agent.llm import LLMClient, ModelLike, create_routed
+
+from ..models import GenerateDataModelContext
+
+
+class DataModelCandidate(BaseModel):
+    """
+    A data model generated at one temperature.
+
+    Attributes
+    ----------
+    temperature : float
+        The temperature of the request.
+    arguments : Optional[Dict[str, Any]]
+        The data model arguments returned by the LLM, or None if the request failed.
+    data_model : Optional[DataModel]
+        The data model. If there are errors, it only holds the nodes and relationships that are valid on their own.
+        None if the request failed.
+    errors : List[str]
+        The validation errors, or the error of the request.
+    score : float
+        The score of the candidate. Higher is better.
+    """
+
+    temperature: float
+    arguments: Optional[Dict[str, Any]] = None
+    data_model: Optional[DataModel] = None
+    errors: List[str] = list()
+    score: float = float("-inf")
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the data model passed validation."""
+
+        return self.data_model is not None and not self.errors
+
+
+CandidateScorer = Callable[[DataModelCandidate, GenerateDataModelContext], float]
+
+
+def score_data_model_candidate(
+    candidate: DataModelCandidate, context: GenerateDataModelContext
+) -> float:
+    """
+    Score a data model candidate.
+    Each validation error costs one point and a data model with fewer than two nodes costs one point.
+    The fraction of valid columns mapped to a property, between 0 and 1, is added.
+
+    Parameters
+    ----------
+    candidate : DataModelCandidate
+        The candidate.
+    context : GenerateDataModelContext
+        The validation context.
+
+    Returns
+    -------
+    float
+        The score. Failed requests score negative infinity.
+    """
+
+    if candidate.arguments is None:
+        return float("-inf")
+
+    nodes = _as_list(candidate.arguments.get("nodes"))
+    mapped = {
+        p.get("column_mapping")
+        for entity in nodes + _as_list(candidate.arguments.get("relationships"))
+        for p in _as_list(entity.get("properties"))
+    }
+    valid_columns = set(context["valid_columns"])
+    coverage = (
+        len(mapped & valid_columns) / len(valid_columns) if valid_columns else 0.0
+    )
+
+    return coverage - len(candidate.errors) - int(len(nodes) < 2)
+
+
+def validate_data_model_candidate(
+    arguments: Dict[str, Any], context: GenerateDataModelContext
+) -> Tuple[DataModel, List[str]]:
+    """
+    Validate the data model arguments returned by the LLM.
+
+    Parameters
+    ----------
+    arguments : Dict[str, Any]
+        The data model arguments.
+    context : GenerateDataModelContext
+        The validation context.
+
+    Returns
+    -------
+    Tuple[DataModel, List[str]]
+        The data model and its validation errors.
+        If there are errors, the data model holds only the nodes and relationships that are valid on their own.
+    """
+
+    try:
+        return DataModel.model_validate(arguments, context=context), list()
+    except ValidationError as e:
+        return DataModel.model_construct(
+            nodes=_validate_entities(Node, arguments.get("nodes"), context),
+            relationships=_validate_entities(
+                Relationship, arguments.get("relationships"), context
+            ),
+        ), [
+            f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+            if error["loc"]
+            else error["msg"]
+            for error in e.errors()
+        ]
+
+
+async def generate_data_model_candidates(
+    client: LLMClient,
+    model: ModelLike,
+    table_schema: TableSchema,
+    messages: List[Dict[str, Any]],
+    context: GenerateDataModelContext,
+    temperatures: List[float],
+    score_candidate: CandidateScorer = score_data_model_candidate,
+) -> List[DataModelCandidate]:
+    """
+    Request one data model per temperature concurrently, then validate and score each one.
+
+    Parameters
+    ----------
+    client : LLMClient
+        The client.
+    model : ModelLike
+        The model name, or a `ModelRouter`.
+    table_schema : TableSchema
+        The table.
+    messages : List[Dict[str, Any]]
+        The messages.
+    context : GenerateDataModelContext
+        The validation context.
+    temperatures : List[float]
+        The temperature of each candidate.
+    score_candidate : CandidateScorer, optional
+        The scoring function, by default `score_data_model_candidate`
+
+    Returns
+    -------
+    List[DataModelCandidate]
+        The candidates, sorted from the highest score. Ties keep the order of `temperatures`.
+    """
+
+    async def generate(temperature: float) -> DataModelCandidate:
+        candidate = DataModelCandidate(temperature=temperature)
+        try:
+            response = await create_routed(
+                client,
+                model,
+                "generate_data_model",
+                table_schema,
+                response_model=DataModel,
+                messages=messages,
+                context=context,
+                temperature=temperature,
+                # a single attempt, invalid candidates are scored instead of retried
+                max_retries=0,
+            )
+            candidate.arguments = response.model_dump()
+            candidate.data_model = response
+        except InstructorRetryException as e:
+            arguments = _completion_arguments(e.last_completion)
+            if arguments is None:
+                candidate.errors = [str(e)]
+            else:
+                candidate.arguments = arguments
+                data_model, errors = validate_data_model_candidate(arguments, context)
+                candidate.data_model = data_model
+                candidate.errors = errors
+        except Exception as e:
+            candidate.errors = [str(e)]
+
+        candidate.score = score_candidate(candidate, context)
+        return candidate
+
+    candidates = await asyncio.gather(*[generate(t) for t in temperatures])
+    return sorted(candidates, key=lambda c: c.score, reverse=True)
+
+
+def _completion_arguments(completion: Any) -> Optional[Dict[str, Any]]:
+    """The arguments of the last tool call of a completion, or None if there are no valid arguments."""
+
+    try:
+        arguments = json.loads(
+            completion.choices[-1].message.tool_calls[-1].function.arguments
+        )
+    except Exception:
+        return None
+    return arguments if isinstance(arguments, dict) else None
+
+
+EntityT = TypeVar("EntityT", Node, Relationship)
+
+
+def _validate_entities(
+    entity_type: Type[EntityT], value: Any, context: GenerateDataModelContext
+) -> List[EntityT]:
+    """The nodes or relationships of the LLM arguments that are valid on their own."""
+
+    entities: List[EntityT] = list()
+    for arguments in _as_list(value):
+        try:
+            entities.append(entity_type.model_validate(arguments, context=context))
+        except ValidationError:
+            continue
+    return entities
+
+
+def _as_list(value: Any) -> List[Dict[str, Any]]:
+    """The dictionaries of a list of LLM arguments, ignoring malformed items."""
+
+    return [v for v in value if isinstance(v, dict)] if isinstance(value, list) else []
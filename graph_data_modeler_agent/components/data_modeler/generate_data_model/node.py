@@ -1,23 +1,41 @@
 import json
-from typing import Any, Callable, Coroutine
+from typing import Any, Callable, Coroutine, List, Optional
 
-from instructor import AsyncInstructor
 from instructor.exceptions import InstructorRetryException
 
 from graph_data_modeler_agent.data_model.core.data_model import DataModel
+from graph_data_modeler_agent.llm import (
+    LLMClientLike,
+    ModelLike,
+    as_llm_client,
+    create_routed,
+)
 
 from ..models import GenerateDataModelContext
 from ..state import DataModelerSingleSourceMainState
+from .candidates import (
+    CandidateScorer,
+    generate_data_model_candidates,
+    score_data_model_candidate,
+)
 from .prompts import create_generate_data_model_single_source_messages
 
 
 def create_generate_data_model_single_source_node(
-    llm_client: AsyncInstructor, model: str
+    llm_client: LLMClientLike,
+    model: ModelLike,
+    candidate_temperatures: Optional[List[float]] = None,
+    score_candidate: CandidateScorer = score_data_model_candidate,
 ) -> Callable[[DataModelerSingleSourceMainState], Coroutine[Any, Any, dict[str, Any]]]:
     """
     Create the generate data model node.
+    If `candidate_temperatures` are provided, one data model per temperature is generated concurrently with a single
+    attempt each, instead of one generation retried on validation errors. The candidate with the highest
+    `score_candidate` score is used.
     """
 
+    client = as_llm_client(llm_client)
+
     async def generate_data_model_single_source(
         state: DataModelerSingleSourceMainState,
     ) -> dict[str, Any]:
@@ -25,7 +43,7 @@ def create_generate_data_model_single_source_node(
         Generate the data model for a single data source.
         """
 
-        errors = list()
+        errors: List[str] = list()
 
         next_data_modeler_action = "data_modeler_error_handler"
 
@@ -46,9 +64,35 @@ def create_generate_data_model_single_source_node(
         messages = create_generate_data_model_single_source_messages(state, context)
         response = None
 
+        if candidate_temperatures:
+            candidates = await generate_data_model_candidates(
+                client,
+                model,
+                state["table_schema"],
+                messages,
+                context,
+                candidate_temperatures,
+                score_candidate,
+            )
+            best = candidates[0]
+            if best.is_valid:
+                next_data_modeler_action = "__end__"
+            else:
+                errors.extend(best.errors)
+
+            return {
+                "data_model": best.data_model or DataModel.model_construct(),
+                "data_modeler_steps": ["generate_data_model"],
+                "errors": errors,
+                "next_data_modeler_action": next_data_modeler_action,
+            }
+
         try:
-            response = await llm_client.chat.completions.create(
-                model=model,
+            response = await create_routed(
+                client,
+                model,
+                "generate_data_model",
+                state["table_schema"],
                 response_model=DataModel,
                 messages=messages,
                 context=context,
@@ -57,7 +101,7 @@ def create_generate_data_model_single_source_node(
             next_data_modeler_action = "__end__"
 
         except InstructorRetryException as e:
-            errors.extend(e.messages)
+            errors.extend(e.messages or [str(e)])
             response = DataModel.model_construct(  # type: ignore
                 json.loads(
                     e.last_completion.choices[-1]
@@ -1,7 +1,9 @@
-from typing import List
-
-from ....data_dictionary.data_dictionary import TableSchema
-from ...discovery.models import DiscoveryRelationship
+from ...encoding import (
+    DATA_MODEL_NOTATION,
+    encode_nodes,
+    encode_relationship_patterns,
+)
+from ...prompts import PromptSection, assemble_messages, create_table_context_sections
 from ..models import GenerateDataModelContext
 from ..state import DataModelerSingleSourceMainState
 
@@ -14,67 +16,27 @@ def create_generate_data_model_single_source_messages(
     Create the messages for the generate data model single source node.
     """
 
-    system_message = "You are a professional graph data modeler. You are a core member of a team that will transform relational table data into a graph data model."
-
-    user_message = """I would like you to generate a graph data model based on this provided information. Ensure that the recommended nodes are implemented in the final data model.
-
----
-
-**Valid Columns**
-{valid_columns}
-
-**Column Descriptions**
-{column_descriptions}
-
-**Use Cases**
-{use_cases}
-
-**Discovery Summary**
-{discovery}
-
-**Nodes**
-{nodes}
-
-**Possible Relationships**
-{possible_relationships}
-
---- 
-
-**Rules**
-{rules}
-
-
-Data Model:
-"""
-
-    return [
-        {"role": "system", "content": system_message},
-        {
-            "role": "user",
-            "content": user_message.format(
-                rules=_format_rules(context),
-                valid_sources=[state["table_schema"].name],
-                valid_columns=state["table_schema"].column_names,
-                column_descriptions=_format_table_schema(state["table_schema"]),
-                use_cases=state.get("use_cases", "No use cases provided."),
-                nodes=state["initial_nodes"],
-                possible_relationships=_format_possible_relationships(
+    return assemble_messages(
+        create_table_context_sections(
+            state["table_schema"],
+            state.get("use_cases", "No use cases provided."),
+            state["discovery"].summary,
+        ),
+        task="I would like you to generate a graph data model based on this provided information. Ensure that the recommended nodes are implemented in the final data model.",
+        sections=[
+            PromptSection(
+                title="Nodes",
+                content=f"{DATA_MODEL_NOTATION}\n{encode_nodes(state['initial_nodes'])}",
+            ),
+            PromptSection(
+                title="Possible Relationships",
+                content=encode_relationship_patterns(
                     state["discovery"].possible_relationships
                 ),
-                possible_property_keys=state["discovery"].possible_property_keys,
-                discovery=state["discovery"].summary,
             ),
-        },
-    ]
-
-
-def _format_table_schema(table_schema: TableSchema) -> str:
-    """
-    Format the table schema for the user message.
-    """
-
-    return "\n".join(
-        [f"* {c}: {table_schema.get_description(c)}" for c in table_schema.column_names]
+            PromptSection(title="Rules", content=_format_rules(context)),
+        ],
+        closing="Data Model:",
     )
 
 
@@ -105,18 +67,3 @@ General
         rules += "\n* A column may only map to a single property in the data model."
 
     return rules + "\n"
-
-
-def _format_possible_relationships(
-    possible_relationships: List[DiscoveryRelationship],
-) -> str:
-    """
-    Format the possible relationships for the user message.
-    """
-
-    return "\n".join(
-        [
-            f"* (:{r['source_node_label']})-[:{r['relationship_type']}]->(:{r['target_node_label']})"
-            for r in possible_relationships
-        ]
-    )
@@ -1,10 +1,15 @@
 import json
 from typing import Any, Callable, Coroutine
 
-from instructor import AsyncInstructor
 from instructor.exceptions import InstructorRetryException
 
 from graph_data_modeler_agent.data_model.core.node import Nodes
+from graph_data_modeler_agent.llm import (
+    LLMClientLike,
+    ModelLike,
+    as_llm_client,
+    create_routed,
+)
 
 from ..models import GenerateNodesContext
 from ..state import DataModelerSingleSourceInputState
@@ -12,12 +17,14 @@ from .prompts import create_generate_nodes_single_source_messages
 
 
 def create_generate_nodes_single_source_node(
-    llm_client: AsyncInstructor, model: str
+    llm_client: LLMClientLike, model: ModelLike
 ) -> Callable[[DataModelerSingleSourceInputState], Coroutine[Any, Any, dict[str, Any]]]:
     """
     Create the generate node.
     """
 
+    client = as_llm_client(llm_client)
+
     async def generate_nodes_single_source(
         state: DataModelerSingleSourceInputState,
     ) -> dict[str, Any]:
@@ -44,8 +51,11 @@ def create_generate_nodes_single_source_node(
         messages = create_generate_nodes_single_source_messages(state, context)
 
         try:
-            response = await llm_client.chat.completions.create(
-                model=model,
+            response = await create_routed(
+                client,
+                model,
+                "generate_nodes",
+                state["table_schema"],
                 response_model=Nodes,
                 messages=messages,
                 context=context,
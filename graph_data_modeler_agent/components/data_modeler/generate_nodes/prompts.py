@@ -1,7 +1,5 @@
-from typing import List
-
-from ....data_dictionary.data_dictionary import TableSchema
-from ...discovery.models import ColumnToNodeMapping
+from ...encoding import encode_discovery
+from ...prompts import PromptSection, assemble_messages, create_table_context_sections
 from ..models import GenerateNodesContext
 from ..state import DataModelerSingleSourceInputState
 
@@ -14,68 +12,24 @@ def create_generate_nodes_single_source_messages(
     Create the messages for the generate nodes single source node.
     """
 
-    system_message = "You are a professional graph data modeler. You are a core member of a team that will transform relational table data into a graph data model."
-
-    user_message = """I would like you to generate a list of nodes for a graph data model based on this provided information. We will add relationships in the next step.
-
----
-
-Each column may be used ONCE in the data model.
-**Column Descriptions**
-{column_descriptions}
-
-**Use Cases**
-{use_cases}
-
-**Discovery Summary**
-{discovery}
-
-**Possible Node Labels**
-{possible_nodes}
-
-**Column to Node Mappings**
-{column_to_node_mappings}
-
---- 
-
-**CRITICAL RULES (do not break these):**
-{rules}
-
-**Output Format**
-{output_format}
-
-Nodes:
-"""
-
-    return [
-        {"role": "system", "content": system_message},
-        {
-            "role": "user",
-            "content": user_message.format(
-                rules=_format_rules(context),
-                valid_sources=context["valid_sources"],
-                valid_columns=context["valid_columns"],
-                column_descriptions=_format_table_schema(state["table_schema"]),
-                discovery=state["discovery"].summary,
-                column_to_node_mappings=_format_column_to_node_mappings(
-                    state["discovery"].column_to_node_mappings
-                ),
-                possible_nodes=state["discovery"].possible_node_labels,
-                possible_property_keys=state["discovery"].possible_property_keys,
-                use_cases=state.get("use_cases", "No use cases provided."),
-                output_format=get_output_format(),
+    return assemble_messages(
+        create_table_context_sections(
+            state["table_schema"],
+            state.get("use_cases", "No use cases provided."),
+            state["discovery"].summary,
+        ),
+        task="I would like you to generate a list of nodes for a graph data model based on this provided information. We will add relationships in the next step.\n\nEach column may be used ONCE in the data model.",
+        sections=[
+            PromptSection(
+                title="Discovery", content=encode_discovery(state["discovery"])
             ),
-        },
-    ]
-
-
-def _format_table_schema(table_schema: TableSchema) -> str:
-    """
-    Format the table schema for the user message.
-    """
-
-    return "\n".join(
-        [f"* {c}: {table_schema.get_description(c)}" for c in table_schema.column_names]
+            PromptSection(
+                title="CRITICAL RULES (do not break these):",
+                content=_format_rules(context),
+            ),
+            PromptSection(title="Output Format", content=get_output_format()),
+        ],
+        closing="Nodes:",
     )
 
 
@@ -88,7 +42,7 @@ def _format_rules(context: GenerateNodesContext) -> str:
 * Each node must have a property marked as `"is_key": true`.
 * Key properties must **never** be shared between nodes.
 * All nodes should have **at least one property**, and no node should contain all properties.
-* Use the `column_to_node_mappings` to determine which columns to use for each node.
+* Use the Column to Node Mappings to determine which columns to use for each node.
 
     """
 
@@ -100,18 +54,6 @@ def _format_rules(context: GenerateNodesContext) -> str:
     return rules
 
 
-def _format_column_to_node_mappings(
-    column_to_node_mappings: List[ColumnToNodeMapping],
-) -> str:
-    """
-    Format the column to node mappings for the user message.
-    """
-    res = "  column_name: node_label\n"
-    return res + "\n".join(
-        [f"* {m['column_name']}: {m['node_label']}" for m in column_to_node_mappings]
-    )
-
-
 def get_output_format() -> str:
     return """Property Format:
 {
@@ -1,9 +1,19 @@
+from .detect_changes_single_source import create_detect_changes_single_source_node
 from .discovery_input import create_discovery_input_node
 from .generate_findings_single_source import create_generate_findings_single_source_node
+from .generate_incremental_findings_single_source import (
+    create_generate_incremental_findings_single_source_node,
+)
+from .generate_key_profile_single_source import (
+    create_generate_key_profile_single_source_node,
+)
 from .generate_stats_single_source import create_generate_stats_single_source_node
 
 __all__ = [
+    "create_detect_changes_single_source_node",
     "create_generate_findings_single_source_node",
+    "create_generate_incremental_findings_single_source_node",
+    "create_generate_key_profile_single_source_node",
     "create_generate_stats_single_source_node",
     "create_discovery_input_node",
 ]
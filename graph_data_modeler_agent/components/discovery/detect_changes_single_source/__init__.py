@@ -0,0 +1,3 @@
+from .node import create_detect_changes_single_source_node
+
+__all__ = ["create_detect_changes_single_source_node"]
@@ -0,0 +1,58 @@
+from typing import Any, Callable, Coroutine
+
+from ....change_detection.detection import detect_table_changes
+from ..reuse import update_discovery
+from ..state import DiscoverySingleSourceMainState
+
+
+def create_detect_changes_single_source_node(
+    shift_threshold: float = 0.5,
+    max_affected_fraction: float = 0.5,
+) -> Callable[[DiscoverySingleSourceMainState], Coroutine[Any, Any, dict[str, Any]]]:
+    """
+    Create the detect changes node.
+    If a previous discovery is provided, the table schema and stats are compared with the previous run's to decide
+    whether the previous discovery can be reused as is, only the affected columns must be discovered again, or more
+    than `max_affected_fraction` of the columns changed and the whole table must be discovered and modeled again.
+    """
+
+    async def detect_changes_single_source(
+        state: DiscoverySingleSourceMainState,
+    ) -> dict[str, Any]:
+        """
+        Detect the changes to the table since the previous run.
+        """
+
+        previous_discovery = state.get("previous_discovery")
+        previous_table_schema = state.get("previous_table_schema")
+        if previous_discovery is None or previous_table_schema is None:
+            return {
+                "next_discovery_action": "generate_findings",
+                "discovery_steps": ["detect_changes"],
+            }
+
+        changes = detect_table_changes(
+            previous_table_schema=previous_table_schema,
+            table_schema=state["table_schema"],
+            previous_stats=state.get("previous_stats"),
+            stats=state.get("stats"),
+            shift_threshold=shift_threshold,
+        )
+        res: dict[str, Any] = {
+            "table_changes": changes,
+            "discovery_steps": ["detect_changes"],
+        }
+
+        column_count = max(len(state["table_schema"].column_names), 1)
+        if not changes.affected_columns:
+            res["discovery"] = update_discovery(previous_discovery, changes)
+            res["next_discovery_action"] = "__end__"
+        elif len(changes.affected_columns) / column_count <= max_affected_fraction:
+            res["next_discovery_action"] = "generate_incremental_findings"
+        else:
+            # the previous discovery and data model are not reused
+            res["table_changes"] = None
+            res["next_discovery_action"] = "generate_findings"
+        return res
+
+    return detect_changes_single_source
@@ -1,20 +1,26 @@
 from typing import Any, Callable, Coroutine
 
-from instructor import AsyncInstructor
-
 from graph_data_modeler_agent.components.discovery.models import DiscoveryResponse
+from graph_data_modeler_agent.llm import (
+    LLMClientLike,
+    ModelLike,
+    as_llm_client,
+    create_routed,
+)
 
 from ..state import DiscoverySingleSourceMainState
 from .prompts import create_generate_findings_single_source_messages
 
 
 def create_generate_findings_single_source_node(
-    llm_client: AsyncInstructor, model: str, max_retries: int = 3
+    llm_client: LLMClientLike, model: ModelLike, max_retries: int = 3
 ) -> Callable[[DiscoverySingleSourceMainState], Coroutine[Any, Any, dict[str, Any]]]:
     """
     Create the generate findings node.
     """
 
+    client = as_llm_client(llm_client)
+
     async def generate_findings_single_source(
         state: DiscoverySingleSourceMainState,
     ) -> dict[str, Any]:
@@ -24,8 +30,11 @@ def create_generate_findings_single_source_node(
 
         messages = create_generate_findings_single_source_messages(state)
 
-        response = await llm_client.chat.completions.create(
-            model=model,
+        response = await create_routed(
+            client,
+            model,
+            "generate_findings",
+            state["table_schema"],
             response_model=DiscoveryResponse,
             messages=messages,
             max_retries=max_retries,
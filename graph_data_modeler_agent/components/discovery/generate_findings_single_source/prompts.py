@@ -1,4 +1,8 @@
+from typing import Optional
+
 from ....data_dictionary.data_dictionary import TableSchema
+from ....profiling.keys import KeyProfile
+from ....profiling.table_stats import TableStats
 from ..state import DiscoverySingleSourceMainState
 
 
@@ -15,6 +19,8 @@ def create_generate_findings_single_source_messages(
 Please perform an anlysis of the following relational data table information. 
 Create a summary of the data that will intellectually inform the graph data modeling process.
 Identify all possible node labels, relationship types, and key properties that will be used in the graph data model.
+The key profile was computed from the data. Unique columns are strong candidates for `possible_property_keys`.
+A column that functionally determines other columns is a candidate node key, and the columns it determines are candidate properties of that node.
 
 <table_summary>
 {table_summary}
@@ -32,6 +38,10 @@ Identify all possible node labels, relationship types, and key properties that w
 {column_descriptions}
 </column_descriptions>
 
+<key_profile>
+{key_profile}
+</key_profile>
+
 Please return your response in json format.
 """
 
@@ -44,8 +54,9 @@ Please return your response in json format.
                     "data_description", "No data description provided."
                 ),
                 use_cases=state.get("use_cases", "No use cases provided."),
-                table_stats=state.get("table_stats", "No stats provided."),
+                table_stats=_format_table_stats(state.get("stats")),
                 column_descriptions=_format_table_schema(state["table_schema"]),
+                key_profile=_format_key_profile(state.get("key_profile")),
             ),
         },
     ]
@@ -56,6 +67,46 @@ def _format_table_schema(table_schema: TableSchema) -> str:
     Format the table schema for the user message.
     """
 
-    return "\n".join(
-        [f"* {c}: {table_schema.get_description(c)}" for c in table_schema.column_names]
-    )
+    descriptions = table_schema.get_descriptions()
+    return "\n".join([f"* {c}: {descriptions[c]}" for c in table_schema.column_names])
+
+
+def _format_table_stats(stats: Optional[TableStats]) -> str:
+    """
+    Format the table stats for the user message.
+    """
+
+    if stats is None:
+        return "No stats provided."
+
+    return stats.to_prompt_text()
+
+
+def _format_key_profile(key_profile: Optional[KeyProfile]) -> str:
+    """
+    Format the key profile for the user message.
+    """
+
+    if key_profile is None:
+        return "No key profile provided."
+
+    sample_note = " (sampled)" if key_profile.sampled else ""
+    lines = [f"Rows profiled: {key_profile.row_count}{sample_note}", "Candidate keys:"]
+    for k in key_profile.candidate_keys:
+        detail = (
+            "unique"
+            if k.is_unique
+            else f"{k.uniqueness:.2%} unique, {k.null_count} nulls"
+        )
+        lines.append(f"* {', '.join(k.columns)}: {detail}")
+    if not key_profile.candidate_keys:
+        lines.append("* None found")
+
+    lines.append("Functional dependencies (determinant -> dependents):")
+    dependents_by_determinant = key_profile.dependents_by_determinant()
+    for determinant, dependents in dependents_by_determinant.items():
+        lines.append(f"* {determinant} -> {', '.join(dependents)}")
+    if not dependents_by_determinant:
+        lines.append("* None found")
+
+    return "\n".join(lines)
@@ -0,0 +1,3 @@
+from .node import create_generate_incremental_findings_single_source_node
+
+__all__ = ["create_generate_incremental_findings_single_source_node"]
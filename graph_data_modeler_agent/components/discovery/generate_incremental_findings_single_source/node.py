@@ -0,0 +1,56 @@
+from typing import Any, Callable, Coroutine
+
+from graph_data_modeler_agent.components.discovery.models import DiscoveryResponse
+from graph_data_modeler_agent.llm import (
+    LLMClientLike,
+    ModelLike,
+    as_llm_client,
+    create_routed,
+)
+
+from ..reuse import merge_discovery
+from ..state import DiscoverySingleSourceMainState
+from .prompts import create_generate_incremental_findings_single_source_messages
+
+
+def create_generate_incremental_findings_single_source_node(
+    llm_client: LLMClientLike, model: ModelLike, max_retries: int = 3
+) -> Callable[[DiscoverySingleSourceMainState], Coroutine[Any, Any, dict[str, Any]]]:
+    """
+    Create the generate incremental findings node.
+    """
+
+    client = as_llm_client(llm_client)
+
+    async def generate_incremental_findings_single_source(
+        state: DiscoverySingleSourceMainState,
+    ) -> dict[str, Any]:
+        """
+        Generate the findings for the changed columns of a single data source and merge them into the previous findings.
+        """
+
+        previous_discovery = state.get("previous_discovery")
+        changes = state.get("table_changes")
+        if previous_discovery is None or changes is None:
+            raise ValueError(
+                "Incremental findings require the previous discovery and the table changes."
+            )
+
+        messages = create_generate_incremental_findings_single_source_messages(state)
+
+        response = await create_routed(
+            client,
+            model,
+            "generate_incremental_findings",
+            state["table_schema"],
+            response_model=DiscoveryResponse,
+            messages=messages,
+            max_retries=max_retries,
+        )
+
+        return {
+            "discovery": merge_discovery(previous_discovery, response, changes),
+            "discovery_steps": ["generate_incremental_findings"],
+        }
+
+    return generate_incremental_findings_single_source
@@ -0,0 +1,132 @@
+from typing import Dict, List
+
+from ....change_detection.detection import TableChanges
+from ..generate_findings_single_source.prompts import (
+    _format_key_profile,
+    _format_table_stats,
+)
+from ..models import DiscoveryResponse
+from ..state import DiscoverySingleSourceMainState
+
+
+def create_generate_incremental_findings_single_source_messages(
+    state: DiscoverySingleSourceMainState,
+) -> List[Dict[str, str]]:
+    """
+    Create the messages for the generate incremental findings single source node.
+    Only the affected columns are described, with the previous findings as context.
+    """
+
+    system_message = "You are a professional graph data analyst. You are a core member of a team that will transform relational table data into a graph data model."
+
+    user_message = """
+A relational data table that was already analyzed has changed. 
+Please analyze only the changed columns below, using the previous findings as context.
+Identify the node labels, relationship types, and key properties that the changed columns add to the previous findings.
+Only map the changed columns to node labels. Reuse the previous node labels where they fit.
+
+<previous_findings>
+{previous_findings}
+</previous_findings>
+
+<use_cases>
+{use_cases}
+</use_cases>
+
+<table_changes>
+{table_changes}
+</table_changes>
+
+<changed_column_stats>
+{table_stats}
+</changed_column_stats>
+
+<changed_column_descriptions>
+{column_descriptions}
+</changed_column_descriptions>
+
+<key_profile>
+{key_profile}
+</key_profile>
+
+Please return your response in json format.
+"""
+
+    previous_discovery = state.get("previous_discovery")
+    changes = state.get("table_changes")
+    if previous_discovery is None or changes is None:
+        raise ValueError(
+            "Incremental findings require the previous discovery and the table changes."
+        )
+    affected_columns = changes.affected_columns
+    descriptions = state["table_schema"].get_descriptions(affected_columns)
+    stats = state.get("stats")
+
+    return [
+        {"role": "system", "content": system_message},
+        {
+            "role": "user",
+            "content": user_message.format(
+                previous_findings=_format_previous_findings(
+                    previous_discovery, affected_columns
+                ),
+                use_cases=state.get("use_cases", "No use cases provided."),
+                table_changes=_format_table_changes(changes),
+                table_stats=_format_table_stats(
+                    stats.subset(affected_columns) if stats is not None else None
+                ),
+                column_descriptions="\n".join(
+                    [f"* {c}: {descriptions[c]}" for c in affected_columns]
+                ),
+                key_profile=_format_key_profile(state.get("key_profile")),
+            ),
+        },
+    ]
+
+
+def _format_previous_findings(
+    discovery: DiscoveryResponse, affected_columns: List[str]
+) -> str:
+    """
+    Format the previous findings for the user message, without the mappings of the affected columns.
+    """
+
+    lines = [
+        discovery.summary,
+        f"Node labels: {', '.join(discovery.possible_node_labels)}",
+        "Relationships:",
+        *[
+            f"* (:{r['source_node_label']})-[:{r['relationship_type']}]->(:{r['target_node_label']})"
+            for r in discovery.possible_relationships
+        ],
+        "Column to node mappings:",
+        *[
+            f"* {m['column_name']} -> {m['node_label']}"
+            for m in discovery.column_to_node_mappings
+            if m["column_name"] not in affected_columns
+        ],
+    ]
+    return "\n".join(lines)
+
+
+def _format_table_changes(changes: TableChanges) -> str:
+    """
+    Format the table changes for the user message.
+    """
+
+    lines = [f"* Added column: {c}" for c in changes.added_columns]
+    lines.extend([f"* Modified column: {c}" for c in changes.modified_columns])
+    lines.extend(
+        [
+            f"* Distribution shift in column: {s.column} ({s.metric})"
+            for s in changes.shifted_columns
+        ]
+    )
+    lines.extend(
+        [
+            f"* Renamed column: {old} -> {new}"
+            for old, new in changes.renamed_columns.items()
+        ]
+    )
+    lines.extend([f"* Dropped column: {c}" for c in changes.dropped_columns])
+    return "\n".join(lines)
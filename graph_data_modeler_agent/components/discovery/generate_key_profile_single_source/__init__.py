@@ -0,0 +1,3 @@
+from .node import create_generate_key_profile_single_source_node
+
+__all__ = ["create_generate_key_profile_single_source_node"]
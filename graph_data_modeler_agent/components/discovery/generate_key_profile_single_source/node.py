@@ -0,0 +1,38 @@
+from typing import Any, Callable, Coroutine, Optional
+
+from ....data_source.data_source import DataSource, read_data
+from ....profiling.keys import profile_keys
+from ..state import DiscoverySingleSourceMainState
+
+
+def create_generate_key_profile_single_source_node(
+    max_key_arity: int = 2, sample_size: Optional[int] = 100_000
+) -> Callable[[DiscoverySingleSourceMainState], Coroutine[Any, Any, dict[str, Any]]]:
+    """
+    Create the generate key profile node.
+    """
+
+    async def generate_key_profile_single_source(
+        state: DiscoverySingleSourceMainState,
+    ) -> dict[str, Any]:
+        """
+        Detect candidate keys and functional dependencies in the data to inform node identification.
+        """
+
+        data = state["data"]
+        if isinstance(data, DataSource):
+            # one extra row is read, so larger files are still reported as sampled
+            data = read_data(
+                data, sample_size=sample_size + 1 if sample_size is not None else None
+            )
+
+        key_profile = profile_keys(
+            data=data, max_key_arity=max_key_arity, sample_size=sample_size
+        )
+
+        return {
+            "key_profile": key_profile,
+            "discovery_steps": ["generate_key_profile"],
+        }
+
+    return generate_key_profile_single_source
@@ -1,19 +1,20 @@
-import io
-from typing import Any, Callable, Coroutine
+from typing import Any, Callable, Coroutine, Iterable
 
 import pandas as pd
-from numpy import number
 
-from graph_data_modeler_agent.components.discovery.models import PandasStatsResponse
+from graph_data_modeler_agent.data_source.data_source import DataSource
+from graph_data_modeler_agent.profiling.stats import accumulate_stats
 
 from ..state import DiscoverySingleSourceMainState
 
 
-def create_generate_stats_single_source_node() -> (
-    Callable[[DiscoverySingleSourceMainState], Coroutine[Any, Any, dict[str, Any]]]
-):
+def create_generate_stats_single_source_node(
+    chunk_size: int = 100_000,
+) -> Callable[[DiscoverySingleSourceMainState], Coroutine[Any, Any, dict[str, Any]]]:
     """
     Create the generate stats node.
+    A `DataSource` is streamed in chunks of `chunk_size` rows into stats accumulators, reading only the columns
+    in the table schema, so the table is never fully loaded.
     """
 
     async def generate_stats_single_source(
@@ -21,37 +22,26 @@ def create_generate_stats_single_source_node() -> (
     ) -> dict[str, Any]:
         """
         Generate the stats for the data to inform the discovery process.
+        The stats are stored as a compact `TableStats` record.
         """
 
-        errors = list()
+        data = state["data"]
+        if data is None:
+            raise ValueError("Stats require the data of the table.")
 
-        df = state["data"]
-        buffer = io.StringIO()
-        df.info(buf=buffer, memory_usage=False, verbose=True)
-
-        df_info = buffer.getvalue()
-        try:
-            desc_numeric = df.describe(
-                percentiles=[0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99],
-                include=[number],
+        chunks: Iterable[pd.DataFrame]
+        if isinstance(data, DataSource):
+            chunks = data.with_low_memory_options().iter_chunks(
+                chunk_size=chunk_size,
+                columns=state["table_schema"].column_names or None,
             )
-        except ValueError as e:
-            errors.append(str(e))
-            desc_numeric = pd.DataFrame()
-        try:
-            desc_categorical = df.describe(include="object")
-        except ValueError as e:
-            errors.append(str(e))
-            desc_categorical = pd.DataFrame()
+        else:
+            chunks = [data]
 
         return {
-            "stats": PandasStatsResponse(
-                categorical_description=desc_categorical,
-                general_description=df_info,
-                numerical_description=desc_numeric,
-            ),
+            "stats": accumulate_stats(chunks).to_table_stats(),
             "discovery_steps": ["generate_stats"],
-            "errors": errors,
+            "errors": list(),
         }
 
     return generate_stats_single_source
@@ -1,4 +1,3 @@
-import pandas as pd
 from pydantic import BaseModel, Field, field_validator
 from typing_extensions import List, TypedDict
 
@@ -67,13 +66,3 @@ Why is this information important to include in the graph data model?""",
         if len(errors) > 0:
             raise ValueError(f"Columns {errors} are mapped to multiple node labels.")
         return v
-
-
-class PandasStatsResponse(TypedDict):
-    """
-    The response from the pandas stats process.
-    """
-
-    general_description: str
-    categorical_description: pd.DataFrame
-    numerical_description: pd.DataFrame
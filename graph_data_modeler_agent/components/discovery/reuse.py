@@ -0,0 +1,110 @@
+"""
+Reuse the discovery of a previous run for a changed table.
+
+Renamed columns are renamed in place and the mappings of dropped columns are removed, so only the columns in
+`TableChanges.affected_columns` need to be discovered again.
+"""
+
+from typing import List, TypeVar
+
+from ...change_detection.detection import TableChanges
+from .models import DiscoveryResponse
+
+T = TypeVar("T")
+
+
+def update_discovery(
+    discovery: DiscoveryResponse, changes: TableChanges
+) -> DiscoveryResponse:
+    """
+    Update a previous discovery for a changed table.
+    Renamed columns are renamed, and the column to node mappings of dropped and affected columns are removed.
+
+    Parameters
+    ----------
+    discovery : DiscoveryResponse
+        The discovery of the previous run.
+    changes : TableChanges
+        The changes to the table.
+
+    Returns
+    -------
+    DiscoveryResponse
+        A new discovery.
+    """
+
+    removed = set(changes.dropped_columns) | set(changes.affected_columns)
+    renamed = changes.renamed_columns
+    return DiscoveryResponse(
+        summary=discovery.summary,
+        possible_node_labels=list(discovery.possible_node_labels),
+        possible_relationships=list(discovery.possible_relationships),
+        possible_property_keys=[
+            renamed.get(k, k)
+            for k in discovery.possible_property_keys
+            if k not in changes.dropped_columns
+        ],
+        column_to_node_mappings=[
+            {**m, "column_name": renamed.get(m["column_name"], m["column_name"])}
+            for m in discovery.column_to_node_mappings
+            if m["column_name"] not in removed
+        ],
+    )
+
+
+def merge_discovery(
+    previous_discovery: DiscoveryResponse,
+    discovery: DiscoveryResponse,
+    changes: TableChanges,
+) -> DiscoveryResponse:
+    """
+    Merge the discovery of the affected columns into a previous discovery.
+    Only the new column to node mappings of affected columns are kept, so mappings of unchanged columns are stable.
+
+    Parameters
+    ----------
+    previous_discovery : DiscoveryResponse
+        The discovery of the previous run.
+    discovery : DiscoveryResponse
+        The discovery of the affected columns.
+    changes : TableChanges
+        The changes to the table.
+
+    Returns
+    -------
+    DiscoveryResponse
+        A new discovery.
+    """
+
+    base = update_discovery(previous_discovery, changes)
+    affected = set(changes.affected_columns)
+    return DiscoveryResponse(
+        summary=f"{base.summary}\n\n{discovery.summary}",
+        possible_node_labels=_union(
+            base.possible_node_labels, discovery.possible_node_labels
+        ),
+        possible_relationships=_union(
+            base.possible_relationships, discovery.possible_relationships
+        ),
+        possible_property_keys=_union(
+            base.possible_property_keys, discovery.possible_property_keys
+        ),
+        column_to_node_mappings=[
+            *base.column_to_node_mappings,
+            *[
+                m
+                for m in discovery.column_to_node_mappings
+                if m["column_name"] in affected
+            ],
+        ],
+    )
+
+
+def _union(first: List[T], second: List[T]) -> List[T]:
+    """Combine two lists, keeping the first occurrence of each item in order."""
+
+    res = list(first)
+    for item in second:
+        if item not in res:
+            res.append(item)
+    return res
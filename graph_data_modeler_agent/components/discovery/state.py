@@ -1,21 +1,29 @@
 from operator import add
-from typing import Annotated, List, Optional, TypedDict
+from typing import Annotated, List, Optional, TypedDict, Union
 
 import pandas as pd
 
+from ...change_detection.detection import TableChanges
 from ...data_dictionary.data_dictionary import TableSchema
-from .models import DiscoveryResponse, PandasStatsResponse
+from ...data_source.data_source import DataSource
+from ...profiling.keys import KeyProfile
+from ...profiling.table_stats import TableStats
+from .models import DiscoveryResponse
 
 
 class DiscoverySingleSourceInputState(TypedDict):
     """
-    The input state of the discovery agent. The discovery agent handles a single DataFrame at a time.
+    The input state of the discovery agent. The discovery agent handles a single DataFrame or `DataSource` at a time.
+    If the discovery, table schema and stats of a previous run are provided, only the columns that changed are discovered again.
     """
 
-    data: Optional[pd.DataFrame]
+    data: Optional[Union[pd.DataFrame, DataSource]]
     table_schema: TableSchema
     use_cases: List[str]
     additional_context: str
+    previous_discovery: Optional[DiscoveryResponse]
+    previous_table_schema: Optional[TableSchema]
+    previous_stats: Optional[TableStats]
     discovery_steps: Annotated[List[str], add]
     next_discovery_action: str
 
@@ -25,11 +33,16 @@ class DiscoverySingleSourceMainState(TypedDict):
     The main state of the discovery agent.
     """
 
-    data: Optional[pd.DataFrame]
+    data: Optional[Union[pd.DataFrame, DataSource]]
     table_schema: TableSchema
     use_cases: List[str]
     additional_context: str
-    stats: Optional[PandasStatsResponse]
+    stats: Optional[TableStats]
+    key_profile: Optional[KeyProfile]
+    previous_discovery: Optional[DiscoveryResponse]
+    previous_table_schema: Optional[TableSchema]
+    previous_stats: Optional[TableStats]
+    table_changes: Optional[TableChanges]
     discovery: DiscoveryResponse
     errors: Annotated[List[str], add]
     discovery_steps: Annotated[List[str], add]
@@ -45,4 +58,6 @@ class DiscoverySingleSourceOutputState(TypedDict):
     table_schema: TableSchema
     use_cases: List[str]
     additional_context: str
+    stats: Optional[TableStats]
+    table_changes: Optional[TableChanges]
     discovery_steps: Annotated[List[str], add]
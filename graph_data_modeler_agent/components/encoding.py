@@ -0,0 +1,286 @@
+"""
+Compact text encodings of data models and LLM responses for prompts.
+
+The pydantic repr of a `Nodes` or `DataModel` repeats every field name, quote and class name for each property, and the
+repr of a list of TypedDicts repeats every key. The encodings here write one Cypher-like line per node or relationship
+instead, with the same information:
+
+    (:Pet {name*: pet_name STRING, kind: pet STRING})
+    (:Person)-[:HAS_PET]->(:Pet)
+
+A property is written as `name: column TYPE`. `*` marks the key property and `alias column` adds the foreign key column
+of the property. Entities are preceded by a `Source <source name>` line whenever their source changes. The encodings
+are deterministic, so the prompts of unchanged inputs are identical and can be cached by the provider. The reasons of
+LLM suggestions are left out.
+"""
+
+from itertools import groupby
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple, Union
+
+from ..data_model.core.data_model import DataModel
+from ..data_model.core.node import Node, Nodes
+from ..data_model.core.property import Property
+from ..data_model.core.relationship import Relationship
+from .discovery.models import (
+    ColumnToNodeMapping,
+    DiscoveryRelationship,
+    DiscoveryResponse,
+)
+
+if TYPE_CHECKING:
+    from .data_model_updater.brainstorm_updates.models import (
+        DataModelUpdaterBrainstormResponse,
+    )
+
+DATA_MODEL_NOTATION = "Notation: (:Label {property: column TYPE}), * marks the key property, `alias column` is a foreign key column of the property."
+
+
+def encode_property(prop: Property) -> str:
+    """
+    Encode a property as `name: column TYPE`, with `*` after the name of a key and the alias last.
+
+    Parameters
+    ----------
+    prop : Property
+        The property.
+
+    Returns
+    -------
+    str
+        The encoding.
+    """
+
+    key = "*" if prop.is_key else ""
+    alias = f" alias {prop.alias}" if prop.alias else ""
+    return f"{prop.name}{key}: {prop.column_mapping} {prop.type}{alias}"
+
+
+def encode_node(node: Node) -> str:
+    """
+    Encode a node as `(:Label {properties})`.
+
+    Parameters
+    ----------
+    node : Node
+        The node.
+
+    Returns
+    -------
+    str
+        The encoding.
+    """
+
+    return f"(:{node.label}{_encode_properties(node.properties)})"
+
+
+def encode_relationship(relationship: Relationship) -> str:
+    """
+    Encode a relationship as `(:Source)-[:TYPE {properties}]->(:Target)`.
+
+    Parameters
+    ----------
+    relationship : Relationship
+        The relationship.
+
+    Returns
+    -------
+    str
+        The encoding.
+    """
+
+    return f"(:{relationship.source})-[:{relationship.type}{_encode_properties(relationship.properties)}]->(:{relationship.target})"
+
+
+def encode_nodes(nodes: Union[Nodes, Sequence[Node]]) -> str:
+    """
+    Encode nodes, one line per node.
+
+    Parameters
+    ----------
+    nodes : Union[Nodes, Sequence[Node]]
+        The nodes.
+
+    Returns
+    -------
+    str
+        The encoding.
+    """
+
+    return "\n".join(
+        _encode_by_source(nodes.nodes if isinstance(nodes, Nodes) else nodes)
+    )
+
+
+def encode_data_model(data_model: DataModel) -> str:
+    """
+    Encode a data model, one line per node and relationship.
+
+    Parameters
+    ----------
+    data_model : DataModel
+        The data model.
+
+    Returns
+    -------
+    str
+        The encoding.
+    """
+
+    return "\n".join(
+        ["Nodes", *_encode_by_source(data_model.nodes)]
+        + ["Relationships", *_encode_by_source(data_model.relationships)]
+    )
+
+
+def encode_relationship_patterns(
+    relationships: Sequence[DiscoveryRelationship],
+) -> str:
+    """
+    Encode suggested relationships, one `(:Source)-[:TYPE]->(:Target)` line per relationship.
+
+    Parameters
+    ----------
+    relationships : Sequence[DiscoveryRelationship]
+        The relationships, such as the `UpdaterRelationship`s of a brainstorm response.
+
+    Returns
+    -------
+    str
+        The encoding.
+    """
+
+    return "\n".join(
+        f"(:{r['source_node_label']})-[:{r['relationship_type']}]->(:{r['target_node_label']})"
+        for r in relationships
+    )
+
+
+def encode_column_to_node_mappings(mappings: Sequence[ColumnToNodeMapping]) -> str:
+    """
+    Encode column to node mappings, one `Label: column, column` line per node label in order of first appearance.
+
+    Parameters
+    ----------
+    mappings : Sequence[ColumnToNodeMapping]
+        The mappings.
+
+    Returns
+    -------
+    str
+        The encoding.
+    """
+
+    columns: Dict[str, List[str]] = dict()
+    for m in mappings:
+        columns.setdefault(m["node_label"], list()).append(m["column_name"])
+
+    return "\n".join(f"{label}: {', '.join(c)}" for label, c in columns.items())
+
+
+def encode_discovery(discovery: DiscoveryResponse) -> str:
+    """
+    Encode the suggestions of a discovery, without its summary.
+
+    Parameters
+    ----------
+    discovery : DiscoveryResponse
+        The discovery.
+
+    Returns
+    -------
+    str
+        The encoding.
+    """
+
+    return _encode_groups(
+        [
+            ("Node Labels", ", ".join(discovery.possible_node_labels)),
+            ("Property Keys", ", ".join(discovery.possible_property_keys)),
+            (
+                "Relationships",
+                encode_relationship_patterns(discovery.possible_relationships),
+            ),
+            (
+                "Column to Node Mappings",
+                encode_column_to_node_mappings(discovery.column_to_node_mappings),
+            ),
+        ]
+    )
+
+
+def encode_brainstorm_response(
+    response: "DataModelUpdaterBrainstormResponse",
+) -> str:
+    """
+    Encode the suggested updates to a data model. Groups without suggestions are left out.
+
+    Parameters
+    ----------
+    response : DataModelUpdaterBrainstormResponse
+        The suggested updates.
+
+    Returns
+    -------
+    str
+        The encoding, or `No updates.` if there are no suggestions.
+    """
+
+    return (
+        _encode_groups(
+            [
+                (
+                    "Remove Nodes",
+                    ", ".join(n["label"] for n in response.nodes_to_remove),
+                ),
+                (
+                    "Remove Relationships",
+                    encode_relationship_patterns(response.relationships_to_remove),
+                ),
+                (
+                    "Remove Properties",
+                    ", ".join(
+                        f"{p['label_or_type']}.{p['property_name']}"
+                        for p in response.properties_to_remove
+                    ),
+                ),
+                (
+                    "New Nodes",
+                    encode_column_to_node_mappings(response.column_to_node_mappings),
+                ),
+                (
+                    "New Relationships",
+                    encode_relationship_patterns(response.new_relationships),
+                ),
+            ]
+        )
+        or "No updates."
+    )
+
+
+def _encode_properties(properties: List[Property]) -> str:
+    """The ` {properties}` of an entity, or nothing without properties."""
+
+    return (
+        " {" + ", ".join(encode_property(p) for p in properties) + "}"
+        if properties
+        else ""
+    )
+
+
+def _encode_by_source(entities: Sequence[Union[Node, Relationship]]) -> List[str]:
+    """The lines of entities, with a `Source` line whenever the source changes."""
+
+    lines: List[str] = list()
+    for source_name, group in groupby(entities, key=lambda e: e.source_name):
+        lines.append(f"Source {source_name}")
+        lines.extend(
+            encode_node(e) if isinstance(e, Node) else encode_relationship(e)
+            for e in group
+        )
+    return lines
+
+
+def _encode_groups(groups: List[Tuple[str, str]]) -> str:
+    """The non-empty `(title, lines)` groups, each as a title line followed by its lines."""
+
+    return "\n".join(f"{title}\n{lines}" for title, lines in groups if lines)
@@ -1,21 +1,23 @@
 from typing import Any, Callable, Coroutine
 
-from graph_data_modeler_agent.components.state import InputState
+from graph_data_modeler_agent.components.state import MultiSourceInputState
 from graph_data_modeler_agent.data_dictionary.data_dictionary import DataDictionary
+from graph_data_modeler_agent.data_dictionary.join_graph import build_join_graph
 
 
 def create_input_validator_node() -> (
-    Callable[[InputState], Coroutine[Any, Any, dict[str, Any]]]
+    Callable[[MultiSourceInputState], Coroutine[Any, Any, dict[str, Any]]]
 ):
     """
-    Create a node that validates the input state.
+    Create a node that validates the input state and builds the join graph of its data dictionary.
     """
 
-    async def input_validator(state: InputState) -> dict[str, Any]:
+    async def input_validator(state: MultiSourceInputState) -> dict[str, Any]:
         try:
             data_dictionary = DataDictionary.model_validate(state["data_dictionary"])
             return {
                 "data_dictionary": data_dictionary,
+                "join_graph": build_join_graph(data_dictionary),
                 "next_action": "discovery",
                 "steps": ["input_validator"],
             }
@@ -0,0 +1,135 @@
+"""
+Assemble the prompts of the data modeling nodes so providers can cache their shared prefix.
+
+Providers such as OpenAI and Anthropic cache the longest prompt prefix they have recently seen and bill cached tokens
+at a discount with a lower latency. A cache hit needs an exact match from the first token, so the generate nodes,
+generate data model, brainstorm updates and update data model prompts are assembled in the same order:
+
+1. The same system message.
+2. The table context, the longest sections that are stable for a table: the column descriptions, the valid columns,
+   the discovery summary and the use cases. These are identical for every call for the same table.
+3. The task of the node.
+4. The sections of the node, such as its rules and the nodes or data model it builds on.
+5. The closing line of the node.
+
+Only the parts after the table context differ between nodes, so the calls for a table after the first one reuse the
+cached table context. The cached prompt tokens are counted in `LLMClientStats`.
+"""
+
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+from ..data_dictionary.table_schema import TableSchema
+
+SYSTEM_MESSAGE = "You are a professional graph data modeler. You are a core member of a team that will transform relational table data into a graph data model."
+
+
+class PromptSection(BaseModel):
+    """
+    A titled section of a prompt.
+
+    Attributes
+    ----------
+    title : str
+        The title.
+    content : str
+        The content.
+    """
+
+    title: str
+    content: str
+
+    def format(self) -> str:
+        """Format the section for a prompt."""
+
+        return f"**{self.title}**\n{self.content}"
+
+
+def create_table_context_sections(
+    table_schema: TableSchema, use_cases: Any, discovery_summary: str
+) -> List[PromptSection]:
+    """
+    Create the table context sections, which start the user message of every data modeling prompt.
+
+    Parameters
+    ----------
+    table_schema : TableSchema
+        The table schema.
+    use_cases : Any
+        The use cases.
+    discovery_summary : str
+        The summary of the discovery of the table.
+
+    Returns
+    -------
+    List[PromptSection]
+        The sections, in the order shared by all prompts.
+    """
+
+    return [
+        PromptSection(
+            title="Column Descriptions", content=format_table_schema(table_schema)
+        ),
+        PromptSection(title="Valid Columns", content=str(table_schema.column_names)),
+        PromptSection(title="Discovery Summary", content=discovery_summary),
+        PromptSection(title="Use Cases", content=str(use_cases)),
+    ]
+
+
+def assemble_messages(
+    table_context: List[PromptSection],
+    task: str,
+    sections: List[PromptSection],
+    closing: str,
+) -> List[Dict[str, str]]:
+    """
+    Assemble the messages of a prompt, with the table context first.
+
+    Parameters
+    ----------
+    table_context : List[PromptSection]
+        The table context sections, from `create_table_context_sections()`.
+    task : str
+        The task of the node.
+    sections : List[PromptSection]
+        The sections of the node.
+    closing : str
+        The closing line.
+
+    Returns
+    -------
+    List[Dict[str, str]]
+        The system and user messages.
+    """
+
+    user_message = "\n\n".join(
+        [s.format() for s in table_context]
+        + ["---", task]
+        + [s.format() for s in sections]
+        + [closing]
+    )
+
+    return [
+        {"role": "system", "content": SYSTEM_MESSAGE},
+        {"role": "user", "content": user_message},
+    ]
+
+
+def format_table_schema(table_schema: TableSchema) -> str:
+    """
+    Format the columns and their descriptions of a table schema.
+
+    Parameters
+    ----------
+    table_schema : TableSchema
+        The table schema.
+
+    Returns
+    -------
+    str
+        One line per column.
+    """
+
+    descriptions = table_schema.get_descriptions()
+    return "\n".join([f"* {c}: {descriptions[c]}" for c in table_schema.column_names])
@@ -1,19 +1,27 @@
 from operator import add
-from typing import Annotated, Any, Dict, List, Optional, TypedDict
+from typing import Annotated, Any, Dict, List, Optional, TypedDict, Union
 
 import pandas as pd
 
+from graph_data_modeler_agent.change_detection.detection import TableChanges
 from graph_data_modeler_agent.components.discovery.models import DiscoveryResponse
-from graph_data_modeler_agent.data_dictionary.data_dictionary import TableSchema
+from graph_data_modeler_agent.data_dictionary.data_dictionary import (
+    DataDictionary,
+    TableSchema,
+)
+from graph_data_modeler_agent.data_dictionary.join_graph import JoinGraph
 from graph_data_modeler_agent.data_model.core import DataModel
+from graph_data_modeler_agent.data_source.data_source import DataSource
+from graph_data_modeler_agent.profiling.table_stats import TableStats
 
 
 class MultiSourceInputState(TypedDict):
     """
     The input state of the multi source agent.
+    `DataSource` inputs are read on demand, so tables are not all held in memory.
     """
 
-    data: List[pd.DataFrame]
+    data: List[Union[pd.DataFrame, DataSource]]
     data_dictionary: Optional[Dict[str, Any]]
     use_cases: List[str]
     additional_context: str
@@ -24,8 +32,12 @@ class MultiSourceInputState(TypedDict):
 class MultiSourceMainState(TypedDict):
     """
     The state of the multi source agent.
+    The join graph of the data dictionary holds the candidate relationships between tables and the groups of tables
+    that can be modeled independently.
     """
 
+    data_dictionary: DataDictionary
+    join_graph: JoinGraph
     errors: Annotated[List[str], add]
     steps: Annotated[List[Any], add]
     next_action: str
@@ -46,12 +58,17 @@ class MultiSourceOutputState(TypedDict):
 class SingleSourceInputState(TypedDict):
     """
     The input state of the single source agent.
+    If the outputs of a previous run are provided, they are reused and only the changed columns are discovered and modeled again.
     """
 
-    data: Optional[pd.DataFrame]
+    data: Optional[Union[pd.DataFrame, DataSource]]
     table_schema: Dict[str, Any]
     use_cases: List[str]
     additional_context: str
+    previous_discovery: Optional[DiscoveryResponse]
+    previous_table_schema: Optional[TableSchema]
+    previous_stats: Optional[TableStats]
+    previous_data_model: Optional[DataModel]
 
 
 class SingleSourceMainState(TypedDict):
@@ -59,13 +76,21 @@ class SingleSourceMainState(TypedDict):
     The state of the single source agent.
     """
 
+    data: Optional[Union[pd.DataFrame, DataSource]]
     data_model: DataModel
     discovery: DiscoveryResponse
     table_schema: TableSchema
     use_cases: List[str]
     additional_context: str
+    previous_discovery: Optional[DiscoveryResponse]
+    previous_table_schema: Optional[TableSchema]
+    previous_stats: Optional[TableStats]
+    previous_data_model: Optional[DataModel]
+    stats: Optional[TableStats]
+    table_changes: Optional[TableChanges]
     errors: Annotated[List[str], add]
     steps: Annotated[List[Any], add]
+    next_action: str
 
 
 class SingleSourceOutputState(TypedDict):
@@ -78,5 +103,7 @@ class SingleSourceOutputState(TypedDict):
     table_schema: TableSchema
     use_cases: List[str]
     additional_context: str
+    stats: Optional[TableStats]
+    table_changes: Optional[TableChanges]
     errors: Annotated[List[str], add]
     steps: Annotated[List[Any], add]
@@ -1,11 +1,13 @@
-from typing import Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, ValidationInfo, field_validator, model_validator
+from pydantic import ValidationInfo, field_validator, model_validator
+
+from .index import VersionedModel
 
 # from ....resources.mappings.type_mappings import PythonTypeEnum
 
 
-class Column(BaseModel, use_enum_values=True):
+class Column(VersionedModel, use_enum_values=True):
     """
     A column representation in a relational table.
 
@@ -41,6 +43,8 @@ class Column(BaseModel, use_enum_values=True):
     ignore: bool = False
     nullable: bool = True
 
+    versioned_lists: ClassVar[Tuple[str, ...]] = ("aliases",)
+
     @field_validator("aliases")
     def validate_aliases(
         cls, aliases: Optional[List[str]], info: ValidationInfo
@@ -63,7 +67,17 @@ class Column(BaseModel, use_enum_values=True):
         cls, python_type: Optional[str], info: ValidationInfo
     ) -> Optional[str]:
         if python_type is not None:
-            valid_python_types = ["str", "int", "float", "bool", "date", "datetime", "list", "dict"]
+            valid_python_types = [
+                "str",
+                "int",
+                "float",
+                "bool",
+                "date",
+                "datetime",
+                "list",
+                "dict",
+                "point",
+            ]
             if python_type.lower() not in valid_python_types:
                 raise ValueError(
                     f"Invalid Python type: {python_type}. Must be one of: {valid_python_types}"
@@ -1,14 +1,23 @@
-from typing import Any, Dict, List
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import PrivateAttr
 
 from .column import Column
+from .index import (
+    DataDictionaryIndex,
+    VersionedModel,
+    build_data_dictionary_index,
+    private,
+    share_version,
+    version,
+)
 from .table_schema import TableSchema
 
 
-class DataDictionary(BaseModel):
+class DataDictionary(VersionedModel):
     """
     The data dictionary describing all tables in the data.
+    Table, column and alias lookups use an index that is built on first use and rebuilt after the data dictionary changes.
 
     Attributes
     ----------
@@ -18,6 +27,51 @@ class DataDictionary(BaseModel):
 
     table_schemas: List[TableSchema]
 
+    versioned_lists: ClassVar[Tuple[str, ...]] = ("table_schemas",)
+
+    _index: Optional[Tuple[int, DataDictionaryIndex]] = PrivateAttr(default=None)
+    # table lookups don't need the column index, so they are cached separately to avoid building it
+    _table_schemas_dict: Optional[Tuple[int, Dict[str, TableSchema]]] = PrivateAttr(
+        default=None
+    )
+
+    @property
+    def index(self) -> DataDictionaryIndex:
+        """
+        The table, column and alias lookup index. The index is rebuilt if the data dictionary has changed since it was built.
+
+        Returns
+        -------
+        DataDictionaryIndex
+            The index.
+        """
+
+        signature = version(self)
+        cached: Optional[Tuple[int, DataDictionaryIndex]] = private(self)["_index"]
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        index = build_data_dictionary_index(self.table_schemas)
+        share_version(self, self.table_schemas)
+        for ts in self.table_schemas:
+            share_version(self, ts.columns)
+        private(self)["_index"] = (signature, index)
+        return index
+
+    @property
+    def foreign_key_graph(self) -> Dict[str, List[str]]:
+        """
+        A dictionary with table name keys and values of the table names referenced by the table's foreign keys.
+        A foreign key references a table whose primary key shares its name or one of its aliases.
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            The dictionary.
+        """
+
+        return {k: list(v) for k, v in self.index.foreign_key_graph.items()}
+
     @property
     def is_multifile(self) -> bool:
         """
@@ -99,9 +153,52 @@ class DataDictionary(BaseModel):
             The `table_name` is not found in the data dictionary.
         """
 
-        if res := {ts.name: ts for ts in self.table_schemas}.get(table_name):
+        signature = version(self)
+        cached: Optional[Tuple[int, Dict[str, TableSchema]]] = private(self)[
+            "_table_schemas_dict"
+        ]
+        if cached is None or cached[0] != signature:
+            cached = (signature, {ts.name: ts for ts in self.table_schemas})
+            share_version(self, self.table_schemas)
+            private(self)["_table_schemas_dict"] = cached
+
+        if res := cached[1].get(table_name):
             return res
         else:
             raise KeyError(
                 f"{table_name} is not a valid `TableSchema` name in this data dictionary."
             )
+
+    def get_tables_with_column(self, column_name: str) -> List[str]:
+        """
+        Retrieve the names of the tables that contain a column.
+
+        Parameters
+        ----------
+        column_name : str
+            The column name.
+
+        Returns
+        -------
+        List[str]
+            The table names. Empty if no table contains the column.
+        """
+
+        return list(self.index.column_tables.get(column_name, list()))
+
+    def get_alias_owners(self, alias: str) -> List[Tuple[str, str]]:
+        """
+        Retrieve the columns that declare an alias.
+
+        Parameters
+        ----------
+        alias : str
+            The alias.
+
+        Returns
+        -------
+        List[Tuple[str, str]]
+            The (table name, column name) pairs of the columns that declare the alias. Empty if no column declares it.
+        """
+
+        return list(self.index.alias_owners.get(alias, list()))
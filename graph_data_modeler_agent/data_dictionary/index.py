@@ -0,0 +1,385 @@
+"""
+Lookup indexes for `TableSchema` and `DataDictionary`.
+
+Indexes are built once on first lookup and reused until the indexed data changes.
+`Column`, `TableSchema` and `DataDictionary` hold a private version that counts the changes to the instance, both
+field assignments and in-place changes to its list fields. When an index is built, the version of the table or data
+dictionary is shared with the entities it indexes, so changes to a column also advance the version of the tables and
+data dictionaries indexing it. Changes to other entities don't. A cached index is stored with the version it was built
+at, so checking whether it is stale doesn't depend on the size of the table or data dictionary.
+The versions are left out of equality.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+from pydantic import BaseModel, PrivateAttr
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from .column import Column
+    from .table_schema import TableSchema
+
+
+class VersionedList(List[Any]):
+    """
+    A list field that advances the versions of the models holding it when it is changed in place.
+    """
+
+    def __init__(self, iterable: Iterable[Any] = ()) -> None:
+        super().__init__(iterable)
+        # the version and owner versions of each model holding this list
+        self.holders: List[Tuple[List[int], List[List[int]]]] = list()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # the items are passed to `__init__`, so the holders are set before any item is added
+        return (type(self), (list(self),), self.__dict__)
+
+    def _advance(self) -> None:
+        """Advance the versions of the models holding this list."""
+
+        for model_version, owner_versions in self.holders:
+            model_version[0] += 1
+            for owner_version in owner_versions:
+                owner_version[0] += 1
+
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self._advance()
+
+    def extend(self, items: Iterable[Any]) -> None:
+        super().extend(items)
+        self._advance()
+
+    def insert(self, index: Any, item: Any) -> None:
+        super().insert(index, item)
+        self._advance()
+
+    def pop(self, index: Any = -1) -> Any:
+        item = super().pop(index)
+        self._advance()
+        return item
+
+    def remove(self, item: Any) -> None:
+        super().remove(item)
+        self._advance()
+
+    def clear(self) -> None:
+        super().clear()
+        self._advance()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._advance()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._advance()
+
+    def __setitem__(self, index: Any, item: Any) -> None:
+        super().__setitem__(index, item)
+        self._advance()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._advance()
+
+    def __iadd__(self, items: Iterable[Any]) -> Self:  # type: ignore[misc]
+        super().__iadd__(items)
+        self._advance()
+        return self
+
+    def __imul__(self, n: Any) -> Self:  # type: ignore[misc]
+        super().__imul__(n)
+        self._advance()
+        return self
+
+
+class VersionedModel(BaseModel):
+    """
+    Base class for models that count the changes to their fields and to the fields of the entities they index.
+    """
+
+    # the list fields whose in-place changes advance the version
+    versioned_lists: ClassVar[Tuple[str, ...]] = ()
+
+    # a one item list, so it can be shared with the indexed entities
+    _version: List[int] = PrivateAttr(default_factory=lambda: [0])
+    # the versions of the tables and data dictionaries indexing this entity
+    _owner_versions: List[List[int]] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, __context: Any) -> None:
+        hold_lists(self, type(self).versioned_lists)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            if name in type(self).versioned_lists:
+                hold_lists(self, (name,))
+            advance_version(self)
+
+    def __eq__(self, other: object) -> bool:
+        # the fields are compared like `BaseModel.__eq__`, without the private attributes
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return (
+            type(self) is type(other)
+            and self.__dict__ == other.__dict__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+        )
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if deep:
+            # the version is deep copied along with the indexed entities and lists that share it
+            private(copied)["_version"][0] += 1
+        else:
+            # the version is shared with the original, so the copy gets its own
+            private(copied)["_version"] = [version(self) + 1]
+            private(copied)["_owner_versions"] = list()
+        # a shallow copy shares the lists of the original and updated lists aren't versioned yet
+        hold_lists(copied, type(copied).versioned_lists)
+        return copied
+
+
+def private(model: BaseModel) -> Dict[str, Any]:
+    """
+    The private attributes of a model.
+    `__pydantic_private__` is read directly to avoid the slow private attribute lookup.
+
+    Parameters
+    ----------
+    model : BaseModel
+        A model with private attributes.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The private attributes.
+    """
+
+    return cast(Dict[str, Any], model.__pydantic_private__)
+
+
+def version(model: VersionedModel) -> int:
+    """
+    The version of a model.
+
+    Parameters
+    ----------
+    model : VersionedModel
+        The model.
+
+    Returns
+    -------
+    int
+        The version.
+    """
+
+    return cast(int, private(model)["_version"][0])
+
+
+def advance_version(model: VersionedModel) -> None:
+    """
+    Advance the version of a model and of the tables and data dictionaries indexing it.
+
+    Parameters
+    ----------
+    model : VersionedModel
+        The changed model.
+    """
+
+    attributes = private(model)
+    attributes["_version"][0] += 1
+    for owner_version in attributes["_owner_versions"]:
+        owner_version[0] += 1
+
+
+def share_version(owner: VersionedModel, entities: Sequence[VersionedModel]) -> None:
+    """
+    Share the version of a table or data dictionary with the entities it indexes.
+
+    Parameters
+    ----------
+    owner : VersionedModel
+        The table or data dictionary.
+    entities : Sequence[VersionedModel]
+        The indexed entities.
+    """
+
+    owner_version = private(owner)["_version"]
+    for entity in entities:
+        owner_versions: List[List[int]] = private(entity)["_owner_versions"]
+        if not any(v is owner_version for v in owner_versions):
+            owner_versions.append(owner_version)
+
+
+def hold_lists(model: VersionedModel, names: Sequence[str]) -> None:
+    """
+    Make the list fields of a model advance its version when they are changed in place.
+
+    Parameters
+    ----------
+    model : VersionedModel
+        The model.
+    names : Sequence[str]
+        The names of the list fields. Fields set to None are skipped.
+    """
+
+    attributes = private(model)
+    holder = (attributes["_version"], attributes["_owner_versions"])
+    for name in names:
+        value = model.__dict__[name]
+        if value is None:
+            continue
+        if not isinstance(value, VersionedList):
+            value = VersionedList(value)
+            model.__dict__[name] = value
+        if not any(h[0] is holder[0] for h in value.holders):
+            value.holders.append(holder)
+
+
+class TableSchemaIndex(NamedTuple):
+    """
+    Lookups for a single table.
+
+    Attributes
+    ----------
+    columns_dict : Dict[str, Column]
+        Column name to `Column`.
+    column_names : List[str]
+        The column names in table order.
+    primary_key : Optional[Column]
+        The primary key column, if it exists.
+    foreign_keys : List[Column]
+        The foreign key columns.
+    """
+
+    columns_dict: Dict[str, "Column"]
+    column_names: List[str]
+    primary_key: Optional["Column"]
+    foreign_keys: List["Column"]
+
+
+class DataDictionaryIndex(NamedTuple):
+    """
+    Lookups across all tables.
+
+    Attributes
+    ----------
+    table_schemas_dict : Dict[str, TableSchema]
+        Table name to `TableSchema`.
+    column_tables : Dict[str, List[str]]
+        Column name to the names of the tables that contain it.
+    alias_owners : Dict[str, List[Tuple[str, str]]]
+        Alias to the (table name, column name) pairs of the columns that declare it.
+    foreign_key_graph : Dict[str, List[str]]
+        Table name to the names of the tables its foreign keys reference.
+        A foreign key references a table whose primary key shares its name or one of its aliases.
+    """
+
+    table_schemas_dict: Dict[str, "TableSchema"]
+    column_tables: Dict[str, List[str]]
+    alias_owners: Dict[str, List[Tuple[str, str]]]
+    foreign_key_graph: Dict[str, List[str]]
+
+
+def build_table_schema_index(columns: Sequence["Column"]) -> TableSchemaIndex:
+    """
+    Build the index of a table's columns.
+
+    Parameters
+    ----------
+    columns : Sequence[Column]
+        The table columns.
+
+    Returns
+    -------
+    TableSchemaIndex
+        The index.
+    """
+
+    columns_dict: Dict[str, "Column"] = dict()
+    foreign_keys: List["Column"] = list()
+    primary_key: Optional["Column"] = None
+
+    for c in columns:
+        columns_dict[c.name] = c
+        if c.primary_key and primary_key is None:
+            primary_key = c
+        if c.foreign_key:
+            foreign_keys.append(c)
+
+    return TableSchemaIndex(
+        columns_dict=columns_dict,
+        column_names=[c.name for c in columns],
+        primary_key=primary_key,
+        foreign_keys=foreign_keys,
+    )
+
+
+def build_data_dictionary_index(
+    table_schemas: Sequence["TableSchema"],
+) -> DataDictionaryIndex:
+    """
+    Build the index of a data dictionary's tables in a single pass over the columns.
+
+    Parameters
+    ----------
+    table_schemas : Sequence[TableSchema]
+        The table schemas.
+
+    Returns
+    -------
+    DataDictionaryIndex
+        The index.
+    """
+
+    table_schemas_dict: Dict[str, "TableSchema"] = dict()
+    column_tables: Dict[str, List[str]] = dict()
+    alias_owners: Dict[str, List[Tuple[str, str]]] = dict()
+    # primary key name or alias to the tables it identifies
+    primary_key_tables: Dict[str, List[str]] = dict()
+
+    for ts in table_schemas:
+        table_schemas_dict[ts.name] = ts
+        for c in ts.columns:
+            column_tables.setdefault(c.name, list()).append(ts.name)
+            for alias in c.aliases or list():
+                alias_owners.setdefault(alias, list()).append((ts.name, c.name))
+            if c.primary_key:
+                for name in [c.name] + (c.aliases or list()):
+                    primary_key_tables.setdefault(name, list()).append(ts.name)
+
+    foreign_key_graph: Dict[str, List[str]] = dict()
+    for ts in table_schemas:
+        referenced: List[str] = list()
+        for c in ts.columns:
+            if not c.foreign_key:
+                continue
+            for name in [c.name] + (c.aliases or list()):
+                for table_name in primary_key_tables.get(name, list()):
+                    if table_name != ts.name and table_name not in referenced:
+                        referenced.append(table_name)
+        foreign_key_graph[ts.name] = referenced
+
+    return DataDictionaryIndex(
+        table_schemas_dict=table_schemas_dict,
+        column_tables=column_tables,
+        alias_owners=alias_owners,
+        foreign_key_graph=foreign_key_graph,
+    )
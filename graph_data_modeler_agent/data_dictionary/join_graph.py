@@ -0,0 +1,472 @@
+"""
+Join graph analysis of a multi-file `DataDictionary`.
+
+Tables are joined by edges derived from the `primary_key`, `foreign_key` and `aliases` column attributes.
+The join graph identifies independent groups of tables, hub tables and junction tables, and precomputes candidate
+relationships that can be provided to the data modeling process.
+"""
+
+from typing import Dict, List, Literal, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from .data_dictionary import DataDictionary
+
+
+class JoinEdge(BaseModel):
+    """
+    A join between two table columns.
+
+    Attributes
+    ----------
+    source_table : str
+        The table containing `source_column`. For foreign key joins this is the referencing table.
+    source_column : str
+        The joining column in `source_table`.
+    target_table : str
+        The table containing `target_column`. For foreign key joins this is the referenced table.
+    target_column : str
+        The joining column in `target_table`.
+    kind : Literal["foreign_key", "alias"]
+        Whether the join is declared by a foreign key referencing a primary key, or by a column alias.
+    """
+
+    source_table: str
+    source_column: str
+    target_table: str
+    target_column: str
+    kind: Literal["foreign_key", "alias"]
+
+
+class CandidateRelationship(BaseModel):
+    """
+    A possible relationship between the entities of two tables.
+
+    Attributes
+    ----------
+    source_table : str
+        The source table.
+    target_table : str
+        The target table.
+    cardinality : Literal["many_to_one", "many_to_many", "unknown"]
+        The cardinality from source to target.
+    join_columns : List[Tuple[str, str]]
+        The (table name, column name) pairs that join the tables, in join order.
+    junction_table : Optional[str], optional
+        The junction table of a many to many relationship, by default None
+    """
+
+    source_table: str
+    target_table: str
+    cardinality: Literal["many_to_one", "many_to_many", "unknown"]
+    join_columns: List[Tuple[str, str]]
+    junction_table: Optional[str] = None
+
+
+class JoinGraph(BaseModel):
+    """
+    The join graph of a data dictionary.
+
+    Attributes
+    ----------
+    tables : List[str]
+        The table names.
+    edges : List[JoinEdge]
+        The joins between tables.
+    components : List[List[str]]
+        The groups of tables connected by joins, largest first. Tables without joins are their own component.
+    hub_tables : List[str]
+        Tables joined to many other tables, most joined first.
+    junction_tables : List[str]
+        Tables that mostly contain foreign keys to two or more tables. These are many to many relationship candidates.
+    candidate_relationships : List[CandidateRelationship]
+        The relationships implied by the joins.
+    """
+
+    tables: List[str]
+    edges: List[JoinEdge]
+    components: List[List[str]]
+    hub_tables: List[str]
+    junction_tables: List[str]
+    candidate_relationships: List[CandidateRelationship]
+
+    @property
+    def adjacency(self) -> Dict[str, List[str]]:
+        """
+        A dictionary with table name keys and values of the tables it is joined to.
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            The dictionary.
+        """
+
+        return _build_adjacency(self.tables, self.edges)
+
+    def get_component(self, table_name: str) -> List[str]:
+        """
+        Retrieve the component containing a table.
+
+        Parameters
+        ----------
+        table_name : str
+            The table name.
+
+        Returns
+        -------
+        List[str]
+            The tables in the component.
+
+        Raises
+        ------
+        KeyError
+            The `table_name` is not found in the join graph.
+        """
+
+        for component in self.components:
+            if table_name in component:
+                return component
+        raise KeyError(f"{table_name} is not a valid table name in this join graph.")
+
+    def get_candidate_relationships(
+        self, table_names: Optional[List[str]] = None
+    ) -> List[CandidateRelationship]:
+        """
+        Retrieve the candidate relationships between a subset of tables.
+
+        Parameters
+        ----------
+        table_names : Optional[List[str]], optional
+            The tables. Both the source and target table of a relationship must be included. By default None, which returns all.
+
+        Returns
+        -------
+        List[CandidateRelationship]
+            The candidate relationships.
+        """
+
+        if table_names is None:
+            return list(self.candidate_relationships)
+
+        names = set(table_names)
+        return [
+            r
+            for r in self.candidate_relationships
+            if r.source_table in names and r.target_table in names
+        ]
+
+    def format_candidate_relationships(
+        self, table_names: Optional[List[str]] = None
+    ) -> str:
+        """
+        Format the candidate relationships for a prompt.
+
+        Parameters
+        ----------
+        table_names : Optional[List[str]], optional
+            The tables. Both the source and target table of a relationship must be included. By default None, which formats all.
+
+        Returns
+        -------
+        str
+            A line per candidate relationship.
+        """
+
+        lines: List[str] = list()
+        for r in self.get_candidate_relationships(table_names):
+            joins = " = ".join([f"{t}.{c}" for t, c in r.join_columns])
+            via = f" via {r.junction_table}" if r.junction_table else ""
+            lines.append(
+                f"* ({r.source_table})-[{r.cardinality}]->({r.target_table}){via} joined on {joins}"
+            )
+        return "\n".join(lines) or "No candidate relationships found."
+
+
+def build_join_graph(
+    data_dictionary: DataDictionary,
+    hub_min_degree: int = 3,
+    max_junction_attribute_columns: int = 2,
+) -> JoinGraph:
+    """
+    Build the join graph of a data dictionary.
+
+    Parameters
+    ----------
+    data_dictionary : DataDictionary
+        The data dictionary.
+    hub_min_degree : int, optional
+        The min number of joined tables for a table to be a hub, by default 3
+    max_junction_attribute_columns : int, optional
+        The max number of non-joining, non-primary key columns in a junction table, by default 2
+
+    Returns
+    -------
+    JoinGraph
+        The join graph.
+    """
+
+    tables = [ts.name for ts in data_dictionary.table_schemas]
+    edges = _find_edges(data_dictionary)
+    adjacency = _build_adjacency(tables, edges)
+
+    hub_tables = sorted(
+        [t for t in tables if len(adjacency[t]) >= hub_min_degree],
+        key=lambda t: -len(adjacency[t]),
+    )
+    junction_tables = _find_junction_tables(
+        data_dictionary=data_dictionary,
+        edges=edges,
+        max_junction_attribute_columns=max_junction_attribute_columns,
+    )
+
+    return JoinGraph(
+        tables=tables,
+        edges=edges,
+        components=_find_components(tables, adjacency),
+        hub_tables=hub_tables,
+        junction_tables=junction_tables,
+        candidate_relationships=_find_candidate_relationships(
+            data_dictionary=data_dictionary,
+            edges=edges,
+            junction_tables=junction_tables,
+        ),
+    )
+
+
+def split_data_dictionary_by_component(
+    data_dictionary: DataDictionary, join_graph: Optional[JoinGraph] = None
+) -> List[DataDictionary]:
+    """
+    Split a data dictionary into one data dictionary per join graph component.
+    Components share no joins, so they may be modeled independently and in parallel.
+
+    Parameters
+    ----------
+    data_dictionary : DataDictionary
+        The data dictionary.
+    join_graph : Optional[JoinGraph], optional
+        The join graph of the data dictionary. By default None, which builds it.
+
+    Returns
+    -------
+    List[DataDictionary]
+        A data dictionary per component, largest first.
+    """
+
+    join_graph = join_graph or build_join_graph(data_dictionary)
+
+    return [
+        DataDictionary(
+            table_schemas=[data_dictionary.get_table_schema(t) for t in component]
+        )
+        for component in join_graph.components
+    ]
+
+
+def _find_edges(data_dictionary: DataDictionary) -> List[JoinEdge]:
+    """Find foreign key joins, then alias joins between columns not already joined."""
+
+    index = data_dictionary.index
+    # primary key name or alias to the (table, column) pairs it identifies
+    primary_keys: Dict[str, List[Tuple[str, str]]] = dict()
+    for ts in data_dictionary.table_schemas:
+        pk = ts.primary_key
+        if pk is not None:
+            for name in [pk.name] + (pk.aliases or list()):
+                primary_keys.setdefault(name, list()).append((ts.name, pk.name))
+
+    edges: List[JoinEdge] = list()
+    joined: Set[Tuple[str, str, str, str]] = set()
+
+    def _add(edge: JoinEdge) -> None:
+        source = (edge.source_table, edge.source_column)
+        target = (edge.target_table, edge.target_column)
+        if edge.source_table != edge.target_table and not joined & {
+            source + target,
+            target + source,
+        }:
+            joined.add(source + target)
+            edges.append(edge)
+
+    for ts in data_dictionary.table_schemas:
+        for fk in ts.foreign_keys:
+            for name in [fk.name] + (fk.aliases or list()):
+                for table_name, column_name in primary_keys.get(name, list()):
+                    _add(
+                        JoinEdge(
+                            source_table=ts.name,
+                            source_column=fk.name,
+                            target_table=table_name,
+                            target_column=column_name,
+                            kind="foreign_key",
+                        )
+                    )
+
+    for ts in data_dictionary.table_schemas:
+        for col in ts.columns:
+            for alias in col.aliases or list():
+                for table_name in index.column_tables.get(alias, list()):
+                    _add(
+                        JoinEdge(
+                            source_table=ts.name,
+                            source_column=col.name,
+                            target_table=table_name,
+                            target_column=alias,
+                            kind="alias",
+                        )
+                    )
+
+    return edges
+
+
+def _build_adjacency(tables: List[str], edges: List[JoinEdge]) -> Dict[str, List[str]]:
+    """Build the undirected table adjacency, ignoring duplicate joins."""
+
+    adjacency: Dict[str, List[str]] = {t: list() for t in tables}
+    for e in edges:
+        if e.target_table not in adjacency[e.source_table]:
+            adjacency[e.source_table].append(e.target_table)
+            adjacency[e.target_table].append(e.source_table)
+    return adjacency
+
+
+def _find_components(
+    tables: List[str], adjacency: Dict[str, List[str]]
+) -> List[List[str]]:
+    """Find the connected components with a breadth first search. Tables keep their data dictionary order."""
+
+    order = {t: i for i, t in enumerate(tables)}
+    seen: Set[str] = set()
+    components: List[List[str]] = list()
+
+    for table in tables:
+        if table in seen:
+            continue
+        seen.add(table)
+        component = [table]
+        frontier = [table]
+        while frontier:
+            nxt: List[str] = list()
+            for t in frontier:
+                for neighbor in adjacency[t]:
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        component.append(neighbor)
+                        nxt.append(neighbor)
+            frontier = nxt
+        components.append(sorted(component, key=lambda t: order[t]))
+
+    return sorted(components, key=lambda c: -len(c))
+
+
+def _find_junction_tables(
+    data_dictionary: DataDictionary,
+    edges: List[JoinEdge],
+    max_junction_attribute_columns: int,
+) -> List[str]:
+    """Find tables with foreign key joins to two or more tables and few other columns."""
+
+    referenced: Dict[str, Set[str]] = dict()
+    joining_columns: Dict[str, Set[str]] = dict()
+    for e in edges:
+        if e.kind == "foreign_key":
+            referenced.setdefault(e.source_table, set()).add(e.target_table)
+            joining_columns.setdefault(e.source_table, set()).add(e.source_column)
+
+    res: List[str] = list()
+    for ts in data_dictionary.table_schemas:
+        if len(referenced.get(ts.name, set())) < 2:
+            continue
+        attribute_columns = [
+            c
+            for c in ts.columns
+            if c.name not in joining_columns[ts.name] and not c.primary_key
+        ]
+        if len(attribute_columns) <= max_junction_attribute_columns:
+            res.append(ts.name)
+
+    return res
+
+
+def _find_candidate_relationships(
+    data_dictionary: DataDictionary,
+    edges: List[JoinEdge],
+    junction_tables: List[str],
+) -> List[CandidateRelationship]:
+    """
+    Foreign key joins are many to one from the referencing table to the referenced table.
+    Junction tables are replaced by many to many relationships between each pair of tables they reference.
+    Alias joins are many to one if they target a primary key, otherwise the cardinality is unknown.
+    """
+
+    junctions = set(junction_tables)
+    res: List[CandidateRelationship] = list()
+    # junction table to its outgoing foreign key joins
+    junction_edges: Dict[str, List[JoinEdge]] = dict()
+
+    for e in edges:
+        if e.kind == "foreign_key" and e.source_table in junctions:
+            junction_edges.setdefault(e.source_table, list()).append(e)
+            continue
+
+        cardinality: Literal["many_to_one", "unknown"]
+        if e.kind == "foreign_key":
+            cardinality = "many_to_one"
+        else:
+            target_pk = data_dictionary.get_table_schema(e.target_table).primary_key
+            source_pk = data_dictionary.get_table_schema(e.source_table).primary_key
+            if target_pk is not None and target_pk.name == e.target_column:
+                cardinality = "many_to_one"
+            elif source_pk is not None and source_pk.name == e.source_column:
+                # orient alias joins from the many side to the primary key side
+                res.append(
+                    CandidateRelationship(
+                        source_table=e.target_table,
+                        target_table=e.source_table,
+                        cardinality="many_to_one",
+                        join_columns=[
+                            (e.target_table, e.target_column),
+                            (e.source_table, e.source_column),
+                        ],
+                    )
+                )
+                continue
+            else:
+                cardinality = "unknown"
+
+        res.append(
+            CandidateRelationship(
+                source_table=e.source_table,
+                target_table=e.target_table,
+                cardinality=cardinality,
+                join_columns=[
+                    (e.source_table, e.source_column),
+                    (e.target_table, e.target_column),
+                ],
+            )
+        )
+
+    for junction_table, j_edges in junction_edges.items():
+        for i, a in enumerate(j_edges):
+            for b in j_edges[i + 1 :]:
+                if (a.target_table, a.target_column) == (
+                    b.target_table,
+                    b.target_column,
+                ):
+                    continue
+                res.append(
+                    CandidateRelationship(
+                        source_table=a.target_table,
+                        target_table=b.target_table,
+                        cardinality="many_to_many",
+                        join_columns=[
+                            (a.target_table, a.target_column),
+                            (junction_table, a.source_column),
+                            (junction_table, b.source_column),
+                            (b.target_table, b.target_column),
+                        ],
+                        junction_table=junction_table,
+                    )
+                )
+
+    return res
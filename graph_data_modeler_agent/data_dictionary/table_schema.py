@@ -1,13 +1,22 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple
 
-from pydantic import BaseModel, field_validator
+from pydantic import PrivateAttr, field_validator
 
 from .column import Column
+from .index import (
+    TableSchemaIndex,
+    VersionedModel,
+    build_table_schema_index,
+    private,
+    share_version,
+    version,
+)
 
 
-class TableSchema(BaseModel):
+class TableSchema(VersionedModel):
     """
     The table schema for a relational table.
+    Column lookups use an index that is built on first use and rebuilt after the table or its columns change.
 
     Attributes
     ----------
@@ -20,6 +29,10 @@ class TableSchema(BaseModel):
     columns: List[Column]
     name: str
 
+    versioned_lists: ClassVar[Tuple[str, ...]] = ("columns",)
+
+    _index: Optional[Tuple[int, TableSchemaIndex]] = PrivateAttr(default=None)
+
     @field_validator("columns")
     def validate_columns(cls, columns: List[Column]) -> List[Column]:
         primary_keys = [c.name for c in columns if c.primary_key]
@@ -29,6 +42,27 @@ class TableSchema(BaseModel):
             )
         return columns
 
+    @property
+    def index(self) -> TableSchemaIndex:
+        """
+        The column lookup index. The index is rebuilt if the table or its columns have changed since it was built.
+
+        Returns
+        -------
+        TableSchemaIndex
+            The index.
+        """
+
+        signature = version(self)
+        cached: Optional[Tuple[int, TableSchemaIndex]] = private(self)["_index"]
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        index = build_table_schema_index(self.columns)
+        share_version(self, self.columns)
+        private(self)["_index"] = (signature, index)
+        return index
+
     @property
     def columns_dict(self) -> Dict[str, Column]:
         """
@@ -40,7 +74,7 @@ class TableSchema(BaseModel):
             The dictionary.
         """
 
-        return {c.name: c for c in self.columns}
+        return dict(self.index.columns_dict)
 
     @property
     def column_names(self) -> List[str]:
@@ -53,7 +87,7 @@ class TableSchema(BaseModel):
             A list of column names.
         """
 
-        return [c.name for c in self.columns]
+        return list(self.index.column_names)
 
     @property
     def primary_key(self) -> Optional[Column]:
@@ -65,11 +99,7 @@ class TableSchema(BaseModel):
         Optional[Column]
             The primary key column, if it exists or `None`.
         """
-        pk = [c for c in self.columns if c.primary_key]
-        if pk:
-            return pk[0]
-        else:
-            return None
+        return self.index.primary_key
 
     @property
     def foreign_keys(self) -> List[Column]:
@@ -82,7 +112,7 @@ class TableSchema(BaseModel):
             The foreign key columns.
         """
 
-        return [c for c in self.columns if c.foreign_key]
+        return list(self.index.foreign_keys)
 
     @property
     def compact_dict(self) -> Dict[str, Any]:
@@ -114,7 +144,24 @@ class TableSchema(BaseModel):
             A `Column` object if it exists, or None
         """
 
-        return self.columns_dict.get(column_name)
+        return self.index.columns_dict.get(column_name)
+
+    def has_column(self, column_name: Optional[str]) -> bool:
+        """
+        Whether a column exists in the table.
+
+        Parameters
+        ----------
+        column_name : Optional[str]
+            The name of the column, such as a property alias. None is never a column.
+
+        Returns
+        -------
+        bool
+            Whether the column exists.
+        """
+
+        return column_name in self.index.columns_dict
 
     def get_description(self, column_name: str) -> str:
         """
@@ -131,7 +178,35 @@ class TableSchema(BaseModel):
             A description of the column, if it exists.
         """
 
-        col = self.columns_dict.get(column_name)
+        col = self.index.columns_dict.get(column_name)
         if col is not None:
             return col.description or ""
         return ""
+
+    def get_descriptions(
+        self, column_names: Optional[Sequence[str]] = None
+    ) -> Dict[str, str]:
+        """
+        Retrieve the descriptions for many columns with a single index lookup. Columns without a description map to an empty string.
+
+        Parameters
+        ----------
+        column_names : Optional[Sequence[str]], optional
+            The column names to search for in the table. By default all columns in the table.
+
+        Returns
+        -------
+        Dict[str, str]
+            Column name to the description of the column, if it exists.
+        """
+
+        index = self.index
+        if column_names is None:
+            column_names = index.column_names
+        descriptions: Dict[str, str] = dict()
+        for column_name in column_names:
+            col = index.columns_dict.get(column_name)
+            descriptions[column_name] = (
+                (col.description or "") if col is not None else ""
+            )
+        return descriptions
@@ -1,4 +1,8 @@
-from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import os
+import pickle
+from typing import Any, Callable, Dict, List, Optional, Set
 
 import pandas as pd
 import yaml
@@ -7,28 +11,184 @@ from .column import Column
 from .data_dictionary import DataDictionary
 from .table_schema import TableSchema
 
+# the LibYAML C loader is an order of magnitude faster than the pure Python loader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# increment when the cached `DataDictionary` format changes
+_CACHE_FORMAT_VERSION = 1
 
-def load_data_dictionary_from_yaml(file_path: str) -> DataDictionary:
+
+def load_data_dictionary(
+    file_path: str, cache_dir: Optional[str] = None
+) -> DataDictionary:
+    """
+    Load a data dictionary stored in a yaml or json file. Can either be a multi or single file data dictionary.
+    The file format is determined by the file extension.
+
+    Parameters
+    ----------
+    file_path : str
+        The location of the file. Must end with `.yaml`, `.yml` or `.json`.
+    cache_dir : Optional[str], optional
+        A directory to cache the validated `DataDictionary` in. By default None, which doesn't cache.
+        See `load_data_dictionary_from_yaml` for details.
+
+    Returns
+    -------
+    DataDictionary
+        The data dictionary.
+
+    Raises
+    ------
+    ValueError
+        The file extension is not supported.
+    """
+
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in {".yaml", ".yml"}:
+        return load_data_dictionary_from_yaml(file_path=file_path, cache_dir=cache_dir)
+    elif extension == ".json":
+        return load_data_dictionary_from_json(file_path=file_path, cache_dir=cache_dir)
+    else:
+        raise ValueError(
+            f"Unsupported data dictionary file extension: {extension}. Must be one of: ['.yaml', '.yml', '.json']"
+        )
+
+
+def load_data_dictionary_from_yaml(
+    file_path: str, cache_dir: Optional[str] = None
+) -> DataDictionary:
     """
     Load a data dictionary stored in a yaml file. Can either be a multi or single file data dictionary.
+    The LibYAML C loader is used if it is available.
+
+    If `cache_dir` is provided, the validated `DataDictionary` is pickled to the cache directory, keyed by the file path.
+    Later loads of the same file return the cached `DataDictionary` if the file modification time and size are unchanged,
+    or if the file content hash is unchanged. Only use a cache directory that you trust, since cached files are unpickled.
+
+    Parameters
+    ----------
+    file_path : str
+        The location of the file.
+    cache_dir : Optional[str], optional
+        A directory to cache the validated `DataDictionary` in, by default None
+
+    Returns
+    -------
+    DataDictionary
+        The data dictionary.
+    """
+
+    return _load_data_dictionary_file(
+        file_path=file_path,
+        parse=lambda content: yaml.load(content, Loader=_YAML_LOADER),
+        cache_dir=cache_dir,
+    )
+
+
+def load_data_dictionary_from_json(
+    file_path: str, cache_dir: Optional[str] = None
+) -> DataDictionary:
+    """
+    Load a data dictionary stored in a json file. Can either be a multi or single file data dictionary.
+    The json file has the same structure as the yaml file.
 
     Parameters
     ----------
     file_path : str
         The location of the file.
+    cache_dir : Optional[str], optional
+        A directory to cache the validated `DataDictionary` in. By default None, which doesn't cache.
+        See `load_data_dictionary_from_yaml` for details.
 
     Returns
     -------
-    Dict[str, Any]
-        The data dictionary as a Python dictionary.
+    DataDictionary
+        The data dictionary.
     """
 
-    with open(file_path, "r") as f:
+    return _load_data_dictionary_file(
+        file_path=file_path, parse=json.loads, cache_dir=cache_dir
+    )
+
+
+def _load_data_dictionary_file(
+    file_path: str,
+    parse: Callable[[bytes], Dict[str, Any]],
+    cache_dir: Optional[str],
+) -> DataDictionary:
+    """Load and validate a data dictionary file, using the cache if provided."""
+
+    if cache_dir is None:
+        with open(file_path, "rb") as f:
+            content = f.read()
+        return _validate_file_contents(parse(content))
+
+    stat = os.stat(file_path)
+    cache_path = os.path.join(
+        cache_dir,
+        hashlib.sha256(os.path.abspath(file_path).encode("utf-8")).hexdigest() + ".pkl",
+    )
+    cached = _read_cache(cache_path)
+    if cached is not None and (cached["mtime_ns"], cached["size"]) == (
+        stat.st_mtime_ns,
+        stat.st_size,
+    ):
+        return cached["data_dictionary"]  # type: ignore[no-any-return]
+
+    with open(file_path, "rb") as f:
         content = f.read()
+    content_hash = hashlib.sha256(content).hexdigest()
 
-    loaded_yaml = yaml.safe_load(content)
+    if cached is not None and cached["content_hash"] == content_hash:
+        data_dictionary: DataDictionary = cached["data_dictionary"]
+    else:
+        data_dictionary = _validate_file_contents(parse(content))
+
+    _write_cache(
+        cache_path=cache_path,
+        contents={
+            "version": _CACHE_FORMAT_VERSION,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "content_hash": content_hash,
+            "data_dictionary": data_dictionary,
+        },
+    )
 
-    values = _format_yaml_contents(loaded_yaml)
+    return data_dictionary
+
+
+def _read_cache(cache_path: str) -> Optional[Dict[str, Any]]:
+    """Read a cached data dictionary. Missing, unreadable or outdated caches are ignored."""
+
+    try:
+        with open(cache_path, "rb") as f:
+            contents: Dict[str, Any] = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+    if (
+        not isinstance(contents, dict)
+        or contents.get("version") != _CACHE_FORMAT_VERSION
+    ):
+        return None
+    return contents
+
+
+def _write_cache(cache_path: str, contents: Dict[str, Any]) -> None:
+    """Write a cached data dictionary atomically, so concurrent loads never read a partial file."""
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(contents, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+
+def _validate_file_contents(file_contents: Dict[str, Any]) -> DataDictionary:
+    """Validate the parsed contents of a yaml or json data dictionary file."""
+
+    values = _format_yaml_contents(file_contents)
 
     return DataDictionary.model_validate(
         {"table_schemas": values.get("table_schema_list")},
@@ -42,43 +202,36 @@ def _format_yaml_contents(yaml_contents: Dict[str, Any]) -> Dict[str, Any]:
     ), "data dictionary yaml file must have 'files' key header."
 
     table_schema_list = list()
-    all_property_names = set()
+    # a set, so alias validation is a constant time lookup per alias
+    all_property_names: Set[str] = set()
 
     for table_schema in yaml_contents["files"]:
         table_schema_dict = {"name": table_schema.get("name")}
         columns_list = list()
         for col in table_schema.get("columns", list()):
-            column_dict = dict()
-            column_dict.update({"name": col.get("name")})
-            column_dict.update(
-                {"description": col.get("desc") or col.get("description")}
-            )
-            column_dict.update({"python_type": col.get("python_type")})
-            column_dict.update(
-                {"aliases": col.get("aliases") or _get_aliases_from_alias(col_dict=col)}
-            )
-
-            if col.get("primary_key") is not None:
-                column_dict.update({"primary_key": col.get("primary_key")})
-            if col.get("foreign_key") is not None:
-                column_dict.update({"foreign_key": col.get("foreign_key")})
-            if col.get("ignore") is not None:
-                column_dict.update({"ignore": col.get("ignore")})
-            if col.get("nullable") is not None:
-                column_dict.update({"nullable": col.get("nullable")})
+            aliases = col.get("aliases") or _get_aliases_from_alias(col_dict=col)
+            column_dict = {
+                "name": col.get("name"),
+                "description": col.get("desc") or col.get("description"),
+                "python_type": col.get("python_type"),
+                "aliases": aliases,
+            }
+
+            for attr in ["primary_key", "foreign_key", "ignore", "nullable"]:
+                if col.get(attr) is not None:
+                    column_dict[attr] = col[attr]
 
             columns_list.append(column_dict)
 
             all_property_names.add(col.get("name"))
-            all_property_names.add(col.get("aliases"))
-            all_property_names.add(col.get("alias"))
+            all_property_names.update(aliases or list())
 
         table_schema_dict.update({"columns": columns_list})
         table_schema_list.append(table_schema_dict)
 
     return {
         "table_schema_list": table_schema_list,
-        "all_property_names": list(all_property_names),
+        "all_property_names": all_property_names,
     }
 
 
@@ -216,7 +369,7 @@ def load_table_schema_from_compact_python_dictionary(
 
 
 def create_data_dictionary_from_pandas_dataframe(
-    dataframe: pd.DataFrame, name: str = "file"
+    dataframe: pd.DataFrame, name: str = "file", infer_types: bool = False
 ) -> DataDictionary:
     """
     Create a `DataDictionary` from the columns of a provided DataFrame.
@@ -225,12 +378,24 @@ def create_data_dictionary_from_pandas_dataframe(
     ----------
     dataframe : pd.DataFrame
         The Pandas DataFrame
+    name : str, optional
+        The table name, by default "file"
+    infer_types : bool, optional
+        Whether to infer the `python_type` and `nullable` attributes of each column from the data, by default False
 
     Returns
     -------
     DataDictionary
     """
 
+    if infer_types:
+        # imported here to avoid a circular import
+        from ..profiling.type_inference import infer_table_schema
+
+        return DataDictionary(
+            table_schemas=[infer_table_schema(data=dataframe, name=name)]
+        )
+
     table_schema = TableSchema(
         name=name, columns=[Column(name=c) for c in list(dataframe.columns)]
     )
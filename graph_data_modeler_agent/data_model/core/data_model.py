@@ -30,6 +30,7 @@ from ..solutions_workbench import (
 from .node import Node
 from .property import Property
 from .relationship import Relationship
+from .svg_visualization import render_html, render_svg
 from .visualization import create_dot
 
 
@@ -64,7 +65,8 @@ class DataModel(BaseModel):
         ----------
         verbose : bool, optional
             Whether to provide more detail, by default True
-
+        neo4j_typing : bool, optional
+            Whether to use Neo4j types instead of Python types, by default True
         print_schema : bool, optional
             Whether to auto print the schema, by default False
 
@@ -74,19 +76,22 @@ class DataModel(BaseModel):
             The schema
         """
 
-        nodes = ""
-        rels = ""
-
-        for n in self.nodes:
-            nodes += n.get_schema(verbose=verbose, neo4j_typing=neo4j_typing)
-        for r in self.relationships:
-            rels += r.get_schema(verbose=verbose, neo4j_typing=neo4j_typing)
-
-        schema = f"""Nodes
-{nodes}
-Relationships
-{rels}
-"""
+        # each `Node` and `Relationship` memoizes its own fragment, so only changed entities are re-rendered
+        schema = "".join(
+            [
+                "Nodes\n",
+                *[
+                    n.get_schema(verbose=verbose, neo4j_typing=neo4j_typing)
+                    for n in self.nodes
+                ],
+                "\nRelationships\n",
+                *[
+                    r.get_schema(verbose=verbose, neo4j_typing=neo4j_typing)
+                    for r in self.relationships
+                ],
+                "\n",
+            ]
+        )
         if print_schema:
             print(schema)
 
@@ -269,10 +274,9 @@ Relationships
                         for prop in source_node.unique_properties:
                             if (
                                 prop.alias is None
-                                and prop.column_mapping
-                                not in data_dictionary.get_table_schema(
+                                and not data_dictionary.get_table_schema(
                                     rel.source_name
-                                ).column_names
+                                ).has_column(prop.column_mapping)
                             ):
                                 errors.append(
                                     InitErrorDetails(
@@ -286,10 +290,9 @@ Relationships
                                     )
                                 )
                             elif (
-                                prop.alias
-                                not in data_dictionary.get_table_schema(
+                                not data_dictionary.get_table_schema(
                                     rel.source_name
-                                ).column_names
+                                ).has_column(prop.alias)
                             ):
                                 errors.append(
                                     InitErrorDetails(
@@ -305,10 +308,9 @@ Relationships
                             # here we assume the column_mapping is the same across files
                             elif (
                                 prop.alias is None
-                                and prop.column_mapping
-                                in data_dictionary.get_table_schema(
+                                and data_dictionary.get_table_schema(
                                     rel.source_name
-                                ).column_names
+                                ).has_column(prop.column_mapping)
                             ):
                                 prop.alias = prop.column_mapping
 
@@ -319,10 +321,9 @@ Relationships
                         for prop in target_node.unique_properties:
                             if (
                                 prop.alias is None
-                                and prop.alias
-                                not in data_dictionary.get_table_schema(
+                                and not data_dictionary.get_table_schema(
                                     rel.source_name
-                                ).column_names
+                                ).has_column(prop.alias)
                             ):
                                 errors.append(
                                     InitErrorDetails(
@@ -336,10 +337,9 @@ Relationships
                                     )
                                 )
                             elif (
-                                prop.alias
-                                not in data_dictionary.get_table_schema(
+                                not data_dictionary.get_table_schema(
                                     rel.source_name
-                                ).column_names
+                                ).has_column(prop.alias)
                             ):
                                 errors.append(
                                     InitErrorDetails(
@@ -355,10 +355,9 @@ Relationships
                             # here we assume the column_mapping is the same across files
                             elif (
                                 prop.alias is None
-                                and prop.column_mapping
-                                in data_dictionary.get_table_schema(
+                                and data_dictionary.get_table_schema(
                                     rel.source_name
-                                ).column_names
+                                ).has_column(prop.column_mapping)
                             ):
                                 prop.alias = prop.column_mapping
 
@@ -543,10 +542,15 @@ Relationships
         return self
 
     def visualize(
-        self, detail_level: Literal[1, 2, 3] = 3, neo4j_typing: bool = False
+        self,
+        detail_level: Literal[1, 2, 3] = 3,
+        neo4j_typing: bool = False,
+        cluster_by_source: bool = False,
+        max_properties: Optional[int] = None,
     ) -> Digraph:
         """
         Visualize the data model using Graphviz. Requires that Graphviz is installed.
+        Rendered output is cached by DOT source, so displaying an unchanged data model again does not re-run Graphviz.
 
         Parameters
         ----------
@@ -557,6 +561,11 @@ Relationships
                 3: Node labels, Relationship types and all Property info
         neo4j_typing : bool, optional
             Whether to use Neo4j types instead of Python types, by default False
+        cluster_by_source : bool, optional
+            Whether to group nodes by `source_name`, by default False
+        max_properties : Optional[int], optional
+            The max number of properties to display per node or relationship before collapsing the rest.
+            Useful for large data models. By default None
 
         Returns
         -------
@@ -570,12 +579,116 @@ Relationships
                 relationships=self.relationships,
                 detail_level=detail_level,
                 neo4j_typing=neo4j_typing,
+                cluster_by_source=cluster_by_source,
+                max_properties=max_properties,
             )
         except Exception as e:
             print(
                 f"Unable to visualize data model. Is `Graphviz` installed properly? Error: {e}"
             )
 
+    def to_svg(
+        self,
+        file_path: str = "data-model.svg",
+        write_file: bool = True,
+        detail_level: Literal[1, 2, 3] = 3,
+        neo4j_typing: bool = False,
+        layout: Literal["force", "layered"] = "force",
+        max_properties: Optional[int] = None,
+    ) -> str:
+        """
+        Render the data model as an SVG without Graphviz. The layout is computed in process.
+
+        Parameters
+        ----------
+        file_path : str, optional
+            The file path to write if write_file = True, by default "data-model.svg"
+        write_file : bool, optional
+            Whether to write the file, by default True
+        detail_level : Literal[1, 2, 3]
+            The level of detail to include in the visual\n
+                1: Node labels and Relationship types only\n
+                2: Node labels, Relationship types and basic Property info\n
+                3: Node labels, Relationship types and all Property info
+        neo4j_typing : bool, optional
+            Whether to use Neo4j types instead of Python types, by default False
+        layout : Literal["force", "layered"], optional
+            The layout algorithm, by default "force"
+        max_properties : Optional[int], optional
+            The max number of properties to display per node or relationship before collapsing the rest, by default None
+
+        Returns
+        -------
+        str
+            The SVG document.
+        """
+
+        svg = render_svg(
+            nodes=self.nodes,
+            relationships=self.relationships,
+            detail_level=detail_level,
+            neo4j_typing=neo4j_typing,
+            layout=layout,
+            max_properties=max_properties,
+        )
+
+        if write_file:
+            with open(f"{file_path}", "w") as f:
+                f.write(svg)
+
+        return svg
+
+    def to_html(
+        self,
+        file_path: str = "data-model.html",
+        write_file: bool = True,
+        detail_level: Literal[1, 2, 3] = 3,
+        neo4j_typing: bool = False,
+        layout: Literal["force", "layered"] = "force",
+        max_properties: Optional[int] = None,
+    ) -> str:
+        """
+        Render the data model as a standalone HTML page without Graphviz. The layout is computed in process.
+
+        Parameters
+        ----------
+        file_path : str, optional
+            The file path to write if write_file = True, by default "data-model.html"
+        write_file : bool, optional
+            Whether to write the file, by default True
+        detail_level : Literal[1, 2, 3]
+            The level of detail to include in the visual\n
+                1: Node labels and Relationship types only\n
+                2: Node labels, Relationship types and basic Property info\n
+                3: Node labels, Relationship types and all Property info
+        neo4j_typing : bool, optional
+            Whether to use Neo4j types instead of Python types, by default False
+        layout : Literal["force", "layered"], optional
+            The layout algorithm, by default "force"
+        max_properties : Optional[int], optional
+            The max number of properties to display per node or relationship before collapsing the rest, by default None
+
+        Returns
+        -------
+        str
+            The HTML document.
+        """
+
+        html = render_html(
+            nodes=self.nodes,
+            relationships=self.relationships,
+            detail_level=detail_level,
+            neo4j_typing=neo4j_typing,
+            layout=layout,
+            max_properties=max_properties,
+        )
+
+        if write_file:
+            with open(f"{file_path}", "w") as f:
+                f.write(html)
+
+        return html
+
     def to_json(self, file_path: str = "data-model.json") -> Dict[str, Any]:
         """
         Output the data model to a json file.
@@ -18,9 +18,10 @@ from ...exceptions import (
 from ..arrows import ArrowsNode
 from ..solutions_workbench import SolutionsWorkbenchNode
 from .property import Property
+from .schema_cache import SchemaCachedModel
 
 
-class Node(BaseModel):
+class Node(SchemaCachedModel):
     """
     Standard Node representation.
     A node is an entity in the database.
@@ -65,15 +66,19 @@ class Node(BaseModel):
             The schema
         """
 
-        props = ""
-        for p in self.properties:
-            props += (
+        variant = (verbose, neo4j_typing)
+        signature = self._schema_signature(self.properties)
+        if (schema := self._get_cached_schema(variant, signature)) is not None:
+            return schema
+
+        schema = f"(:{self.label})\n" + "".join(
+            [
                 "* " + p.get_schema(verbose=verbose, neo4j_typing=neo4j_typing) + "\n"
-            )
-        schema = f"""(:{self.label})
-{props}"""
+                for p in self.properties
+            ]
+        )
 
-        return schema
+        return self._set_cached_schema(variant, signature, schema)
 
     @property
     def property_names(self) -> List[str]:
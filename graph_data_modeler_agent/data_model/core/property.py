@@ -1,6 +1,6 @@
 from typing import Dict, Optional
 
-from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from pydantic import Field, ValidationInfo, field_validator
 from pydantic.alias_generators import to_camel
 
 from ...resources import (
@@ -11,6 +11,7 @@ from ...resources import (
     PythonTypeEnum,
 )
 from ..solutions_workbench import SolutionsWorkbenchProperty
+from .schema_cache import SchemaCachedModel
 
 NEO4J_TYPES = {
     "LIST",
@@ -30,7 +31,7 @@ NEO4J_TYPES = {
 }
 
 
-class Property(BaseModel):
+class Property(SchemaCachedModel):
     """
     Property representation.
 
@@ -112,17 +113,19 @@ class Property(BaseModel):
             The schema
         """
 
-        ending = ""
-        if self.is_key:
-            ending = " | KEY"
+        variant = (verbose, neo4j_typing)
+        signature = self._schema_signature()
+        if (schema := self._get_cached_schema(variant, signature)) is not None:
+            return schema
 
         if verbose:
-            return (
-                f"{self.name} ({self.column_mapping}): {self.type}"
-                + ending
+            schema = f"{self.name} ({self.column_mapping}): {self.type}" + (
+                " | KEY" if self.is_key else ""
             )
         else:
-            return f"{self.name}: {self.type}"
+            schema = f"{self.name}: {self.type}"
+
+        return self._set_cached_schema(variant, signature, schema)
 
     @property
     def neo4j_type(self) -> str:
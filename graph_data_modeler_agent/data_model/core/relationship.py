@@ -1,7 +1,6 @@
 from typing import Dict, List
 
 from pydantic import (
-    BaseModel,
     ValidationError,
     ValidationInfo,
     field_validator,
@@ -16,9 +15,10 @@ from ..solutions_workbench import (
     SolutionsWorkbenchRelationship,
 )
 from .property import Property
+from .schema_cache import SchemaCachedModel
 
 
-class Relationship(BaseModel):
+class Relationship(SchemaCachedModel):
     """
     Relationship representation.
     """
@@ -49,15 +49,19 @@ class Relationship(BaseModel):
             The schema
         """
 
-        props = ""
-        for p in self.properties:
-            props += (
+        variant = (verbose, neo4j_typing)
+        signature = self._schema_signature(self.properties)
+        if (schema := self._get_cached_schema(variant, signature)) is not None:
+            return schema
+
+        schema = f"(:{self.source})-[:{self.type}]->(:{self.target})\n" + "".join(
+            [
                 "* " + p.get_schema(verbose=verbose, neo4j_typing=neo4j_typing) + "\n"
-            )
-        schema = f"""(:{self.source})-[:{self.type}]->(:{self.target})
-{props}"""
+                for p in self.properties
+            ]
+        )
 
-        return schema
+        return self._set_cached_schema(variant, signature, schema)
 
     @property
     def property_names(self) -> List[str]:
@@ -0,0 +1,78 @@
+"""
+Memoization of `get_schema` fragments for the core data model classes.
+
+Each entity caches its rendered schema per variant, such as (verbose, neo4j_typing), along with a signature.
+An entity's signature is its own mutation version plus the identity and mutation version of each child entity,
+so a cached fragment is invalidated by field assignment on the entity or its children and by in-place changes to
+its child lists (appending a `Property` to a `Node`, for example). Unchanged entities keep their cached fragments.
+The cache and the mutation version are left out of equality, so rendering a schema doesn't change `==`.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, cast
+
+from pydantic import BaseModel, PrivateAttr
+from typing_extensions import Self
+
+
+class SchemaCachedModel(BaseModel):
+    """
+    Base class for models that memoize their `get_schema` output.
+    """
+
+    _schema_version: int = PrivateAttr(default=0)
+    _schema_cache: Dict[Tuple[Any, ...], Tuple[Any, str]] = PrivateAttr(
+        default_factory=dict
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            _private(self)["_schema_version"] += 1
+
+    def __eq__(self, other: object) -> bool:
+        # the fields are compared like `BaseModel.__eq__`, without the private cache
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return (
+            type(self) is type(other)
+            and self.__dict__ == other.__dict__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+        )
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        # the private cache is shallow copied and is stale if `update` is provided
+        _private(copied)["_schema_cache"] = dict()
+        return copied
+
+    def _schema_signature(self, *children: Sequence["SchemaCachedModel"]) -> Any:
+        # `__pydantic_private__` is read directly to avoid the slow private attribute lookup
+        signature: List[Any] = [_private(self)["_schema_version"]]
+        for child_list in children:
+            signature.append(tuple(child_list))
+            signature.append(
+                tuple([_private(c)["_schema_version"] for c in child_list])
+            )
+        return tuple(signature)
+
+    def _get_cached_schema(
+        self, variant: Tuple[Any, ...], signature: Any
+    ) -> Optional[str]:
+        cached: Optional[Tuple[Any, str]] = _private(self)["_schema_cache"].get(variant)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        return None
+
+    def _set_cached_schema(
+        self, variant: Tuple[Any, ...], signature: Any, schema: str
+    ) -> str:
+        _private(self)["_schema_cache"][variant] = (signature, schema)
+        return schema
+
+
+def _private(model: BaseModel) -> Dict[str, Any]:
+    """The private attributes of a model, which are always set for models with private attributes."""
+
+    return cast(Dict[str, Any], model.__pydantic_private__)
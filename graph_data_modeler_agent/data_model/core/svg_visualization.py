@@ -0,0 +1,478 @@
+"""
+Pure Python SVG and HTML rendering of a data model. This does not require the Graphviz executable.
+
+Layouts are computed with vectorized numpy iterations, so large data models may be rendered in process.
+Node and relationship text reuses the `format_node` and `format_relationship` detail levels of the Graphviz visual.
+"""
+
+import html
+import math
+from typing import List, Literal, Optional, Tuple
+
+import numpy as np
+
+from .node import Node
+from .relationship import Relationship
+from .visualization import format_node, format_relationship
+
+FONT_SIZE: int = 12
+CHAR_WIDTH: float = 7.2
+LINE_HEIGHT: int = 16
+BOX_PADDING: int = 10
+MARGIN: int = 40
+
+# max number of rows in a pairwise repulsion block. Bounds memory to a few block x n float32 arrays.
+_REPULSION_BLOCK_SIZE: int = 512
+
+
+def compute_layout(
+    nodes: List[Node],
+    relationships: List[Relationship],
+    layout: Literal["force", "layered"] = "force",
+    iterations: int = 100,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Compute unit scale 2D positions for the nodes of a data model.
+
+    Parameters
+    ----------
+    nodes : List[Node]
+        The nodes to place.
+    relationships : List[Relationship]
+        The relationships between the nodes. Relationships referencing unknown node labels are ignored.
+    layout : Literal["force", "layered"], optional
+        The layout algorithm, by default "force"\n
+            force: Fruchterman-Reingold force-directed layout\n
+            layered: Layers by breadth first depth from source nodes, ordered by the barycenter heuristic
+    iterations : int, optional
+        The number of force-directed or barycenter ordering iterations, by default 100
+    seed : int, optional
+        The random seed for the initial force-directed positions, by default 0
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (len(nodes), 2) with one (x, y) position per node.
+    """
+
+    src, tgt = _edge_index_arrays(nodes=nodes, relationships=relationships)
+
+    match layout:
+        case "force":
+            return _force_directed_layout(
+                num_nodes=len(nodes), src=src, tgt=tgt, iterations=iterations, seed=seed
+            )
+        case "layered":
+            return _layered_layout(
+                num_nodes=len(nodes), src=src, tgt=tgt, iterations=iterations
+            )
+        case _:
+            raise ValueError(
+                f"Invalid layout: {layout}. Must be one of ['force', 'layered']"
+            )
+
+
+def render_svg(
+    nodes: List[Node],
+    relationships: List[Relationship],
+    detail_level: Literal[1, 2, 3] = 3,
+    neo4j_typing: bool = False,
+    layout: Literal["force", "layered"] = "force",
+    max_properties: Optional[int] = None,
+    iterations: int = 100,
+    seed: int = 0,
+) -> str:
+    """
+    Render a data model as an SVG string.
+
+    Parameters
+    ----------
+    nodes : List[Node]
+        The nodes to draw.
+    relationships : List[Relationship]
+        The relationships to draw.
+    detail_level : Literal[1, 2, 3], optional
+        The level of detail to include in the visual, by default 3
+    neo4j_typing : bool, optional
+        Whether to use Neo4j types instead of Python types, by default False
+    layout : Literal["force", "layered"], optional
+        The layout algorithm, by default "force"
+    max_properties : Optional[int], optional
+        The max number of properties to display per node or relationship before collapsing the rest, by default None
+    iterations : int, optional
+        The number of layout iterations, by default 100
+    seed : int, optional
+        The random seed for the layout, by default 0
+
+    Returns
+    -------
+    str
+        The SVG document.
+    """
+
+    node_lines = [
+        _split_label(
+            format_node(
+                node=n,
+                detail_level=detail_level,
+                neo4j_typing=neo4j_typing,
+                max_properties=max_properties,
+            )
+        )
+        for n in nodes
+    ]
+    box_sizes = np.array(
+        [
+            (
+                max([len(line) for line in lines] + [1]) * CHAR_WIDTH + 2 * BOX_PADDING,
+                len(lines) * LINE_HEIGHT + 2 * BOX_PADDING,
+            )
+            for lines in node_lines
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+
+    positions = compute_layout(
+        nodes=nodes,
+        relationships=relationships,
+        layout=layout,
+        iterations=iterations,
+        seed=seed,
+    )
+    centers = _scale_positions(positions=positions, box_sizes=box_sizes)
+
+    label_to_idx = {n.label: i for i, n in enumerate(nodes)}
+    elements: List[str] = list()
+
+    for rel in relationships:
+        if rel.source not in label_to_idx or rel.target not in label_to_idx:
+            continue
+        elements.append(
+            _render_edge(
+                source_idx=label_to_idx[rel.source],
+                target_idx=label_to_idx[rel.target],
+                centers=centers,
+                box_sizes=box_sizes,
+                label_lines=_split_label(
+                    format_relationship(
+                        relationship=rel,
+                        detail_level=detail_level,
+                        neo4j_typing=neo4j_typing,
+                        max_properties=max_properties,
+                    )
+                ),
+            )
+        )
+
+    for idx, lines in enumerate(node_lines):
+        elements.append(
+            _render_node(center=centers[idx], size=box_sizes[idx], lines=lines)
+        )
+
+    if len(nodes):
+        width = float((centers[:, 0] + box_sizes[:, 0] / 2).max()) + MARGIN
+        height = float((centers[:, 1] + box_sizes[:, 1] / 2).max()) + MARGIN
+    else:
+        width, height = 2 * MARGIN, 2 * MARGIN
+
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{height:.0f}" '
+        f'viewBox="0 0 {width:.0f} {height:.0f}" font-family="monospace" font-size="{FONT_SIZE}">\n'
+        "<defs>"
+        '<marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" markerWidth="8" markerHeight="8" orient="auto-start-reverse">'
+        '<path d="M 0 0 L 10 5 L 0 10 z" fill="black"/>'
+        "</marker>"
+        "</defs>\n"
+        f'<rect width="100%" height="100%" fill="azure"/>\n'
+        + "\n".join(elements)
+        + "\n</svg>\n"
+    )
+
+
+def render_html(
+    nodes: List[Node],
+    relationships: List[Relationship],
+    detail_level: Literal[1, 2, 3] = 3,
+    neo4j_typing: bool = False,
+    layout: Literal["force", "layered"] = "force",
+    max_properties: Optional[int] = None,
+    iterations: int = 100,
+    seed: int = 0,
+    title: str = "Data Model",
+) -> str:
+    """
+    Render a data model as a standalone HTML page containing an inline SVG.
+
+    Parameters
+    ----------
+    nodes : List[Node]
+        The nodes to draw.
+    relationships : List[Relationship]
+        The relationships to draw.
+    detail_level : Literal[1, 2, 3], optional
+        The level of detail to include in the visual, by default 3
+    neo4j_typing : bool, optional
+        Whether to use Neo4j types instead of Python types, by default False
+    layout : Literal["force", "layered"], optional
+        The layout algorithm, by default "force"
+    max_properties : Optional[int], optional
+        The max number of properties to display per node or relationship before collapsing the rest, by default None
+    iterations : int, optional
+        The number of layout iterations, by default 100
+    seed : int, optional
+        The random seed for the layout, by default 0
+    title : str, optional
+        The page title, by default "Data Model"
+
+    Returns
+    -------
+    str
+        The HTML document.
+    """
+
+    svg = render_svg(
+        nodes=nodes,
+        relationships=relationships,
+        detail_level=detail_level,
+        neo4j_typing=neo4j_typing,
+        layout=layout,
+        max_properties=max_properties,
+        iterations=iterations,
+        seed=seed,
+    )
+
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+<style>body {{ margin: 0; overflow: auto; background: azure; }}</style>
+</head>
+<body>
+{svg}</body>
+</html>
+"""
+
+
+def _edge_index_arrays(
+    nodes: List[Node], relationships: List[Relationship]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Map relationships to source and target node index arrays. Self loops and unknown labels are dropped."""
+
+    label_to_idx = {n.label: i for i, n in enumerate(nodes)}
+    pairs = [
+        (label_to_idx[r.source], label_to_idx[r.target])
+        for r in relationships
+        if r.source in label_to_idx
+        and r.target in label_to_idx
+        and r.source != r.target
+    ]
+    if not pairs:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    edges = np.array(pairs, dtype=np.int64)
+    return edges[:, 0], edges[:, 1]
+
+
+def _force_directed_layout(
+    num_nodes: int,
+    src: np.ndarray,
+    tgt: np.ndarray,
+    iterations: int,
+    seed: int,
+) -> np.ndarray:
+    """Fruchterman-Reingold layout with vectorized repulsion computed in row blocks."""
+
+    if num_nodes == 0:
+        return np.empty((0, 2))
+    if num_nodes == 1:
+        return np.zeros((1, 2))
+
+    rng = np.random.default_rng(seed)
+    k = 1.0
+    pos = rng.uniform(-1.0, 1.0, size=(num_nodes, 2)) * math.sqrt(num_nodes)
+    temperature = math.sqrt(num_nodes)
+    cooling = temperature / (iterations + 1)
+
+    for _ in range(iterations):
+        x, y = pos[:, 0].astype(np.float32), pos[:, 1].astype(np.float32)
+        disp = np.zeros_like(pos)
+
+        # repulsion between every pair: k^2 / d along the pair direction
+        for start in range(0, num_nodes, _REPULSION_BLOCK_SIZE):
+            end = min(start + _REPULSION_BLOCK_SIZE, num_nodes)
+            dx = x[start:end, None] - x[None, :]
+            dy = y[start:end, None] - y[None, :]
+            scale = k * k / np.maximum(dx * dx + dy * dy, 1e-4)
+            disp[start:end, 0] += (dx * scale).sum(axis=1)
+            disp[start:end, 1] += (dy * scale).sum(axis=1)
+
+        # attraction along relationships: d^2 / k along the edge direction
+        if len(src):
+            delta = pos[src] - pos[tgt]
+            dist = np.sqrt((delta**2).sum(axis=-1))[:, None]
+            force = delta * dist / k
+            np.subtract.at(disp, src, force)
+            np.add.at(disp, tgt, force)
+
+        length = np.maximum(np.sqrt((disp**2).sum(axis=-1)), 1e-9)[:, None]
+        pos += disp / length * np.minimum(length, temperature)
+        temperature = max(temperature - cooling, 1e-3)
+
+    return pos
+
+
+def _layered_layout(
+    num_nodes: int, src: np.ndarray, tgt: np.ndarray, iterations: int
+) -> np.ndarray:
+    """Breadth first layering from source nodes with barycenter ordering within layers."""
+
+    if num_nodes == 0:
+        return np.empty((0, 2))
+
+    children: List[List[int]] = [list() for _ in range(num_nodes)]
+    for s, t in zip(src.tolist(), tgt.tolist()):
+        children[s].append(t)
+    in_degree = np.bincount(tgt, minlength=num_nodes)
+
+    layers = np.full(num_nodes, -1, dtype=np.int64)
+    roots = [i for i in range(num_nodes) if in_degree[i] == 0]
+    # visit roots first, then any nodes only reachable through cycles
+    for start in roots + list(range(num_nodes)):
+        if layers[start] >= 0:
+            continue
+        layers[start] = 0
+        frontier = [start]
+        while frontier:
+            next_frontier = list()
+            for current in frontier:
+                for child in children[current]:
+                    if layers[child] < 0:
+                        layers[child] = layers[current] + 1
+                        next_frontier.append(child)
+            frontier = next_frontier
+
+    # initial order within each layer is the node index
+    order = np.zeros(num_nodes, dtype=np.float64)
+    for layer in np.unique(layers):
+        members = np.flatnonzero(layers == layer)
+        order[members] = np.arange(len(members))
+
+    # barycenter sweeps: move each node towards the mean order of its neighbors
+    if len(src):
+        both_src = np.concatenate([src, tgt])
+        both_tgt = np.concatenate([tgt, src])
+        degree = np.bincount(both_src, minlength=num_nodes)
+        for _ in range(min(iterations, 24)):
+            sums = np.bincount(both_src, weights=order[both_tgt], minlength=num_nodes)
+            barycenter = np.where(degree > 0, sums / np.maximum(degree, 1), order)
+            for layer in np.unique(layers):
+                members = np.flatnonzero(layers == layer)
+                ranked = members[np.argsort(barycenter[members], kind="stable")]
+                order[ranked] = np.arange(len(ranked))
+
+    # center each layer horizontally
+    positions = np.zeros((num_nodes, 2))
+    for layer in np.unique(layers):
+        members = np.flatnonzero(layers == layer)
+        positions[members, 0] = order[members] - (len(members) - 1) / 2
+    positions[:, 1] = layers
+
+    return positions
+
+
+def _scale_positions(positions: np.ndarray, box_sizes: np.ndarray) -> np.ndarray:
+    """Scale unit positions to pixel centers so neighboring boxes do not overlap and all boxes are in view."""
+
+    if len(positions) == 0:
+        return positions
+
+    spacing = box_sizes.max(axis=0) + MARGIN
+    centers = positions * spacing
+    centers -= (centers - box_sizes / 2).min(axis=0)
+
+    return np.asarray(centers + MARGIN)
+
+
+def _split_label(label: str) -> List[str]:
+    """Split a Graphviz label into plain text lines."""
+
+    return [
+        line for line in label.replace("\\l", "\n").split("\n") if line.strip() != ""
+    ]
+
+
+def _render_node(center: np.ndarray, size: np.ndarray, lines: List[str]) -> str:
+    x, y = center[0] - size[0] / 2, center[1] - size[1] / 2
+    text_y = y + BOX_PADDING + FONT_SIZE
+    tspans = "".join(
+        [
+            f'<tspan x="{x + BOX_PADDING:.1f}" y="{text_y + i * LINE_HEIGHT:.1f}"'
+            + (' font-weight="bold"' if i == 0 else "")
+            + f">{html.escape(line)}</tspan>"
+            for i, line in enumerate(lines)
+        ]
+    )
+    return (
+        f'<g class="node"><rect x="{x:.1f}" y="{y:.1f}" width="{size[0]:.1f}" height="{size[1]:.1f}" '
+        'rx="8" fill="#c1cdcd" stroke="black"/>'
+        f"<text>{tspans}</text></g>"
+    )
+
+
+def _render_edge(
+    source_idx: int,
+    target_idx: int,
+    centers: np.ndarray,
+    box_sizes: np.ndarray,
+    label_lines: List[str],
+) -> str:
+    if source_idx == target_idx:
+        # self loop drawn from the top right corner of the box
+        cx, cy = centers[source_idx]
+        w, h = box_sizes[source_idx] / 2
+        path = (
+            f"M {cx + w * 0.5:.1f} {cy - h:.1f} "
+            f"C {cx + w * 0.5:.1f} {cy - h - 40:.1f}, {cx + w + 40:.1f} {cy - h * 0.5:.1f}, "
+            f"{cx + w:.1f} {cy - h * 0.5:.1f}"
+        )
+        label_x, label_y = cx + w + 10, cy - h - 10
+    else:
+        start = _box_boundary_point(
+            centers[source_idx], centers[target_idx], box_sizes[source_idx]
+        )
+        end = _box_boundary_point(
+            centers[target_idx], centers[source_idx], box_sizes[target_idx]
+        )
+        path = f"M {start[0]:.1f} {start[1]:.1f} L {end[0]:.1f} {end[1]:.1f}"
+        label_x, label_y = (start + end) / 2
+
+    tspans = "".join(
+        [
+            f'<tspan x="{label_x:.1f}" y="{label_y + i * LINE_HEIGHT:.1f}">{html.escape(line.strip())}</tspan>'
+            for i, line in enumerate(label_lines)
+        ]
+    )
+    return (
+        f'<g class="relationship"><path d="{path}" fill="none" stroke="black" stroke-width="2" marker-end="url(#arrow)"/>'
+        f'<text text-anchor="middle">{tspans}</text></g>'
+    )
+
+
+def _box_boundary_point(
+    center: np.ndarray, towards: np.ndarray, size: np.ndarray
+) -> np.ndarray:
+    """The point where the segment from `center` to `towards` exits a box of `size` around `center`."""
+
+    direction = towards - center
+    half = size / 2
+    scale = min(
+        [
+            half[axis] / abs(direction[axis])
+            for axis in (0, 1)
+            if abs(direction[axis]) > 1e-9
+        ]
+        + [1.0]
+    )
+    return np.asarray(center + direction * scale)
@@ -1,18 +1,83 @@
-from typing import List, Literal
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 from graphviz import Digraph
 
 from .node import Node
+from .property import Property
 from .relationship import Relationship
 
+# rendered output keyed by a hash of the DOT source and render options
+_RENDER_CACHE: "OrderedDict[str, Union[bytes, str]]" = OrderedDict()
+_RENDER_CACHE_MAX_SIZE: int = 64
+
+
+class CachedDigraph(Digraph):
+    """
+    A `Digraph` that memoizes rendered output by DOT source.
+    Displaying or piping an unchanged data model will not spawn the Graphviz executable again.
+    """
+
+    def pipe(self, *args: Any, **kwargs: Any) -> Union[bytes, str]:
+        cache_key = hashlib.sha256(
+            (self.source + repr(args) + repr(sorted(kwargs.items()))).encode("utf-8")
+        ).hexdigest()
+
+        if (res := _RENDER_CACHE.get(cache_key)) is not None:
+            _RENDER_CACHE.move_to_end(cache_key)
+            return res
+
+        rendered: Union[bytes, str] = super().pipe(*args, **kwargs)
+        _RENDER_CACHE[cache_key] = rendered
+        if len(_RENDER_CACHE) > _RENDER_CACHE_MAX_SIZE:
+            _RENDER_CACHE.popitem(last=False)
+
+        return rendered
+
+
+def clear_render_cache() -> None:
+    """Clear the cache of rendered Graphviz output."""
+
+    _RENDER_CACHE.clear()
+
 
 def create_dot(
     nodes: List[Node],
     relationships: List[Relationship],
     detail_level: Literal[1, 2, 3] = 3,
     neo4j_typing: bool = False,
+    cluster_by_source: bool = False,
+    max_properties: Optional[int] = None,
 ) -> Digraph:
-    dot = Digraph(
+    """
+    Create the Graphviz dot for a data model.
+
+    Node and relationship labels are memoized on each entity, so only entities that have changed since the last call are re-formatted.
+
+    Parameters
+    ----------
+    nodes : List[Node]
+        The nodes to draw.
+    relationships : List[Relationship]
+        The relationships to draw.
+    detail_level : Literal[1, 2, 3], optional
+        The level of detail to include in the visual, by default 3
+    neo4j_typing : bool, optional
+        Whether to use Neo4j types instead of Python types, by default False
+    cluster_by_source : bool, optional
+        Whether to group nodes into a subgraph per `source_name`, by default False
+    max_properties : Optional[int], optional
+        The max number of properties to display per node or relationship. Remaining properties are collapsed into a single line.
+        Key properties are displayed first. By default None, which displays all properties.
+
+    Returns
+    -------
+    Digraph
+        The dot for visualization
+    """
+
+    dot = CachedDigraph(
         comment="Data Model",
         engine="dot",
         graph_attr={"pad": "0.5", "bgcolor": "azure"},
@@ -25,15 +90,41 @@ def create_dot(
         edge_attr={"labeldistance": "20.0", "penwidth": "2"},
     )
 
-    for node in nodes:
-        node_label = format_node(
-            node=node, detail_level=detail_level, neo4j_typing=neo4j_typing
-        )
-        dot.node(name=node.label, label=node_label)
+    if cluster_by_source:
+        source_to_nodes: Dict[str, List[Node]] = dict()
+        for node in nodes:
+            source_to_nodes.setdefault(node.source_name, list()).append(node)
+
+        for idx, (source_name, source_nodes) in enumerate(source_to_nodes.items()):
+            with dot.subgraph(name=f"cluster_{idx}") as cluster:
+                cluster.attr(label=source_name, style="dashed", color="gray40")
+                for node in source_nodes:
+                    cluster.node(
+                        name=node.label,
+                        label=format_node(
+                            node=node,
+                            detail_level=detail_level,
+                            neo4j_typing=neo4j_typing,
+                            max_properties=max_properties,
+                        ),
+                    )
+
+    else:
+        for node in nodes:
+            node_label = format_node(
+                node=node,
+                detail_level=detail_level,
+                neo4j_typing=neo4j_typing,
+                max_properties=max_properties,
+            )
+            dot.node(name=node.label, label=node_label)
 
     for rel in relationships:
         rel_label = format_relationship(
-            relationship=rel, detail_level=detail_level, neo4j_typing=neo4j_typing
+            relationship=rel,
+            detail_level=detail_level,
+            neo4j_typing=neo4j_typing,
+            max_properties=max_properties,
         )
         dot.edge(
             tail_name=rel.source,
@@ -45,42 +136,97 @@ def create_dot(
 
 
 def format_node(
-    node: Node, detail_level: Literal[1, 2, 3] = 3, neo4j_typing: bool = False
+    node: Node,
+    detail_level: Literal[1, 2, 3] = 3,
+    neo4j_typing: bool = False,
+    max_properties: Optional[int] = None,
 ) -> str:
     """Format a node for Graphviz visual"""
 
     assert detail_level < 4 and detail_level > 0, "Detail level must be 1, 2 or 3"
-    match detail_level:
-        case 1:
-            return f"\n(:{node.label})\n "
-        case 2:
-            schema = node.get_schema(verbose=False, neo4j_typing=neo4j_typing)
-        case 3:
-            schema = node.get_schema(verbose=True, neo4j_typing=neo4j_typing)
-
-    parts = schema.split("\n")
-    lbl = parts[0] + "\n"
-    props = r"\l".join(parts[1:])
+    if detail_level == 1:
+        return f"\n(:{node.label})\n "
+
+    variant = ("dot", detail_level, neo4j_typing, max_properties)
+    signature = node._schema_signature(node.properties)
+    if (label := node._get_cached_schema(variant, signature)) is not None:
+        return label
+
+    label = f"(:{node.label})\n" + _format_properties(
+        properties=node.properties,
+        verbose=detail_level == 3,
+        neo4j_typing=neo4j_typing,
+        max_properties=max_properties,
+    )
 
-    return lbl + props
+    return node._set_cached_schema(variant, signature, label)
 
 
 def format_relationship(
     relationship: Relationship,
     detail_level: Literal[1, 2, 3] = 3,
     neo4j_typing: bool = False,
+    max_properties: Optional[int] = None,
 ) -> str:
     """Format a relationship for Graphviz visual"""
 
     assert detail_level < 4 and detail_level > 0, "Detail level must be 1, 2 or 3"
-    match detail_level:
-        case 1:
-            return f"[:{relationship.type}]"
-        case 2:
-            schema = relationship.get_schema(verbose=False, neo4j_typing=neo4j_typing)
-        case 3:
-            schema = relationship.get_schema(verbose=True, neo4j_typing=neo4j_typing)
-
-    parts = schema.split("\n")
-    props = r"\l".join(parts[1:])
-    return "  [:" + relationship.type + "]  " + "\n" + props
+    if detail_level == 1:
+        return f"[:{relationship.type}]"
+
+    variant = ("dot", detail_level, neo4j_typing, max_properties)
+    signature = relationship._schema_signature(relationship.properties)
+    if (label := relationship._get_cached_schema(variant, signature)) is not None:
+        return label
+
+    label = (
+        "  [:"
+        + relationship.type
+        + "]  "
+        + "\n"
+        + _format_properties(
+            properties=relationship.properties,
+            verbose=detail_level == 3,
+            neo4j_typing=neo4j_typing,
+            max_properties=max_properties,
+        )
+    )
+
+    return relationship._set_cached_schema(variant, signature, label)
+
+
+def _format_properties(
+    properties: List[Property],
+    verbose: bool,
+    neo4j_typing: bool,
+    max_properties: Optional[int],
+) -> str:
+    """Format properties as left justified Graphviz lines, collapsing any past `max_properties`."""
+
+    displayed, num_collapsed = _select_displayed_properties(
+        properties=properties, max_properties=max_properties
+    )
+    lines = [
+        "* " + p.get_schema(verbose=verbose, neo4j_typing=neo4j_typing)
+        for p in displayed
+    ]
+    if num_collapsed:
+        lines.append(f"* ... {num_collapsed} more properties")
+
+    # trailing empty line to left justify the final property
+    return r"\l".join(lines + [""])
+
+
+def _select_displayed_properties(
+    properties: List[Property], max_properties: Optional[int]
+) -> Tuple[List[Property], int]:
+    """Select the properties to display, prioritizing key properties. Returns the displayed properties and the number collapsed."""
+
+    if max_properties is None or len(properties) <= max_properties:
+        return properties, 0
+
+    keys = [p for p in properties if p.is_key][:max_properties]
+    others = [p for p in properties if not p.is_key][: max_properties - len(keys)]
+    selected = {id(p) for p in keys + others}
+
+    return [p for p in properties if id(p) in selected], len(properties) - len(selected)
@@ -0,0 +1,3 @@
+from .data_source import DataSource, read_data
+
+__all__ = ["DataSource", "read_data"]
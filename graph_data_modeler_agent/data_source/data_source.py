@@ -0,0 +1,303 @@
+"""
+Lazy file-backed data sources.
+
+A `DataSource` holds only a file location, format and reader options, so it is cheap to copy and pickle in agent
+states. Data is read on demand, whole, in chunks or as a sample, and is not kept by the `DataSource`.
+"""
+
+import csv
+import importlib.util
+import os
+from typing import Any, Dict, Iterator, List, Literal, Optional, Union
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, Field, model_validator
+
+DataFormat = Literal["csv", "json", "jsonl", "parquet"]
+
+FILE_EXTENSION_FORMATS: Dict[str, DataFormat] = {
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".txt": "csv",
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".parquet": "parquet",
+}
+
+_SNIFFED_DELIMITERS = ",|;\t"
+
+
+class DataSource(BaseModel):
+    """
+    A lazy reference to a data file.
+
+    Attributes
+    ----------
+    file_path : str
+        The file location.
+    file_format : Optional[DataFormat], optional
+        One of `csv`, `json`, `jsonl` or `parquet`. By default None, which infers the format from the file extension.
+    read_options : Dict[str, Any], optional
+        Keyword arguments passed to the pandas reader, such as `sep` or `usecols`.
+        If `sep` is not provided for a delimited file, the delimiter is detected from the header line.
+    """
+
+    file_path: str
+    file_format: Optional[DataFormat] = None
+    read_options: Dict[str, Any] = Field(default_factory=dict)
+
+    @model_validator(mode="after")
+    def validate_file_format(self) -> "DataSource":
+        if self.file_format is None:
+            extension = os.path.splitext(self.file_path)[1].lower()
+            if extension not in FILE_EXTENSION_FORMATS:
+                raise ValueError(
+                    f"Unable to infer the format of {self.file_path}. Provide a `file_format` or use one of the extensions: {list(FILE_EXTENSION_FORMATS)}"
+                )
+            self.file_format = FILE_EXTENSION_FORMATS[extension]
+        return self
+
+    @property
+    def name(self) -> str:
+        """The file name."""
+
+        return os.path.basename(self.file_path)
+
+    @property
+    def is_empty_file(self) -> bool:
+        """Whether the file contains no bytes."""
+
+        return os.path.getsize(self.file_path) == 0
+
+    def read(self) -> pd.DataFrame:
+        """
+        Read the whole file.
+
+        Returns
+        -------
+        pd.DataFrame
+            The data.
+        """
+
+        if self.is_empty_file:
+            return pd.DataFrame()
+
+        match self.file_format:
+            case "csv":
+                return pd.read_csv(self.file_path, **self._csv_options())
+            case "jsonl":
+                return pd.read_json(self.file_path, lines=True, **self.read_options)
+            case "json":
+                return pd.read_json(self.file_path, **self.read_options)
+            case _:
+                return pd.read_parquet(self.file_path, **self.read_options)
+
+    def iter_chunks(
+        self, chunk_size: int = 100_000, columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read the file in chunks. JSON files are read whole and split, since they can't be streamed by pandas.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            The number of rows per chunk, by default 100,000
+        columns : Optional[List[str]], optional
+            The columns to read. CSV and Parquet files skip the other columns while parsing.
+            Columns missing from the file are ignored. By default None, which reads all columns.
+
+        Yields
+        ------
+        pd.DataFrame
+            The chunks in file order. An empty file yields no chunks.
+        """
+
+        if self.is_empty_file:
+            return
+
+        match self.file_format:
+            case "csv":
+                options = self._csv_options()
+                if columns is not None:
+                    selected = set(columns)
+                    options = {**options, "usecols": lambda c: c in selected}
+                yield from pd.read_csv(self.file_path, chunksize=chunk_size, **options)
+            case "jsonl":
+                for chunk in pd.read_json(
+                    self.file_path,
+                    lines=True,
+                    chunksize=chunk_size,
+                    **self.read_options,
+                ):
+                    yield _select_columns(chunk, columns)
+            case "json":
+                df = _select_columns(self.read(), columns)
+                for start in range(0, len(df), chunk_size):
+                    yield df.iloc[start : start + chunk_size]
+            case _:
+                yield from self._iter_parquet_chunks(
+                    chunk_size=chunk_size, columns=columns
+                )
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        """
+        Read the first rows of the file.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of rows, by default 5
+
+        Returns
+        -------
+        pd.DataFrame
+            The rows.
+        """
+
+        return next(self.iter_chunks(chunk_size=n), pd.DataFrame())
+
+    def sample(
+        self, n: int, random_state: int = 0, chunk_size: int = 100_000
+    ) -> pd.DataFrame:
+        """
+        Read a uniform random sample of rows in a single pass over chunks.
+        Each row receives a random key and the rows with the `n` smallest keys are kept, so at most `n + chunk_size`
+        rows are held in memory.
+
+        Parameters
+        ----------
+        n : int
+            The max number of rows.
+        random_state : int, optional
+            The seed, by default 0
+        chunk_size : int, optional
+            The number of rows per chunk, by default 100,000
+
+        Returns
+        -------
+        pd.DataFrame
+            The sampled rows in file order, with a new index.
+        """
+
+        rng = np.random.default_rng(random_state)
+        kept: List[pd.DataFrame] = list()
+        keys = np.empty(0)
+        for chunk in self.iter_chunks(chunk_size=chunk_size):
+            kept.append(chunk)
+            keys = np.concatenate([keys, rng.random(len(chunk))])
+            if len(keys) > n:
+                current = pd.concat(kept)
+                keep = np.sort(np.argpartition(keys, n)[:n])
+                kept, keys = [current.iloc[keep]], keys[keep]
+
+        if not kept:
+            return pd.DataFrame()
+        return pd.concat(kept).reset_index(drop=True)
+
+    def _csv_options(self) -> Dict[str, Any]:
+        """The CSV reader options, with a detected delimiter if none is provided."""
+
+        if "sep" in self.read_options or "delimiter" in self.read_options:
+            return self.read_options
+        with open(self.file_path, newline="") as f:
+            header = f.readline()
+        try:
+            sep = csv.Sniffer().sniff(header, delimiters=_SNIFFED_DELIMITERS).delimiter
+        except csv.Error:
+            sep = ","
+        return {**self.read_options, "sep": sep}
+
+    def with_low_memory_options(self) -> "DataSource":
+        """
+        Copy the data source with reader options that reduce memory use.
+        CSV files are memory mapped, and if pyarrow is installed, columns are read into Arrow-backed dtypes,
+        so string values stay in Arrow buffers instead of becoming Python objects.
+        Options already in `read_options` are kept.
+
+        Returns
+        -------
+        DataSource
+            The copy.
+        """
+
+        options: Dict[str, Any] = dict()
+        if self.file_format == "csv":
+            options["memory_map"] = True
+        if _has_pyarrow():
+            options["dtype_backend"] = "pyarrow"
+        return self.model_copy(
+            update={"read_options": {**options, **self.read_options}}
+        )
+
+    def _iter_parquet_chunks(
+        self, chunk_size: int, columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Read a Parquet file in row batches. Requires pyarrow."""
+
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Reading Parquet files in chunks requires pyarrow. Install it with `pip install pyarrow`."
+            ) from e
+
+        parquet_file = pq.ParquetFile(self.file_path)
+        if columns is None:
+            columns = self.read_options.get("columns")
+        else:
+            selected = set(columns)
+            columns = [c for c in parquet_file.schema_arrow.names if c in selected]
+        types_mapper = (
+            pd.ArrowDtype
+            if self.read_options.get("dtype_backend") == "pyarrow"
+            else None
+        )
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas(types_mapper=types_mapper)
+
+
+def _select_columns(df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+    """Select the columns of a DataFrame that are in `columns`, in DataFrame order."""
+
+    if columns is None:
+        return df
+    selected = set(columns)
+    return df[[c for c in df.columns if c in selected]]
+
+
+def _has_pyarrow() -> bool:
+    """Whether pyarrow is installed."""
+
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def read_data(
+    data: Union[pd.DataFrame, DataSource],
+    sample_size: Optional[int] = None,
+    random_state: int = 0,
+) -> pd.DataFrame:
+    """
+    Retrieve a DataFrame from a DataFrame or a `DataSource`.
+
+    Parameters
+    ----------
+    data : Union[pd.DataFrame, DataSource]
+        The data.
+    sample_size : Optional[int], optional
+        The max number of rows to read from a `DataSource`. Larger files are randomly sampled in a single pass.
+        DataFrames are returned as is. By default None, which reads all rows.
+    random_state : int, optional
+        The seed used to sample, by default 0
+
+    Returns
+    -------
+    pd.DataFrame
+        The data.
+    """
+
+    if isinstance(data, pd.DataFrame):
+        return data
+    if sample_size is None:
+        return data.read()
+    return data.sample(n=sample_size, random_state=random_state)
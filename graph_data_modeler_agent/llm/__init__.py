@@ -0,0 +1,34 @@
+from .client import (
+    LLMClient,
+    LLMClientLike,
+    LLMClientStats,
+    as_llm_client,
+    is_transient_llm_error,
+    prompt_token_usage,
+)
+from .routing import (
+    ModelLike,
+    ModelRouter,
+    RoutingDecision,
+    RoutingPolicy,
+    TableComplexity,
+    create_routed,
+)
+from .tokens import estimate_message_tokens, estimate_tokens
+
+__all__ = [
+    "LLMClient",
+    "LLMClientLike",
+    "LLMClientStats",
+    "ModelLike",
+    "ModelRouter",
+    "RoutingDecision",
+    "RoutingPolicy",
+    "TableComplexity",
+    "as_llm_client",
+    "create_routed",
+    "estimate_message_tokens",
+    "estimate_tokens",
+    "is_transient_llm_error",
+    "prompt_token_usage",
+]
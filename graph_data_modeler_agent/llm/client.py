@@ -0,0 +1,501 @@
+"""
+An async LLM client used by every node that calls an LLM.
+
+`LLMClient` wraps an instructor client and adds what a single `chat.completions.create()` call doesn't control:
+
+* A shared pooled HTTP client. `LLMClient.from_openai()` creates one `httpx.AsyncClient` with bounded connection and
+  keep-alive limits, so concurrent nodes reuse connections instead of opening new ones.
+* Per-call timeouts.
+* Retries of transient errors, such as timeouts, connection errors, rate limits and server errors, with exponential
+  backoff and full jitter. These are separate from instructor's `max_retries`, which retries responses that fail
+  validation by sending the errors back to the model.
+* Optional request hedging. When a request takes longer than a latency budget, by default the 95th percentile of the
+  model's recent latencies, a second identical request is sent and the first response is used. The slower request is
+  cancelled. This cuts tail latency for roughly 5% more requests.
+* Prompt token usage. The prompt tokens and the prompt tokens the provider served from its prompt cache are counted
+  from the usage of each response, so the cache hit ratio of prompts sharing a prefix can be measured.
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
+from instructor import AsyncInstructor
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletionMessageParam
+
+# the names of the openai and httpx errors that are safe to retry
+_TRANSIENT_ERROR_NAMES = {
+    "APIConnectionError",
+    "APITimeoutError",
+    "RateLimitError",
+    "InternalServerError",
+    "ConnectError",
+    "ReadTimeout",
+    "RemoteProtocolError",
+}
+
+_TRANSIENT_STATUS_CODES = {408, 409, 429}
+
+# the stats of the running `LLMClient.create()` call, which instructor hooks update
+_call_stats: ContextVar[Optional["LLMClientStats"]] = ContextVar(
+    "_call_stats", default=None
+)
+
+
+class LLMClientStats(BaseModel):
+    """
+    The request statistics of an `LLMClient`.
+
+    Attributes
+    ----------
+    requests : int
+        The number of calls.
+    retries : int
+        The number of attempts retried after a transient error.
+    hedges : int
+        The number of hedged requests sent.
+    hedge_wins : int
+        The number of hedged requests that responded before the request they hedged.
+    validation_errors : int
+        The number of responses that failed validation. Instructor retries them up to its `max_retries`.
+        Only counted for instructor clients.
+    prompt_tokens : int
+        The number of prompt tokens of the responses, as reported by the provider. Only counted for instructor clients.
+    cached_prompt_tokens : int
+        The number of prompt tokens served from the provider's prompt cache. Only counted for instructor clients.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    validation_errors: int = 0
+    prompt_tokens: int = 0
+    cached_prompt_tokens: int = 0
+
+    @property
+    def cached_token_ratio(self) -> float:
+        """The fraction of prompt tokens served from the provider's prompt cache."""
+
+        if not self.prompt_tokens:
+            return 0.0
+        return self.cached_prompt_tokens / self.prompt_tokens
+
+    def add(self, other: "LLMClientStats") -> None:
+        """Add the counts of `other`."""
+
+        for field in type(self).model_fields:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+
+class LLMClient:
+    """
+    An async LLM client with timeouts, transient error retries and request hedging.
+
+    Parameters
+    ----------
+    client : AsyncInstructor
+        The instructor client, or any object with an equivalent `chat.completions.create()` method.
+    timeout : Optional[float], optional
+        The max number of seconds per attempt, including hedged requests, by default None, which doesn't time out
+    max_retries : int, optional
+        The max number of times an attempt is retried after a transient error, by default 2
+    retry_delay : float, optional
+        The base delay in seconds between retries, doubled after each retry, by default 0.5
+    max_retry_delay : float, optional
+        The max delay in seconds between retries, by default 8.0
+    hedge : bool, optional
+        Whether to send a second request when the first exceeds the latency budget, by default False
+    hedge_quantile : float, optional
+        The quantile of the model's recent latencies used as the latency budget, by default 0.95
+    hedge_after : Optional[float], optional
+        The latency budget in seconds until `min_latency_samples` latencies are recorded for a model, by default None,
+        which doesn't hedge until then
+    min_latency_samples : int, optional
+        The number of latencies recorded for a model before its budget is estimated from them, by default 20
+    latency_window : int, optional
+        The number of recent latencies kept per model, by default 200
+    http_client : Optional[Any], optional
+        The HTTP client to close with `aclose()`, by default None
+    """
+
+    def __init__(
+        self,
+        client: AsyncInstructor,
+        timeout: Optional[float] = None,
+        max_retries: int = 2,
+        retry_delay: float = 0.5,
+        max_retry_delay: float = 8.0,
+        hedge: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_after: Optional[float] = None,
+        min_latency_samples: int = 20,
+        latency_window: int = 200,
+        http_client: Optional[Any] = None,
+    ) -> None:
+        self.client = client
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_after = hedge_after
+        self.min_latency_samples = min_latency_samples
+        self.latency_window = latency_window
+        self.http_client = http_client
+        self.stats = LLMClientStats()
+        self._latencies: Dict[str, Deque[float]] = dict()
+        _add_hooks(client)
+
+    @classmethod
+    def from_openai(
+        cls,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        connect_timeout: float = 10.0,
+        mode: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> "LLMClient":
+        """
+        Create a client of the OpenAI API, or an OpenAI compatible API, with a pooled HTTP client.
+        The OpenAI client's own retries are disabled, so transient errors are only retried by the `LLMClient`.
+
+        Parameters
+        ----------
+        api_key : Optional[str], optional
+            The API key, by default None, which reads the `OPENAI_API_KEY` environment variable
+        base_url : Optional[str], optional
+            The API URL, by default None, which uses the OpenAI API
+        max_connections : int, optional
+            The max number of concurrent connections, by default 100
+        max_keepalive_connections : int, optional
+            The max number of idle connections kept open for reuse, by default 20
+        connect_timeout : float, optional
+            The max number of seconds to open a connection, by default 10.0
+        mode : Optional[instructor.Mode], optional
+            The instructor mode, by default None, which uses `instructor.Mode.TOOLS`
+        **kwargs : Any
+            The arguments of the `LLMClient`, such as `timeout` and `hedge`.
+
+        Returns
+        -------
+        LLMClient
+            The client.
+        """
+
+        import httpx
+        import instructor
+        import openai
+
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=httpx.Timeout(kwargs.get("timeout"), connect=connect_timeout),
+        )
+        openai_client = openai.AsyncOpenAI(
+            api_key=api_key, base_url=base_url, http_client=http_client, max_retries=0
+        )
+        client = instructor.from_openai(
+            openai_client, mode=mode or instructor.Mode.TOOLS
+        )
+        return cls(client, http_client=http_client, **kwargs)
+
+    async def create(
+        self,
+        model: str,
+        response_model: Any,
+        messages: List[Dict[str, Any]],
+        timeout: Optional[float] = None,
+        stats: Optional[LLMClientStats] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Request a structured response.
+
+        Parameters
+        ----------
+        model : str
+            The model.
+        response_model : Any
+            The Pydantic model of the response.
+        messages : List[Dict[str, Any]]
+            The messages.
+        timeout : Optional[float], optional
+            The max number of seconds per attempt, by default None, which uses the client's `timeout`
+        stats : Optional[LLMClientStats], optional
+            The statistics of this call, which are updated as well as the client's `stats`, by default None
+        **kwargs : Any
+            The other arguments of `chat.completions.create()`, such as `context` and `max_retries`, the number of
+            validation retries.
+
+        Returns
+        -------
+        Any
+            The response, an instance of `response_model`.
+
+        Raises
+        ------
+        Exception
+            The last error, if it is not transient or the request still fails after `max_retries` retries.
+        """
+
+        call_stats = stats if stats is not None else LLMClientStats()
+        call_stats.requests += 1
+        token = _call_stats.set(call_stats)
+        chat_messages = cast(List["ChatCompletionMessageParam"], messages)
+
+        def request() -> Awaitable[Any]:
+            return self.client.chat.completions.create(
+                model=model,
+                response_model=response_model,
+                messages=chat_messages,
+                **kwargs,
+            )
+
+        attempt = 0
+        try:
+            while True:
+                try:
+                    return await asyncio.wait_for(
+                        self._hedged(model, request, call_stats),
+                        timeout or self.timeout,
+                    )
+                except Exception as e:
+                    if attempt >= self.max_retries or not is_transient_llm_error(e):
+                        raise
+                    call_stats.retries += 1
+                    await asyncio.sleep(
+                        random.uniform(
+                            0, min(self.max_retry_delay, self.retry_delay * 2**attempt)
+                        )
+                    )
+                    attempt += 1
+        finally:
+            _call_stats.reset(token)
+            self.stats.add(call_stats)
+
+    def latency_budget(self, model: str) -> Optional[float]:
+        """
+        The number of seconds after which a request of a model is hedged.
+
+        Parameters
+        ----------
+        model : str
+            The model.
+
+        Returns
+        -------
+        Optional[float]
+            The budget, or None if requests are not hedged.
+        """
+
+        if not self.hedge:
+            return None
+        latencies = self._latencies.get(model, ())
+        if len(latencies) < self.min_latency_samples:
+            return self.hedge_after
+        return float(np.quantile(list(latencies), self.hedge_quantile))
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+
+        if self.http_client is not None:
+            await self.http_client.aclose()
+
+    async def __aenter__(self) -> "LLMClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def _hedged(
+        self,
+        model: str,
+        request: Callable[[], Awaitable[Any]],
+        stats: LLMClientStats,
+    ) -> Any:
+        """Send a request, and a second one if the first exceeds the latency budget. Returns the first response."""
+
+        budget = self.latency_budget(model)
+        tasks: Dict["asyncio.Future[Any]", float] = dict()
+        tasks[asyncio.ensure_future(request())] = time.perf_counter()
+        try:
+            if budget is not None:
+                done, _ = await asyncio.wait(tasks, timeout=budget)
+                if not done:
+                    stats.hedges += 1
+                    tasks[asyncio.ensure_future(request())] = time.perf_counter()
+            return await self._first_response(model, tasks, stats)
+        finally:
+            for task, start in tasks.items():
+                if not task.done():
+                    task.cancel()
+                    # the elapsed time of a cancelled request is a lower bound of its latency. Recording it keeps
+                    # the budget from drifting down to the latencies of the hedged requests that won
+                    self._record_latency(model, time.perf_counter() - start)
+
+    async def _first_response(
+        self,
+        model: str,
+        tasks: Dict["asyncio.Future[Any]", float],
+        stats: LLMClientStats,
+    ) -> Any:
+        """Wait for the first successful request, or raise the error of the last failed one."""
+
+        pending: Set["asyncio.Future[Any]"] = set(tasks)
+        first = next(iter(tasks))
+        while True:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    self._record_latency(model, time.perf_counter() - tasks[task])
+                    if task is not first:
+                        stats.hedge_wins += 1
+                    return task.result()
+            if not pending:
+                raise done.pop().exception()  # type: ignore[misc]
+
+    def _record_latency(self, model: str, seconds: float) -> None:
+        """Record the latency of a request."""
+
+        self._latencies.setdefault(model, deque(maxlen=self.latency_window)).append(
+            seconds
+        )
+
+
+LLMClientLike = Union[AsyncInstructor, LLMClient]
+
+
+def as_llm_client(client: LLMClientLike) -> LLMClient:
+    """
+    Wrap an instructor client in an `LLMClient` with the default settings. An `LLMClient` is returned as is.
+
+    Parameters
+    ----------
+    client : LLMClientLike
+        The client.
+
+    Returns
+    -------
+    LLMClient
+        The client.
+    """
+
+    return client if isinstance(client, LLMClient) else LLMClient(client)
+
+
+def _add_hooks(client: Any) -> None:
+    """Count the validation errors and token usage of an instructor client's calls in the stats of the running call."""
+
+    on = getattr(client, "on", None)
+    if not callable(on) or getattr(client, "_llm_client_hooks", False):
+        return
+    on("parse:error", _count_validation_error)
+    on("completion:response", _count_prompt_tokens)
+    client._llm_client_hooks = True
+
+
+def _count_validation_error(error: Exception) -> None:
+    """Count a validation error in the stats of the running call."""
+
+    stats = _call_stats.get()
+    if stats is not None:
+        stats.validation_errors += 1
+
+
+def _count_prompt_tokens(response: Any) -> None:
+    """Count the prompt tokens and cached prompt tokens of a response in the stats of the running call."""
+
+    stats = _call_stats.get()
+    usage = getattr(response, "usage", None)
+    if stats is not None and usage is not None:
+        prompt_tokens, cached_prompt_tokens = prompt_token_usage(usage)
+        stats.prompt_tokens += prompt_tokens
+        stats.cached_prompt_tokens += cached_prompt_tokens
+
+
+def prompt_token_usage(usage: Any) -> Tuple[int, int]:
+    """
+    Read the prompt tokens and the cached prompt tokens of the usage of a response.
+    OpenAI reports the cached tokens in `prompt_tokens_details.cached_tokens`, and Anthropic reports the tokens read
+    from and written to its cache apart from `input_tokens`.
+
+    Parameters
+    ----------
+    usage : Any
+        The usage of an OpenAI or Anthropic response.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The number of prompt tokens and the number of them served from the prompt cache.
+    """
+
+    if getattr(usage, "prompt_tokens", None) is not None:
+        details = getattr(usage, "prompt_tokens_details", None)
+        return usage.prompt_tokens, getattr(details, "cached_tokens", None) or 0
+
+    cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+    cache_creation = getattr(usage, "cache_creation_input_tokens", None) or 0
+    input_tokens = getattr(usage, "input_tokens", None) or 0
+    return input_tokens + cache_read + cache_creation, cache_read
+
+
+def is_transient_llm_error(error: BaseException) -> bool:
+    """
+    Whether an LLM request error is transient, so the request can be retried.
+    Instructor wraps provider errors, so the errors that caused `error` are checked too.
+
+    Parameters
+    ----------
+    error : BaseException
+        The error.
+
+    Returns
+    -------
+    bool
+        Whether the error is transient.
+    """
+
+    seen: Set[int] = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, (asyncio.TimeoutError, TimeoutError)):
+            return True
+        if type(current).__name__ in _TRANSIENT_ERROR_NAMES:
+            return True
+        status_code = getattr(current, "status_code", None)
+        if isinstance(status_code, int) and (
+            status_code in _TRANSIENT_STATUS_CODES or status_code >= 500
+        ):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
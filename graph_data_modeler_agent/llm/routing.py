@@ -0,0 +1,367 @@
+"""
+Route the LLM calls of each node to a small or a large model by the complexity of the table.
+
+Throughput is bound by the rate limit of the large model, so calls that a small, fast model handles well are sent to
+it. A `RoutingPolicy` picks the model of a call from measurable complexity:
+
+* The stage, the node making the call. Some stages, such as brainstorming, always use the small model.
+* The number of columns of the table.
+* The estimated number of prompt tokens.
+* The validation errors of previous calls of the same stage for similar tables, whose column names overlap by at least
+  `similarity_threshold` (Jaccard). A stage that needed retries for similar tables uses the large model.
+
+A `ModelRouter` applies a policy per stage, records each decision with its outcome, and learns the validation errors of
+tables as they are modeled. Nodes accept a `ModelRouter` wherever they accept a model name.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from ..data_dictionary.table_schema import TableSchema
+from .client import LLMClient, LLMClientStats
+from .tokens import estimate_message_tokens
+
+
+class TableComplexity(BaseModel):
+    """
+    The complexity measures of an LLM call for a table.
+
+    Attributes
+    ----------
+    column_count : int
+        The number of columns of the table.
+    prompt_tokens : int
+        The estimated number of prompt tokens.
+    similar_table_errors : float
+        The mean number of validation errors of previous calls of the same stage for similar tables.
+    similar_tables : int
+        The number of similar tables.
+    """
+
+    column_count: int
+    prompt_tokens: int
+    similar_table_errors: float = 0.0
+    similar_tables: int = 0
+
+
+class RoutingPolicy(BaseModel):
+    """
+    The rules that pick the model of an LLM call.
+    The large model is used if any limit is exceeded, and the small model otherwise.
+
+    Attributes
+    ----------
+    small_model : str
+        The small, fast model.
+    large_model : str
+        The large model.
+    max_columns : int
+        The max number of columns of a table for the small model, by default 30
+    max_prompt_tokens : int
+        The max number of estimated prompt tokens for the small model, by default 8,000
+    max_similar_table_errors : float
+        The max mean number of validation errors of similar tables for the small model, by default 0.5
+    small_model_stages : List[str]
+        The stages that always use the small model, by default brainstorm_updates
+    large_model_stages : List[str]
+        The stages that always use the large model, by default none
+    """
+
+    small_model: str
+    large_model: str
+    max_columns: int = 30
+    max_prompt_tokens: int = 8_000
+    max_similar_table_errors: float = 0.5
+    small_model_stages: List[str] = Field(
+        default_factory=lambda: ["brainstorm_updates"]
+    )
+    large_model_stages: List[str] = Field(default_factory=list)
+
+    def choose(self, stage: str, complexity: TableComplexity) -> Tuple[str, str]:
+        """
+        Pick the model of a call.
+
+        Parameters
+        ----------
+        stage : str
+            The stage.
+        complexity : TableComplexity
+            The complexity of the call.
+
+        Returns
+        -------
+        Tuple[str, str]
+            The model and the reason it was picked.
+        """
+
+        if stage in self.large_model_stages:
+            return self.large_model, f"{stage} always uses the large model"
+        if stage in self.small_model_stages:
+            return self.small_model, f"{stage} always uses the small model"
+        if complexity.column_count > self.max_columns:
+            return (
+                self.large_model,
+                f"{complexity.column_count} columns > {self.max_columns}",
+            )
+        if complexity.prompt_tokens > self.max_prompt_tokens:
+            return (
+                self.large_model,
+                f"{complexity.prompt_tokens:,} prompt tokens > {self.max_prompt_tokens:,}",
+            )
+        if complexity.similar_table_errors > self.max_similar_table_errors:
+            return (
+                self.large_model,
+                f"{complexity.similar_table_errors:.2f} validation errors for {complexity.similar_tables} similar tables > {self.max_similar_table_errors:.2f}",
+            )
+        return self.small_model, "within the small model limits"
+
+
+class RoutingDecision(BaseModel):
+    """
+    The model picked for an LLM call, and the outcome of the call.
+
+    Attributes
+    ----------
+    stage : str
+        The stage.
+    table_name : str
+        The table.
+    model : str
+        The model.
+    reason : str
+        Why the model was picked.
+    complexity : TableComplexity
+        The complexity of the call.
+    validation_errors : Optional[int]
+        The number of responses that failed validation, or None until the call finishes.
+    failed : Optional[bool]
+        Whether the call failed, or None until the call finishes.
+    """
+
+    stage: str
+    table_name: str
+    model: str
+    reason: str
+    complexity: TableComplexity
+    validation_errors: Optional[int] = None
+    failed: Optional[bool] = None
+
+
+class ModelRouter:
+    """
+    Pick the model of each LLM call with a policy per stage, and record the decisions.
+
+    Parameters
+    ----------
+    policy : RoutingPolicy
+        The policy of the stages without their own policy.
+    stage_policies : Optional[Dict[str, RoutingPolicy]], optional
+        The policies of specific stages, by default None
+    similarity_threshold : float, optional
+        The min Jaccard similarity of column names of similar tables, by default 0.5
+    history_size : int, optional
+        The number of recent call outcomes kept to find similar tables, by default 1,000
+    """
+
+    def __init__(
+        self,
+        policy: RoutingPolicy,
+        stage_policies: Optional[Dict[str, RoutingPolicy]] = None,
+        similarity_threshold: float = 0.5,
+        history_size: int = 1_000,
+    ) -> None:
+        self.policy = policy
+        self.stage_policies = stage_policies or dict()
+        self.similarity_threshold = similarity_threshold
+        self.decisions: List[RoutingDecision] = list()
+        self._history: Deque[Tuple[str, FrozenSet[str], int]] = deque(
+            maxlen=history_size
+        )
+
+    def route(
+        self,
+        stage: str,
+        table_schema: TableSchema,
+        messages: List[Dict[str, Any]],
+    ) -> RoutingDecision:
+        """
+        Pick the model of a call and record the decision.
+
+        Parameters
+        ----------
+        stage : str
+            The stage.
+        table_schema : TableSchema
+            The table.
+        messages : List[Dict[str, Any]]
+            The messages of the call.
+
+        Returns
+        -------
+        RoutingDecision
+            The decision.
+        """
+
+        columns = frozenset(c.lower() for c in table_schema.column_names)
+        errors = [
+            e
+            for s, c, e in self._history
+            if s == stage and _jaccard(columns, c) >= self.similarity_threshold
+        ]
+        complexity = TableComplexity(
+            column_count=len(columns),
+            prompt_tokens=estimate_message_tokens(messages),
+            similar_table_errors=sum(errors) / len(errors) if errors else 0.0,
+            similar_tables=len(errors),
+        )
+        model, reason = self.stage_policies.get(stage, self.policy).choose(
+            stage, complexity
+        )
+        decision = RoutingDecision(
+            stage=stage,
+            table_name=table_schema.name,
+            model=model,
+            reason=reason,
+            complexity=complexity,
+        )
+        self.decisions.append(decision)
+        return decision
+
+    def record_outcome(
+        self,
+        decision: RoutingDecision,
+        table_schema: TableSchema,
+        validation_errors: int,
+        failed: bool,
+    ) -> None:
+        """
+        Record the outcome of a call, so later calls for similar tables can use it.
+        A failed call counts as one more validation error.
+
+        Parameters
+        ----------
+        decision : RoutingDecision
+            The decision of the call.
+        table_schema : TableSchema
+            The table.
+        validation_errors : int
+            The number of responses that failed validation.
+        failed : bool
+            Whether the call failed.
+        """
+
+        decision.validation_errors = validation_errors
+        decision.failed = failed
+        self._history.append(
+            (
+                decision.stage,
+                frozenset(c.lower() for c in table_schema.column_names),
+                validation_errors + int(failed),
+            )
+        )
+
+    async def create(
+        self,
+        client: LLMClient,
+        stage: str,
+        table_schema: TableSchema,
+        messages: List[Dict[str, Any]],
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Route a call, make it and record its outcome.
+
+        Parameters
+        ----------
+        client : LLMClient
+            The client.
+        stage : str
+            The stage.
+        table_schema : TableSchema
+            The table.
+        messages : List[Dict[str, Any]]
+            The messages.
+        **kwargs : Any
+            The other arguments of `LLMClient.create()`, such as `response_model`.
+
+        Returns
+        -------
+        Any
+            The response.
+        """
+
+        decision = self.route(stage, table_schema, messages)
+        stats = LLMClientStats()
+        try:
+            response = await client.create(
+                model=decision.model, messages=messages, stats=stats, **kwargs
+            )
+        except Exception:
+            self.record_outcome(decision, table_schema, stats.validation_errors, True)
+            raise
+        self.record_outcome(decision, table_schema, stats.validation_errors, False)
+        return response
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """
+        Count the decisions per stage and model.
+
+        Returns
+        -------
+        Dict[str, Dict[str, int]]
+            The number of calls per model, per stage.
+        """
+
+        counts: Dict[str, Dict[str, int]] = dict()
+        for decision in self.decisions:
+            stage_counts = counts.setdefault(decision.stage, dict())
+            stage_counts[decision.model] = stage_counts.get(decision.model, 0) + 1
+        return counts
+
+
+ModelLike = Union[str, ModelRouter]
+
+
+async def create_routed(
+    client: LLMClient,
+    model: ModelLike,
+    stage: str,
+    table_schema: TableSchema,
+    messages: List[Dict[str, Any]],
+    **kwargs: Any,
+) -> Any:
+    """
+    Make an LLM call with a model, or the model a router picks.
+
+    Parameters
+    ----------
+    client : LLMClient
+        The client.
+    model : ModelLike
+        The model name, or a `ModelRouter`.
+    stage : str
+        The stage making the call.
+    table_schema : TableSchema
+        The table.
+    messages : List[Dict[str, Any]]
+        The messages.
+    **kwargs : Any
+        The other arguments of `LLMClient.create()`, such as `response_model`.
+
+    Returns
+    -------
+    Any
+        The response.
+    """
+
+    if isinstance(model, ModelRouter):
+        return await model.create(client, stage, table_schema, messages, **kwargs)
+    return await client.create(model=model, messages=messages, **kwargs)
+
+
+def _jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """The Jaccard similarity of two sets."""
+
+    return len(a & b) / len(a | b) if a or b else 1.0
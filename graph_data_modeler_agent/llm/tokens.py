@@ -0,0 +1,54 @@
+"""
+Token count estimates of prompts, without a provider specific tokenizer.
+
+Estimates use roughly 4 characters per token, which is close for English text and JSON with common tokenizers.
+They are meant to compare prompts and tables, not to enforce provider limits.
+"""
+
+import json
+from typing import Any, Dict, List
+
+CHARACTERS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens of a text.
+
+    Parameters
+    ----------
+    text : str
+        The text.
+
+    Returns
+    -------
+    int
+        The estimated number of tokens.
+    """
+
+    return -(-len(text) // CHARACTERS_PER_TOKEN)
+
+
+def estimate_message_tokens(messages: List[Dict[str, Any]]) -> int:
+    """
+    Estimate the number of prompt tokens of chat messages.
+
+    Parameters
+    ----------
+    messages : List[Dict[str, Any]]
+        The messages.
+
+    Returns
+    -------
+    int
+        The estimated number of tokens.
+    """
+
+    return sum(
+        estimate_tokens(
+            m["content"]
+            if isinstance(m.get("content"), str)
+            else json.dumps(m.get("content"))
+        )
+        for m in messages
+    )
@@ -0,0 +1,50 @@
+from .dictionary_inference import (
+    ColumnProfile,
+    FileProfile,
+    infer_data_dictionary,
+    profile_file,
+    profile_files,
+)
+from .join_discovery import JoinCandidate, apply_join_candidates, discover_joins
+from .keys import CandidateKey, FunctionalDependency, KeyProfile, profile_keys
+from .sketches import ColumnSketch, hash_values
+from .stats import StatsAccumulator, accumulate_stats
+from .table_stats import (
+    CategoricalColumnStats,
+    ColumnStats,
+    NumericColumnStats,
+    TableStats,
+)
+from .type_inference import (
+    InferredColumnType,
+    apply_inferred_types,
+    infer_column_types,
+    infer_table_schema,
+)
+
+__all__ = [
+    "CandidateKey",
+    "CategoricalColumnStats",
+    "ColumnProfile",
+    "ColumnSketch",
+    "ColumnStats",
+    "FileProfile",
+    "FunctionalDependency",
+    "InferredColumnType",
+    "JoinCandidate",
+    "KeyProfile",
+    "NumericColumnStats",
+    "StatsAccumulator",
+    "TableStats",
+    "accumulate_stats",
+    "apply_inferred_types",
+    "apply_join_candidates",
+    "discover_joins",
+    "hash_values",
+    "infer_column_types",
+    "infer_data_dictionary",
+    "infer_table_schema",
+    "profile_file",
+    "profile_files",
+    "profile_keys",
+]
@@ -0,0 +1,369 @@
+"""
+Data dictionary inference from raw CSV, JSON, JSONL and Parquet files.
+
+Each file is profiled in a single pass over chunks, in a separate process per file. A file profile holds the inferred
+column types, null counts, numeric ranges and a `ColumnSketch` per column. The profiles are then combined into a
+`DataDictionary` with candidate primary keys, and cross-file joins found by LSH over the column sketches are declared as
+foreign keys and aliases.
+"""
+
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+from pydantic import BaseModel
+
+from ..data_dictionary.column import Column
+from ..data_dictionary.data_dictionary import DataDictionary
+from ..data_dictionary.table_schema import TableSchema
+from ..data_source.data_source import DataSource
+from .join_discovery import apply_join_candidates, discover_joins
+from .sketches import DEFAULT_NUM_PERM, ColumnSketch, hash_values
+from .type_inference import InferredColumnType, infer_column_types
+
+SUPPORTED_FILE_EXTENSIONS = [".csv", ".json", ".jsonl", ".parquet"]
+# `id`, `customer_id` or `customerId`, but not `paid` or `valid`
+_IDENTIFIER_NAME_PATTERN = re.compile(r"(?i:^id$|_id$)|[a-z0-9](?:Id|ID)$")
+
+# min ratio of estimated distinct values to rows for a column to be a key
+_KEY_DISTINCT_RATIO: float = 0.97
+
+
+class ColumnProfile(BaseModel, arbitrary_types_allowed=True):
+    """
+    The profile of a column.
+
+    Attributes
+    ----------
+    inferred_type : InferredColumnType
+        The inferred type and null counts.
+    sketch : ColumnSketch
+        The MinHash and HyperLogLog sketch of the column values.
+    min_value : Optional[float], optional
+        The min value of a numeric column, by default None
+    max_value : Optional[float], optional
+        The max value of a numeric column, by default None
+    first_chunk_unique : bool
+        Whether the values in the first chunk are unique. Along with the distinct count estimate, this indicates a key.
+    """
+
+    inferred_type: InferredColumnType
+    sketch: ColumnSketch
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    first_chunk_unique: bool
+
+    @property
+    def name(self) -> str:
+        """The column name."""
+
+        return self.inferred_type.name
+
+    @property
+    def is_key_candidate(self) -> bool:
+        """Whether the column has no nulls and a distinct value for nearly every row."""
+
+        row_count = self.inferred_type.row_count
+        return (
+            row_count > 1
+            and not self.inferred_type.nullable
+            and self.first_chunk_unique
+            and self.sketch.distinct_count() >= _KEY_DISTINCT_RATIO * row_count
+        )
+
+    def describe(self) -> str:
+        """
+        A short statistical description of the column.
+
+        Returns
+        -------
+        str
+            The description.
+        """
+
+        t = self.inferred_type
+        null_ratio = t.null_count / t.row_count if t.row_count else 0.0
+        distinct = round(self.sketch.distinct_count())
+        description = (
+            f"{t.neo4j_type} values. About {distinct:,} distinct values "
+            f"in {t.row_count:,} rows, {null_ratio:.0%} null."
+        )
+        if self.min_value is not None and self.max_value is not None:
+            description += f" Range {self.min_value:g} to {self.max_value:g}."
+        return description
+
+
+class FileProfile(BaseModel):
+    """
+    The profile of a file.
+
+    Attributes
+    ----------
+    name : str
+        The file name, used as the table name.
+    file_path : str
+        The file location.
+    row_count : int
+        The number of rows.
+    columns : List[ColumnProfile]
+        The column profiles in column order.
+    profile_seconds : float
+        The time spent profiling the file.
+    """
+
+    name: str
+    file_path: str
+    row_count: int
+    columns: List[ColumnProfile]
+    profile_seconds: float
+
+
+def list_data_files(directory: str) -> List[str]:
+    """
+    List the supported data files in a directory.
+
+    Parameters
+    ----------
+    directory : str
+        The directory.
+
+    Returns
+    -------
+    List[str]
+        The file paths, sorted by file name.
+    """
+
+    return [
+        os.path.join(directory, f)
+        for f in sorted(os.listdir(directory))
+        if os.path.splitext(f)[1].lower() in SUPPORTED_FILE_EXTENSIONS
+    ]
+
+
+def profile_file(
+    file_path: str, chunk_size: int = 100_000, num_perm: int = DEFAULT_NUM_PERM
+) -> FileProfile:
+    """
+    Profile a CSV, JSON, JSONL or Parquet file in a single pass. CSV, JSONL and Parquet files are read in chunks.
+
+    Parameters
+    ----------
+    file_path : str
+        The file location.
+    chunk_size : int, optional
+        The number of rows per chunk, by default 100,000
+    num_perm : int, optional
+        The number of MinHash bins per column sketch, by default 128
+
+    Returns
+    -------
+    FileProfile
+        The file profile.
+    """
+
+    start = time.perf_counter()
+    sketches: Dict[str, ColumnSketch] = dict()
+    ranges: Dict[str, Tuple[Optional[float], Optional[float]]] = dict()
+    first_chunk_unique: Dict[str, bool] = dict()
+
+    def _profiled_chunks() -> Iterator[pd.DataFrame]:
+        for chunk in _read_chunks(file_path=file_path, chunk_size=chunk_size):
+            for col in chunk.columns:
+                name = str(col)
+                series = chunk[col]
+                if name not in sketches:
+                    sketches[name] = ColumnSketch(num_perm=num_perm)
+                    ranges[name] = (None, None)
+                    first_chunk_unique[name] = _is_unique(series)
+                sketches[name].update(hash_values(series))
+                if pd.api.types.is_numeric_dtype(
+                    series.dtype
+                ) and not pd.api.types.is_bool_dtype(series.dtype):
+                    ranges[name] = _merge_range(ranges[name], series)
+            yield chunk
+
+    inferred_types = infer_column_types(_profiled_chunks())
+
+    columns = [
+        ColumnProfile(
+            inferred_type=t,
+            sketch=sketches[t.name],
+            min_value=ranges[t.name][0],
+            max_value=ranges[t.name][1],
+            first_chunk_unique=first_chunk_unique[t.name],
+        )
+        for t in inferred_types
+    ]
+
+    return FileProfile(
+        name=os.path.basename(file_path),
+        file_path=file_path,
+        row_count=inferred_types[0].row_count if inferred_types else 0,
+        columns=columns,
+        profile_seconds=time.perf_counter() - start,
+    )
+
+
+def profile_files(
+    file_paths: List[str],
+    max_workers: Optional[int] = None,
+    chunk_size: int = 100_000,
+    num_perm: int = DEFAULT_NUM_PERM,
+) -> List[FileProfile]:
+    """
+    Profile files in parallel processes.
+
+    Parameters
+    ----------
+    file_paths : List[str]
+        The file locations.
+    max_workers : Optional[int], optional
+        The max number of processes. 1 profiles the files in the current process. By default None, which uses the CPU count.
+    chunk_size : int, optional
+        The number of rows per chunk, by default 100,000
+    num_perm : int, optional
+        The number of MinHash bins per column sketch, by default 128
+
+    Returns
+    -------
+    List[FileProfile]
+        The file profiles in the order of `file_paths`.
+    """
+
+    if max_workers == 1 or len(file_paths) <= 1:
+        return [
+            profile_file(file_path=f, chunk_size=chunk_size, num_perm=num_perm)
+            for f in file_paths
+        ]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                profile_file,
+                file_paths,
+                [chunk_size] * len(file_paths),
+                [num_perm] * len(file_paths),
+            )
+        )
+
+
+def infer_data_dictionary(
+    data: Union[str, List[str]],
+    max_workers: Optional[int] = None,
+    chunk_size: int = 100_000,
+    num_perm: int = DEFAULT_NUM_PERM,
+    min_alias_containment: float = 0.8,
+) -> DataDictionary:
+    """
+    Infer a `DataDictionary` from raw data files.
+
+    Each column receives an inferred `python_type`, `nullable` and a short statistical description.
+    Each table receives at most one candidate `primary_key`, a column with no nulls and a distinct value per row.
+    Columns whose values are mostly contained in a key column of another file are declared as a `foreign_key`,
+    and as `aliases` of the key column if they are named differently.
+
+    Parameters
+    ----------
+    data : Union[str, List[str]]
+        A directory of CSV, JSON, JSONL and Parquet files, or a list of file paths.
+    max_workers : Optional[int], optional
+        The max number of profiling processes. 1 profiles the files in the current process. By default None, which uses the CPU count.
+    chunk_size : int, optional
+        The number of rows per chunk, by default 100,000
+    num_perm : int, optional
+        The number of MinHash bins per column sketch, by default 128
+    min_alias_containment : float, optional
+        The min estimated fraction of a column's distinct values found in a key column for the columns to join, by default 0.8
+
+    Returns
+    -------
+    DataDictionary
+        The inferred data dictionary.
+    """
+
+    file_paths = list_data_files(data) if isinstance(data, str) else data
+    profiles = profile_files(
+        file_paths=file_paths,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+        num_perm=num_perm,
+    )
+
+    data_dictionary = DataDictionary(
+        table_schemas=[_create_table_schema(profile=p) for p in profiles]
+    )
+    join_candidates = discover_joins(
+        profiles=profiles, min_containment=min_alias_containment
+    )
+
+    return apply_join_candidates(
+        data_dictionary=data_dictionary, join_candidates=join_candidates
+    )
+
+
+def _create_table_schema(profile: FileProfile) -> TableSchema:
+    """Create a `TableSchema` from a file profile."""
+
+    primary_key = _select_primary_key(profile)
+
+    return TableSchema(
+        name=profile.name,
+        columns=[
+            Column(
+                name=c.name,
+                description=c.describe(),
+                python_type=c.inferred_type.python_type,
+                nullable=c.inferred_type.nullable,
+                primary_key=c.name == primary_key,
+            )
+            for c in profile.columns
+        ],
+    )
+
+
+def _select_primary_key(profile: FileProfile) -> Optional[str]:
+    """Select the key candidate named like an identifier, otherwise the first key candidate."""
+
+    candidates = [c.name for c in profile.columns if c.is_key_candidate]
+    for name in candidates:
+        if _IDENTIFIER_NAME_PATTERN.search(name):
+            return name
+    return candidates[0] if candidates else None
+
+
+def _read_chunks(file_path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Read a file in chunks."""
+
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in SUPPORTED_FILE_EXTENSIONS:
+        raise ValueError(
+            f"Unsupported file extension: {extension}. Must be one of: {SUPPORTED_FILE_EXTENSIONS}"
+        )
+
+    yield from DataSource(file_path=file_path).iter_chunks(chunk_size=chunk_size)
+
+
+def _is_unique(series: pd.Series) -> bool:
+    """Whether the values of a series are unique. Unhashable values are compared by their string form."""
+
+    try:
+        return bool(series.is_unique)
+    except TypeError:
+        return bool(series.astype(str).is_unique)
+
+
+def _merge_range(
+    current: Tuple[Optional[float], Optional[float]], series: pd.Series
+) -> Tuple[Optional[float], Optional[float]]:
+    """Merge the min and max of a numeric series into the current range."""
+
+    if series.isna().all():
+        return current
+    low, high = float(series.min()), float(series.max())
+    return (
+        low if current[0] is None else min(current[0], low),
+        high if current[1] is None else max(current[1], high),
+    )
@@ -0,0 +1,269 @@
+"""
+Join discovery between files from column value sketches.
+
+Candidate foreign key to primary key pairs are found with LSH banding over the MinHash signatures of the columns:
+columns are bucketed by each band of their signature and only columns that share a bucket with a key column are compared.
+Candidates are then verified with vectorized Jaccard and containment estimates, so no pair of columns is ever compared
+by scanning their values.
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from ..data_dictionary.column import Column
+from ..data_dictionary.data_dictionary import DataDictionary
+from ..data_dictionary.table_schema import TableSchema
+
+if TYPE_CHECKING:
+    from .dictionary_inference import ColumnProfile, FileProfile
+
+_EMPTY_BIN = np.iinfo(np.uint64).max
+# types that may be joined on
+JOINABLE_TYPES = {"STRING", "INTEGER"}
+
+
+class JoinCandidate(BaseModel):
+    """
+    A likely foreign key to primary key join between columns in different files.
+
+    Attributes
+    ----------
+    source_table : str
+        The table containing the foreign key.
+    source_column : str
+        The foreign key column.
+    target_table : str
+        The table containing the key.
+    target_column : str
+        The key column.
+    containment : float
+        The estimated fraction of the foreign key's distinct values found in the key.
+    jaccard : float
+        The estimated Jaccard similarity of the distinct values.
+    """
+
+    source_table: str
+    source_column: str
+    target_table: str
+    target_column: str
+    containment: float
+    jaccard: float
+
+
+def discover_joins(
+    profiles: List["FileProfile"],
+    min_containment: float = 0.8,
+    rows_per_band: int = 1,
+) -> List[JoinCandidate]:
+    """
+    Discover likely joins between the columns of different files.
+
+    A column joins the key column in another file that best contains its distinct values.
+    Key columns only join other key columns if their distinct values mostly overlap, since unrelated surrogate keys
+    often contain each other.
+
+    Parameters
+    ----------
+    profiles : List[FileProfile]
+        The file profiles. Column sketches must share parameters.
+    min_containment : float, optional
+        The min estimated fraction of a column's distinct values found in the key column, by default 0.8
+    rows_per_band : int, optional
+        The number of signature bins per LSH band. More rows per band produce fewer candidate pairs,
+        but may miss joins between columns of very different sizes. By default 1
+
+    Returns
+    -------
+    List[JoinCandidate]
+        At most one join per column, in file and column order.
+    """
+
+    columns: List[Tuple[str, "ColumnProfile"]] = [
+        (p.name, c)
+        for p in profiles
+        for c in p.columns
+        if c.inferred_type.neo4j_type in JOINABLE_TYPES
+        and c.sketch.distinct_count() >= 2
+    ]
+    if not columns:
+        return list()
+
+    signatures = np.stack([c.sketch.signature for _, c in columns])
+    distinct_counts = np.array([c.sketch.distinct_count() for _, c in columns])
+    is_key = np.array([c.is_key_candidate for _, c in columns])
+    file_ids = pd.factorize(np.array([f for f, _ in columns]))[0]
+    names = np.array([c.name for _, c in columns])
+
+    source_idx, target_idx = _lsh_candidate_pairs(
+        signatures=signatures, is_key=is_key, rows_per_band=rows_per_band
+    )
+    keep = file_ids[source_idx] != file_ids[target_idx]
+    # same named keys, such as `id`, are usually unrelated surrogate keys
+    keep &= ~(is_key[source_idx] & (names[source_idx] == names[target_idx]))
+    source_idx, target_idx = source_idx[keep], target_idx[keep]
+
+    jaccard, containment, violations = _estimate_overlap(
+        source=signatures[source_idx],
+        target=signatures[target_idx],
+        source_distinct=distinct_counts[source_idx],
+        target_distinct=distinct_counts[target_idx],
+    )
+    # surrogate keys often overlap, so two key columns must have nearly the same values
+    score = np.where(is_key[source_idx], jaccard, containment)
+    # a bin where the source min hash is below the target min hash proves that value is missing from the target
+    keep = (score >= min_containment) & (violations <= 1 - min_containment)
+
+    # only the best matching key is used, since integer ranges of unrelated keys often contain each other
+    best: Dict[int, Tuple[Tuple[float, float], int, float, float]] = dict()
+    for s, t, sc, j, c in zip(
+        source_idx[keep],
+        target_idx[keep],
+        score[keep],
+        jaccard[keep],
+        containment[keep],
+    ):
+        if int(s) not in best or (sc, j) > best[int(s)][0]:
+            best[int(s)] = ((float(sc), float(j)), int(t), float(c), float(j))
+
+    res: List[JoinCandidate] = list()
+    for s in sorted(best):
+        _, t, c, j = best[s]
+        res.append(
+            JoinCandidate(
+                source_table=columns[s][0],
+                source_column=columns[s][1].name,
+                target_table=columns[t][0],
+                target_column=columns[t][1].name,
+                containment=c,
+                jaccard=j,
+            )
+        )
+    return res
+
+
+def apply_join_candidates(
+    data_dictionary: DataDictionary, join_candidates: List[JoinCandidate]
+) -> DataDictionary:
+    """
+    Declare discovered joins in a data dictionary.
+    Source columns are marked as `foreign_key`, unless they are a primary key.
+    Differently named source and target columns are added to each other's `aliases`.
+
+    Parameters
+    ----------
+    data_dictionary : DataDictionary
+        The data dictionary.
+    join_candidates : List[JoinCandidate]
+        The joins to declare.
+
+    Returns
+    -------
+    DataDictionary
+        A new `DataDictionary` with the joins declared.
+    """
+
+    foreign_keys = {(j.source_table, j.source_column) for j in join_candidates}
+    aliases: Dict[Tuple[str, str], List[str]] = dict()
+    for j in join_candidates:
+        if j.source_column == j.target_column:
+            continue
+        for table, column, alias in [
+            (j.source_table, j.source_column, j.target_column),
+            (j.target_table, j.target_column, j.source_column),
+        ]:
+            column_aliases = aliases.setdefault((table, column), list())
+            if alias not in column_aliases:
+                column_aliases.append(alias)
+
+    table_schemas: List[TableSchema] = list()
+    for ts in data_dictionary.table_schemas:
+        columns: List[Column] = list()
+        for col in ts.columns:
+            column_key = (ts.name, col.name)
+            new_aliases = [
+                a
+                for a in aliases.get(column_key, list())
+                if a not in (col.aliases or list())
+            ]
+            is_foreign_key = column_key in foreign_keys and not col.primary_key
+            if new_aliases or (is_foreign_key and not col.foreign_key):
+                col = Column.model_validate(
+                    {
+                        **col.model_dump(),
+                        "aliases": (col.aliases or list()) + new_aliases or None,
+                        "foreign_key": col.foreign_key or is_foreign_key,
+                    }
+                )
+            columns.append(col)
+        table_schemas.append(TableSchema(name=ts.name, columns=columns))
+
+    return DataDictionary(table_schemas=table_schemas)
+
+
+def _lsh_candidate_pairs(
+    signatures: np.ndarray, is_key: np.ndarray, rows_per_band: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the (source, target) column index pairs that share an LSH bucket, where the target is a key column.
+    Bands containing an empty bin are not bucketed, since empty bins match between any two small columns.
+    """
+
+    num_cols, num_perm = signatures.shape
+    num_bands = num_perm // rows_per_band
+    bands = signatures[:, : num_bands * rows_per_band].reshape(
+        num_cols, num_bands, rows_per_band
+    )
+
+    valid = ~(bands == _EMPTY_BIN).any(axis=2)
+    band_hashes = bands[:, :, 0].copy()
+    for r in range(1, rows_per_band):
+        band_hashes = band_hashes * np.uint64(0x9E3779B97F4A7C15) ^ bands[:, :, r]
+
+    col_idx, band_idx = np.nonzero(valid)
+    buckets = pd.DataFrame(
+        {
+            "col": col_idx,
+            "band": band_idx,
+            "hash": band_hashes[col_idx, band_idx],
+        }
+    )
+    key_buckets = buckets[is_key[buckets["col"].to_numpy()]]
+
+    pairs = buckets.merge(
+        key_buckets, on=["band", "hash"], suffixes=("_source", "_target")
+    )
+    pairs = pairs[pairs["col_source"] != pairs["col_target"]]
+    pairs = pairs[["col_source", "col_target"]].drop_duplicates()
+
+    return pairs["col_source"].to_numpy(), pairs["col_target"].to_numpy()
+
+
+def _estimate_overlap(
+    source: np.ndarray,
+    target: np.ndarray,
+    source_distinct: np.ndarray,
+    target_distinct: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Estimate the Jaccard similarity, source containment in target and the fraction of source bins that
+    prove a source value is missing from the target, for each row of paired signatures.
+    """
+
+    source_filled = source != _EMPTY_BIN
+    target_filled = target != _EMPTY_BIN
+    filled = source_filled | target_filled
+
+    matches = ((source == target) & filled).sum(axis=1)
+    jaccard = matches / np.maximum(filled.sum(axis=1), 1)
+
+    intersection = jaccard * (source_distinct + target_distinct) / (1 + jaccard)
+    containment = np.minimum(intersection / np.maximum(source_distinct, 1), 1.0)
+
+    violations = ((source < target) & source_filled).sum(axis=1) / np.maximum(
+        source_filled.sum(axis=1), 1
+    )
+
+    return jaccard, containment, violations
@@ -0,0 +1,366 @@
+"""
+Candidate key and functional dependency detection for tabular data.
+
+Each column is hashed once to a uint64 array, so uniqueness checks of single and composite columns and functional
+dependency checks are vectorized integer operations independent of the original column types.
+Functional dependencies are only mined from determinants whose values repeat, since a near-unique column determines
+every other column on almost all rows without describing an entity.
+Large tables are profiled on a seeded random row sample.
+"""
+
+from itertools import combinations
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+# used to combine column hashes into a composite hash
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+class CandidateKey(BaseModel):
+    """
+    A column or combination of columns that uniquely identifies rows.
+
+    Attributes
+    ----------
+    columns : List[str]
+        The columns that make up the key.
+    uniqueness : float
+        The ratio of distinct values to rows. 1.0 is a unique key.
+    null_count : int
+        The number of rows with a null value in any key column.
+    """
+
+    columns: List[str]
+    uniqueness: float
+    null_count: int
+
+    @property
+    def is_unique(self) -> bool:
+        """Whether the key is unique and contains no nulls in the profiled rows."""
+
+        return self.uniqueness == 1.0 and self.null_count == 0
+
+
+class FunctionalDependency(BaseModel):
+    """
+    An approximate functional dependency `determinant -> dependent`.
+
+    Attributes
+    ----------
+    determinant : str
+        The determining column.
+    dependent : str
+        The dependent column.
+    confidence : float
+        The fraction of rows that agree with the most common dependent value for their determinant value.
+        1.0 is an exact functional dependency.
+    """
+
+    determinant: str
+    dependent: str
+    confidence: float
+
+
+class KeyProfile(BaseModel):
+    """
+    The candidate keys and functional dependencies found in a table.
+
+    Attributes
+    ----------
+    candidate_keys : List[CandidateKey]
+        The single and composite candidate keys, single column keys first.
+    functional_dependencies : List[FunctionalDependency]
+        The functional dependencies between non-key columns.
+    row_count : int
+        The number of rows profiled.
+    sampled : bool
+        Whether the rows profiled were a sample of the table.
+    """
+
+    candidate_keys: List[CandidateKey]
+    functional_dependencies: List[FunctionalDependency]
+    row_count: int
+    sampled: bool
+
+    def dependents_by_determinant(self) -> Dict[str, List[str]]:
+        """
+        Group the functional dependencies by determinant.
+        Each determinant is a possible node key and its dependents are possible properties of that node.
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            A mapping of determinant column to dependent columns.
+        """
+
+        res: Dict[str, List[str]] = dict()
+        for fd in self.functional_dependencies:
+            res.setdefault(fd.determinant, list()).append(fd.dependent)
+        return res
+
+
+def profile_keys(
+    data: pd.DataFrame,
+    max_key_arity: int = 2,
+    min_key_uniqueness: float = 0.99,
+    min_fd_confidence: float = 0.98,
+    max_fd_determinant_uniqueness: float = 0.5,
+    max_composite_columns: int = 12,
+    sample_size: Optional[int] = 100_000,
+    random_state: int = 0,
+) -> KeyProfile:
+    """
+    Detect candidate keys and approximate functional dependencies in a DataFrame.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The data to profile.
+    max_key_arity : int, optional
+        The max number of columns in a composite key, by default 2
+    min_key_uniqueness : float, optional
+        The min ratio of distinct values to rows for a near-unique key, by default 0.99
+    min_fd_confidence : float, optional
+        The min confidence of a functional dependency, by default 0.98
+    max_fd_determinant_uniqueness : float, optional
+        The max ratio of distinct values to rows of a functional dependency determinant, by default 0.5
+    max_composite_columns : int, optional
+        The max number of columns considered for composite keys. The highest cardinality columns are used, by default 12
+    sample_size : Optional[int], optional
+        The max number of rows to profile. Larger tables are randomly sampled. By default 100,000. None profiles all rows.
+    random_state : int, optional
+        The seed for sampling, by default 0
+
+    Returns
+    -------
+    KeyProfile
+        The detected keys and dependencies.
+    """
+
+    sampled = sample_size is not None and len(data) > sample_size
+    if sampled:
+        data = data.sample(n=sample_size, random_state=random_state)
+
+    row_count = len(data)
+    if row_count == 0:
+        return KeyProfile(
+            candidate_keys=[], functional_dependencies=[], row_count=0, sampled=sampled
+        )
+
+    hashes = {str(col): _hash_series(data[col]) for col in data.columns}
+    nulls = {str(col): data[col].isna().to_numpy() for col in data.columns}
+    cardinalities = {col: len(pd.unique(h)) for col, h in hashes.items()}
+
+    candidate_keys = detect_candidate_keys(
+        hashes=hashes,
+        nulls=nulls,
+        cardinalities=cardinalities,
+        row_count=row_count,
+        max_key_arity=max_key_arity,
+        min_key_uniqueness=min_key_uniqueness,
+        max_composite_columns=max_composite_columns,
+    )
+
+    key_columns = {k.columns[0] for k in candidate_keys if len(k.columns) == 1}
+    functional_dependencies = detect_functional_dependencies(
+        hashes={c: h for c, h in hashes.items() if c not in key_columns},
+        cardinalities=cardinalities,
+        row_count=row_count,
+        min_fd_confidence=min_fd_confidence,
+        max_fd_determinant_uniqueness=max_fd_determinant_uniqueness,
+    )
+
+    return KeyProfile(
+        candidate_keys=candidate_keys,
+        functional_dependencies=functional_dependencies,
+        row_count=row_count,
+        sampled=sampled,
+    )
+
+
+def detect_candidate_keys(
+    hashes: Dict[str, np.ndarray],
+    nulls: Dict[str, np.ndarray],
+    cardinalities: Dict[str, int],
+    row_count: int,
+    max_key_arity: int = 2,
+    min_key_uniqueness: float = 0.99,
+    max_composite_columns: int = 12,
+) -> List[CandidateKey]:
+    """
+    Detect single and minimal composite candidate keys from hashed columns.
+
+    Parameters
+    ----------
+    hashes : Dict[str, np.ndarray]
+        A mapping of column name to uint64 value hashes.
+    nulls : Dict[str, np.ndarray]
+        A mapping of column name to boolean null mask.
+    cardinalities : Dict[str, int]
+        A mapping of column name to number of distinct values.
+    row_count : int
+        The number of rows.
+    max_key_arity : int, optional
+        The max number of columns in a composite key, by default 2
+    min_key_uniqueness : float, optional
+        The min ratio of distinct values to rows, by default 0.99
+    max_composite_columns : int, optional
+        The max number of columns considered for composite keys, by default 12
+
+    Returns
+    -------
+    List[CandidateKey]
+        The candidate keys ordered by arity, then uniqueness.
+    """
+
+    res: List[CandidateKey] = list()
+
+    for col, cardinality in cardinalities.items():
+        uniqueness = cardinality / row_count
+        if uniqueness >= min_key_uniqueness and row_count > 1:
+            res.append(
+                CandidateKey(
+                    columns=[col],
+                    uniqueness=uniqueness,
+                    null_count=int(nulls[col].sum()),
+                )
+            )
+
+    # composite keys are only built from columns that are not keys themselves, so every composite key is minimal
+    # with respect to single columns. Constant columns never contribute to uniqueness.
+    single_keys = {k.columns[0] for k in res}
+    highest_cardinality = set(
+        sorted(
+            [c for c, n in cardinalities.items() if c not in single_keys and n > 1],
+            key=lambda c: -cardinalities[c],
+        )[:max_composite_columns]
+    )
+    # keep the table column order so keys read naturally
+    composite_columns = [c for c in cardinalities if c in highest_cardinality]
+
+    found: List[Tuple[str, ...]] = list()
+    for arity in range(2, max_key_arity + 1):
+        arity_keys: List[CandidateKey] = list()
+        for columns in combinations(composite_columns, arity):
+            if any(set(k).issubset(columns) for k in found):
+                continue
+            # the product of cardinalities bounds the number of distinct combinations
+            if np.prod([cardinalities[c] for c in columns], dtype=float) < (
+                min_key_uniqueness * row_count
+            ):
+                continue
+
+            combined = _combine_hashes([hashes[c] for c in columns])
+            uniqueness = len(pd.unique(combined)) / row_count
+            if uniqueness >= min_key_uniqueness:
+                null_mask = np.logical_or.reduce([nulls[c] for c in columns])
+                arity_keys.append(
+                    CandidateKey(
+                        columns=list(columns),
+                        uniqueness=uniqueness,
+                        null_count=int(null_mask.sum()),
+                    )
+                )
+        found.extend([tuple(k.columns) for k in arity_keys])
+        res.extend(arity_keys)
+
+    return sorted(res, key=lambda k: (len(k.columns), -k.uniqueness, k.null_count))
+
+
+def detect_functional_dependencies(
+    hashes: Dict[str, np.ndarray],
+    cardinalities: Dict[str, int],
+    row_count: int,
+    min_fd_confidence: float = 0.98,
+    max_fd_determinant_uniqueness: float = 0.5,
+) -> List[FunctionalDependency]:
+    """
+    Detect approximate functional dependencies between hashed columns.
+    Constant columns are ignored, since they are trivially determined by every column.
+    Near-unique columns are not determinants, since they trivially determine every column.
+
+    Parameters
+    ----------
+    hashes : Dict[str, np.ndarray]
+        A mapping of column name to uint64 value hashes.
+    cardinalities : Dict[str, int]
+        A mapping of column name to number of distinct values.
+    row_count : int
+        The number of rows.
+    min_fd_confidence : float, optional
+        The min confidence of a functional dependency, by default 0.98
+    max_fd_determinant_uniqueness : float, optional
+        The max ratio of distinct values to rows of a determinant, by default 0.5
+
+    Returns
+    -------
+    List[FunctionalDependency]
+        The functional dependencies ordered by determinant in column order, then by descending confidence.
+    """
+
+    columns = [c for c in hashes if cardinalities[c] > 1]
+    # each violating row adds at most one distinct (determinant, dependent) pair
+    max_violations = int((1 - min_fd_confidence) * row_count)
+
+    codes = {c: pd.factorize(hashes[c])[0] for c in columns}
+
+    res: List[FunctionalDependency] = list()
+    for determinant in columns:
+        det_cardinality = cardinalities[determinant]
+        # each determinant value must repeat on average to support a dependency
+        if det_cardinality > max_fd_determinant_uniqueness * row_count:
+            continue
+        determined: List[FunctionalDependency] = list()
+        for dependent in columns:
+            if dependent == determinant:
+                continue
+            # a column can't determine a column with more distinct values beyond the violation budget
+            if cardinalities[dependent] - det_cardinality > max_violations:
+                continue
+
+            pairs = codes[determinant].astype(np.int64) * cardinalities[
+                dependent
+            ] + codes[dependent].astype(np.int64)
+            unique_pairs, pair_counts = np.unique(pairs, return_counts=True)
+            if len(unique_pairs) - det_cardinality > max_violations:
+                continue
+
+            # rows that agree with the most common dependent value of their determinant value
+            pair_determinants = unique_pairs // cardinalities[dependent]
+            max_counts = np.zeros(det_cardinality, dtype=np.int64)
+            np.maximum.at(max_counts, pair_determinants, pair_counts)
+            confidence = float(max_counts.sum()) / row_count
+
+            if confidence >= min_fd_confidence:
+                determined.append(
+                    FunctionalDependency(
+                        determinant=determinant,
+                        dependent=dependent,
+                        confidence=confidence,
+                    )
+                )
+        # ties keep the column order of the dependents
+        res.extend(sorted(determined, key=lambda fd: fd.confidence, reverse=True))
+
+    return res
+
+
+def _hash_series(series: pd.Series) -> np.ndarray:
+    """Hash the values of a series to uint64. Unhashable values, such as lists, are hashed by their string form."""
+
+    try:
+        return np.asarray(pd.util.hash_pandas_object(series, index=False))
+    except TypeError:
+        return np.asarray(pd.util.hash_pandas_object(series.astype(str), index=False))
+
+
+def _combine_hashes(hashes: List[np.ndarray]) -> np.ndarray:
+    """Combine column hashes into a single composite hash per row."""
+
+    combined = hashes[0].copy()
+    for h in hashes[1:]:
+        combined = (combined * _HASH_MULTIPLIER) ^ h
+    return combined
@@ -0,0 +1,232 @@
+"""
+Mergeable column sketches for profiling data that is read in chunks.
+
+A `ColumnSketch` holds a MinHash signature, for estimating the value overlap between columns, and a HyperLogLog,
+for estimating the number of distinct values. Both are updated with vectorized numpy operations and merged with an
+element-wise min or max, so chunks and files may be sketched independently and combined.
+
+The MinHash signature uses one permutation hashing: each value is hashed once and assigned to one of `num_perm` bins,
+and each bin keeps its min hash. This costs a single pass per value instead of a pass per permutation.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_NUM_PERM: int = 128
+DEFAULT_HLL_PRECISION: int = 12
+
+_MAX_HASH = np.iinfo(np.uint64).max
+
+
+def hash_values(series: pd.Series) -> np.ndarray:
+    """
+    Hash the non-null values of a series to uint64.
+    Numeric values are hashed by their integer value if they are all integral, so integer columns read as floats
+    because of missing values hash equally to integer columns. Other values are hashed by their string form.
+
+    Parameters
+    ----------
+    series : pd.Series
+        The series.
+
+    Returns
+    -------
+    np.ndarray
+        The hashes of the non-null values.
+    """
+
+    values = series.dropna()
+    if pd.api.types.is_bool_dtype(values.dtype):
+        values = values.astype(str)
+    elif pd.api.types.is_float_dtype(values.dtype):
+        if bool(((values % 1) == 0).all()):
+            values = values.astype("int64")
+    elif not pd.api.types.is_integer_dtype(values.dtype):
+        try:
+            return np.asarray(pd.util.hash_pandas_object(values, index=False))
+        except TypeError:
+            # unhashable values, such as lists
+            values = values.astype(str)
+
+    return np.asarray(pd.util.hash_pandas_object(values, index=False))
+
+
+class ColumnSketch:
+    """
+    A MinHash signature and HyperLogLog for a column.
+
+    Parameters
+    ----------
+    num_perm : int, optional
+        The number of MinHash bins, by default 128
+    hll_precision : int, optional
+        The number of HyperLogLog index bits. The relative error is about 1.04 / sqrt(2 ** hll_precision). By default 12
+    seed : int, optional
+        The seed of the MinHash permutation. Sketches must share a seed to be compared. By default 0
+    """
+
+    def __init__(
+        self,
+        num_perm: int = DEFAULT_NUM_PERM,
+        hll_precision: int = DEFAULT_HLL_PRECISION,
+        seed: int = 0,
+    ) -> None:
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.hll_precision = hll_precision
+        self.seed = seed
+        # xor-multiply permutation. Odd multipliers are invertible modulo 2 ** 64.
+        self._xor = np.uint64(
+            rng.integers(0, _MAX_HASH, dtype=np.uint64, endpoint=True)
+        )
+        self._multiplier = np.uint64(
+            rng.integers(0, _MAX_HASH, dtype=np.uint64, endpoint=True) | 1
+        )
+        self.signature = np.full(num_perm, _MAX_HASH, dtype=np.uint64)
+        self.registers = np.zeros(2**hll_precision, dtype=np.uint8)
+        self.count = 0
+
+    def update(self, hashes: np.ndarray) -> None:
+        """
+        Add value hashes to the sketch.
+
+        Parameters
+        ----------
+        hashes : np.ndarray
+            The uint64 value hashes, such as from `hash_values`.
+        """
+
+        self.count += len(hashes)
+        hashes = pd.unique(hashes)
+        if len(hashes) == 0:
+            return
+
+        permuted = (hashes ^ self._xor) * self._multiplier
+        bins = (permuted % np.uint64(self.num_perm)).astype(np.intp)
+        np.minimum.at(self.signature, bins, permuted)
+
+        p = self.hll_precision
+        idx = (hashes >> np.uint64(64 - p)).astype(np.int64)
+        # the rank is the position of the first set bit after the index bits
+        rest = hashes << np.uint64(p)
+        rank = (_leading_zeros(rest) + 1).clip(max=64 - p + 1).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+
+    def merge(self, other: "ColumnSketch") -> None:
+        """
+        Merge another sketch into this sketch.
+
+        Parameters
+        ----------
+        other : ColumnSketch
+            A sketch with the same parameters.
+        """
+
+        if (other.num_perm, other.hll_precision, other.seed) != (
+            self.num_perm,
+            self.hll_precision,
+            self.seed,
+        ):
+            raise ValueError("Only sketches with the same parameters can be merged.")
+
+        np.minimum(self.signature, other.signature, out=self.signature)
+        np.maximum(self.registers, other.registers, out=self.registers)
+        self.count += other.count
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether no values have been added."""
+
+        return self.count == 0
+
+    def distinct_count(self) -> float:
+        """
+        Estimate the number of distinct values.
+
+        Returns
+        -------
+        float
+            The estimate.
+        """
+
+        m = len(self.registers)
+        harmonic_sum = float(np.sum(np.exp2(-self.registers.astype(float))))
+        estimate = _hll_alpha(m) * m**2 / harmonic_sum
+        zeros = int(np.count_nonzero(self.registers == 0))
+        # linear counting is more accurate for small cardinalities
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * np.log(m / zeros)
+        return float(min(estimate, self.count))
+
+    def jaccard(self, other: "ColumnSketch") -> float:
+        """
+        Estimate the Jaccard similarity of the distinct values of two sketches.
+
+        Parameters
+        ----------
+        other : ColumnSketch
+            A sketch with the same parameters.
+
+        Returns
+        -------
+        float
+            The estimate.
+        """
+
+        if self.is_empty or other.is_empty:
+            return 0.0
+        # bins that are empty in both sketches carry no information
+        filled = (self.signature != _MAX_HASH) | (other.signature != _MAX_HASH)
+        matches = (self.signature == other.signature) & filled
+        return float(np.count_nonzero(matches) / np.count_nonzero(filled))
+
+    def containment(
+        self, other: "ColumnSketch", jaccard: Optional[float] = None
+    ) -> float:
+        """
+        Estimate the fraction of this sketch's distinct values that are also in the other sketch.
+
+        Parameters
+        ----------
+        other : ColumnSketch
+            A sketch with the same parameters.
+        jaccard : Optional[float], optional
+            A precomputed Jaccard estimate, by default None
+
+        Returns
+        -------
+        float
+            The estimate, between 0 and 1.
+        """
+
+        j = self.jaccard(other) if jaccard is None else jaccard
+        a, b = self.distinct_count(), other.distinct_count()
+        if a == 0:
+            return 0.0
+        intersection = j * (a + b) / (1 + j)
+        return float(min(intersection / a, 1.0))
+
+
+def _leading_zeros(values: np.ndarray) -> np.ndarray:
+    """The number of leading zero bits of uint64 values. The halves are handled separately so floats are exact."""
+
+    hi = (values >> np.uint64(32)).astype(np.float64)
+    lo = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    # frexp returns the exponent e where 2 ** (e - 1) <= x < 2 ** e, which is the bit length
+    hi_bits = np.frexp(hi)[1]
+    lo_bits = np.frexp(lo)[1]
+    return np.where(hi > 0, 32 - hi_bits, 64 - lo_bits)
+
+
+def _hll_alpha(m: int) -> float:
+    """The HyperLogLog bias correction constant."""
+
+    if m == 16:
+        return 0.673
+    if m == 32:
+        return 0.697
+    if m == 64:
+        return 0.709
+    return 0.7213 / (1 + 1.079 / m)
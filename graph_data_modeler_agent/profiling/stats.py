@@ -0,0 +1,299 @@
+"""
+Chunked summary statistics for tabular data.
+
+A `StatsAccumulator` is updated with DataFrame chunks and produces the same descriptions as `DataFrame.info()` and
+`DataFrame.describe()`, without holding the whole table. Numeric columns are kept as compact float arrays, so their
+percentiles are exact. Categorical columns are reduced to value counts per chunk. Once a column has more than
+`max_distinct` distinct values, its distinct count is estimated with a HyperLogLog sketch and only its most frequent
+values are counted, so high cardinality string columns are never accumulated whole.
+`StatsAccumulator.to_table_stats()` reduces the accumulated statistics to a compact `TableStats` record.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .sketches import ColumnSketch, hash_values
+from .table_stats import (
+    CategoricalColumnStats,
+    ColumnStats,
+    NumericColumnStats,
+    TableStats,
+)
+
+DEFAULT_PERCENTILES: List[float] = [0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99]
+
+
+class StatsAccumulator:
+    """
+    Accumulate summary statistics over DataFrame chunks.
+
+    Parameters
+    ----------
+    percentiles : Optional[List[float]], optional
+        The percentiles of the numerical description, by default None, which uses 10%, 25%, 50%, 75%, 90%, 95% and 99%.
+    max_distinct : int, optional
+        The max number of distinct values counted exactly per categorical column. Columns with more distinct values
+        report an estimated `unique`, and `top` and `freq` from the values that remain most frequent. By default 10,000
+    """
+
+    def __init__(
+        self, percentiles: Optional[List[float]] = None, max_distinct: int = 10_000
+    ) -> None:
+        self.percentiles = percentiles or DEFAULT_PERCENTILES
+        self.max_distinct = max_distinct
+        self.row_count = 0
+        self._dtypes: Dict[str, str] = dict()
+        self._non_null_counts: Dict[str, int] = dict()
+        self._numeric_values: Dict[str, List[np.ndarray]] = dict()
+        self._value_counts: Dict[str, pd.Series] = dict()
+        self._sketches: Dict[str, ColumnSketch] = dict()
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Add a chunk of rows.
+
+        Parameters
+        ----------
+        chunk : pd.DataFrame
+            The chunk. Chunks should share columns.
+        """
+
+        self.row_count += len(chunk)
+        for col in chunk.columns:
+            name = str(col)
+            series = chunk[col]
+            self._dtypes.setdefault(name, str(series.dtype))
+            self._non_null_counts[name] = self._non_null_counts.get(name, 0) + int(
+                series.count()
+            )
+
+            if _is_numeric(series) and name not in self._value_counts:
+                self._numeric_values.setdefault(name, list()).append(
+                    series.dropna().to_numpy(dtype=np.float64)
+                )
+            elif _is_categorical(series) or name in self._value_counts:
+                if name in self._numeric_values:
+                    # earlier chunks were parsed as numbers, but the whole column is not numeric
+                    self._dtypes[name] = str(series.dtype)
+                    self._add_value_counts(
+                        name, _numbers_to_strings(self._numeric_values.pop(name))
+                    )
+                self._add_value_counts(name, series)
+
+    def _add_value_counts(self, name: str, series: pd.Series) -> None:
+        """Merge the value counts of a series into a column's value counts, keeping the order of first appearance."""
+
+        counts = _value_counts(series)
+        current = self._value_counts.get(name)
+        if current is not None:
+            counts = pd.concat([current, counts]).groupby(level=0, sort=False).sum()
+
+        sketch = self._sketches.get(name)
+        if sketch is None and len(counts) > self.max_distinct:
+            # switch to estimates, starting from the values seen so far
+            sketch = self._sketches[name] = ColumnSketch()
+            sketch.update(hash_values(counts.index.to_series()))
+        elif sketch is not None:
+            sketch.update(hash_values(series))
+        if sketch is not None and len(counts) > self.max_distinct:
+            counts = counts.nlargest(self.max_distinct, keep="first")
+
+        self._value_counts[name] = counts
+
+    def general_description(self) -> str:
+        """
+        Describe the columns, non-null counts and dtypes in the layout of `DataFrame.info()`.
+
+        Returns
+        -------
+        str
+            The description.
+        """
+
+        names = list(self._dtypes)
+        counts = [f"{self._non_null_counts[n]} non-null" for n in names]
+        dtypes = [self._dtypes[n] for n in names]
+        number_width = max(len(str(len(names) - 1)) + 2, 4)
+        name_width = max([len("Column"), *[len(n) for n in names]])
+        count_width = max([len("Non-Null Count"), *[len(c) for c in counts]])
+        dtype_width = max([len("Dtype"), *[len(d) for d in dtypes]])
+
+        lines = [
+            "<class 'pandas.DataFrame'>",
+            f"RangeIndex: {self.row_count} entries, 0 to {self.row_count - 1}"
+            if self.row_count
+            else "RangeIndex: 0 entries",
+            f"Data columns (total {len(names)} columns):",
+            f" {'#':<{number_width}}{'Column':<{name_width}}  {'Non-Null Count':<{count_width}}  {'Dtype':<{dtype_width}}",
+            f"{'---':<{number_width + 1}}{'------':<{name_width}}  {'--------------':<{count_width}}  {'-----':<{dtype_width}}",
+        ]
+        for i, (n, c, d) in enumerate(zip(names, counts, dtypes)):
+            lines.append(
+                f" {i:<{number_width}}{n:<{name_width}}  {c:<{count_width}}  {d:<{dtype_width}}"
+            )
+        dtype_counts = pd.Series(dtypes, dtype=object).value_counts().sort_index()
+        lines.append(
+            "dtypes: " + ", ".join([f"{d}({c})" for d, c in dtype_counts.items()])
+        )
+        return "\n".join(lines)
+
+    def numerical_description(self) -> pd.DataFrame:
+        """
+        Describe the numeric columns in the layout of `DataFrame.describe()`. See `TableStats.numerical_description()`.
+
+        Returns
+        -------
+        pd.DataFrame
+            The description, with a column per numeric column. Empty if there are no numeric columns.
+        """
+
+        return self.to_table_stats().numerical_description()
+
+    def categorical_description(self) -> pd.DataFrame:
+        """
+        Describe the categorical columns in the layout of `DataFrame.describe(include="object")`.
+        See `TableStats.categorical_description()`.
+
+        Returns
+        -------
+        pd.DataFrame
+            The count, unique, top and freq rows, with a column per categorical column. Empty if there are no categorical columns.
+        """
+
+        return self.to_table_stats(top_k=1).categorical_description()
+
+    def to_table_stats(self, top_k: int = 5) -> TableStats:
+        """
+        Reduce the accumulated statistics to a `TableStats` record.
+
+        Parameters
+        ----------
+        top_k : int, optional
+            The number of most frequent values kept per categorical column, by default 5
+
+        Returns
+        -------
+        TableStats
+            The stats.
+        """
+
+        numeric = list()
+        for name, values in self._numeric_values.items():
+            series = pd.Series(np.concatenate(values))
+            numeric.append(
+                NumericColumnStats(
+                    name=name,
+                    count=len(series),
+                    mean=_optional_float(series.mean()),
+                    std=_optional_float(series.std()),
+                    min=_optional_float(series.min()),
+                    max=_optional_float(series.max()),
+                    percentiles=[
+                        _optional_float(v) for v in series.quantile(self.percentiles)
+                    ],
+                )
+            )
+
+        categorical = list()
+        for name, counts in self._value_counts.items():
+            top = counts.nlargest(top_k, keep="first")
+            categorical.append(
+                CategoricalColumnStats(
+                    name=name,
+                    count=self._non_null_counts[name],
+                    unique=(
+                        round(self._sketches[name].distinct_count())
+                        if name in self._sketches
+                        else len(counts)
+                    ),
+                    unique_estimated=name in self._sketches,
+                    top_values=[(str(v), int(n)) for v, n in top.items()],
+                )
+            )
+
+        return TableStats(
+            row_count=self.row_count,
+            percentiles=list(self.percentiles),
+            columns=[
+                ColumnStats(
+                    name=name, dtype=dtype, non_null_count=self._non_null_counts[name]
+                )
+                for name, dtype in self._dtypes.items()
+            ],
+            numeric=numeric,
+            categorical=categorical,
+        )
+
+
+def accumulate_stats(
+    chunks: Iterable[pd.DataFrame],
+    percentiles: Optional[List[float]] = None,
+    max_distinct: int = 10_000,
+) -> StatsAccumulator:
+    """
+    Accumulate summary statistics over DataFrame chunks.
+
+    Parameters
+    ----------
+    chunks : Iterable[pd.DataFrame]
+        The chunks.
+    percentiles : Optional[List[float]], optional
+        The percentiles of the numerical description, by default None
+    max_distinct : int, optional
+        The max number of distinct values counted exactly per categorical column, by default 10,000
+
+    Returns
+    -------
+    StatsAccumulator
+        The accumulator.
+    """
+
+    accumulator = StatsAccumulator(percentiles=percentiles, max_distinct=max_distinct)
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator
+
+
+def _is_numeric(series: pd.Series) -> bool:
+    """Whether a series is numeric. Booleans are not numeric, matching `DataFrame.describe()`."""
+
+    return pd.api.types.is_numeric_dtype(
+        series.dtype
+    ) and not pd.api.types.is_bool_dtype(series.dtype)
+
+
+def _is_categorical(series: pd.Series) -> bool:
+    """Whether a series holds strings or Python objects."""
+
+    return bool(
+        pd.api.types.is_object_dtype(series.dtype)
+        or pd.api.types.is_string_dtype(series.dtype)
+    )
+
+
+def _numbers_to_strings(values: List[np.ndarray]) -> pd.Series:
+    """Format accumulated numbers as strings, with integral numbers formatted as integers."""
+
+    numbers = pd.Series(np.concatenate(values))
+    if bool(((numbers % 1) == 0).all()):
+        return numbers.astype("int64").astype(str)
+    return numbers.astype(str)
+
+
+def _optional_float(value: float) -> Optional[float]:
+    """Convert a statistic to a float, or None if it is NaN."""
+
+    return None if pd.isna(value) else float(value)
+
+
+def _value_counts(series: pd.Series) -> pd.Series:
+    """The value counts of a series. Unhashable values, such as lists, are counted by their string form."""
+
+    values = series.dropna()
+    if pd.api.types.is_object_dtype(values.dtype) and bool(
+        values.map(lambda v: isinstance(v, (list, dict, set))).any()
+    ):
+        values = values.astype(str)
+    return values.value_counts(sort=False)
@@ -0,0 +1,352 @@
+"""
+A compact, typed record of a table's summary statistics.
+
+`TableStats` holds the dtype and non-null count of each column, the count, mean, standard deviation, extremes and
+percentiles of each numeric column, and the most frequent values of each categorical column. It serializes to a
+small binary format, where the numeric statistics are a single float64 block and the rest is a JSON header, and
+renders to deterministic text for prompts, so stats can be cached, compared between runs and sent between processes
+cheaply.
+"""
+
+import json
+import struct
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+_MAGIC: bytes = b"GDMS"
+_VERSION: int = 1
+_HEADER_LENGTH = struct.Struct("<I")
+# the fixed statistics of each numeric column in the binary block, followed by its percentiles
+_NUMERIC_FIELDS: Tuple[str, ...] = ("count", "mean", "std", "min", "max")
+
+
+class ColumnStats(BaseModel):
+    """
+    The dtype and non-null count of a column.
+
+    Attributes
+    ----------
+    name : str
+        The column name.
+    dtype : str
+        The pandas dtype of the column.
+    non_null_count : int
+        The number of non-null values.
+    """
+
+    name: str
+    dtype: str
+    non_null_count: int
+
+
+class NumericColumnStats(BaseModel):
+    """
+    The summary statistics of a numeric column. Statistics are None when the column has no values to compute them from.
+
+    Attributes
+    ----------
+    name : str
+        The column name.
+    count : int
+        The number of non-null values.
+    mean : Optional[float]
+        The mean.
+    std : Optional[float]
+        The sample standard deviation.
+    min : Optional[float]
+        The min value.
+    max : Optional[float]
+        The max value.
+    percentiles : List[Optional[float]]
+        The values at the `TableStats.percentiles`, in the same order.
+    """
+
+    name: str
+    count: int
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    percentiles: List[Optional[float]]
+
+
+class CategoricalColumnStats(BaseModel):
+    """
+    The summary statistics of a categorical column.
+
+    Attributes
+    ----------
+    name : str
+        The column name.
+    count : int
+        The number of non-null values.
+    unique : int
+        The number of distinct values.
+    unique_estimated : bool
+        Whether `unique` is an estimate from a sketch instead of an exact count.
+    top_values : List[Tuple[str, int]]
+        The most frequent values and their counts, most frequent first. Values are in their string form.
+    """
+
+    name: str
+    count: int
+    unique: int
+    unique_estimated: bool = False
+    top_values: List[Tuple[str, int]]
+
+    @property
+    def top(self) -> Optional[str]:
+        """The most frequent value, or None if the column has no values."""
+
+        return self.top_values[0][0] if self.top_values else None
+
+    @property
+    def freq(self) -> Optional[int]:
+        """The count of the most frequent value, or None if the column has no values."""
+
+        return self.top_values[0][1] if self.top_values else None
+
+
+class TableStats(BaseModel):
+    """
+    The summary statistics of a table.
+
+    Attributes
+    ----------
+    row_count : int
+        The number of rows.
+    percentiles : List[float]
+        The percentiles of the numeric columns, as fractions.
+    columns : List[ColumnStats]
+        The dtype and non-null count of every column, in table order.
+    numeric : List[NumericColumnStats]
+        The numeric columns.
+    categorical : List[CategoricalColumnStats]
+        The categorical columns.
+    """
+
+    row_count: int
+    percentiles: List[float]
+    columns: List[ColumnStats]
+    numeric: List[NumericColumnStats]
+    categorical: List[CategoricalColumnStats]
+
+    def subset(self, column_names: List[str]) -> "TableStats":
+        """
+        Select the stats of some columns.
+
+        Parameters
+        ----------
+        column_names : List[str]
+            The columns to keep. Columns without stats are ignored.
+
+        Returns
+        -------
+        TableStats
+            New stats with only the selected columns, in table order.
+        """
+
+        keep = set(column_names)
+        return TableStats(
+            row_count=self.row_count,
+            percentiles=list(self.percentiles),
+            columns=[c for c in self.columns if c.name in keep],
+            numeric=[c for c in self.numeric if c.name in keep],
+            categorical=[c for c in self.categorical if c.name in keep],
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the stats to compressed bytes.
+
+        Returns
+        -------
+        bytes
+            The serialized stats.
+        """
+
+        header = self.model_dump(mode="json", exclude={"numeric"})
+        header["numeric"] = [c.name for c in self.numeric]
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        block = np.array(
+            [
+                [
+                    *[getattr(c, f) for f in _NUMERIC_FIELDS],
+                    *c.percentiles,
+                ]
+                for c in self.numeric
+            ],
+            dtype="<f8",
+        )
+        payload = (
+            _HEADER_LENGTH.pack(len(header_bytes)) + header_bytes + block.tobytes()
+        )
+        return _MAGIC + bytes([_VERSION]) + zlib.compress(payload)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TableStats":
+        """
+        Deserialize stats from bytes created by `to_bytes()`.
+
+        Parameters
+        ----------
+        data : bytes
+            The serialized stats.
+
+        Returns
+        -------
+        TableStats
+            The stats.
+
+        Raises
+        ------
+        ValueError
+            If the bytes are not serialized stats or were serialized by an unsupported version.
+        """
+
+        if data[: len(_MAGIC)] != _MAGIC:
+            raise ValueError("Data is not serialized `TableStats`.")
+        version = data[len(_MAGIC)]
+        if version != _VERSION:
+            raise ValueError(
+                f"Unsupported `TableStats` serialization version {version}."
+            )
+
+        payload = zlib.decompress(data[len(_MAGIC) + 1 :])
+        (header_length,) = _HEADER_LENGTH.unpack_from(payload)
+        header_end = _HEADER_LENGTH.size + header_length
+        header = json.loads(payload[_HEADER_LENGTH.size : header_end])
+        names = header.pop("numeric")
+        width = len(_NUMERIC_FIELDS) + len(header["percentiles"])
+        block = np.frombuffer(payload[header_end:], dtype="<f8").reshape(
+            len(names), width
+        )
+
+        numeric = list()
+        for name, row in zip(names, block):
+            values: List[Optional[float]] = [
+                None if np.isnan(v) else float(v) for v in row
+            ]
+            numeric.append(
+                NumericColumnStats(
+                    name=name,
+                    count=int(row[0]),
+                    mean=values[1],
+                    std=values[2],
+                    min=values[3],
+                    max=values[4],
+                    percentiles=values[len(_NUMERIC_FIELDS) :],
+                )
+            )
+        return cls(numeric=numeric, **header)
+
+    def to_prompt_text(self) -> str:
+        """
+        Render the stats as text for prompts. The text only depends on the stats, so equal stats render identically.
+
+        Returns
+        -------
+        str
+            The text.
+        """
+
+        lines = [f"Rows: {self.row_count}", "Columns:"]
+        for c in self.columns:
+            lines.append(f"* {c.name} ({c.dtype}): {c.non_null_count} non-null")
+
+        if self.numeric:
+            labels = [_percentile_label(p) for p in self.percentiles]
+            lines.append("Numeric columns:")
+            for n in self.numeric:
+                values = [
+                    f"count {n.count}",
+                    f"mean {_format_number(n.mean)}",
+                    f"std {_format_number(n.std)}",
+                    f"min {_format_number(n.min)}",
+                    *[
+                        f"{label} {_format_number(v)}"
+                        for label, v in zip(labels, n.percentiles)
+                    ],
+                    f"max {_format_number(n.max)}",
+                ]
+                lines.append(f"* {n.name}: {', '.join(values)}")
+
+        if self.categorical:
+            lines.append("Categorical columns:")
+            for cat in self.categorical:
+                unique = f"~{cat.unique}" if cat.unique_estimated else str(cat.unique)
+                top_values = ", ".join([f"{v!r} ({n})" for v, n in cat.top_values])
+                lines.append(
+                    f"* {cat.name}: count {cat.count}, unique {unique}, top values: {top_values or 'none'}"
+                )
+
+        return "\n".join(lines)
+
+    def numerical_description(self) -> pd.DataFrame:
+        """
+        Describe the numeric columns in the layout of `DataFrame.describe()`.
+
+        Returns
+        -------
+        pd.DataFrame
+            The description, with a column per numeric column. Empty if there are no numeric columns.
+        """
+
+        index = [
+            "count",
+            "mean",
+            "std",
+            "min",
+            *[_percentile_label(p) for p in self.percentiles],
+            "max",
+        ]
+        return pd.DataFrame(
+            {
+                n.name: pd.Series(
+                    [n.count, n.mean, n.std, n.min, *n.percentiles, n.max],
+                    index=index,
+                    dtype=np.float64,
+                )
+                for n in self.numeric
+            }
+        )
+
+    def categorical_description(self) -> pd.DataFrame:
+        """
+        Describe the categorical columns in the layout of `DataFrame.describe(include="object")`.
+
+        Returns
+        -------
+        pd.DataFrame
+            The count, unique, top and freq rows, with a column per categorical column. Empty if there are no categorical columns.
+        """
+
+        description: Dict[str, pd.Series] = {
+            c.name: pd.Series(
+                {
+                    "count": c.count,
+                    "unique": c.unique,
+                    "top": c.top if c.top_values else np.nan,
+                    "freq": c.freq if c.top_values else np.nan,
+                },
+                dtype=object,
+            )
+            for c in self.categorical
+        }
+        return pd.DataFrame(description)
+
+
+def _percentile_label(percentile: float) -> str:
+    """Label a percentile as `DataFrame.describe()` does, such as "25%" or "99.9%"."""
+
+    return f"{percentile * 100:g}%"
+
+
+def _format_number(value: Optional[float]) -> str:
+    """Format a statistic with up to 6 significant digits, so rendering does not depend on float noise."""
+
+    return "n/a" if value is None else f"{value:.6g}"
@@ -0,0 +1,374 @@
+"""
+Vectorized Neo4j type inference for tabular data.
+
+Each column is tested against a sequence of candidate types using pandas vectorized string and parsing operations.
+Candidates are first tested against a small head sample, so most columns are rejected cheaply before a full scan.
+Data may be provided as a single DataFrame or as an iterable of DataFrame chunks, in which case the per chunk results are merged.
+"""
+
+import time
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+from pydantic import BaseModel
+
+from ..data_dictionary.column import Column
+from ..data_dictionary.table_schema import TableSchema
+
+NEO4J_TO_COLUMN_PYTHON_TYPE: Dict[str, str] = {
+    "STRING": "str",
+    "INTEGER": "int",
+    "FLOAT": "float",
+    "BOOLEAN": "bool",
+    "DATE": "date",
+    "LOCAL DATETIME": "datetime",
+    "ZONED DATETIME": "datetime",
+    "LIST": "list",
+    "POINT": "point",
+}
+
+TRUE_VALUES = {"true", "t", "yes", "y"}
+FALSE_VALUES = {"false", "f", "no", "n"}
+LIST_DELIMITERS = [";", "|"]
+
+_HEAD_SAMPLE_SIZE: int = 128
+# the min fraction of values with a delimiter for a delimited list, so text with an occasional `;` stays a string
+_LIST_DELIMITER_MIN_FRACTION = 0.75
+_INTEGER_PATTERN = r"^[+-]?\d+$"
+_LEADING_ZERO_PATTERN = r"^[+-]?0\d"
+_DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+_DATETIME_PATTERN = (
+    r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?$"
+)
+_ZONED_PATTERN = r"(?:Z|[+-]\d{2}:?\d{2})$"
+_BRACKETED_LIST_PATTERN = r"^\[.*\]$"
+# `POINT(x y)`, or a bracketed `[lat, lon]` or `(lat, lon)` pair. Bare `lat, lon` pairs are too easily confused with text
+_POINT_PATTERN = r"(?i)^(POINT\s*\(\s*-?\d+(\.\d+)?\s+-?\d+(\.\d+)?\s*\)|\[\s*-?\d{1,3}\.\d+\s*,\s*-?\d{1,3}\.\d+\s*\]|\(\s*-?\d{1,3}\.\d+\s*,\s*-?\d{1,3}\.\d+\s*\))$"
+
+
+class InferredColumnType(BaseModel):
+    """
+    The inferred type of a column.
+
+    Attributes
+    ----------
+    name : str
+        The column name.
+    neo4j_type : str
+        The inferred Neo4j type.
+    python_type : str
+        The inferred type as a `Column.python_type` value.
+    nullable : bool
+        Whether any null or empty values were found.
+    null_count : int
+        The number of null or empty values.
+    row_count : int
+        The number of rows scanned.
+    list_delimiter : Optional[str], optional
+        The delimiter of list values encoded as strings, if the type is LIST, by default None
+    inference_seconds : float
+        The time spent inferring this column's type.
+    """
+
+    name: str
+    neo4j_type: str
+    python_type: str
+    nullable: bool
+    null_count: int
+    row_count: int
+    list_delimiter: Optional[str] = None
+    inference_seconds: float
+
+
+def infer_column_types(
+    data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    sample_size: Optional[int] = None,
+) -> List[InferredColumnType]:
+    """
+    Infer the Neo4j type of each column.
+
+    Parameters
+    ----------
+    data : Union[pd.DataFrame, Iterable[pd.DataFrame]]
+        A DataFrame or an iterable of DataFrame chunks with the same columns.
+    sample_size : Optional[int], optional
+        The max number of rows to scan. By default None, which scans all rows.
+
+    Returns
+    -------
+    List[InferredColumnType]
+        The inferred types in column order.
+    """
+
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+
+    types: Dict[str, Optional[str]] = dict()
+    delimiters: Dict[str, Optional[str]] = dict()
+    null_counts: Dict[str, int] = dict()
+    seconds: Dict[str, float] = dict()
+    row_count = 0
+
+    for chunk in chunks:
+        if sample_size is not None:
+            if row_count >= sample_size:
+                break
+            chunk = chunk.iloc[: sample_size - row_count]
+        row_count += len(chunk)
+
+        for col in chunk.columns:
+            start = time.perf_counter()
+            series = chunk[col]
+            chunk_type, delimiter, nulls = _infer_series_type(series)
+
+            name = str(col)
+            if name not in types:
+                types[name], delimiters[name] = chunk_type, delimiter
+                null_counts[name], seconds[name] = 0, 0.0
+            else:
+                types[name] = merge_neo4j_types(types[name], chunk_type)
+                if delimiters[name] is None:
+                    delimiters[name] = delimiter
+            null_counts[name] += nulls
+            seconds[name] += time.perf_counter() - start
+
+    res: List[InferredColumnType] = list()
+    for name, neo4j_type in types.items():
+        # columns with no values are left as strings
+        final_type = neo4j_type or "STRING"
+        res.append(
+            InferredColumnType(
+                name=name,
+                neo4j_type=final_type,
+                python_type=NEO4J_TO_COLUMN_PYTHON_TYPE[final_type],
+                nullable=null_counts[name] > 0,
+                null_count=null_counts[name],
+                row_count=row_count,
+                list_delimiter=delimiters[name] if final_type == "LIST" else None,
+                inference_seconds=seconds[name],
+            )
+        )
+
+    return res
+
+
+def merge_neo4j_types(a: Optional[str], b: Optional[str]) -> Optional[str]:
+    """
+    Merge two inferred types into the most specific type that is compatible with both.
+    `None` indicates that no values were observed.
+
+    Parameters
+    ----------
+    a : Optional[str]
+        The first type.
+    b : Optional[str]
+        The second type.
+
+    Returns
+    -------
+    Optional[str]
+        The merged type.
+    """
+
+    if a is None or a == b:
+        return b
+    if b is None:
+        return a
+
+    pair = {a, b}
+    if pair == {"INTEGER", "FLOAT"}:
+        return "FLOAT"
+    if pair == {"DATE", "LOCAL DATETIME"}:
+        return "LOCAL DATETIME"
+    if pair == {"LOCAL DATETIME", "ZONED DATETIME"} or pair == {
+        "DATE",
+        "ZONED DATETIME",
+    }:
+        return "ZONED DATETIME"
+
+    return "STRING"
+
+
+def apply_inferred_types(
+    table_schema: TableSchema,
+    inferred_types: List[InferredColumnType],
+    overwrite: bool = False,
+) -> TableSchema:
+    """
+    Populate the `python_type` and `nullable` attributes of the columns in a `TableSchema` from inferred types.
+    Columns that are in the inferred types but not the table schema are added.
+
+    Parameters
+    ----------
+    table_schema : TableSchema
+        The table schema to update.
+    inferred_types : List[InferredColumnType]
+        The inferred column types.
+    overwrite : bool, optional
+        Whether to overwrite `python_type` values that are already declared, by default False
+
+    Returns
+    -------
+    TableSchema
+        A new `TableSchema` with the inferred types applied.
+    """
+
+    inferred = {t.name: t for t in inferred_types}
+    columns: List[Column] = list()
+
+    for col in table_schema.columns:
+        t = inferred.get(col.name)
+        if t is not None and (overwrite or col.python_type is None):
+            update: Dict[str, Any] = {"python_type": t.python_type}
+            # primary keys are never nullable
+            if not col.primary_key:
+                update["nullable"] = t.nullable
+            col = col.model_copy(update=update)
+        columns.append(col)
+
+    existing = set(table_schema.column_names)
+    columns.extend(
+        [
+            Column(name=t.name, python_type=t.python_type, nullable=t.nullable)
+            for t in inferred_types
+            if t.name not in existing
+        ]
+    )
+
+    return TableSchema(name=table_schema.name, columns=columns)
+
+
+def infer_table_schema(
+    data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    name: str = "file",
+    sample_size: Optional[int] = None,
+) -> TableSchema:
+    """
+    Create a `TableSchema` with inferred column types.
+
+    Parameters
+    ----------
+    data : Union[pd.DataFrame, Iterable[pd.DataFrame]]
+        A DataFrame or an iterable of DataFrame chunks with the same columns.
+    name : str, optional
+        The table name, by default "file"
+    sample_size : Optional[int], optional
+        The max number of rows to scan. By default None, which scans all rows.
+
+    Returns
+    -------
+    TableSchema
+        The table schema.
+    """
+
+    return apply_inferred_types(
+        TableSchema(name=name, columns=[]),
+        infer_column_types(data=data, sample_size=sample_size),
+    )
+
+
+def _infer_series_type(series: pd.Series) -> tuple[Optional[str], Optional[str], int]:
+    """Infer the type of a single series. Returns the type, list delimiter if any and null count."""
+
+    dtype = series.dtype
+
+    if pd.api.types.is_bool_dtype(dtype):
+        nulls = int(series.isna().sum())
+        return ("BOOLEAN" if nulls < len(series) else None), None, nulls
+
+    if pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER", None, int(series.isna().sum())
+
+    if pd.api.types.is_float_dtype(dtype):
+        values = series.dropna()
+        nulls = len(series) - len(values)
+        if values.empty:
+            return None, None, nulls
+        # pandas reads integer columns with missing values as floats
+        is_integral = bool(((values % 1) == 0).all())
+        return ("INTEGER" if is_integral else "FLOAT"), None, nulls
+
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        values = series.dropna()
+        nulls = len(series) - len(values)
+        if values.empty:
+            return None, None, nulls
+        if getattr(dtype, "tz", None) is not None:
+            return "ZONED DATETIME", None, nulls
+        is_date = bool((values == values.dt.normalize()).all())
+        return ("DATE" if is_date else "LOCAL DATETIME"), None, nulls
+
+    if not (pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)):
+        return "STRING", None, int(series.isna().sum())
+
+    values = series.dropna()
+    if pd.api.types.is_object_dtype(dtype):
+        # JSON sources may contain parsed lists or dicts
+        first = values.iloc[0] if len(values) else None
+        if isinstance(first, list):
+            return "LIST", None, len(series) - len(values)
+        if isinstance(first, dict):
+            return "STRING", None, len(series) - len(values)
+    values = values.astype(str).str.strip()
+    values = values[values != ""]
+    nulls = len(series) - len(values)
+
+    if values.empty:
+        return None, None, nulls
+
+    return (*_infer_string_values_type(values), nulls)
+
+
+def _infer_string_values_type(values: pd.Series) -> tuple[str, Optional[str]]:
+    """Infer the type of non-empty string values. Returns the type and list delimiter if any."""
+
+    head = values.iloc[:_HEAD_SAMPLE_SIZE]
+
+    def _all_match(pattern: str) -> bool:
+        return bool(head.str.match(pattern).all()) and bool(
+            values.str.match(pattern).all()
+        )
+
+    lowered_head = head.str.lower()
+    if lowered_head.isin(TRUE_VALUES | FALSE_VALUES).all():
+        if values.str.lower().isin(TRUE_VALUES | FALSE_VALUES).all():
+            return "BOOLEAN", None
+
+    if _all_match(_INTEGER_PATTERN):
+        # leading zeros indicate an identifier or code, not a number
+        if values.str.match(_LEADING_ZERO_PATTERN).any():
+            return "STRING", None
+        return "INTEGER", None
+
+    if not pd.to_numeric(head, errors="coerce").isna().any():
+        if not pd.to_numeric(values, errors="coerce").isna().any():
+            return "FLOAT", None
+
+    if _all_match(_DATE_PATTERN):
+        if not pd.to_datetime(values, format="%Y-%m-%d", errors="coerce").isna().any():
+            return "DATE", None
+
+    if _all_match(_DATETIME_PATTERN):
+        zoned = values.str.contains(_ZONED_PATTERN)
+        if zoned.all():
+            return "ZONED DATETIME", None
+        if not zoned.any():
+            return "LOCAL DATETIME", None
+
+    if _all_match(_POINT_PATTERN):
+        return "POINT", None
+
+    if _all_match(_BRACKETED_LIST_PATTERN):
+        return "LIST", ","
+
+    for delimiter in LIST_DELIMITERS:
+        if (
+            head.str.contains(delimiter, regex=False).mean()
+            >= _LIST_DELIMITER_MIN_FRACTION
+        ):
+            if (
+                values.str.contains(delimiter, regex=False).mean()
+                >= _LIST_DELIMITER_MIN_FRACTION
+            ):
+                return "LIST", delimiter
+
+    return "STRING", None
@@ -1,4 +1,5 @@
 from .type_mappings import (
+    TYPES_MAP_NEO4J_TO_ADMIN_IMPORT,
     TYPES_MAP_NEO4J_TO_PYTHON,
     TYPES_MAP_PYTHON_TO_NEO4J,
     TYPES_MAP_PYTHON_TO_SOLUTIONS_WORKBENCH,
@@ -7,6 +8,7 @@ from .type_mappings import (
 )
 
 __all__ = [
+    "TYPES_MAP_NEO4J_TO_ADMIN_IMPORT",
     "TYPES_MAP_NEO4J_TO_PYTHON",
     "TYPES_MAP_PYTHON_TO_NEO4J",
     "TYPES_MAP_SOLUTIONS_WORKBENCH_TO_PYTHON",
@@ -57,6 +57,21 @@ TYPES_MAP_NEO4J_TO_PYTHON = {
 
 TYPES_MAP_PYTHON_TO_NEO4J = {v: k for k, v in TYPES_MAP_NEO4J_TO_PYTHON.items()}
 
+# `neo4j-admin database import` header types. Types without a header type are imported as strings
+TYPES_MAP_NEO4J_TO_ADMIN_IMPORT = {
+    "BOOLEAN": "boolean",
+    "INTEGER": "long",
+    "FLOAT": "double",
+    "STRING": "string",
+    "DATE": "date",
+    "ZONED TIME": "time",
+    "LOCAL TIME": "localtime",
+    "ZONED DATETIME": "datetime",
+    "LOCAL DATETIME": "localdatetime",
+    "DURATION": "duration",
+    "POINT": "point",
+}
+
 TYPES_MAP_SOLUTIONS_WORKBENCH_TO_PYTHON = {
     "String": "str",
     "Integer": "int",
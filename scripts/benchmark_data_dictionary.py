@@ -0,0 +1,124 @@
+"""
+Benchmark data dictionary lookups and prompt formatting on a synthetic wide data dictionary.
+
+The baseline functions reproduce the lookups before `TableSchema` and `DataDictionary` were indexed,
+where each `get_description` or `get_table_schema` call rebuilt a dictionary of all columns or tables.
+
+Usage:
+    python3 -m scripts.benchmark_data_dictionary --num_tables=100 --num_columns=5000
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from graph_data_modeler_agent.data_dictionary.column import Column
+from graph_data_modeler_agent.data_dictionary.data_dictionary import DataDictionary
+from graph_data_modeler_agent.data_dictionary.table_schema import TableSchema
+
+
+def create_synthetic_data_dictionary(
+    num_tables: int, num_columns: int
+) -> DataDictionary:
+    columns_per_table = num_columns // num_tables
+    table_schemas: List[TableSchema] = list()
+    for t in range(num_tables):
+        columns = [Column(name=f"table_{t}_id", primary_key=True, description="id")]
+        if t > 0:
+            columns.append(
+                Column(
+                    name=f"table_{t - 1}_id",
+                    foreign_key=True,
+                    aliases=[f"table_{t - 1}_ref"],
+                )
+            )
+        columns.extend(
+            [
+                Column(name=f"table_{t}_col_{c}", description=f"column {c}")
+                for c in range(columns_per_table - len(columns))
+            ]
+        )
+        table_schemas.append(TableSchema(name=f"table_{t}", columns=columns))
+    return DataDictionary(table_schemas=table_schemas)
+
+
+def baseline_format_table_schema(table_schema: TableSchema) -> str:
+    names = [c.name for c in table_schema.columns]
+    lines = list()
+    for name in names:
+        col = {c.name: c for c in table_schema.columns}.get(name)
+        lines.append(f"* {name}: {(col.description or '') if col else ''}")
+    return "\n".join(lines)
+
+
+def indexed_format_table_schema(table_schema: TableSchema) -> str:
+    return "\n".join(
+        [f"* {c}: {table_schema.get_description(c)}" for c in table_schema.column_names]
+    )
+
+
+def baseline_table_lookups(data_dictionary: DataDictionary) -> None:
+    for ts in data_dictionary.table_schemas:
+        {t.name: t for t in data_dictionary.table_schemas}.get(ts.name)
+
+
+def indexed_table_lookups(data_dictionary: DataDictionary) -> None:
+    for ts in data_dictionary.table_schemas:
+        data_dictionary.get_table_schema(ts.name)
+
+
+def _time(fn: Callable[[], None], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_tables", type=int, default=100)
+    parser.add_argument("--num_columns", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    dd = create_synthetic_data_dictionary(args.num_tables, args.num_columns)
+    wide_table = TableSchema(
+        name="wide",
+        columns=[Column(name=f"col_{i}") for i in range(args.num_columns)],
+    )
+
+    start = time.perf_counter()
+    dd.index
+    index_build = time.perf_counter() - start
+
+    results = {
+        "format all tables": (
+            _time(
+                lambda: [baseline_format_table_schema(ts) for ts in dd.table_schemas],
+                args.repeat,
+            ),
+            _time(
+                lambda: [indexed_format_table_schema(ts) for ts in dd.table_schemas],
+                args.repeat,
+            ),
+        ),
+        f"format 1 table x {args.num_columns} columns": (
+            _time(lambda: baseline_format_table_schema(wide_table), 1),
+            _time(lambda: indexed_format_table_schema(wide_table), args.repeat),
+        ),
+        "get_table_schema for every table": (
+            _time(lambda: baseline_table_lookups(dd), args.repeat),
+            _time(lambda: indexed_table_lookups(dd), args.repeat),
+        ),
+    }
+
+    print(f"{args.num_tables} tables, {args.num_columns} columns")
+    print(f"data dictionary index build: {index_build * 1000:.2f} ms")
+    for name, (baseline, indexed) in results.items():
+        print(
+            f"{name}: baseline {baseline * 1000:.2f} ms | indexed {indexed * 1000:.2f} ms | {baseline / indexed:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark join discovery on synthetic column sketches.
+
+The baseline reproduces join discovery before LSH banding, where every joinable column was compared with every key
+column in another file.
+
+Usage:
+    python3 -m scripts.benchmark_join_discovery --num_files=300 --num_columns=3000
+"""
+
+import argparse
+import time
+from typing import List, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from graph_data_modeler_agent.profiling.dictionary_inference import (
+    ColumnProfile,
+    FileProfile,
+)
+from graph_data_modeler_agent.profiling.join_discovery import discover_joins
+from graph_data_modeler_agent.profiling.sketches import ColumnSketch, hash_values
+from graph_data_modeler_agent.profiling.type_inference import InferredColumnType
+
+
+def create_synthetic_profiles(
+    num_files: int, num_columns: int, num_rows: int
+) -> List[FileProfile]:
+    """Each file has a key, a foreign key to the previous file's key and random integer columns."""
+
+    rng = np.random.default_rng(0)
+    columns_per_file = num_columns // num_files
+    profiles: List[FileProfile] = list()
+    for f in range(num_files):
+        values = {f"file_{f}_id": np.arange(num_rows) + f * num_rows * 10}
+        if f > 0:
+            values["parent"] = rng.integers(0, num_rows, num_rows) + (f - 1) * (
+                num_rows * 10
+            )
+        for c in range(columns_per_file - len(values)):
+            values[f"col_{c}"] = rng.integers(-(10**12), 10**12, num_rows)
+
+        columns = list()
+        for name, v in values.items():
+            sketch = ColumnSketch()
+            sketch.update(hash_values(pd.Series(v)))
+            columns.append(
+                ColumnProfile(
+                    inferred_type=InferredColumnType(
+                        name=name,
+                        neo4j_type="INTEGER",
+                        python_type="int",
+                        nullable=False,
+                        null_count=0,
+                        row_count=num_rows,
+                        inference_seconds=0.0,
+                    ),
+                    sketch=sketch,
+                    first_chunk_unique=name.endswith("_id"),
+                )
+            )
+        profiles.append(
+            FileProfile(
+                name=f"file_{f}.csv",
+                file_path=f"file_{f}.csv",
+                row_count=num_rows,
+                columns=columns,
+                profile_seconds=0.0,
+            )
+        )
+    return profiles
+
+
+def baseline_discover_joins(
+    profiles: List[FileProfile], min_containment: float = 0.8
+) -> Set[Tuple[str, str]]:
+    joinable = [(p.name, c) for p in profiles for c in p.columns]
+    keys = [(f, c) for f, c in joinable if c.is_key_candidate]
+    res = set()
+    for file_name, c in joinable:
+        best = None
+        for key_file, key in keys:
+            if file_name == key_file:
+                continue
+            jaccard = c.sketch.jaccard(key.sketch)
+            score = (
+                jaccard
+                if c.is_key_candidate
+                else c.sketch.containment(key.sketch, jaccard=jaccard)
+            )
+            if score >= min_containment and (best is None or score > best[0]):
+                best = (score, key_file)
+        if best is not None:
+            res.add((file_name, best[1]))
+    return res
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_files", type=int, default=300)
+    parser.add_argument("--num_columns", type=int, default=3000)
+    parser.add_argument("--num_rows", type=int, default=1000)
+    parser.add_argument("--skip_baseline", action="store_true")
+    args = parser.parse_args()
+
+    profiles = create_synthetic_profiles(
+        args.num_files, args.num_columns, args.num_rows
+    )
+    expected = {
+        (f"file_{f}.csv", f"file_{f - 1}.csv") for f in range(1, args.num_files)
+    }
+
+    start = time.perf_counter()
+    joins = discover_joins(profiles)
+    lsh_seconds = time.perf_counter() - start
+    found = {(j.source_table, j.target_table) for j in joins}
+
+    print(f"{args.num_files} files, {args.num_columns} columns")
+    print(
+        f"lsh: {lsh_seconds * 1000:.2f} ms | recall {len(found & expected) / len(expected):.3f} | {len(found - expected)} false joins"
+    )
+
+    if not args.skip_baseline:
+        start = time.perf_counter()
+        baseline = baseline_discover_joins(profiles)
+        baseline_seconds = time.perf_counter() - start
+        print(
+            f"pairwise baseline: {baseline_seconds * 1000:.2f} ms | recall {len(baseline & expected) / len(expected):.3f} | {baseline_seconds / lsh_seconds:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark the tail latency of LLM requests with and without request hedging.
+
+The provider is simulated by an in-process stand-in whose latencies follow a log-normal distribution with a heavy
+tail, so a few requests are much slower than the median, as LLM APIs under load are. Requests run concurrently and
+the latency percentiles and the number of extra requests sent are reported.
+
+Usage:
+    python3 -m scripts.benchmark_llm_hedging --num_requests=500 --concurrency=20
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, List
+
+import numpy as np
+from pydantic import BaseModel
+
+from graph_data_modeler_agent.llm import LLMClient
+
+
+class Answer(BaseModel):
+    value: int
+
+
+class HeavyTailCompletions:
+    """Responds after a log-normal latency, plus `outlier_latency` for a `outlier_rate` fraction of requests."""
+
+    def __init__(
+        self, median: float, sigma: float, outlier_rate: float, outlier_latency: float
+    ) -> None:
+        self.median = median
+        self.sigma = sigma
+        self.outlier_rate = outlier_rate
+        self.outlier_latency = outlier_latency
+        self.rng = np.random.default_rng(0)
+        self.calls = 0
+
+    async def create(self, **kwargs: Any) -> Answer:
+        self.calls += 1
+        latency = self.median * float(self.rng.lognormal(0.0, self.sigma))
+        if self.rng.random() < self.outlier_rate:
+            latency += self.outlier_latency
+        await asyncio.sleep(latency)
+        return Answer(value=1)
+
+
+async def run_requests(
+    client: LLMClient, num_requests: int, concurrency: int
+) -> List[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    messages = [{"role": "user", "content": "Answer."}]
+
+    async def request() -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            await client.create(model="m", response_model=Answer, messages=messages)
+            return time.perf_counter() - start
+
+    return list(await asyncio.gather(*[request() for _ in range(num_requests)]))
+
+
+def report(name: str, latencies: List[float], calls: int) -> None:
+    p50, p95, p99 = np.quantile(latencies, [0.5, 0.95, 0.99])
+    print(
+        f"{name}: p50 {p50 * 1000:.0f} ms | p95 {p95 * 1000:.0f} ms | p99 {p99 * 1000:.0f} ms | max {max(latencies) * 1000:.0f} ms | {calls} provider calls"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--median", type=float, default=0.02)
+    parser.add_argument("--sigma", type=float, default=0.3)
+    parser.add_argument("--outlier_rate", type=float, default=0.03)
+    parser.add_argument("--outlier_latency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    print(
+        f"{args.num_requests} requests, {args.concurrency} concurrent, median {args.median * 1000:.0f} ms, {args.outlier_rate:.0%} outliers +{args.outlier_latency * 1000:.0f} ms"
+    )
+    for hedge in [False, True]:
+        completions = HeavyTailCompletions(
+            args.median, args.sigma, args.outlier_rate, args.outlier_latency
+        )
+        client = LLMClient(
+            SimpleNamespace(chat=SimpleNamespace(completions=completions)),  # type: ignore[arg-type]
+            hedge=hedge,
+        )
+        latencies = asyncio.run(
+            run_requests(client, args.num_requests, args.concurrency)
+        )
+        report("hedged" if hedge else "single", latencies, completions.calls)
+
+
+if __name__ == "__main__":
+    main()
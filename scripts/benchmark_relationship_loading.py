@@ -0,0 +1,215 @@
+"""
+Benchmark relationship loading throughput of endpoint partitioned parallel batches against serial batches.
+
+Neo4j is simulated by an in-process driver where each transaction takes a fixed latency plus a cost per row and locks
+the nodes its rows touch. A transaction that needs a node locked by a running transaction fails with a transient
+deadlock error and is retried, as concurrent Neo4j transactions waiting on each other's locks would. The naive
+parallel run loads the same batches concurrently without partitioning, to show the lock conflicts partitioning avoids.
+
+Usage:
+    python3 -m scripts.benchmark_relationship_loading --num_rows=50000 --max_workers=8
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+from graph_data_modeler_agent.code_generation import (
+    IngestionGenerator,
+    IngestionStatement,
+    Neo4jLoader,
+    iter_row_batches,
+    run_with_retries,
+)
+from graph_data_modeler_agent.data_model.core import (
+    DataModel,
+    Node,
+    Property,
+    Relationship,
+)
+
+
+class DeadlockDetected(Exception):
+    def is_retryable(self) -> bool:
+        return True
+
+
+class LockingSession:
+    def __init__(self, driver: "LockingDriver") -> None:
+        self.driver = driver
+
+    def __enter__(self) -> "LockingSession":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+    def run(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> Any:
+        self.driver.execute_query(query, parameters_=parameters)
+        return self
+
+    def consume(self) -> None:
+        return None
+
+
+class LockingDriver:
+    """Simulates transaction latency and node locks of relationship MERGEs."""
+
+    def __init__(self, batch_latency: float, row_latency: float) -> None:
+        self.batch_latency = batch_latency
+        self.row_latency = row_latency
+        self.lock = threading.Lock()
+        self.locked: Set[Hashable] = set()
+        self.deadlocks = 0
+
+    def session(self, database: Optional[str] = None) -> LockingSession:
+        return LockingSession(self)
+
+    def execute_query(
+        self,
+        query: str,
+        parameters_: Optional[Dict[str, Any]] = None,
+        database_: Optional[str] = None,
+    ) -> None:
+        rows: List[Dict[str, Any]] = (
+            parameters_["dict"]["rows"] if parameters_ is not None else list()
+        )
+        keys = {v for row in rows for v in row.values()}
+        with self.lock:
+            if keys & self.locked:
+                self.deadlocks += 1
+                raise DeadlockDetected()
+            self.locked |= keys
+        try:
+            time.sleep(self.batch_latency + self.row_latency * len(rows))
+        finally:
+            with self.lock:
+                self.locked -= keys
+
+
+def create_data_model() -> DataModel:
+    person = Node(
+        label="Person",
+        properties=[
+            Property(
+                name="id",
+                type="STRING",
+                column_mapping="person_id",
+                alias="friend_id",
+                is_key=True,
+            )
+        ],
+        source_name="file",
+    )
+    knows = Relationship(
+        type="KNOWS",
+        properties=[],
+        source="Person",
+        target="Person",
+        source_name="file",
+    )
+    return DataModel(nodes=[person], relationships=[knows])
+
+
+def create_synthetic_data(num_rows: int, num_people: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "person_id": [f"p{i}" for i in rng.integers(0, num_people, num_rows)],
+            "friend_id": [f"p{i}" for i in rng.integers(0, num_people, num_rows)],
+        }
+    )
+
+
+def load_relationships(
+    driver: LockingDriver,
+    generator: IngestionGenerator,
+    data: pd.DataFrame,
+    max_workers: int,
+    relationship_buckets: int,
+) -> float:
+    loader = Neo4jLoader(
+        driver,
+        generator,
+        max_workers=max_workers,
+        retry_delay=0.001,
+        relationship_buckets=relationship_buckets,
+    )
+    start = time.perf_counter()
+    loader.load_relationships({"friends.csv": data})
+    return time.perf_counter() - start
+
+
+def load_relationships_naive_parallel(
+    driver: LockingDriver,
+    statement: IngestionStatement,
+    data: pd.DataFrame,
+    max_workers: int,
+) -> float:
+    def run(batch: List[Dict[str, Any]]) -> None:
+        run_with_retries(
+            lambda: driver.execute_query(
+                statement.cypher, parameters_={"dict": {"rows": batch}}
+            ),
+            max_retries=1_000,
+            retry_delay=0.001,
+        )
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(run, iter_row_batches(data, statement)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_rows", type=int, default=50_000)
+    parser.add_argument("--num_people", type=int, default=100_000)
+    parser.add_argument("--batch_size", type=int, default=500)
+    parser.add_argument("--max_workers", type=int, default=8)
+    parser.add_argument("--batch_latency", type=float, default=0.002)
+    parser.add_argument("--row_latency", type=float, default=0.00002)
+    args = parser.parse_args()
+
+    data = create_synthetic_data(args.num_rows, args.num_people)
+    generator = IngestionGenerator(
+        create_data_model(),
+        csv_name="friends.csv",
+        max_batch_size=args.batch_size,
+        min_batch_size=1,
+    )
+    statement = generator.generate_relationship_statements()[0]
+
+    print(
+        f"{args.num_rows:,} KNOWS rows between {args.num_people:,} people, {args.batch_size} rows per batch"
+    )
+    serial_driver = LockingDriver(args.batch_latency, args.row_latency)
+    serial_seconds = load_relationships(serial_driver, generator, data, 1, 1)
+    print(
+        f"serial: {serial_seconds:.2f} s | {args.num_rows / serial_seconds:,.0f} rows/sec | {serial_driver.deadlocks} deadlocks"
+    )
+
+    naive_driver = LockingDriver(args.batch_latency, args.row_latency)
+    naive_seconds = load_relationships_naive_parallel(
+        naive_driver, statement, data, args.max_workers
+    )
+    print(
+        f"naive parallel ({args.max_workers} workers): {naive_seconds:.2f} s | {args.num_rows / naive_seconds:,.0f} rows/sec | {naive_driver.deadlocks} deadlocks"
+    )
+
+    partitioned_driver = LockingDriver(args.batch_latency, args.row_latency)
+    partitioned_seconds = load_relationships(
+        partitioned_driver, generator, data, args.max_workers, args.max_workers
+    )
+    print(
+        f"partitioned ({args.max_workers} workers): {partitioned_seconds:.2f} s | {args.num_rows / partitioned_seconds:,.0f} rows/sec | {partitioned_driver.deadlocks} deadlocks | {serial_seconds / partitioned_seconds:.1f}x serial throughput"
+    )
+
+
+if __name__ == "__main__":
+    main()
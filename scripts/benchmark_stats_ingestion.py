@@ -0,0 +1,95 @@
+"""
+Benchmark peak memory of stats generation on a synthetic string heavy CSV file.
+
+The baseline reproduces stats generation before chunked ingestion, where the whole file was read into a DataFrame
+before `DataFrame.info()` and `DataFrame.describe()`. Peak memory is measured with tracemalloc, which tracks Python
+objects and numpy buffers but not Arrow buffers.
+
+Usage:
+    python3 -m scripts.benchmark_stats_ingestion --num_rows=1000000
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from graph_data_modeler_agent.data_source.data_source import DataSource
+from graph_data_modeler_agent.profiling.stats import (
+    DEFAULT_PERCENTILES,
+    accumulate_stats,
+)
+
+
+def create_synthetic_csv(file_path: str, num_rows: int) -> None:
+    rng = np.random.default_rng(0)
+    cities = np.array([f"city_{i}" for i in range(500)])
+    pd.DataFrame(
+        {
+            "id": np.arange(num_rows),
+            "email": [f"user_{i}@example.com" for i in range(num_rows)],
+            "city": cities[rng.integers(0, len(cities), num_rows)],
+            "status": rng.choice(["active", "inactive", "pending"], num_rows),
+            "comment": rng.choice(
+                ["a long free text comment about the order", "short note", ""],
+                num_rows,
+            ),
+            "amount": rng.random(num_rows) * 1_000,
+        }
+    ).to_csv(file_path, index=False)
+
+
+def baseline_stats(file_path: str) -> None:
+    df = pd.read_csv(file_path)
+    df.info(buf=io.StringIO(), memory_usage=False, verbose=True)
+    df.describe(percentiles=DEFAULT_PERCENTILES, include=[np.number])
+    df.describe(include="object")
+
+
+def chunked_stats(file_path: str) -> None:
+    accumulator = accumulate_stats(
+        DataSource(file_path=file_path).with_low_memory_options().iter_chunks()
+    )
+    accumulator.general_description()
+    accumulator.numerical_description()
+    accumulator.categorical_description()
+
+
+def _measure(fn: Callable[[str], None], file_path: str) -> Tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(file_path)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / 1024**2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "synthetic.csv")
+        create_synthetic_csv(file_path, args.num_rows)
+        size_mb = os.path.getsize(file_path) / 1024**2
+
+        baseline_seconds, baseline_mb = _measure(baseline_stats, file_path)
+        chunked_seconds, chunked_mb = _measure(chunked_stats, file_path)
+
+    print(f"{args.num_rows:,} rows, {size_mb:.1f} MB csv")
+    print(f"baseline: {baseline_seconds:.2f} s | peak {baseline_mb:.1f} MB")
+    print(
+        f"chunked: {chunked_seconds:.2f} s | peak {chunked_mb:.1f} MB | {baseline_mb / chunked_mb:.1f}x less memory"
+    )
+
+
+if __name__ == "__main__":
+    main()
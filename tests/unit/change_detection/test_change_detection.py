@@ -0,0 +1,339 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Callable, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+from langgraph.graph.state import CompiledStateGraph
+
+from graph_data_modeler_agent.agents.single_source_input.discovery_and_modeling_agent import (
+    create_discovery_and_modeling_agent,
+)
+from graph_data_modeler_agent.agents.single_source_input.discovery_and_modeling_with_iteration_agent import (
+    create_discovery_and_modeling_with_iteration_agent,
+)
+from graph_data_modeler_agent.change_detection import (
+    TableChanges,
+    detect_table_changes,
+    lost_key_labels,
+    update_data_model,
+)
+from graph_data_modeler_agent.components.data_model_updater.brainstorm_updates.models import (
+    DataModelUpdaterBrainstormResponse,
+)
+from graph_data_modeler_agent.components.discovery.models import DiscoveryResponse
+from graph_data_modeler_agent.components.discovery.reuse import (
+    merge_discovery,
+    update_discovery,
+)
+from graph_data_modeler_agent.data_dictionary.column import Column
+from graph_data_modeler_agent.data_dictionary.table_schema import TableSchema
+from graph_data_modeler_agent.data_model.core import DataModel
+from graph_data_modeler_agent.data_model.core.node import Nodes
+from graph_data_modeler_agent.profiling.stats import accumulate_stats
+from tests.unit.data_model.core.test_data_model import (
+    good_nodes,
+    good_relationships,
+)
+
+PETS = pd.read_csv("tests/resources/data/pets.csv")
+
+DISCOVERY = DiscoveryResponse(
+    summary="People own pets that play with toys.",
+    possible_node_labels=["Person", "Pet", "Toy"],
+    possible_relationships=[
+        {
+            "relationship_type": "HAS_PET",
+            "source_node_label": "Person",
+            "target_node_label": "Pet",
+        }
+    ],
+    possible_property_keys=["name", "pet_name", "toy"],
+    column_to_node_mappings=[
+        {"column_name": "name", "node_label": "Person", "reason": "name"},
+        {"column_name": "pet_name", "node_label": "Pet", "reason": "name"},
+        {"column_name": "toy", "node_label": "Toy", "reason": "name"},
+        {"column_name": "toy_type", "node_label": "Toy", "reason": "kind"},
+    ],
+)
+
+VET_DISCOVERY = DiscoveryResponse(
+    summary="Pets visit vets.",
+    possible_node_labels=["Vet", "Pet"],
+    possible_relationships=[
+        {
+            "relationship_type": "VISITS",
+            "source_node_label": "Pet",
+            "target_node_label": "Vet",
+        }
+    ],
+    possible_property_keys=["vet"],
+    column_to_node_mappings=[
+        {"column_name": "vet", "node_label": "Vet", "reason": "name"},
+        {"column_name": "name", "node_label": "Vet", "reason": "ignored"},
+    ],
+)
+
+
+def _table(df: pd.DataFrame) -> Tuple[TableSchema, Any]:
+    schema = TableSchema(
+        name="pets.csv", columns=[Column(name=str(c)) for c in df.columns]
+    )
+    return schema, accumulate_stats([df]).to_table_stats()
+
+
+def test_no_changes() -> None:
+    schema, stats = _table(PETS)
+
+    changes = detect_table_changes(schema, schema.model_copy(), stats, stats)
+
+    assert not changes.has_changes
+    assert changes.affected_columns == []
+
+
+def test_added_dropped_and_modified_columns() -> None:
+    previous_schema, _ = _table(PETS)
+    schema, _ = _table(PETS.drop(columns=["knows"]).assign(vet="Dr. A"))
+    schema.get_column("age").description = "The age of the person."
+
+    changes = detect_table_changes(previous_schema, schema)
+
+    assert changes.added_columns == ["vet"]
+    assert changes.dropped_columns == ["knows"]
+    assert changes.modified_columns == ["age"]
+    assert changes.renamed_columns == {}
+    assert changes.affected_columns == ["vet", "age"]
+
+
+def test_renamed_columns() -> None:
+    previous_schema, previous_stats = _table(PETS)
+    schema, stats = _table(
+        PETS.rename(columns={"toy_type": "toy_kind", "age": "years"}).assign(
+            vet="Dr. A"
+        )
+    )
+
+    changes = detect_table_changes(previous_schema, schema, previous_stats, stats)
+
+    assert changes.renamed_columns == {"toy_type": "toy_kind", "age": "years"}
+    assert changes.added_columns == ["vet"]
+    assert changes.dropped_columns == []
+    assert changes.affected_columns == ["vet"]
+
+
+def test_distribution_shifts() -> None:
+    rng = np.random.default_rng(0)
+    previous = pd.DataFrame(
+        {
+            "amount": rng.normal(100, 10, 1_000),
+            "stable": rng.normal(0, 1, 1_000),
+            "status": rng.choice(["active", "inactive"], 1_000, p=[0.9, 0.1]),
+            "city": rng.choice(["A", "B", "C"], 1_000),
+            "note": ["x"] * 1_000,
+        }
+    )
+    current = pd.DataFrame(
+        {
+            "amount": rng.normal(130, 10, 1_000),
+            "stable": rng.normal(0.05, 1, 1_000),
+            "status": rng.choice(["active", "inactive"], 1_000, p=[0.1, 0.9]),
+            "city": rng.choice(["A", "B", "C"], 1_000),
+            "note": ["x"] * 500 + [None] * 500,
+        }
+    )
+    previous_schema, previous_stats = _table(previous)
+    schema, stats = _table(current)
+
+    changes = detect_table_changes(previous_schema, schema, previous_stats, stats)
+
+    assert [(s.column, s.metric) for s in changes.shifted_columns] == [
+        ("amount", "percentiles"),
+        ("status", "top_values"),
+        ("note", "null_rate"),
+    ]
+
+
+def test_update_discovery() -> None:
+    changes = TableChanges(
+        added_columns=["vet"],
+        dropped_columns=["toy"],
+        renamed_columns={"pet_name": "pet_nickname"},
+        modified_columns=["name"],
+    )
+
+    res = update_discovery(DISCOVERY, changes)
+
+    assert [m["column_name"] for m in res.column_to_node_mappings] == [
+        "pet_nickname",
+        "toy_type",
+    ]
+    assert res.possible_property_keys == ["name", "pet_nickname"]
+    assert DISCOVERY.column_to_node_mappings[1]["column_name"] == "pet_name"
+
+
+def test_merge_discovery() -> None:
+    changes = TableChanges(added_columns=["vet"])
+
+    res = merge_discovery(DISCOVERY, VET_DISCOVERY, changes)
+
+    assert res.possible_node_labels == ["Person", "Pet", "Toy", "Vet"]
+    assert len(res.possible_relationships) == 2
+    assert res.possible_property_keys == ["name", "pet_name", "toy", "vet"]
+    assert res.column_to_node_mappings[-1]["column_name"] == "vet"
+    assert [m["node_label"] for m in res.column_to_node_mappings].count("Vet") == 1
+    assert res.summary.startswith(DISCOVERY.summary)
+
+
+def test_update_data_model() -> None:
+    data_model = DataModel(nodes=good_nodes, relationships=good_relationships)
+    changes = TableChanges(
+        dropped_columns=["toy", "toy_type"],
+        renamed_columns={"knows": "friend", "pet": "species"},
+    )
+
+    res = update_data_model(data_model, changes)
+
+    assert "Toy" not in res.node_labels
+    assert all("Toy" not in (r.source, r.target) for r in res.relationships)
+    person = res.nodes[res.node_labels.index("Person")]
+    pet = res.nodes[res.node_labels.index("Pet")]
+    assert person.properties[0].alias == "friend"
+    assert pet.properties[1].column_mapping == "species"
+    # the previous data model is unchanged
+    assert "Toy" in data_model.node_labels
+    assert data_model.nodes[2].properties[1].column_mapping == "pet"
+
+
+def test_update_data_model_removes_nodes_without_key() -> None:
+    data_model = DataModel(nodes=good_nodes, relationships=good_relationships)
+    changes = TableChanges(dropped_columns=["name"])
+
+    res = update_data_model(data_model, changes)
+
+    assert lost_key_labels(data_model, changes) == ["Person"]
+    assert res.node_labels == ["Address", "Pet", "Toy"]
+    assert res.relationship_types == ["PLAYS_WITH"]
+
+
+class FakeCompletions:
+    def __init__(self, data_model: DataModel) -> None:
+        self.data_model = data_model
+        self.calls: List[Tuple[Any, List[dict]]] = list()
+
+    async def create(
+        self, response_model: Any, messages: List[dict], **kwargs: Any
+    ) -> Any:
+        self.calls.append((response_model, messages))
+        if response_model is DiscoveryResponse:
+            return VET_DISCOVERY
+        if response_model is DataModelUpdaterBrainstormResponse:
+            return DataModelUpdaterBrainstormResponse(
+                column_to_node_mappings=[
+                    {"column_name": "vet", "node_label": "Vet", "reason": "name"}
+                ]
+            )
+        if response_model is Nodes:
+            return Nodes(nodes=self.data_model.nodes)
+        return self.data_model
+
+
+def _agent_state(df: pd.DataFrame) -> dict:
+    previous_schema, previous_stats = _table(PETS)
+    schema, _ = _table(df)
+    return {
+        "data": df,
+        "table_schema": schema,
+        "use_cases": ["Which pets live in Chicago?"],
+        "additional_context": "",
+        "previous_discovery": DISCOVERY,
+        "previous_table_schema": previous_schema,
+        "previous_stats": previous_stats,
+        "previous_data_model": DataModel(
+            nodes=good_nodes, relationships=good_relationships
+        ),
+    }
+
+
+AgentFactory = Callable[..., CompiledStateGraph]
+
+
+@pytest.fixture(
+    params=[
+        create_discovery_and_modeling_agent,
+        create_discovery_and_modeling_with_iteration_agent,
+    ]
+)
+def create_agent(request: pytest.FixtureRequest) -> AgentFactory:
+    return request.param  # type: ignore[no-any-return]
+
+
+def _run(state: dict, completions: FakeCompletions, create_agent: AgentFactory) -> dict:
+    llm_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    agent = create_agent(llm_client, llm_client, "m", "m")
+    return asyncio.run(agent.ainvoke(state))  # type: ignore[no-any-return]
+
+
+def test_unchanged_table_reuses_previous_run(create_agent: AgentFactory) -> None:
+    state = _agent_state(PETS)
+    completions = FakeCompletions(state["previous_data_model"])
+
+    res = _run(state, completions, create_agent)
+
+    assert completions.calls == []
+    assert res["discovery"] == DISCOVERY
+    previous_data_model = state["previous_data_model"]
+    # the reused data model is validated against the table, which sets its source name
+    assert (
+        res["data_model"].model_dump()
+        == previous_data_model.model_copy(
+            update={
+                "nodes": [
+                    n.model_copy(update={"source_name": "pets.csv"})
+                    for n in previous_data_model.nodes
+                ],
+                "relationships": [
+                    r.model_copy(update={"source_name": "pets.csv"})
+                    for r in previous_data_model.relationships
+                ],
+            }
+        ).model_dump()
+    )
+    assert not res["table_changes"].has_changes
+    assert res["stats"] is not None
+
+
+def test_changed_table_only_prompts_for_affected_columns(
+    create_agent: AgentFactory,
+) -> None:
+    df = PETS.rename(columns={"toy_type": "toy_kind"}).assign(vet="Dr. A")
+    state = _agent_state(df)
+    completions = FakeCompletions(state["previous_data_model"])
+
+    res = _run(state, completions, create_agent)
+
+    assert [c[0] for c in completions.calls] == [
+        DiscoveryResponse,
+        DataModelUpdaterBrainstormResponse,
+        DataModel,
+    ]
+    findings_prompt = completions.calls[0][1][1]["content"]
+    assert "* vet:" in findings_prompt
+    assert "* name:" not in findings_prompt
+    assert "**Changed Columns**\n" in completions.calls[1][1][1]["content"]
+    assert "toy_kind" in completions.calls[1][1][1]["content"]
+    assert res["table_changes"].renamed_columns == {"toy_type": "toy_kind"}
+    assert res["discovery"].possible_node_labels == ["Person", "Pet", "Toy", "Vet"]
+    mappings = {m["column_name"] for m in res["discovery"].column_to_node_mappings}
+    assert {"toy_kind", "vet"} <= mappings
+
+
+def test_dropped_key_column_models_table_again(create_agent: AgentFactory) -> None:
+    state = _agent_state(PETS.drop(columns=["name"]))
+    completions = FakeCompletions(state["previous_data_model"])
+
+    res = _run(state, completions, create_agent)
+
+    # the iteration agent goes on to update the new data model
+    assert [c[0] for c in completions.calls][:2] == [Nodes, DataModel]
+    assert any("Person" in e for e in res["errors"])
@@ -0,0 +1,206 @@
+import asyncio
+import os
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graph_data_modeler_agent.agents.single_source_input.discovery_agent import (
+    create_discovery_agent,
+)
+from graph_data_modeler_agent.checkpointing.serialization import (
+    dumps,
+    hash_state,
+    loads,
+)
+from graph_data_modeler_agent.checkpointing.sqlite_store import (
+    SQLiteNodeOutputStore,
+    checkpoint_node,
+    create_run_config,
+)
+from graph_data_modeler_agent.components.discovery.models import DiscoveryResponse
+from graph_data_modeler_agent.data_dictionary.column import Column
+from graph_data_modeler_agent.data_dictionary.table_schema import TableSchema
+from graph_data_modeler_agent.data_model.core import DataModel
+from graph_data_modeler_agent.data_source.data_source import DataSource
+from graph_data_modeler_agent.profiling.stats import accumulate_stats
+from tests.unit.data_model.core.test_data_model import (
+    good_nodes,
+    good_relationships,
+)
+
+DISCOVERY = DiscoveryResponse(
+    summary="People own pets.",
+    possible_node_labels=["Person", "Pet"],
+    possible_relationships=[
+        {
+            "relationship_type": "HAS_PET",
+            "source_node_label": "Person",
+            "target_node_label": "Pet",
+        }
+    ],
+    possible_property_keys=["name"],
+    column_to_node_mappings=[
+        {"column_name": "name", "node_label": "Person", "reason": "name"}
+    ],
+)
+
+
+class FakeCompletions:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls = 0
+        self.fail = fail
+
+    async def create(self, **kwargs: Any) -> DiscoveryResponse:
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("provider unavailable")
+        return DISCOVERY
+
+
+def _fake_llm_client(completions: FakeCompletions) -> Any:
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+def test_serialization_round_trip() -> None:
+    data_model = DataModel(nodes=good_nodes, relationships=good_relationships)
+    data_model.get_schema()
+    df = pd.read_csv("tests/resources/data/pets.csv")
+    output = {
+        "data_model": data_model,
+        "discovery": DISCOVERY,
+        "table_schema": TableSchema(
+            name="pets.csv", columns=[Column(name="name", primary_key=True)]
+        ),
+        "stats": accumulate_stats([df]).to_table_stats(),
+    }
+
+    res = loads(dumps(output))
+
+    assert res["data_model"].model_dump() == data_model.model_dump()
+    assert res["discovery"] == DISCOVERY
+    assert res["table_schema"] == output["table_schema"]
+    assert res["stats"] == output["stats"]
+
+
+def test_hash_state_depends_on_content_only() -> None:
+    data_model = DataModel(nodes=good_nodes, relationships=good_relationships)
+    df = pd.read_csv("tests/resources/data/pets.csv")
+
+    before = hash_state({"data_model": data_model, "data": df, "steps": ["a"]})
+    data_model.get_schema()
+    after = hash_state({"steps": ["a"], "data": df.copy(), "data_model": data_model})
+
+    assert before == after
+    changed = df.copy()
+    changed.loc[0, "age"] = 99
+    assert hash_state({"data": changed}) != hash_state({"data": df})
+
+
+def test_hash_state_data_source(tmp_path) -> None:
+    path = os.path.join(tmp_path, "a.csv")
+    with open(path, "w") as f:
+        f.write("a\n1\n")
+    before = hash_state({"data": DataSource(file_path=path)})
+    with open(path, "w") as f:
+        f.write("a\n1\n2\n")
+
+    assert hash_state({"data": DataSource(file_path=path)}) != before
+
+
+def test_hash_state_numpy_values() -> None:
+    values = np.array([1.5, 2.5])
+
+    assert hash_state({"n": np.int64(3), "x": np.float64(0.5)}) == hash_state(
+        {"n": 3, "x": 0.5}
+    )
+    assert hash_state({"v": values}) == hash_state({"v": values.copy()})
+    assert hash_state({"v": values}) != hash_state({"v": values[::-1]})
+    assert hash_state({"v": np.array(["a", None])}) == hash_state(
+        {"v": np.array(["a", None])}
+    )
+    assert hash_state({"i": pd.Index(["a", "b"])}) != hash_state(
+        {"i": pd.Index(["b", "a"])}
+    )
+
+
+def test_hash_state_picklable_value() -> None:
+    assert hash_state({"v": complex(1, 2)}) == hash_state({"v": complex(1, 2)})
+    assert hash_state({"v": complex(1, 2)}) != hash_state({"v": complex(2, 1)})
+
+
+def test_hash_state_unsupported_value() -> None:
+    with pytest.raises(TypeError):
+        hash_state({"client": lambda: None})
+
+
+def test_store(tmp_path) -> None:
+    database = os.path.join(tmp_path, "checkpoints.db")
+    with SQLiteNodeOutputStore(database) as store:
+        store.put("run", "node_a", "hash_1", {"value": 1})
+        store.put("run", "node_b", "hash_1", {"value": 2})
+        store.put("other", "node_a", "hash_1", {"value": 3})
+
+    with SQLiteNodeOutputStore(database) as store:
+        assert store.get("run", "node_a", "hash_1") == {"value": 1}
+        assert store.get("run", "node_a", "hash_2") is None
+        assert store.completed_nodes("run") == [
+            ("node_a", "hash_1"),
+            ("node_b", "hash_1"),
+        ]
+        store.delete_run("run")
+        assert store.completed_nodes("run") == []
+        assert store.get("other", "node_a", "hash_1") == {"value": 3}
+
+
+def test_checkpoint_node_without_store_is_unchanged() -> None:
+    async def node(state: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+    assert checkpoint_node(node, "node", None) is node
+
+
+def test_discovery_agent_resume() -> None:
+    store = SQLiteNodeOutputStore()
+    state = {
+        "data": pd.read_csv("tests/resources/data/pets.csv"),
+        "table_schema": TableSchema(name="pets.csv", columns=[Column(name="name")]),
+        "use_cases": ["Which pets live in Chicago?"],
+        "additional_context": "",
+    }
+
+    failing = FakeCompletions(fail=True)
+    agent = create_discovery_agent(_fake_llm_client(failing), "model", store)
+    with pytest.raises(RuntimeError):
+        asyncio.run(agent.ainvoke(state, create_run_config("batch")))
+
+    completed: List[str] = [n for n, _ in store.completed_nodes("batch")]
+    assert completed == [
+        "discovery_agent.discovery_input",
+        "discovery_agent.generate_stats",
+        "discovery_agent.generate_key_profile",
+    ]
+
+    completions = FakeCompletions()
+    agent = create_discovery_agent(_fake_llm_client(completions), "model", store)
+    res = asyncio.run(agent.ainvoke(state, create_run_config("batch")))
+    assert res["discovery"] == DISCOVERY
+    assert completions.calls == 1
+
+    # every node is skipped on the next resume, including the LLM call
+    res = asyncio.run(agent.ainvoke(state, create_run_config("batch")))
+    assert res["discovery"] == DISCOVERY
+    assert completions.calls == 1
+    assert res["discovery_steps"] == [
+        "discovery_input",
+        "generate_stats",
+        "generate_key_profile",
+        "detect_changes",
+        "generate_findings",
+    ]
+
+    # runs without a run id are not checkpointed
+    asyncio.run(agent.ainvoke(state))
+    assert completions.calls == 2
@@ -0,0 +1,118 @@
+"""An in-process fake of the Neo4j driver that records queries."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+
+class FakeTransientError(Exception):
+    """A transient error, such as a deadlock, that the driver would retry."""
+
+    def is_retryable(self) -> bool:
+        return True
+
+
+class FakeResult:
+    def consume(self) -> None:
+        return None
+
+
+class FakeSession:
+    def __init__(self, driver: "FakeDriver", database: Optional[str]) -> None:
+        self.driver = driver
+        self.database = database
+
+    def __enter__(self) -> "FakeSession":
+        with self.driver.lock:
+            self.driver.open_sessions += 1
+            self.driver.max_open_sessions = max(
+                self.driver.max_open_sessions, self.driver.open_sessions
+            )
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        with self.driver.lock:
+            self.driver.open_sessions -= 1
+
+    def run(
+        self, query: str, parameters: Optional[Dict[str, Any]] = None
+    ) -> FakeResult:
+        self.driver.record(query, parameters, self.database)
+        return FakeResult()
+
+
+class FakeDriver:
+    """
+    Records the queries run with `execute_query()` or in sessions, in order.
+    `fail` is called with each query and its parameters before it is recorded and can raise to simulate errors.
+    `lock_keys` returns the nodes a query locks. A query that needs a node locked by a running query fails with a
+    transient deadlock error, as concurrent transactions waiting on each other's locks would.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        fail: Optional[Callable[[str, Optional[Dict[str, Any]]], None]] = None,
+        lock_keys: Optional[
+            Callable[[str, Optional[Dict[str, Any]]], Set[Hashable]]
+        ] = None,
+    ) -> None:
+        self.latency = latency
+        self.fail = fail
+        self.lock_keys = lock_keys
+        self.locked: Set[Hashable] = set()
+        self.deadlocks = 0
+        self.lock = threading.Lock()
+        self.queries: List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]] = list()
+        self.open_sessions = 0
+        self.max_open_sessions = 0
+
+    def session(self, database: Optional[str] = None) -> FakeSession:
+        return FakeSession(self, database)
+
+    def execute_query(
+        self,
+        query: str,
+        parameters_: Optional[Dict[str, Any]] = None,
+        database_: Optional[str] = None,
+    ) -> None:
+        self.record(query, parameters_, database_)
+
+    def record(
+        self, query: str, parameters: Optional[Dict[str, Any]], database: Optional[str]
+    ) -> None:
+        keys = (
+            self.lock_keys(query, parameters) if self.lock_keys is not None else set()
+        )
+        with self.lock:
+            if keys & self.locked:
+                self.deadlocks += 1
+                raise FakeTransientError("Deadlock detected.")
+            self.locked |= keys
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            if self.fail is not None:
+                self.fail(query, parameters)
+            with self.lock:
+                self.queries.append((query, parameters, database))
+        finally:
+            with self.lock:
+                self.locked -= keys
+
+    def batches(self, query_contains: str = "") -> List[List[Dict[str, Any]]]:
+        """The row batches of the recorded queries that contain `query_contains`."""
+
+        return [
+            p["dict"]["rows"]
+            for q, p, _ in self.queries
+            if p is not None and query_contains in q
+        ]
+
+
+def lock_row_values(query: str, parameters: Optional[Dict[str, Any]]) -> Set[Hashable]:
+    """Lock the nodes of every value in the rows of a query, which are the endpoints of relationship rows."""
+
+    if parameters is None or "MATCH" not in query:
+        return set()
+    return {v for row in parameters["dict"]["rows"] for v in row.values()}
@@ -0,0 +1,206 @@
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+from graph_data_modeler_agent.code_generation import (
+    BulkImportExporter,
+    BulkImportFiles,
+    format_import_values,
+)
+from graph_data_modeler_agent.data_model.core import (
+    DataModel,
+    Node,
+    Property,
+    Relationship,
+)
+from graph_data_modeler_agent.data_source import DataSource
+from tests.unit.code_generation.test_ingestion_generator import PETS
+
+PERSON = Node(
+    label="Person",
+    properties=[
+        Property(
+            name="name",
+            type="STRING",
+            column_mapping="name",
+            alias="knows",
+            is_key=True,
+        ),
+        Property(name="age", type="INTEGER", column_mapping="age"),
+    ],
+    source_name="pets.csv",
+)
+PET = Node(
+    label="Pet",
+    properties=[
+        Property(name="name", type="STRING", column_mapping="pet_name", is_key=True),
+        Property(name="kind", type="STRING", column_mapping="pet"),
+    ],
+    source_name="pets.csv",
+)
+SHELTER = Node(
+    label="Shelter",
+    properties=[
+        Property(name="name", type="STRING", column_mapping="shelter", is_key=True),
+        Property(name="open", type="BOOLEAN", column_mapping="open"),
+    ],
+    source_name="shelters.csv",
+)
+DATA_MODEL = DataModel(
+    nodes=[PERSON, PET, SHELTER],
+    relationships=[
+        Relationship(
+            type="KNOWS",
+            properties=[],
+            source="Person",
+            target="Person",
+            source_name="pets.csv",
+        ),
+        Relationship(
+            type="HAS_PET",
+            properties=[],
+            source="Person",
+            target="Pet",
+            source_name="pets.csv",
+        ),
+    ],
+)
+SHELTERS = pd.DataFrame(
+    {"shelter": ["Paws", "Claws", "Paws"], "open": ["True", "no", "TRUE"]}
+)
+
+
+def _read(files: List[str]) -> pd.DataFrame:
+    return pd.concat(
+        [pd.read_csv(f, header=None, dtype=str, keep_default_na=False) for f in files],
+        ignore_index=True,
+    )
+
+
+def _export(
+    output_dir: str, num_partitions: int, max_workers: Optional[int]
+) -> BulkImportFiles:
+    return BulkImportExporter(
+        DATA_MODEL,
+        output_dir,
+        num_partitions=num_partitions,
+        max_workers=max_workers,
+    ).export({"pets.csv": PETS, "shelters.csv": SHELTERS})
+
+
+def test_headers(tmp_path: Path) -> None:
+    files = _export(str(tmp_path), num_partitions=4, max_workers=1)
+
+    headers = {
+        g.name: open(g.header_file).read().strip()
+        for g in [*files.nodes, *files.relationships]
+    }
+    assert headers == {
+        "Person": ":ID(Person),name:string,age:long",
+        "Pet": ":ID(Pet),name:string,kind:string",
+        "Shelter": ":ID(Shelter),name:string,open:boolean",
+        "(:Person)-[:KNOWS]->(:Person)": ":START_ID(Person),:END_ID(Person)",
+        "(:Person)-[:HAS_PET]->(:Pet)": ":START_ID(Person),:END_ID(Pet)",
+    }
+
+
+def test_nodes_are_deduplicated_across_partitions(tmp_path: Path) -> None:
+    files = _export(str(tmp_path), num_partitions=4, max_workers=1)
+    nodes = {g.name: g for g in files.nodes}
+
+    people = _read(nodes["Person"].data_files)
+    assert sorted(people[0]) == sorted(PETS["name"].unique())
+    assert nodes["Person"].count == PETS["name"].nunique()
+    assert set(people[2]) == {str(a) for a in PETS["age"]}
+    # each person is in a single partition
+    partitions = [set(_read([f])[0]) for f in nodes["Person"].data_files]
+    assert sum(len(p) for p in partitions) == len(set.union(*partitions))
+
+    shelters = _read(nodes["Shelter"].data_files).sort_values(0)
+    assert shelters.values.tolist() == [
+        ["Claws", "Claws", ""],
+        ["Paws", "Paws", "true"],
+    ]
+
+
+def test_relationships_are_deduplicated(tmp_path: Path) -> None:
+    files = _export(str(tmp_path), num_partitions=4, max_workers=1)
+    relationships = {g.label_or_type: g for g in files.relationships}
+
+    knows = _read(relationships["KNOWS"].data_files)
+    expected = PETS[["name", "knows"]].drop_duplicates()
+    assert sorted(map(tuple, knows.values.tolist())) == sorted(
+        map(tuple, expected.values.tolist())
+    )
+    assert relationships["HAS_PET"].count == len(
+        PETS[["name", "pet_name"]].drop_duplicates()
+    )
+
+
+def test_streamed_and_parallel_exports_match(tmp_path: Path) -> None:
+    expected = _export(os.path.join(tmp_path, "a"), num_partitions=2, max_workers=1)
+    streamed = BulkImportExporter(
+        DATA_MODEL,
+        os.path.join(tmp_path, "b"),
+        num_partitions=2,
+        chunk_size=2,
+        max_workers=2,
+    ).export(
+        {
+            "pets.csv": DataSource(file_path="tests/resources/data/pets.csv"),
+            "shelters.csv": SHELTERS,
+        }
+    )
+
+    for a, b in zip(
+        [*expected.nodes, *expected.relationships],
+        [*streamed.nodes, *streamed.relationships],
+    ):
+        assert a.count == b.count
+        assert sorted(_read(a.data_files).values.tolist()) == sorted(
+            _read(b.data_files).values.tolist()
+        )
+    # spill files are removed
+    assert all(f.endswith(".csv") for f in os.listdir(os.path.join(tmp_path, "b")))
+
+
+def test_float_keys_match_across_chunks(tmp_path: Path) -> None:
+    shelters = pd.DataFrame({"shelter": [1.0, 2.0, 1.5, 1.0], "open": ["yes"] * 4})
+    data_model = DataModel(nodes=[PERSON, SHELTER], relationships=[])
+
+    files = BulkImportExporter(
+        data_model,
+        str(tmp_path),
+        num_partitions=1,
+        chunk_size=2,
+        max_workers=1,
+    ).export({"pets.csv": PETS, "shelters.csv": shelters})
+
+    nodes = {g.name: g for g in files.nodes}
+    assert sorted(_read(nodes["Shelter"].data_files)[0]) == ["1", "1.5", "2"]
+
+
+def test_import_command(tmp_path: Path) -> None:
+    files = _export(str(tmp_path), num_partitions=1, max_workers=1)
+
+    command = files.import_command(database="pets")
+
+    assert command.startswith(
+        "neo4j-admin database import full --skip-bad-relationships=true "
+        "--nodes=Person="
+    )
+    header = os.path.join(tmp_path, "Person_KNOWS_Person_header.csv")
+    assert f"--relationships=KNOWS={header}," in command
+    assert command.endswith(" pets")
+
+
+def test_format_import_values() -> None:
+    assert format_import_values(
+        pd.Series(["1", "2.9", None, "x", "inf"]), "INTEGER"
+    ).tolist() == [1, 2, pd.NA, pd.NA, pd.NA]
+    assert format_import_values(
+        pd.Series([True, "False", "maybe", None], dtype=object), "BOOLEAN"
+    ).tolist()[:2] == ["true", "false"]
+    assert format_import_values(pd.Series(["a"]), "STRING").tolist() == ["a"]
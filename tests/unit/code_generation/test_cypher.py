@@ -0,0 +1,220 @@
+from graph_data_modeler_agent.code_generation import (
+    IngestionGenerator,
+    generate_constraints_key,
+    generate_match_node_clause,
+    generate_match_same_node_labels_clause,
+    generate_merge_node_clause_standard,
+    generate_merge_node_load_csv_clause,
+    generate_merge_relationship_clause_standard,
+    generate_merge_relationship_load_csv_clause,
+    generate_node_key_constraint,
+    generate_relationship_key_constraint,
+    generate_set_property,
+    generate_set_unique_property,
+    generate_unique_constraint,
+    quote_identifier,
+)
+from graph_data_modeler_agent.data_model.core import (
+    DataModel,
+    Node,
+    Property,
+    Relationship,
+)
+from tests.resources.answers import ingestion_generation_answers as answers
+
+NODE_A = Node(
+    label="NodeA",
+    properties=[
+        Property(
+            name="uniqueProp1",
+            type="STRING",
+            column_mapping="unique_prop_1",
+            is_key=True,
+        ),
+        Property(name="prop1", type="STRING", column_mapping="prop_1"),
+        Property(
+            name="uniqueProp3",
+            type="STRING",
+            column_mapping="unique_prop_3",
+            is_key=True,
+        ),
+    ],
+    source_name="file",
+)
+NODE_B = Node(
+    label="NodeB",
+    properties=[
+        Property(
+            name="uniqueProp2",
+            type="STRING",
+            column_mapping="unique_prop_2",
+            is_key=True,
+        ),
+        Property(name="prop2", type="STRING", column_mapping="prop_2"),
+        Property(name="prop3", type="STRING", column_mapping="prop_3"),
+    ],
+    source_name="file",
+)
+HAS_RELATIONSHIP = Relationship(
+    type="HAS_RELATIONSHIP",
+    properties=[Property(name="relProp", type="INTEGER", column_mapping="rel_prop")],
+    source="NodeA",
+    target="NodeB",
+    source_name="file",
+)
+PERSON = Node(
+    label="Person",
+    properties=[
+        Property(
+            name="name",
+            type="STRING",
+            column_mapping="name",
+            alias="knows_person",
+            is_key=True,
+        )
+    ],
+    source_name="file",
+)
+KNOWS = Relationship(
+    type="KNOWS", properties=[], source="Person", target="Person", source_name="file"
+)
+OWNER = Node(
+    label="Person",
+    properties=[
+        Property(
+            name="name",
+            type="STRING",
+            column_mapping="name",
+            alias="person_name",
+            is_key=True,
+        )
+    ],
+    source_name="people.csv",
+)
+PET = Node(
+    label="Pet",
+    properties=[
+        Property(name="name", type="STRING", column_mapping="name", is_key=True)
+    ],
+    source_name="pets.csv",
+)
+LOVES = Relationship(
+    type="LOVES", properties=[], source="Pet", target="Person", source_name="pets.csv"
+)
+
+
+def test_constraints() -> None:
+    assert (
+        generate_constraints_key("NodeA", ["uniqueProp1"])
+        == answers.constraints_key_a_1
+    )
+    assert generate_unique_constraint("NodeA", "uniqueProp1") == answers.constraint_a_1
+    assert generate_unique_constraint("NodeB", "uniqueProp2") == answers.constraint_b
+    assert (
+        generate_node_key_constraint("NodeA", ["nk1", "nk2"])
+        == answers.node_key_constraint_answer
+    )
+    assert (
+        generate_relationship_key_constraint("HAS_RELATIONSHIP", ["nk1", "nk2"])
+        == answers.relationship_key_constraint_answer
+    )
+
+
+def test_property_clauses() -> None:
+    types = {"relProp": "INTEGER"}
+
+    assert (
+        generate_set_unique_property(NODE_A.node_key_mapping, dict())
+        == answers.set_unique_property_a
+    )
+    assert (
+        generate_set_property(
+            NODE_B.nonunique_properties_mapping_for_set_clause, dict()
+        )
+        == answers.set_properties_b
+    )
+    assert (
+        generate_set_property({"relProp": "rel_prop"}, types)
+        == answers.set_properties_rel_1
+    )
+    assert generate_set_property(dict(), types) == ""
+    assert generate_match_node_clause(NODE_A) == answers.match_node_a
+
+
+def test_merge_nodes() -> None:
+    assert generate_merge_node_clause_standard(NODE_A) == answers.merge_node_standard_a
+    assert (
+        generate_merge_node_load_csv_clause(NODE_B, "test.csv", batch_size=10000)
+        == answers.merge_node_load_csv_b
+    )
+
+
+def test_merge_relationships() -> None:
+    assert (
+        generate_merge_relationship_clause_standard(NODE_A, NODE_B, HAS_RELATIONSHIP)
+        == answers.merge_relationship_standard
+    )
+    assert (
+        generate_merge_relationship_load_csv_clause(
+            NODE_A,
+            NODE_B,
+            HAS_RELATIONSHIP,
+            "test.csv",
+            method="browser",
+            batch_size=50,
+        )
+        == answers.merge_relationship_load_csv
+    )
+
+
+def test_merge_relationship_same_labels() -> None:
+    assert generate_match_same_node_labels_clause(PERSON) == answers.match_same_labels
+    assert (
+        generate_merge_relationship_clause_standard(PERSON, PERSON, KNOWS)
+        == answers.merge_relationship_standard_same_node
+    )
+
+
+def test_merge_relationship_different_files() -> None:
+    assert (
+        generate_merge_relationship_clause_standard(PET, OWNER, LOVES)
+        == answers.merge_relationship_standard_different_files
+    )
+
+
+def test_generator_constraints() -> None:
+    data_model = DataModel(nodes=[NODE_A, NODE_B], relationships=[HAS_RELATIONSHIP])
+
+    assert IngestionGenerator(data_model).generate_constraints() == {
+        answers.constraints_key_a_1: answers.constraint_a_1,
+        answers.constraints_key_a_3: answers.constraint_a_3,
+        answers.constraints_key_b: answers.constraint_b,
+    }
+    assert list(
+        IngestionGenerator(data_model, use_key_constraints=True)
+        .generate_constraints()
+        .values()
+    ) == [
+        "CREATE CONSTRAINT `nodea_uniqueprop1_uniqueprop3` IF NOT EXISTS FOR (n:`NodeA`) REQUIRE (n.`uniqueProp1`, n.`uniqueProp3`) IS NODE KEY;\n",
+        answers.constraint_b,
+    ]
+
+
+def test_identifiers_are_quoted() -> None:
+    node = Node(
+        label="Pet Owner",
+        properties=[
+            Property(name="name", type="STRING", column_mapping="name`s", is_key=True),
+            Property(name="match", type="INTEGER", column_mapping="age (years)"),
+        ],
+        source_name="file",
+    )
+
+    assert quote_identifier("a`b") == "`a``b`"
+    assert generate_merge_node_clause_standard(node).endswith(
+        "MERGE (n:`Pet Owner` {`name`: row.`name``s`})\n"
+        "SET n.`match` = toIntegerOrNull(row.`age (years)`)"
+    )
+    assert generate_unique_constraint("Pet Owner", "name") == (
+        "CREATE CONSTRAINT `pet owner_name` IF NOT EXISTS FOR (n:`Pet Owner`) REQUIRE n.`name` IS UNIQUE;\n"
+    )
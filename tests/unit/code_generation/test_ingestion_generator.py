@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+from graph_data_modeler_agent.code_generation import (
+    IngestionGenerator,
+    iter_row_batches,
+    load_data,
+)
+from graph_data_modeler_agent.data_model.core import (
+    DataModel,
+    Node,
+    Property,
+    Relationship,
+)
+from graph_data_modeler_agent.data_source import DataSource
+from tests.unit.code_generation.fake_neo4j import FakeDriver
+
+PETS = pd.read_csv("tests/resources/data/pets.csv")
+
+PERSON = Node(
+    label="Person",
+    properties=[
+        Property(
+            name="name",
+            type="STRING",
+            column_mapping="name",
+            alias="knows",
+            is_key=True,
+        ),
+        Property(name="age", type="INTEGER", column_mapping="age"),
+    ],
+    source_name="file",
+)
+PET = Node(
+    label="Pet",
+    properties=[
+        Property(name="name", type="STRING", column_mapping="pet_name", is_key=True),
+        Property(name="kind", type="STRING", column_mapping="pet"),
+    ],
+    source_name="file",
+)
+DATA_MODEL = DataModel(
+    nodes=[PERSON, PET],
+    relationships=[
+        Relationship(
+            type="KNOWS",
+            properties=[],
+            source="Person",
+            target="Person",
+            source_name="file",
+        ),
+        Relationship(
+            type="HAS_PET",
+            properties=[],
+            source="Person",
+            target="Pet",
+            source_name="file",
+        ),
+    ],
+)
+
+
+def test_statements() -> None:
+    generator = IngestionGenerator(DATA_MODEL, max_values_per_batch=8, min_batch_size=1)
+    nodes = generator.generate_node_statements()
+    relationships = generator.generate_relationship_statements()
+
+    assert [s.name for s in nodes] == ["Person", "Pet"]
+    assert nodes[0].columns == ["name", "age"]
+    assert nodes[0].batch_size == 4
+    assert [s.columns for s in relationships] == [
+        ["name", "knows"],
+        ["name", "pet_name"],
+    ]
+    # relationship batches are smaller than node batches with as many values
+    assert relationships[0].batch_size == 1
+    assert "toIntegerOrNull(row.`age`)" in nodes[0].cypher
+
+
+def test_batch_size_bounds() -> None:
+    generator = IngestionGenerator(
+        DATA_MODEL, max_batch_size=500, min_batch_size=10, max_values_per_batch=1000
+    )
+
+    assert generator.batch_size(1) == 500
+    assert generator.batch_size(2) == 500
+    assert generator.batch_size(4) == 250
+    assert generator.batch_size(4, relationship=True) == 62
+    assert generator.batch_size(1000) == 10
+
+
+def test_iter_row_batches() -> None:
+    statement = IngestionGenerator(
+        DATA_MODEL, max_batch_size=4, min_batch_size=1
+    ).generate_node_statements()[0]
+    data = PETS.copy()
+    data.loc[0, "age"] = np.nan
+
+    batches = list(iter_row_batches(data, statement))
+
+    assert [len(b) for b in batches] == [4, 4, 1]
+    assert batches[0][0] == {"name": "Bob", "age": None}
+    assert set(batches[1][0]) == {"name", "age"}
+
+
+def test_load_data() -> None:
+    driver = FakeDriver()
+    generator = IngestionGenerator(
+        DATA_MODEL, csv_name="pets.csv", max_batch_size=4, min_batch_size=1
+    )
+
+    rows = load_data(driver, generator, {"pets.csv": PETS}, database="neo4j")
+
+    constraints = driver.queries[:2]
+    assert [q[0] for q in constraints] == list(
+        generator.generate_constraints().values()
+    )
+    assert rows == {
+        "Person": len(PETS),
+        "Pet": len(PETS),
+        "(:Person)-[:KNOWS]->(:Person)": len(PETS),
+        "(:Person)-[:HAS_PET]->(:Pet)": len(PETS),
+    }
+    assert sum(len(b) for b in driver.batches()) == 4 * len(PETS)
+    assert all(q[2] == "neo4j" for q in driver.queries)
+
+
+def test_iter_row_batches_streams_data_source() -> None:
+    statement = IngestionGenerator(
+        DATA_MODEL, max_batch_size=4, min_batch_size=1
+    ).generate_node_statements()[1]
+
+    batches = list(
+        iter_row_batches(
+            DataSource(file_path="tests/resources/data/pets.csv"), statement
+        )
+    )
+
+    assert [len(b) for b in batches] == [4, 4, 1]
+    assert batches[0][0] == {"pet_name": "Benny", "pet": "dog"}
@@ -0,0 +1,169 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+import pytest
+
+from graph_data_modeler_agent.code_generation import (
+    IngestionGenerator,
+    Neo4jLoader,
+    is_transient_error,
+    run_with_retries,
+)
+from graph_data_modeler_agent.data_model.core import (
+    DataModel,
+    Node,
+    Property,
+    Relationship,
+)
+from graph_data_modeler_agent.data_source import DataSource
+from tests.unit.code_generation.fake_neo4j import FakeDriver, FakeTransientError
+from tests.unit.code_generation.test_ingestion_generator import DATA_MODEL, PETS
+
+TOY = Node(
+    label="Toy",
+    properties=[
+        Property(name="name", type="STRING", column_mapping="toy", is_key=True),
+    ],
+    source_name="file",
+)
+MULTI_LABEL_DATA_MODEL = DataModel(
+    nodes=[*DATA_MODEL.nodes, TOY],
+    relationships=[
+        *DATA_MODEL.relationships,
+        Relationship(
+            type="PLAYS_WITH",
+            properties=[],
+            source="Pet",
+            target="Toy",
+            source_name="file",
+        ),
+    ],
+)
+
+
+def _loader(driver: FakeDriver, **kwargs: Any) -> Neo4jLoader:
+    generator = IngestionGenerator(
+        MULTI_LABEL_DATA_MODEL,
+        csv_name="pets.csv",
+        max_batch_size=4,
+        min_batch_size=1,
+    )
+    return Neo4jLoader(driver, generator, retry_delay=0.0, **kwargs)
+
+
+def test_load_report() -> None:
+    driver = FakeDriver()
+
+    report = _loader(driver, database="neo4j").load({"pets.csv": PETS})
+
+    assert list(report.nodes) == ["Person", "Pet", "Toy"]
+    assert list(report.relationships) == ["KNOWS", "HAS_PET", "PLAYS_WITH"]
+    assert all(s.rows == len(PETS) and s.batches == 3 for s in report.nodes.values())
+    assert report.rows == 6 * len(PETS)
+    assert report.rows_per_second > 0
+    assert "Person: 9 rows, 3 batches, 0 retries" in str(report)
+    assert all(q[2] == "neo4j" for q in driver.queries)
+
+
+def test_relationships_load_after_nodes() -> None:
+    driver = FakeDriver(latency=0.001)
+
+    _loader(driver, max_workers=3).load({"pets.csv": PETS})
+
+    # constraints, node MERGEs and relationship MATCHes in the order they ran
+    kinds = [
+        "CONSTRAINT" if "CONSTRAINT" in q else q.split("\n")[2][:5]
+        for q, _, _ in driver.queries
+    ]
+    last_node = max(i for i, k in enumerate(kinds) if k == "MERGE")
+    first_relationship = min(i for i, k in enumerate(kinds) if k == "MATCH")
+    assert kinds[:3] == ["CONSTRAINT"] * 3
+    assert last_node < first_relationship
+
+
+def test_labels_load_in_parallel_within_pool_bound() -> None:
+    driver = FakeDriver(latency=0.01)
+
+    _loader(driver, max_workers=2).load({"pets.csv": PETS})
+
+    assert driver.max_open_sessions == 2
+
+
+def test_streams_data_source() -> None:
+    driver = FakeDriver()
+
+    report = _loader(driver).load(
+        {"pets.csv": DataSource(file_path="tests/resources/data/pets.csv")}
+    )
+
+    assert report.rows == 6 * len(PETS)
+    assert driver.batches("MERGE (n:`Toy`")[0] == [
+        {"toy": "chuck-it"},
+        {"toy": "chuck-it"},
+        {"toy": "barry"},
+        {"toy": "barry"},
+    ]
+
+
+def test_retries_transient_errors() -> None:
+    lock = threading.Lock()
+    failures: Dict[str, int] = dict()
+
+    def fail(query: str, parameters: Optional[Dict[str, Any]]) -> None:
+        # the first attempt of every Pet batch deadlocks
+        if "MERGE (n:`Pet`" not in query or parameters is None:
+            return
+        key = str(parameters["dict"]["rows"])
+        with lock:
+            failures[key] = failures.get(key, 0) + 1
+            if failures[key] == 1:
+                raise FakeTransientError("deadlock")
+
+    driver = FakeDriver(fail=fail)
+
+    report = _loader(driver).load({"pets.csv": PETS})
+
+    assert report.nodes["Pet"].retries == 3
+    assert report.nodes["Pet"].rows == len(PETS)
+    assert len(driver.batches("MERGE (n:`Pet`")) == 3
+
+
+def test_run_with_retries() -> None:
+    delays: List[float] = list()
+    calls: List[int] = list()
+
+    def flaky() -> None:
+        calls.append(1)
+        if len(calls) < 3:
+            raise FakeTransientError()
+
+    assert run_with_retries(flaky, retry_delay=1.0, sleep=delays.append) == 2
+    assert len(delays) == 2
+    assert 0.0 <= delays[0] <= 1.0 and 0.0 <= delays[1] <= 2.0
+
+    with pytest.raises(FakeTransientError):
+        run_with_retries(
+            lambda: (_ for _ in ()).throw(FakeTransientError()),
+            max_retries=2,
+            sleep=delays.append,
+        )
+
+    with pytest.raises(ValueError):
+        run_with_retries(
+            lambda: (_ for _ in ()).throw(ValueError()), sleep=delays.append
+        )
+    assert len(delays) == 4
+
+
+def test_is_transient_error() -> None:
+    class ServiceUnavailable(Exception):
+        pass
+
+    class Neo4jError(Exception):
+        code = "Neo.TransientError.Transaction.DeadlockDetected"
+
+    assert is_transient_error(FakeTransientError())
+    assert is_transient_error(ServiceUnavailable())
+    assert is_transient_error(Neo4jError())
+    assert not is_transient_error(ValueError())
@@ -0,0 +1,185 @@
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graph_data_modeler_agent.code_generation import (
+    PreflightReport,
+    cast_failures,
+    run_preflight_checks,
+)
+from graph_data_modeler_agent.code_generation.preflight import _HashIndex
+from graph_data_modeler_agent.data_model.core import DataModel
+from tests.unit.code_generation.test_bulk_import import DATA_MODEL, SHELTER, SHELTERS
+from tests.unit.code_generation.test_ingestion_generator import PETS
+
+CLEAN_SHELTERS = SHELTERS.assign(open=["true", "false", "true"])
+
+
+def _check(
+    pets: pd.DataFrame,
+    shelters: pd.DataFrame = CLEAN_SHELTERS,
+    chunk_size: int = 100_000,
+) -> PreflightReport:
+    return run_preflight_checks(
+        DATA_MODEL,
+        {"pets.csv": pets, "shelters.csv": shelters},
+        chunk_size=chunk_size,
+    )
+
+
+def _violations(report: PreflightReport) -> dict:
+    return {(v.check, v.entity, tuple(v.columns)): v for v in report.violations}
+
+
+def test_clean_data_passes() -> None:
+    report = _check(PETS, chunk_size=2)
+
+    assert report.passed
+    assert report.rows_checked == {"pets.csv": 9, "shelters.csv": 3}
+
+
+def test_null_keys() -> None:
+    pets = PETS.copy()
+    pets.loc[[2, 7], "pet_name"] = None
+
+    violation = _violations(_check(pets, chunk_size=4))[
+        ("null_key", "Pet", ("pet_name",))
+    ]
+
+    assert violation.count == 2
+    assert violation.samples == [
+        {"row": 2, "pet_name": None},
+        {"row": 7, "pet_name": None},
+    ]
+
+
+def test_duplicate_keys_with_conflicting_values_across_chunks() -> None:
+    pets = PETS.copy()
+    # Bob is on rows 0 and 1, in different chunks
+    pets.loc[1, "age"] = 52
+
+    violations = _violations(_check(pets, chunk_size=1))
+
+    violation = violations[("duplicate_key", "Person", ("name", "age"))]
+    assert violation.count == 1
+    assert violation.samples == [{"row": 1, "name": "Bob", "age": 52}]
+    # repeated keys with the same values are not violations
+    assert ("duplicate_key", "Pet", ("pet_name", "pet")) not in violations
+
+
+def test_missing_endpoints() -> None:
+    pets = PETS.copy()
+    pets.loc[4, "knows"] = "Zoe"
+    pets.loc[6, "knows"] = None
+
+    violation = _violations(_check(pets, chunk_size=3))[
+        ("missing_endpoint", "(:Person)-[:KNOWS]->(:Person)", ("knows",))
+    ]
+
+    assert violation.count == 1
+    assert violation.samples == [{"row": 4, "knows": "Zoe"}]
+
+
+def test_invalid_types() -> None:
+    pets = PETS.copy().astype({"age": object})
+    pets.loc[3, "age"] = "fifty"
+
+    violations = _violations(_check(pets, SHELTERS))
+
+    assert violations[("invalid_type", "Person", ("age",))].samples == [
+        {"row": 3, "age": "fifty"}
+    ]
+    # "no" is not a boolean
+    assert violations[("invalid_type", "Shelter", ("open",))].count == 1
+
+
+def test_missing_columns() -> None:
+    report = _check(PETS.drop(columns=["pet"]))
+
+    violation = _violations(report)[("missing_column", "Pet", ("pet",))]
+    assert violation.count == 9
+    assert "missing_column: Pet in pets.csv (pet): 9 rows" in str(report)
+
+
+def test_file_and_chunk_function_sources(tmp_path: Path) -> None:
+    shelters = tmp_path / "shelters.csv"
+    CLEAN_SHELTERS.to_csv(shelters, index=False)
+
+    def pet_chunks() -> Iterator[pd.DataFrame]:
+        return iter([PETS.iloc[:5], PETS.iloc[5:]])
+
+    report = run_preflight_checks(
+        DATA_MODEL, {"pets.csv": pet_chunks, "shelters.csv": str(shelters)}
+    )
+
+    assert report.passed
+
+
+def test_one_time_iterator_of_relationships_fails() -> None:
+    with pytest.raises(ValueError):
+        run_preflight_checks(
+            DATA_MODEL, {"pets.csv": iter([PETS]), "shelters.csv": CLEAN_SHELTERS}
+        )
+
+
+def test_cast_failures() -> None:
+    assert cast_failures(pd.Series(["1", "2.5", "x", None]), "INTEGER").tolist() == [
+        False,
+        False,
+        True,
+        False,
+    ]
+    assert cast_failures(
+        pd.Series(["2024-01-31", "2024-02-30", "soon"]), "DATE"
+    ).tolist() == [False, True, True]
+    assert cast_failures(
+        pd.Series(["12:30:00", "12:30:00+01:00", "25:00:00"]), "LOCAL TIME"
+    ).tolist() == [False, False, True]
+    assert not cast_failures(pd.Series(["anything"]), "STRING").any()
+
+
+def test_hash_index() -> None:
+    index = _HashIndex()
+    rng = np.random.default_rng(0)
+    hashes = rng.integers(0, 2**63, 1_000).astype(np.uint64)
+    for chunk in np.array_split(hashes, 10):
+        index.add(chunk)
+
+    assert index.contains(hashes).all()
+    assert not index.contains(np.array([2**63 + 1], dtype=np.uint64)).any()
+
+    conflicts = index.add_conflicts(
+        np.array([1, 2, 1], dtype=np.uint64), np.array([5, 6, 7], dtype=np.uint64)
+    )
+    assert conflicts.tolist() == [False, False, True]
+    conflicts = index.add_conflicts(
+        np.array([2, 3], dtype=np.uint64), np.array([6, 0], dtype=np.uint64)
+    )
+    assert conflicts.tolist() == [False, False]
+
+
+def test_duplicate_keys_across_sources() -> None:
+    data_model = DataModel(
+        nodes=[SHELTER, SHELTER.model_copy(update={"source_name": "shelters_2.csv"})],
+        relationships=[],
+    )
+    more_shelters = pd.DataFrame({"shelter": ["Claws"], "open": ["true"]})
+
+    violations = _violations(
+        run_preflight_checks(
+            data_model,
+            {"shelters.csv": CLEAN_SHELTERS, "shelters_2.csv": more_shelters},
+        )
+    )
+
+    violation = violations[("duplicate_key", "Shelter", ("shelter", "open"))]
+    assert violation.source_name == "shelters_2.csv"
+    assert violation.samples == [{"row": 0, "shelter": "Claws", "open": "true"}]
+
+
+def test_missing_source_fails() -> None:
+    with pytest.raises(ValueError, match="shelters.csv"):
+        run_preflight_checks(DATA_MODEL, {"pets.csv": PETS})
@@ -0,0 +1,163 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from graph_data_modeler_agent.code_generation import (
+    IngestionGenerator,
+    Neo4jLoader,
+    assign_endpoint_buckets,
+    iter_row_batches,
+    schedule_relationship_rows,
+)
+from graph_data_modeler_agent.data_model.core import (
+    DataModel,
+    Node,
+    Property,
+    Relationship,
+)
+from tests.unit.code_generation.fake_neo4j import FakeDriver, lock_row_values
+
+RNG = np.random.default_rng(0)
+# a few hub people make most rows share nodes
+FRIENDS = pd.DataFrame(
+    {
+        "name": [f"person_{i}" for i in RNG.zipf(1.5, 2_000) % 300],
+        "knows": [f"person_{i}" for i in RNG.zipf(1.5, 2_000) % 300],
+        "pet_name": [f"pet_{i}" for i in RNG.integers(0, 100, 2_000)],
+    }
+)
+
+PERSON = Node(
+    label="Person",
+    properties=[
+        Property(
+            name="name",
+            type="STRING",
+            column_mapping="name",
+            alias="knows",
+            is_key=True,
+        )
+    ],
+    source_name="file",
+)
+PET = Node(
+    label="Pet",
+    properties=[
+        Property(name="name", type="STRING", column_mapping="pet_name", is_key=True)
+    ],
+    source_name="file",
+)
+DATA_MODEL = DataModel(
+    nodes=[PERSON, PET],
+    relationships=[
+        Relationship(
+            type="KNOWS",
+            properties=[],
+            source="Person",
+            target="Person",
+            source_name="file",
+        ),
+        Relationship(
+            type="HAS_PET",
+            properties=[],
+            source="Person",
+            target="Pet",
+            source_name="file",
+        ),
+    ],
+)
+
+
+def _assert_rounds_disjoint(
+    rounds: List[List[pd.DataFrame]], source_column: str, target_column: str
+) -> None:
+    for partitions in rounds:
+        nodes = [set(p[source_column]) | set(p[target_column]) for p in partitions]
+        for i, a in enumerate(nodes):
+            for b in nodes[i + 1 :]:
+                assert not a & b
+
+
+def test_schedule_different_labels() -> None:
+    rounds = schedule_relationship_rows(FRIENDS, ["name"], ["pet_name"], 4)
+
+    assert len(rounds) == 4
+    assert all(len(partitions) <= 4 for partitions in rounds)
+    assert sorted(i for p in sum(rounds, list()) for i in p.index) == list(
+        FRIENDS.index
+    )
+    _assert_rounds_disjoint(rounds, "name", "pet_name")
+
+
+def test_schedule_same_label() -> None:
+    rounds = schedule_relationship_rows(
+        FRIENDS, ["name"], ["knows"], 4, same_label=True
+    )
+
+    assert sum(len(p) for p in sum(rounds, list())) == len(FRIENDS)
+    _assert_rounds_disjoint(rounds, "name", "knows")
+    for partitions in rounds:
+        for p in partitions:
+            assert list(p.index) == sorted(p.index)
+
+
+def test_schedule_single_bucket() -> None:
+    rounds = schedule_relationship_rows(FRIENDS, ["name"], ["knows"], 1)
+
+    assert len(rounds) == 1 and len(rounds[0]) == 1
+    assert rounds[0][0].equals(FRIENDS)
+    assert schedule_relationship_rows(FRIENDS.iloc[:0], ["name"], ["knows"], 4) == []
+
+
+def test_equal_keys_share_buckets_across_dtypes() -> None:
+    data = pd.DataFrame({"id": [1, 2, 3, 4], "friend_id": [2.0, 1.0, np.nan, 3.0]})
+
+    source_buckets, target_buckets = assign_endpoint_buckets(
+        data, ["id"], ["friend_id"], 8
+    )
+
+    assert target_buckets[0] == source_buckets[1]
+    assert target_buckets[1] == source_buckets[0]
+    assert target_buckets[3] == source_buckets[2]
+
+
+def test_unpartitioned_parallel_load_has_lock_conflicts() -> None:
+    driver = FakeDriver(latency=0.001, lock_keys=lock_row_values)
+    statement = IngestionGenerator(
+        DATA_MODEL, max_batch_size=50, min_batch_size=1
+    ).generate_relationship_statements()[0]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(
+            executor.map(
+                lambda batch: _run_ignoring_errors(driver, statement.cypher, batch),
+                iter_row_batches(FRIENDS, statement),
+            )
+        )
+
+    assert driver.deadlocks > 0
+
+
+def _run_ignoring_errors(driver: FakeDriver, query: str, batch: List[dict]) -> None:
+    try:
+        driver.execute_query(query, parameters_={"dict": {"rows": batch}})
+    except Exception:
+        pass
+
+
+def test_partitioned_load_has_no_lock_conflicts() -> None:
+    driver = FakeDriver(latency=0.001, lock_keys=lock_row_values)
+    generator = IngestionGenerator(
+        DATA_MODEL, csv_name="friends.csv", max_batch_size=50, min_batch_size=1
+    )
+
+    report = Neo4jLoader(driver, generator, max_workers=4, max_retries=0).load(
+        {"friends.csv": FRIENDS}
+    )
+
+    assert driver.deadlocks == 0
+    assert report.relationships["KNOWS"].rows == len(FRIENDS)
+    assert report.relationships["HAS_PET"].rows == len(FRIENDS)
+    assert driver.max_open_sessions > 1
@@ -0,0 +1,113 @@
+import glob
+
+import pytest
+
+from graph_data_modeler_agent.components.data_model_updater.brainstorm_updates.models import (
+    DataModelUpdaterBrainstormResponse,
+)
+from graph_data_modeler_agent.components.encoding import (
+    encode_brainstorm_response,
+    encode_data_model,
+    encode_discovery,
+    encode_nodes,
+)
+from graph_data_modeler_agent.data_model.core import DataModel
+from graph_data_modeler_agent.data_model.core.node import Nodes
+from graph_data_modeler_agent.llm import estimate_tokens
+from tests.unit.change_detection.test_change_detection import VET_DISCOVERY
+from tests.unit.checkpointing.test_checkpointing import DISCOVERY
+from tests.unit.data_model.core.test_data_model import good_nodes, good_relationships
+
+DATA_MODEL = DataModel(nodes=good_nodes, relationships=good_relationships)
+UPDATES = DataModelUpdaterBrainstormResponse(
+    nodes_to_remove=[{"label": "Address", "reason": "Not needed."}],
+    relationships_to_remove=[
+        {
+            "relationship_type": "HAS_ADDRESS",
+            "source_node_label": "Person",
+            "target_node_label": "Address",
+            "reason": "Not needed.",
+        }
+    ],
+    properties_to_remove=[
+        {"label_or_type": "Person", "property_name": "age", "reason": "Unused."}
+    ],
+    column_to_node_mappings=[
+        {"column_name": "vet", "node_label": "Vet", "reason": "A vet."},
+        {"column_name": "vet_phone", "node_label": "Vet", "reason": "A phone."},
+    ],
+    new_relationships=[
+        {
+            "relationship_type": "TREATED_BY",
+            "source_node_label": "Pet",
+            "target_node_label": "Vet",
+        }
+    ],
+)
+FIXTURE_DATA_MODELS = [DATA_MODEL] + [
+    DataModel.from_arrows(f)
+    for f in sorted(glob.glob("tests/resources/data_models/*arrows*.json"))
+]
+
+
+def test_encode_data_model() -> None:
+    assert encode_data_model(DATA_MODEL) == (
+        "Nodes\n"
+        "Source people_pets.csv\n"
+        "(:Person {name*: name STRING alias knows, age: age STRING})\n"
+        "(:Address {street*: street STRING, city: city STRING})\n"
+        "(:Pet {name*: pet_name STRING, kind: pet STRING})\n"
+        "(:Toy {name*: toy STRING, kind: toy_type STRING})\n"
+        "Relationships\n"
+        "Source people_pets.csv\n"
+        "(:Person)-[:HAS_ADDRESS]->(:Address)\n"
+        "(:Person)-[:KNOWS]->(:Person)\n"
+        "(:Person)-[:HAS_PET]->(:Pet)\n"
+        "(:Pet)-[:PLAYS_WITH]->(:Toy)"
+    )
+    assert encode_nodes(Nodes(nodes=good_nodes)) == encode_nodes(good_nodes)
+
+
+def test_encode_discovery() -> None:
+    assert encode_discovery(DISCOVERY) == (
+        "Node Labels\nPerson, Pet\n"
+        "Property Keys\nname\n"
+        "Relationships\n(:Person)-[:HAS_PET]->(:Pet)\n"
+        "Column to Node Mappings\nPerson: name"
+    )
+
+
+def test_encode_brainstorm_response() -> None:
+    assert encode_brainstorm_response(UPDATES) == (
+        "Remove Nodes\nAddress\n"
+        "Remove Relationships\n(:Person)-[:HAS_ADDRESS]->(:Address)\n"
+        "Remove Properties\nPerson.age\n"
+        "New Nodes\nVet: vet, vet_phone\n"
+        "New Relationships\n(:Pet)-[:TREATED_BY]->(:Vet)"
+    )
+    assert (
+        encode_brainstorm_response(
+            DataModelUpdaterBrainstormResponse(column_to_node_mappings=[])
+        )
+        == "No updates."
+    )
+
+
+@pytest.mark.parametrize("data_model", FIXTURE_DATA_MODELS)
+def test_data_model_encoding_reduces_tokens(data_model: DataModel) -> None:
+    nodes = Nodes.model_construct(nodes=data_model.nodes)
+
+    # the reprs were embedded in the prompts before
+    assert estimate_tokens(encode_data_model(data_model)) < 0.4 * estimate_tokens(
+        repr(data_model)
+    )
+    assert estimate_tokens(encode_nodes(nodes)) < 0.4 * estimate_tokens(str(nodes))
+
+
+def test_response_encoding_reduces_tokens() -> None:
+    for discovery in [DISCOVERY, VET_DISCOVERY]:
+        assert estimate_tokens(encode_discovery(discovery)) < 0.5 * estimate_tokens(
+            str(discovery.model_dump(exclude={"summary"}))
+        )
+    updates_tokens = estimate_tokens(encode_brainstorm_response(UPDATES))
+    assert updates_tokens < 0.4 * estimate_tokens(str(UPDATES.model_dump()))
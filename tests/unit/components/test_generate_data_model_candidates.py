@@ -0,0 +1,175 @@
+import asyncio
+import time
+from typing import Any, Dict
+
+from graph_data_modeler_agent.components.data_modeler.generate_data_model import (
+    DataModelCandidate,
+    create_generate_data_model_single_source_node,
+    score_data_model_candidate,
+    validate_data_model_candidate,
+)
+from graph_data_modeler_agent.data_dictionary.column import Column
+from graph_data_modeler_agent.data_dictionary.table_schema import TableSchema
+from graph_data_modeler_agent.data_model.core.node import Node, Nodes
+from graph_data_modeler_agent.llm import LLMClient
+from tests.unit.checkpointing.test_checkpointing import DISCOVERY
+from tests.unit.llm.fake_llm import FakeOpenAIServer
+
+TABLE = TableSchema(
+    name="pets.csv",
+    columns=[Column(name=c) for c in ["name", "age", "pet_name", "pet"]],
+)
+CONTEXT: Dict[str, Any] = {
+    "table_schema": TABLE,
+    "valid_columns": TABLE.column_names,
+    "valid_sources": ["pets.csv"],
+    "table_column_listings": {"pets.csv": TABLE.column_names},
+    "allow_duplicate_column_mappings": False,
+    "enforce_uniqueness": True,
+    "apply_neo4j_naming_conventions": True,
+    "allow_parallel_relationships": False,
+    "allow_relationships_between_same_node_label": True,
+}
+
+
+def _property(name: str, column: str, is_key: bool = False) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "type": "STRING",
+        "column_mapping": column,
+        "alias": None,
+        "is_key": is_key,
+    }
+
+
+VALID = {
+    "nodes": [
+        {
+            "label": "Person",
+            "properties": [
+                _property("name", "name", is_key=True),
+                _property("age", "age"),
+            ],
+            "source_name": "pets.csv",
+        },
+        {
+            "label": "Pet",
+            "properties": [
+                _property("name", "pet_name", is_key=True),
+                _property("kind", "pet"),
+            ],
+            "source_name": "pets.csv",
+        },
+    ],
+    "relationships": [
+        {
+            "type": "HAS_PET",
+            "properties": [],
+            "source": "Person",
+            "target": "Pet",
+            "source_name": "pets.csv",
+        }
+    ],
+}
+# `name` is mapped twice
+INVALID = {
+    "nodes": [
+        VALID["nodes"][0],
+        {
+            "label": "Pet",
+            "properties": [_property("owner", "name", is_key=True)],
+            "source_name": "pets.csv",
+        },
+    ],
+    "relationships": VALID["relationships"],
+}
+STATE = {
+    "table_schema": TABLE,
+    "use_cases": ["Which pets does each person own?"],
+    "initial_nodes": Nodes.model_construct(
+        nodes=[Node.model_validate(n) for n in VALID["nodes"]]
+    ),
+    "discovery": DISCOVERY,
+}
+
+
+def test_validate_data_model_candidate() -> None:
+    data_model, errors = validate_data_model_candidate(VALID, CONTEXT)
+    assert errors == []
+    assert data_model.node_labels == ["Person", "Pet"]
+
+    data_model, errors = validate_data_model_candidate(INVALID, CONTEXT)
+    assert len(errors) >= 1
+    # the nodes and relationships are valid on their own
+    assert data_model.node_labels == ["Person", "Pet"]
+    assert data_model.relationship_types == ["HAS_PET"]
+
+    malformed = {"nodes": [VALID["nodes"][0], {"label": "Pet"}], "relationships": None}
+    data_model, errors = validate_data_model_candidate(malformed, CONTEXT)
+    assert len(errors) >= 1
+    assert data_model.node_labels == ["Person"]
+    assert data_model.relationships == []
+
+
+def test_score_data_model_candidate() -> None:
+    def score(arguments: Any, errors: int = 0) -> float:
+        candidate = DataModelCandidate(
+            temperature=0.0, arguments=arguments, errors=["error"] * errors
+        )
+        return score_data_model_candidate(candidate, CONTEXT)
+
+    # all 4 columns mapped
+    assert score(VALID) == 1.0
+    # 2 of 4 columns mapped
+    assert score({**VALID, "nodes": INVALID["nodes"]}) == 0.5
+    assert score(VALID, errors=1) == 0.0
+    # a single node data model
+    assert score({"nodes": VALID["nodes"][:1], "relationships": []}) == -0.5
+    assert score(None) == float("-inf")
+    # malformed arguments do not raise
+    assert score({"nodes": "Person"}) == -1.0
+
+
+def _run_node(server: FakeOpenAIServer, **kwargs: Any) -> Dict[str, Any]:
+    async def run() -> Dict[str, Any]:
+        async with LLMClient.from_openai(
+            api_key="test", base_url=server.base_url
+        ) as client:
+            node = create_generate_data_model_single_source_node(client, "m", **kwargs)
+            return await node(STATE)  # type: ignore[arg-type]
+
+    return asyncio.run(run())
+
+
+def test_candidates_are_generated_concurrently() -> None:
+    # warm up the DataModel schema generation of instructor
+    with FakeOpenAIServer(VALID) as server:
+        _run_node(server)
+
+    # only one of the candidates is valid
+    with FakeOpenAIServer(
+        lambda request: VALID if request == 1 else INVALID, latency=lambda r: 0.3
+    ) as server:
+        start = time.perf_counter()
+        res = _run_node(server, candidate_temperatures=[0.0, 0.5, 1.0])
+        elapsed = time.perf_counter() - start
+
+    # a single attempt per candidate, in one round-trip instead of three
+    assert server.requests == 3
+    assert elapsed < 0.6
+    assert res["next_data_modeler_action"] == "__end__"
+    assert res["errors"] == []
+    assert (
+        res["data_model"].model_dump()
+        == validate_data_model_candidate(VALID, CONTEXT)[0].model_dump()
+    )
+
+
+def test_invalid_candidates_go_to_the_error_handler() -> None:
+    with FakeOpenAIServer(INVALID) as server:
+        res = _run_node(server, candidate_temperatures=[0.0, 1.0])
+
+    assert server.requests == 2
+    assert res["next_data_modeler_action"] == "data_modeler_error_handler"
+    assert res["errors"] == validate_data_model_candidate(INVALID, CONTEXT)[1]
+    assert all(isinstance(n, Node) for n in res["data_model"].nodes)
@@ -0,0 +1,94 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from graph_data_modeler_agent.components.data_model_updater.brainstorm_updates.models import (
+    DataModelUpdaterBrainstormResponse,
+)
+from graph_data_modeler_agent.components.data_model_updater.brainstorm_updates.prompts import (
+    create_brainstorm_updates_to_data_model_messages,
+)
+from graph_data_modeler_agent.components.data_model_updater.update_data_model.prompts import (
+    create_update_data_model_single_source_messages,
+)
+from graph_data_modeler_agent.components.data_modeler.generate_data_model.prompts import (
+    create_generate_data_model_single_source_messages,
+)
+from graph_data_modeler_agent.components.data_modeler.generate_nodes.prompts import (
+    create_generate_nodes_single_source_messages,
+)
+from graph_data_modeler_agent.components.prompts import (
+    SYSTEM_MESSAGE,
+    assemble_messages,
+    create_table_context_sections,
+)
+from graph_data_modeler_agent.data_dictionary.column import Column
+from graph_data_modeler_agent.data_dictionary.table_schema import TableSchema
+from graph_data_modeler_agent.data_model.core import DataModel
+from graph_data_modeler_agent.data_model.core.node import Nodes
+from graph_data_modeler_agent.llm import LLMClient
+from tests.unit.checkpointing.test_checkpointing import DISCOVERY
+from tests.unit.components.test_generate_data_model_candidates import CONTEXT
+from tests.unit.data_model.core.test_data_model import good_nodes, good_relationships
+from tests.unit.llm.fake_llm import FakeOpenAIServer
+from tests.unit.llm.test_client import Answer
+
+PETS = pd.read_csv("tests/resources/data/pets.csv")
+TABLE = TableSchema(
+    name="pets.csv",
+    columns=[
+        Column(name=c, description=f"The {c.replace('_', ' ')} of a person or pet.")
+        for c in PETS.columns
+    ],
+)
+STATE: Dict[str, Any] = {
+    "table_schema": TABLE,
+    "use_cases": ["Which pets live in Chicago?", "Which toys does each pet have?"],
+    "discovery": DISCOVERY,
+    "initial_nodes": Nodes(nodes=good_nodes),
+    "data_model": DataModel(nodes=good_nodes, relationships=good_relationships),
+    "possible_updates_to_data_model": DataModelUpdaterBrainstormResponse(
+        column_to_node_mappings=[
+            {"column_name": "toy", "node_label": "Toy", "reason": "toys"}
+        ]
+    ),
+}
+
+
+def _prompts() -> List[List[Dict[str, str]]]:
+    return [
+        create_generate_nodes_single_source_messages(STATE, CONTEXT),  # type: ignore[arg-type]
+        create_generate_data_model_single_source_messages(STATE, CONTEXT),  # type: ignore[arg-type]
+        create_brainstorm_updates_to_data_model_messages(STATE, CONTEXT),  # type: ignore[arg-type]
+        create_update_data_model_single_source_messages(STATE, CONTEXT),  # type: ignore[arg-type]
+    ]
+
+
+def test_prompts_share_the_table_context_prefix() -> None:
+    table_context = assemble_messages(
+        create_table_context_sections(TABLE, STATE["use_cases"], DISCOVERY.summary),
+        task="",
+        sections=[],
+        closing="",
+    )[1]["content"].rstrip()
+
+    for messages in _prompts():
+        assert messages[0] == {"role": "system", "content": SYSTEM_MESSAGE}
+        assert messages[1]["content"].startswith(table_context)
+
+
+def test_prompts_hit_the_prompt_cache() -> None:
+    async def run(base_url: str) -> LLMClient:
+        async with LLMClient.from_openai(api_key="test", base_url=base_url) as client:
+            for messages in _prompts():
+                await client.create(model="m", response_model=Answer, messages=messages)
+            return client
+
+    with FakeOpenAIServer({"value": 1}) as server:
+        client = asyncio.run(run(server.base_url))
+
+    # every prompt after the first reuses at least the system message and table context
+    table_context_tokens = server.prompts[0].index("---") // 4
+    assert client.stats.cached_prompt_tokens >= 3 * table_context_tokens
+    assert client.stats.cached_token_ratio > 0.2
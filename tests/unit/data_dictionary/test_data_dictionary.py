@@ -1,6 +1,9 @@
 from typing import Any, Dict
 
+import pytest
+
 from graph_data_modeler_agent.data_dictionary.data_dictionary import DataDictionary
+from graph_data_modeler_agent.data_dictionary.table_schema import TableSchema
 
 table_a = {
     "name": "table_a",
@@ -48,3 +51,106 @@ def test_is_multifile_false(validation_info_context: Dict[str, Any]) -> None:
     )
 
     assert not dd.is_multifile
+
+
+def test_get_table_schema(validation_info_context: Dict[str, Any]) -> None:
+    dd = DataDictionary.model_validate(
+        {"table_schemas": [table_a, table_b]}, context=validation_info_context
+    )
+
+    assert dd.get_table_schema("table_b").name == "table_b"
+    with pytest.raises(KeyError):
+        dd.get_table_schema("table_z")
+
+
+def test_alias_and_column_lookups() -> None:
+    dd = DataDictionary.model_validate(
+        {
+            "table_schemas": [
+                table_a,
+                {
+                    "name": "table_c",
+                    "columns": [
+                        {"name": "col_c", "primary_key": True},
+                        {"name": "col_b", "aliases": ["col_a"]},
+                    ],
+                },
+            ]
+        }
+    )
+
+    assert dd.get_tables_with_column("col_b") == ["table_a", "table_c"]
+    assert dd.get_tables_with_column("col_z") == []
+    assert dd.get_alias_owners("col_a") == [("table_c", "col_b")]
+    assert dd.get_alias_owners("col_z") == []
+
+
+def test_foreign_key_graph() -> None:
+    dd = DataDictionary.model_validate(
+        {
+            "table_schemas": [
+                table_a,
+                {
+                    "name": "table_b",
+                    "columns": [
+                        {"name": "col_c", "primary_key": True},
+                        {
+                            "name": "col_a_alias",
+                            "foreign_key": True,
+                            "aliases": ["col_a"],
+                        },
+                    ],
+                },
+                {
+                    "name": "table_c",
+                    "columns": [
+                        {"name": "col_d", "primary_key": True},
+                        {"name": "col_a", "foreign_key": True},
+                        {"name": "col_c", "foreign_key": True},
+                    ],
+                },
+            ]
+        }
+    )
+
+    assert dd.foreign_key_graph == {
+        "table_a": [],
+        "table_b": ["table_a"],
+        "table_c": ["table_a", "table_b"],
+    }
+
+
+def test_index_reflects_added_table(validation_info_context: Dict[str, Any]) -> None:
+    dd = DataDictionary.model_validate(
+        {"table_schemas": [table_a]}, context=validation_info_context
+    )
+    assert dd.get_tables_with_column("col_c") == []
+
+    dd.table_schemas.append(TableSchema.model_validate(table_b))
+
+    assert dd.get_tables_with_column("col_c") == ["table_b"]
+
+
+def test_index_reflects_in_place_alias_change(
+    validation_info_context: Dict[str, Any],
+) -> None:
+    dd = DataDictionary.model_validate(
+        {"table_schemas": [table_a, table_b]}, context=validation_info_context
+    )
+    dd.table_schemas[0].columns[1].aliases = list()
+    assert dd.get_alias_owners("col_c") == []
+
+    dd.table_schemas[0].columns[1].aliases.append("col_c")
+
+    assert dd.get_alias_owners("col_c") == [("table_a", "col_b")]
+
+
+def test_index_excluded_from_equality(validation_info_context: Dict[str, Any]) -> None:
+    dd = DataDictionary.model_validate(
+        {"table_schemas": [table_a, table_b]}, context=validation_info_context
+    )
+    other = dd.model_copy(deep=True)
+    dd.get_tables_with_column("col_a")
+    dd.table_schemas[0].name = "table_a"
+
+    assert dd == other
@@ -1,5 +1,14 @@
+import json
+import os
+
+import pytest
+import yaml
+
+from graph_data_modeler_agent.data_dictionary.data_dictionary import DataDictionary
 from graph_data_modeler_agent.data_dictionary.utils import (
+    load_data_dictionary,
     load_data_dictionary_from_compact_python_dictionary,
+    load_data_dictionary_from_json,
     load_data_dictionary_from_yaml,
     load_table_schema_from_compact_python_dictionary,
     get_dictionary_depth,
@@ -114,3 +123,84 @@ def test_get_dictionary_depth_equals_3() -> None:
     d = {"a": {"c": {"d": "e"}}, "1": {"2": {"3": "4"}}}
 
     assert get_dictionary_depth(d) == 3
+
+
+def test_json_matches_yaml(tmp_path) -> None:
+    yaml_path = "tests/resources/configs/data_dictionary_multi.yaml"
+    json_path = os.path.join(tmp_path, "data_dictionary_multi.json")
+    with open(yaml_path) as f:
+        contents = yaml.safe_load(f)
+    with open(json_path, "w") as f:
+        json.dump(contents, f)
+
+    assert load_data_dictionary_from_json(json_path) == load_data_dictionary_from_yaml(
+        yaml_path
+    )
+    assert load_data_dictionary(json_path) == load_data_dictionary(yaml_path)
+
+
+def test_load_data_dictionary_unsupported_extension() -> None:
+    with pytest.raises(ValueError):
+        load_data_dictionary("data_dictionary.txt")
+
+
+def test_yaml_aliases_list(tmp_path) -> None:
+    path = os.path.join(tmp_path, "dd.yaml")
+    with open(path, "w") as f:
+        yaml.safe_dump(
+            {
+                "files": [
+                    {"name": "a.csv", "columns": [{"name": "col_a"}]},
+                    {
+                        "name": "b.csv",
+                        "columns": [{"name": "col_b", "aliases": ["col_a", "a"]}],
+                    },
+                ]
+            },
+            f,
+        )
+
+    dd = load_data_dictionary_from_yaml(path)
+
+    assert dd.get_alias_owners("col_a") == [("b.csv", "col_b")]
+
+
+def test_load_data_dictionary_cache(tmp_path, mocker) -> None:
+    path = os.path.join(tmp_path, "dd.yaml")
+    cache_dir = os.path.join(tmp_path, "cache")
+    with open("tests/resources/configs/data_dictionary_multi.yaml") as f:
+        contents = f.read()
+    with open(path, "w") as f:
+        f.write(contents)
+
+    validate = mocker.spy(DataDictionary, "model_validate")
+
+    first = load_data_dictionary(path, cache_dir=cache_dir)
+    second = load_data_dictionary(path, cache_dir=cache_dir)
+    assert first == second
+    assert validate.call_count == 1
+
+    # unchanged content with a new modification time reuses the cache
+    os.utime(path, ns=(0, 0))
+    load_data_dictionary(path, cache_dir=cache_dir)
+    assert validate.call_count == 1
+
+    with open(path, "w") as f:
+        f.write(contents.replace("column d", "column d updated"))
+    updated = load_data_dictionary(path, cache_dir=cache_dir)
+    assert validate.call_count == 2
+    assert updated.get_table_schema("b.csv").get_description("col_d") == (
+        "column d updated"
+    )
+
+
+def test_load_data_dictionary_corrupt_cache(tmp_path) -> None:
+    path = "tests/resources/configs/data_dictionary_single.yaml"
+    cache_dir = os.path.join(tmp_path, "cache")
+    load_data_dictionary(path, cache_dir=cache_dir)
+
+    for file_name in os.listdir(cache_dir):
+        with open(os.path.join(cache_dir, file_name), "wb") as f:
+            f.write(b"not a pickle")
+
+    assert load_data_dictionary(path, cache_dir=cache_dir) == load_data_dictionary(path)
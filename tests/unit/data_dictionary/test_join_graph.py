@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+from graph_data_modeler_agent.components.input_validator.node import (
+    create_input_validator_node,
+)
+from graph_data_modeler_agent.data_dictionary.data_dictionary import DataDictionary
+from graph_data_modeler_agent.data_dictionary.join_graph import (
+    build_join_graph,
+    split_data_dictionary_by_component,
+)
+
+
+@pytest.fixture(scope="function")
+def store_data_dictionary() -> DataDictionary:
+    return DataDictionary.model_validate(
+        {
+            "table_schemas": [
+                {
+                    "name": "customers",
+                    "columns": [
+                        {"name": "customer_id", "primary_key": True},
+                        {"name": "customer_name"},
+                    ],
+                },
+                {
+                    "name": "products",
+                    "columns": [
+                        {"name": "product_id", "primary_key": True},
+                        {"name": "product_name"},
+                    ],
+                },
+                {
+                    "name": "orders",
+                    "columns": [
+                        {"name": "order_id", "primary_key": True},
+                        {"name": "customer_id", "foreign_key": True},
+                        {"name": "order_date"},
+                    ],
+                },
+                {
+                    "name": "order_items",
+                    "columns": [
+                        {"name": "order_id", "foreign_key": True},
+                        {
+                            "name": "item_product",
+                            "foreign_key": True,
+                            "aliases": ["product_id"],
+                        },
+                        {"name": "quantity"},
+                    ],
+                },
+                {
+                    "name": "reviews",
+                    "columns": [
+                        {"name": "review_id", "primary_key": True},
+                        {"name": "reviewer", "aliases": ["customer_id"]},
+                    ],
+                },
+                {
+                    "name": "employees",
+                    "columns": [
+                        {"name": "employee_id", "primary_key": True},
+                        {"name": "employee_name"},
+                    ],
+                },
+            ]
+        }
+    )
+
+
+def test_build_join_graph_edges(store_data_dictionary: DataDictionary) -> None:
+    join_graph = build_join_graph(store_data_dictionary)
+
+    edges = {
+        (e.source_table, e.source_column, e.target_table, e.target_column, e.kind)
+        for e in join_graph.edges
+    }
+
+    assert edges == {
+        ("orders", "customer_id", "customers", "customer_id", "foreign_key"),
+        ("order_items", "order_id", "orders", "order_id", "foreign_key"),
+        ("order_items", "item_product", "products", "product_id", "foreign_key"),
+        ("reviews", "reviewer", "customers", "customer_id", "alias"),
+        ("reviews", "reviewer", "orders", "customer_id", "alias"),
+    }
+
+
+def test_build_join_graph_components(store_data_dictionary: DataDictionary) -> None:
+    join_graph = build_join_graph(store_data_dictionary)
+
+    assert join_graph.components == [
+        ["customers", "products", "orders", "order_items", "reviews"],
+        ["employees"],
+    ]
+    assert join_graph.get_component("employees") == ["employees"]
+    with pytest.raises(KeyError):
+        join_graph.get_component("missing")
+
+
+def test_build_join_graph_hubs_and_junctions(
+    store_data_dictionary: DataDictionary,
+) -> None:
+    join_graph = build_join_graph(store_data_dictionary)
+
+    assert join_graph.hub_tables == ["orders"]
+    assert join_graph.junction_tables == ["order_items"]
+
+
+def test_build_join_graph_candidate_relationships(
+    store_data_dictionary: DataDictionary,
+) -> None:
+    join_graph = build_join_graph(store_data_dictionary)
+
+    rels = {
+        (r.source_table, r.target_table, r.cardinality, r.junction_table)
+        for r in join_graph.candidate_relationships
+    }
+
+    assert ("orders", "customers", "many_to_one", None) in rels
+    assert ("reviews", "customers", "many_to_one", None) in rels
+    assert ("reviews", "orders", "unknown", None) in rels
+    assert ("orders", "products", "many_to_many", "order_items") in rels
+    # junction table joins are replaced by the many to many relationship
+    assert not any(r[0] == "order_items" for r in rels)
+
+    formatted = join_graph.format_candidate_relationships(["orders", "products"])
+    assert formatted == (
+        "* (orders)-[many_to_many]->(products) via order_items joined on "
+        "orders.order_id = order_items.order_id = order_items.item_product = products.product_id"
+    )
+    assert (
+        join_graph.format_candidate_relationships(["employees"])
+        == "No candidate relationships found."
+    )
+
+
+def test_split_data_dictionary_by_component(
+    store_data_dictionary: DataDictionary,
+) -> None:
+    res = split_data_dictionary_by_component(store_data_dictionary)
+
+    assert [len(dd.table_schemas) for dd in res] == [5, 1]
+    assert res[1].table_schemas[0].name == "employees"
+
+
+def test_input_validator_builds_join_graph(
+    store_data_dictionary: DataDictionary,
+) -> None:
+    input_validator = create_input_validator_node()
+
+    state = {"data_dictionary": store_data_dictionary.model_dump()}
+    res = asyncio.run(input_validator(state))  # type: ignore[arg-type]
+
+    assert res["next_action"] == "discovery"
+    assert res["join_graph"] == build_join_graph(store_data_dictionary)
@@ -115,3 +115,103 @@ def test_get_column_not_exists() -> None:
     )
 
     assert ts.get_column("error") is None
+
+
+def test_index_lookups() -> None:
+    ts = TableSchema(
+        name="table_a",
+        columns=[
+            Column(name="col_a", primary_key=True, description="a"),
+            Column(name="col_b", foreign_key=True),
+        ],
+    )
+
+    assert ts.has_column("col_a")
+    assert not ts.has_column("col_z")
+    assert ts.get_description("col_a") == "a"
+    assert ts.get_description("col_z") == ""
+    assert ts.primary_key is not None and ts.primary_key.name == "col_a"
+    assert [c.name for c in ts.foreign_keys] == ["col_b"]
+
+
+def test_get_descriptions() -> None:
+    ts = TableSchema(
+        name="table_a",
+        columns=[Column(name="col_a", description="a"), Column(name="col_b")],
+    )
+
+    assert ts.get_descriptions() == {"col_a": "a", "col_b": ""}
+    assert ts.get_descriptions(["col_b", "col_z"]) == {"col_b": "", "col_z": ""}
+
+
+def test_index_reflects_mutation() -> None:
+    ts = TableSchema(name="table_a", columns=[Column(name="col_a")])
+    assert ts.column_names == ["col_a"]
+
+    ts.columns.append(Column(name="col_b"))
+    assert ts.has_column("col_b")
+
+    ts.columns[0].name = "renamed"
+    assert ts.column_names == ["renamed", "col_b"]
+    assert not ts.has_column("col_a")
+
+    ts.columns[1] = Column(name="col_d")
+    assert ts.column_names == ["renamed", "col_d"]
+
+    ts.columns = [Column(name="col_c")]
+    assert ts.column_names == ["col_c"]
+
+    ts.columns.insert(0, Column(name="col_e"))
+    assert ts.column_names == ["col_e", "col_c"]
+
+    del ts.columns[1]
+    assert ts.column_names == ["col_e"]
+
+
+def test_index_returns_copies() -> None:
+    ts = TableSchema(name="table_a", columns=[Column(name="col_a")])
+
+    ts.column_names.append("col_b")
+    ts.columns_dict.pop("col_a")
+
+    assert ts.column_names == ["col_a"]
+    assert ts.has_column("col_a")
+
+
+def test_index_kept_when_other_tables_change() -> None:
+    ts = TableSchema(name="table_a", columns=[Column(name="col_a")])
+    index = ts.index
+
+    TableSchema(name="table_b", columns=[Column(name="col_b")]).columns[0].name = "x"
+
+    assert ts.index is index
+    assert ts == TableSchema(name="table_a", columns=[Column(name="col_a")])
+
+
+def test_index_reflects_mutation_of_copies() -> None:
+    ts = TableSchema(name="table_a", columns=[Column(name="col_a")])
+    assert ts.column_names == ["col_a"]
+
+    copied = ts.model_copy(deep=True)
+    copied.columns[0].name = "renamed"
+    updated = ts.model_copy(update={"columns": [Column(name="col_b")]})
+
+    assert copied.column_names == ["renamed"]
+    assert updated.column_names == ["col_b"]
+    assert ts.column_names == ["col_a"]
+
+
+def test_index_reflects_in_place_mutation_of_copies() -> None:
+    ts = TableSchema(name="table_a", columns=[Column(name="col_a")])
+    assert ts.column_names == ["col_a"]
+
+    copied = ts.model_copy(deep=True)
+    copied.columns.append(Column(name="col_b"))
+    shallow = ts.model_copy()
+    assert shallow.column_names == ["col_a"]
+    # a shallow copy shares the column list with the original
+    shallow.columns.append(Column(name="col_c"))
+
+    assert copied.column_names == ["col_a", "col_b"]
+    assert shallow.column_names == ["col_a", "col_c"]
+    assert ts.column_names == ["col_a", "col_c"]
@@ -145,6 +145,37 @@ def test_to_dict() -> None:
     ]
 
 
+def test_get_schema() -> None:
+    test_model = DataModel(nodes=good_nodes[:2], relationships=good_relationships[:1])
+
+    assert test_model.get_schema(verbose=False) == (
+        "Nodes\n"
+        "(:Person)\n* name: STRING\n* age: STRING\n"
+        "(:Address)\n* street: STRING\n* city: STRING\n"
+        "\nRelationships\n"
+        "(:Person)-[:HAS_ADDRESS]->(:Address)\n"
+        "\n"
+    )
+
+
+def test_get_schema_reflects_mutation() -> None:
+    test_model = DataModel(
+        nodes=[n.model_copy(deep=True) for n in good_nodes],
+        relationships=good_relationships,
+    )
+    before = test_model.get_schema()
+
+    test_model.nodes[0].properties[1].name = "yearsOld"
+    test_model.nodes[0].properties.append(
+        Property(name="nickname", type="STRING", column_mapping="nickname")
+    )
+    after = test_model.get_schema()
+
+    assert before != after
+    assert "* yearsOld (age): STRING\n" in after
+    assert "* nickname (nickname): STRING\n" in after
+
+
 def test_neo4j_naming_conventions_used() -> None:
     """
     Test renaming labels, types and properties to Neo4j naming conventions.
@@ -329,3 +360,11 @@ def test_data_model_with_multi_csv_from_arrows() -> None:
 
 def test_data_model_with_multi_csv_from_solutions_workbench() -> None:
     pass
+
+
+def test_data_model_equality_after_get_schema() -> None:
+    data_model = DataModel(nodes=good_nodes, relationships=good_relationships)
+    other = data_model.model_copy(deep=True)
+    data_model.get_schema()
+
+    assert data_model == other
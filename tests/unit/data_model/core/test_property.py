@@ -79,6 +79,40 @@ class TestProperty(unittest.TestCase):
             p = Property(name="city", type="STRING", column_mapping="city", is_key=False)
             self.assertEqual(p.type, "STRING")
 
+    def test_get_schema(self) -> None:
+        p = Property(name="name", type="STRING", column_mapping="name", is_key=True)
+
+        self.assertEqual(p.get_schema(), "name (name): STRING | KEY")
+        self.assertEqual(p.get_schema(verbose=False), "name: STRING")
+
+    def test_get_schema_cache_invalidated_on_mutation(self) -> None:
+        p = Property(name="name", type="STRING", column_mapping="name", is_key=True)
+        p.get_schema()
+
+        p.is_key = False
+        self.assertEqual(p.get_schema(), "name (name): STRING")
+
+        p.column_mapping = "first_name"
+        self.assertEqual(p.get_schema(), "name (first_name): STRING")
+
+    def test_get_schema_cache_invalidated_on_model_copy(self) -> None:
+        p = Property(name="name", type="STRING", column_mapping="name", is_key=True)
+        p.get_schema()
+
+        copied = p.model_copy(update={"type": "INTEGER"})
+
+        self.assertEqual(copied.get_schema(), "name (name): INTEGER | KEY")
+        self.assertEqual(p.get_schema(), "name (name): STRING | KEY")
+
+    def test_get_schema_cache_excluded_from_equality(self) -> None:
+        p = Property(name="name", type="STRING", column_mapping="name", is_key=True)
+        other = p.model_copy()
+        p.get_schema()
+        p.is_key = True
+
+        self.assertEqual(p, other)
+        self.assertNotEqual(p, other.model_copy(update={"is_key": False}))
+
     @patch('graph_data_modeler_agent.data_model.core.property.Property.from_arrows')
     def test_parse_arrows_property(self, mock_from_arrows) -> None:
         """
@@ -0,0 +1,127 @@
+import xml.dom.minidom
+
+import numpy as np
+import pytest
+
+from graph_data_modeler_agent.data_model.core import (
+    DataModel,
+    Node,
+    Property,
+    Relationship,
+)
+from graph_data_modeler_agent.data_model.core.svg_visualization import (
+    compute_layout,
+    render_html,
+    render_svg,
+)
+
+nodes = [
+    Node(
+        label=label,
+        properties=[
+            Property(
+                name="id",
+                type="STRING",
+                column_mapping=f"{label.lower()}_id",
+                is_key=True,
+            ),
+            Property(
+                name="name", type="STRING", column_mapping=f"{label.lower()}_name"
+            ),
+        ],
+        source_name="file.csv",
+    )
+    for label in ["Person", "Pet", "Toy", "Shelter"]
+]
+relationships = [
+    Relationship(type="HAS_PET", source="Person", target="Pet"),
+    Relationship(type="PLAYS_WITH", source="Pet", target="Toy"),
+    Relationship(type="LIVES_IN", source="Pet", target="Shelter"),
+    Relationship(type="KNOWS", source="Person", target="Person"),
+]
+
+
+@pytest.mark.parametrize("layout", ["force", "layered"])
+def test_compute_layout_shape(layout: str) -> None:
+    positions = compute_layout(nodes, relationships, layout=layout, iterations=20)
+
+    assert positions.shape == (4, 2)
+    assert np.isfinite(positions).all()
+    # no two nodes share a position
+    assert len({tuple(p) for p in positions.round(6)}) == 4
+
+
+def test_compute_layout_deterministic() -> None:
+    a = compute_layout(nodes, relationships, layout="force", seed=7, iterations=20)
+    b = compute_layout(nodes, relationships, layout="force", seed=7, iterations=20)
+
+    assert np.array_equal(a, b)
+
+
+def test_layered_layout_follows_relationship_direction() -> None:
+    positions = compute_layout(nodes, relationships, layout="layered")
+
+    assert positions[0, 1] < positions[1, 1] < positions[2, 1]
+    assert positions[2, 1] == positions[3, 1]
+
+
+def test_compute_layout_bad_layout() -> None:
+    with pytest.raises(ValueError):
+        compute_layout(nodes, relationships, layout="circle")
+
+
+def test_compute_layout_empty() -> None:
+    assert compute_layout([], [], layout="force").shape == (0, 2)
+    assert compute_layout([], [], layout="layered").shape == (0, 2)
+
+
+def test_render_svg_is_valid_xml() -> None:
+    svg = render_svg(nodes, relationships, detail_level=3, iterations=20)
+
+    doc = xml.dom.minidom.parseString(svg)
+
+    assert doc.documentElement.tagName == "svg"
+    assert svg.count('class="node"') == 4
+    assert svg.count('class="relationship"') == 4
+    assert "(:Person)" in svg
+    assert "[:HAS_PET]" in svg
+    assert "id (person_id): STRING | KEY" in svg
+
+
+def test_render_svg_detail_level_1() -> None:
+    svg = render_svg(nodes, relationships, detail_level=1, iterations=20)
+
+    assert "(:Person)" in svg
+    assert "person_id" not in svg
+
+
+def test_render_svg_escapes_text() -> None:
+    node = Node(
+        label="A",
+        properties=[
+            Property(name="x", type="STRING", column_mapping="<x&y>", is_key=True)
+        ],
+        source_name="file.csv",
+    )
+
+    svg = render_svg([node], [], iterations=5)
+
+    xml.dom.minidom.parseString(svg)
+    assert "&lt;x&amp;y&gt;" in svg
+
+
+def test_render_html() -> None:
+    html = render_html(nodes, relationships, layout="layered", title="Pets")
+
+    assert html.startswith("<!DOCTYPE html>")
+    assert "<title>Pets</title>" in html
+    assert "<svg" in html
+
+
+def test_data_model_to_svg(tmp_path) -> None:
+    data_model = DataModel(nodes=nodes[:2], relationships=relationships[:1])
+    file_path = tmp_path / "data-model.svg"
+
+    svg = data_model.to_svg(file_path=str(file_path), layout="layered")
+
+    assert file_path.read_text() == svg
@@ -0,0 +1,128 @@
+from graph_data_modeler_agent.data_model.core import (
+    DataModel,
+    Node,
+    Property,
+    Relationship,
+)
+from graph_data_modeler_agent.data_model.core.visualization import (
+    clear_render_cache,
+    create_dot,
+    format_node,
+    format_relationship,
+)
+
+
+def _make_node(label: str, source_name: str, num_props: int = 3) -> Node:
+    return Node(
+        label=label,
+        properties=[
+            Property(
+                name=f"{label.lower()}Prop{i}",
+                type="STRING",
+                column_mapping=f"{label.lower()}_prop_{i}",
+                is_key=i == num_props - 1,
+            )
+            for i in range(num_props)
+        ],
+        source_name=source_name,
+    )
+
+
+def test_format_node() -> None:
+    node = _make_node("Person", "people.csv", num_props=2)
+
+    assert format_node(node, detail_level=1) == "\n(:Person)\n "
+    assert (
+        format_node(node, detail_level=2)
+        == "(:Person)\n* personProp0: STRING\\l* personProp1: STRING\\l"
+    )
+    assert (
+        format_node(node, detail_level=3)
+        == "(:Person)\n* personProp0 (person_prop_0): STRING\\l* personProp1 (person_prop_1): STRING | KEY\\l"
+    )
+
+
+def test_format_node_without_properties() -> None:
+    node = Node.model_construct(label="Person", properties=[], source_name="a.csv")
+
+    assert format_node(node, detail_level=3) == "(:Person)\n"
+
+
+def test_format_node_reflects_mutation() -> None:
+    node = _make_node("Person", "people.csv", num_props=2)
+    format_node(node, detail_level=2)
+
+    node.properties[0].name = "renamed"
+
+    assert "* renamed: STRING" in format_node(node, detail_level=2)
+
+
+def test_format_node_max_properties_keeps_keys() -> None:
+    node = _make_node("Person", "people.csv", num_props=5)
+
+    label = format_node(node, detail_level=2, max_properties=2)
+
+    assert "personProp4" in label
+    assert "personProp0" in label
+    assert "personProp1" not in label
+    assert "* ... 3 more properties" in label
+
+
+def test_format_relationship() -> None:
+    rel = Relationship(
+        type="KNOWS",
+        source="Person",
+        target="Person",
+        properties=[Property(name="since", type="INTEGER", column_mapping="since")],
+    )
+
+    assert format_relationship(rel, detail_level=1) == "[:KNOWS]"
+    assert (
+        format_relationship(rel, detail_level=2) == "  [:KNOWS]  \n* since: INTEGER\\l"
+    )
+
+
+def test_create_dot_cluster_by_source() -> None:
+    nodes = [
+        _make_node("Person", "people.csv"),
+        _make_node("Pet", "pets.csv"),
+        _make_node("Toy", "pets.csv"),
+    ]
+    rels = [
+        Relationship(type="HAS_PET", source="Person", target="Pet"),
+        Relationship(type="PLAYS_WITH", source="Pet", target="Toy"),
+    ]
+
+    source = create_dot(nodes, rels, cluster_by_source=True).source
+
+    assert source.count("subgraph cluster_") == 2
+    assert 'label="people.csv"' in source
+    assert 'label="pets.csv"' in source
+    assert "Person -> Pet" in source
+
+
+def test_visualize_params() -> None:
+    nodes = [_make_node("Person", "people.csv"), _make_node("Pet", "pets.csv")]
+    rels = [Relationship(type="HAS_PET", source="Person", target="Pet")]
+    data_model = DataModel(nodes=nodes, relationships=rels)
+
+    source = data_model.visualize(
+        detail_level=2, cluster_by_source=True, max_properties=1
+    ).source
+
+    assert "subgraph cluster_" in source
+    assert "* ... 2 more properties" in source
+
+
+def test_render_cached_by_source(mocker) -> None:
+    clear_render_cache()
+    mock_pipe = mocker.patch("graphviz.Digraph.pipe", return_value=b"<svg/>")
+    nodes = [_make_node("Person", "people.csv"), _make_node("Pet", "pets.csv")]
+    rels = [Relationship(type="HAS_PET", source="Person", target="Pet")]
+
+    create_dot(nodes, rels).pipe(format="svg")
+    create_dot(nodes, rels).pipe(format="svg")
+    nodes[0].properties[0].name = "renamed"
+    create_dot(nodes, rels).pipe(format="svg")
+
+    assert mock_pipe.call_count == 2
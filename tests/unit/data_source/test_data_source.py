@@ -0,0 +1,125 @@
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graph_data_modeler_agent.data_source.data_source import DataSource, read_data
+
+DATA_DIR = "tests/resources/data"
+
+
+def test_infer_file_format() -> None:
+    assert DataSource(file_path="a/b.csv").file_format == "csv"
+    assert DataSource(file_path="a/b.JSONL").file_format == "jsonl"
+    assert DataSource(file_path="a/b.parquet").file_format == "parquet"
+    assert DataSource(file_path="a/b.data", file_format="json").file_format == "json"
+
+
+def test_infer_file_format_unknown_extension() -> None:
+    with pytest.raises(ValueError):
+        DataSource(file_path="a/b.data")
+
+
+def test_name() -> None:
+    assert DataSource(file_path=f"{DATA_DIR}/pets.csv").name == "pets.csv"
+
+
+def test_read_detects_delimiter() -> None:
+    piped = DataSource(file_path=f"{DATA_DIR}/pets-piped.csv").read()
+    comma = DataSource(file_path=f"{DATA_DIR}/pets.csv").read()
+
+    assert list(piped.columns) == list(comma.columns)
+    assert len(piped) == len(comma)
+
+
+def test_read_options() -> None:
+    df = DataSource(
+        file_path=f"{DATA_DIR}/pets-piped.csv",
+        read_options={"sep": "|", "usecols": ["name", "age"]},
+    ).read()
+
+    assert list(df.columns) == ["name", "age"]
+
+
+def test_read_formats_match() -> None:
+    csv_df = DataSource(file_path=f"{DATA_DIR}/pets.csv").read()
+    json_df = DataSource(file_path=f"{DATA_DIR}/pets.json").read()
+    jsonl_df = DataSource(file_path=f"{DATA_DIR}/pets.jsonl").read()
+
+    assert len(csv_df) == len(json_df) == len(jsonl_df)
+    assert set(json_df.columns) == set(jsonl_df.columns)
+
+
+@pytest.mark.parametrize("file_name", ["pets.csv", "pets.json", "pets.jsonl"])
+def test_iter_chunks(file_name: str) -> None:
+    source = DataSource(file_path=f"{DATA_DIR}/{file_name}")
+
+    chunks = list(source.iter_chunks(chunk_size=4))
+
+    assert all(len(c) <= 4 for c in chunks)
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks).reset_index(drop=True), source.read()
+    )
+
+
+def test_empty_file() -> None:
+    source = DataSource(file_path=f"{DATA_DIR}/test_dir/a.csv")
+
+    assert source.read().empty
+    assert list(source.iter_chunks()) == []
+    assert source.head().empty
+    assert source.sample(10).empty
+
+
+def test_head() -> None:
+    source = DataSource(file_path=f"{DATA_DIR}/pets.csv")
+
+    pd.testing.assert_frame_equal(source.head(3), source.read().head(3))
+
+
+def test_sample(tmp_path) -> None:
+    path = os.path.join(tmp_path, "numbers.csv")
+    pd.DataFrame({"n": np.arange(10_000)}).to_csv(path, index=False)
+    source = DataSource(file_path=path)
+
+    sample = source.sample(n=500, chunk_size=1_000)
+
+    assert len(sample) == 500
+    assert sample["n"].is_unique
+    assert sample["n"].is_monotonic_increasing
+    # a uniform sample covers the whole file, not only the first chunks
+    assert sample["n"].max() > 9_000
+    pd.testing.assert_frame_equal(sample, source.sample(n=500, chunk_size=1_000))
+    assert len(source.sample(n=20_000)) == 10_000
+
+
+def test_pickle_is_light(tmp_path) -> None:
+    path = os.path.join(tmp_path, "numbers.csv")
+    pd.DataFrame({"n": np.arange(100_000)}).to_csv(path, index=False)
+    source = DataSource(file_path=path)
+    source.read()
+
+    assert len(pickle.dumps(source)) < 1_000
+    assert pickle.loads(pickle.dumps(source)) == source
+
+
+def test_read_data() -> None:
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    source = DataSource(file_path=f"{DATA_DIR}/pets.csv")
+
+    assert read_data(df) is df
+    assert read_data(df, sample_size=1) is df
+    assert len(read_data(source)) == len(source.read())
+    assert len(read_data(source, sample_size=2)) == 2
+
+
+def test_parquet(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    path = os.path.join(tmp_path, "numbers.parquet")
+    pd.DataFrame({"n": np.arange(1_000)}).to_parquet(path)
+    source = DataSource(file_path=path)
+
+    assert [len(c) for c in source.iter_chunks(chunk_size=400)] == [400, 400, 200]
+    assert len(source.read()) == 1_000
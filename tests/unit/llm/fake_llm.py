@@ -0,0 +1,176 @@
+"""Offline stand-ins of an LLM provider, to test latency and errors without network access."""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from graph_data_modeler_agent.llm.tokens import CHARACTERS_PER_TOKEN, estimate_tokens
+
+
+class FakeStatusError(Exception):
+    """An error with an HTTP status code, like the errors of the openai client."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+class FakeCompletions:
+    """
+    An in-process stand-in of `chat.completions`.
+    `latency` returns the seconds each call takes from its call number, starting at 0, and `fail` can raise to
+    simulate errors. Cancelled calls are counted in `cancelled`.
+    """
+
+    def __init__(
+        self,
+        response: Any,
+        latency: Callable[[int], float] = lambda call: 0.0,
+        fail: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        self.response = response
+        self.latency = latency
+        self.fail = fail
+        self.calls: List[Dict[str, Any]] = list()
+        self.cancelled = 0
+
+    async def create(self, **kwargs: Any) -> Any:
+        call = len(self.calls)
+        self.calls.append(kwargs)
+        try:
+            await asyncio.sleep(self.latency(call))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail is not None:
+            self.fail(call)
+        return self.response
+
+
+def fake_llm_client(completions: FakeCompletions) -> Any:
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+class FakeOpenAIServer:
+    """
+    A local HTTP server of the OpenAI chat completions API.
+    Each request responds with a tool call of the requested tool with `arguments`, or `arguments(request number)`,
+    after `latency(request number)` seconds. The client address of each request is recorded, so connection reuse can
+    be checked.
+    Prompt caching is simulated: the cached tokens of a request are the estimated tokens of the longest prefix its
+    messages share with a previous request.
+    """
+
+    def __init__(
+        self,
+        arguments: Union[Dict[str, Any], Callable[[int], Dict[str, Any]]],
+        latency: Callable[[int], float] = lambda request: 0.0,
+    ) -> None:
+        self.arguments = arguments
+        self.latency = latency
+        self.requests = 0
+        self.client_addresses: Set[Tuple[str, int]] = set()
+        self.prompts: List[str] = list()
+        self.lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self) -> Any:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                prompt = "".join(m.get("content") or "" for m in body["messages"])
+                with server.lock:
+                    request = server.requests
+                    server.requests += 1
+                    server.client_addresses.add(self.client_address)
+                    cached = max(
+                        [_common_prefix_length(prompt, p) for p in server.prompts],
+                        default=0,
+                    )
+                    server.prompts.append(prompt)
+                time.sleep(server.latency(request))
+                arguments = (
+                    server.arguments(request)
+                    if callable(server.arguments)
+                    else server.arguments
+                )
+
+                response = json.dumps(
+                    {
+                        "id": f"chatcmpl-{request}",
+                        "object": "chat.completion",
+                        "created": 0,
+                        "model": body["model"],
+                        "choices": [
+                            {
+                                "index": 0,
+                                "finish_reason": "stop",
+                                "message": {
+                                    "role": "assistant",
+                                    "content": None,
+                                    "tool_calls": [
+                                        {
+                                            "id": f"call_{request}",
+                                            "type": "function",
+                                            "function": {
+                                                "name": body["tools"][0]["function"][
+                                                    "name"
+                                                ],
+                                                "arguments": json.dumps(arguments),
+                                            },
+                                        }
+                                    ],
+                                },
+                            }
+                        ],
+                        "usage": {
+                            "prompt_tokens": estimate_tokens(prompt),
+                            "prompt_tokens_details": {
+                                "cached_tokens": cached // CHARACTERS_PER_TOKEN
+                            },
+                            "completion_tokens": 1,
+                            "total_tokens": estimate_tokens(prompt) + 1,
+                        },
+                    }
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                try:
+                    self.wfile.write(response)
+                except (BrokenPipeError, ConnectionResetError):
+                    # the client cancelled the request
+                    pass
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return None
+
+        return Handler
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    return len(os.path.commonprefix([a, b]))
@@ -0,0 +1,258 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+from pydantic import BaseModel
+
+from graph_data_modeler_agent.agents.single_source_input import (
+    create_discovery_and_modeling_agent,
+)
+from graph_data_modeler_agent.llm import (
+    LLMClient,
+    LLMClientStats,
+    as_llm_client,
+    is_transient_llm_error,
+    prompt_token_usage,
+)
+from tests.unit.llm.fake_llm import (
+    FakeCompletions,
+    FakeOpenAIServer,
+    FakeStatusError,
+    fake_llm_client,
+)
+
+
+class Answer(BaseModel):
+    value: int
+
+
+ANSWER = Answer(value=1)
+MESSAGES = [{"role": "user", "content": "Answer."}]
+
+
+def _create(client: LLMClient, **kwargs: Any) -> Any:
+    return asyncio.run(
+        client.create(model="m", response_model=Answer, messages=MESSAGES, **kwargs)
+    )
+
+
+def test_create_passes_arguments() -> None:
+    completions = FakeCompletions(ANSWER)
+    client = LLMClient(fake_llm_client(completions))
+
+    assert _create(client, max_retries=3, context={"a": 1}) == ANSWER
+    assert completions.calls == [
+        {
+            "model": "m",
+            "response_model": Answer,
+            "messages": MESSAGES,
+            "max_retries": 3,
+            "context": {"a": 1},
+        }
+    ]
+
+
+def test_transient_errors_are_retried() -> None:
+    def fail(call: int) -> None:
+        if call < 2:
+            raise FakeStatusError(503)
+
+    completions = FakeCompletions(ANSWER, fail=fail)
+    client = LLMClient(fake_llm_client(completions), retry_delay=0.001)
+
+    assert _create(client) == ANSWER
+    assert len(completions.calls) == 3
+    assert client.stats.retries == 2
+
+
+def test_other_errors_are_not_retried() -> None:
+    def fail(call: int) -> None:
+        raise FakeStatusError(400)
+
+    completions = FakeCompletions(ANSWER, fail=fail)
+    client = LLMClient(fake_llm_client(completions), retry_delay=0.001)
+
+    with pytest.raises(FakeStatusError):
+        _create(client)
+    assert len(completions.calls) == 1
+
+
+def test_timeouts_are_retried() -> None:
+    completions = FakeCompletions(
+        ANSWER, latency=lambda call: 1.0 if call == 0 else 0.0
+    )
+    client = LLMClient(fake_llm_client(completions), timeout=0.05, retry_delay=0.001)
+
+    assert _create(client) == ANSWER
+    assert completions.cancelled == 1
+    assert client.stats.retries == 1
+
+
+def test_timeouts_raise_after_max_retries() -> None:
+    completions = FakeCompletions(ANSWER, latency=lambda call: 1.0)
+    client = LLMClient(
+        fake_llm_client(completions), timeout=0.01, max_retries=1, retry_delay=0.001
+    )
+
+    with pytest.raises(asyncio.TimeoutError):
+        _create(client)
+    assert len(completions.calls) == 2
+
+
+def test_hedging_cuts_tail_latency() -> None:
+    # every 10th call is slow, so its hedged request, the next call, is fast
+    completions = FakeCompletions(
+        ANSWER, latency=lambda call: 0.5 if call % 10 == 9 else 0.01
+    )
+    client = LLMClient(fake_llm_client(completions), hedge=True, min_latency_samples=5)
+
+    async def run() -> List[float]:
+        loop = asyncio.get_running_loop()
+        latencies = list()
+        for _ in range(30):
+            start = loop.time()
+            await client.create(model="m", response_model=Answer, messages=MESSAGES)
+            latencies.append(loop.time() - start)
+        return latencies
+
+    assert max(asyncio.run(run())) < 0.2
+    assert client.stats.hedges >= 3
+    assert client.stats.hedge_wins == client.stats.hedges
+    assert completions.cancelled == client.stats.hedges
+
+
+def test_no_hedging_before_budget_is_known() -> None:
+    completions = FakeCompletions(ANSWER, latency=lambda call: 0.05)
+    client = LLMClient(fake_llm_client(completions), hedge=True)
+
+    _create(client)
+
+    assert client.latency_budget("m") is None
+    assert client.stats.hedges == 0
+
+
+def test_hedge_after_fixed_budget_uses_first_response() -> None:
+    # the hedged request fails, so the slow first request's response is used
+    def fail(call: int) -> None:
+        if call == 1:
+            raise FakeStatusError(400)
+
+    completions = FakeCompletions(
+        ANSWER, latency=lambda call: 0.1 if call == 0 else 0.0, fail=fail
+    )
+    client = LLMClient(fake_llm_client(completions), hedge=True, hedge_after=0.01)
+
+    assert _create(client) == ANSWER
+    assert client.stats.hedges == 1
+    assert client.stats.hedge_wins == 0
+
+
+def test_is_transient_llm_error_checks_causes() -> None:
+    try:
+        try:
+            raise FakeStatusError(429)
+        except FakeStatusError as e:
+            raise RuntimeError("wrapped") from e
+    except RuntimeError as e:
+        assert is_transient_llm_error(e)
+
+    assert is_transient_llm_error(asyncio.TimeoutError())
+    assert not is_transient_llm_error(ValueError("invalid"))
+
+
+def test_as_llm_client() -> None:
+    client = LLMClient(fake_llm_client(FakeCompletions(ANSWER)))
+
+    assert as_llm_client(client) is client
+    wrapped = as_llm_client(fake_llm_client(FakeCompletions(ANSWER)))
+    assert isinstance(wrapped, LLMClient)
+
+
+def test_agents_wrap_the_client_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    wrapped: List[LLMClient] = list()
+    init = LLMClient.__init__
+
+    def counting_init(self: LLMClient, *args: Any, **kwargs: Any) -> None:
+        init(self, *args, **kwargs)
+        wrapped.append(self)
+
+    monkeypatch.setattr(LLMClient, "__init__", counting_init)
+    client = fake_llm_client(FakeCompletions(ANSWER))
+    create_discovery_and_modeling_agent(client, client, "m", "m")
+
+    assert len(wrapped) == 1
+
+
+def test_from_openai_reuses_pooled_connections() -> None:
+    async def run(base_url: str) -> LLMClient:
+        async with LLMClient.from_openai(
+            api_key="test", base_url=base_url, max_connections=2, timeout=5.0
+        ) as client:
+            responses = await asyncio.gather(
+                *[
+                    client.create(model="m", response_model=Answer, messages=MESSAGES)
+                    for _ in range(8)
+                ]
+            )
+            assert [r.model_dump() for r in responses] == [{"value": 1}] * 8
+            return client
+
+    with FakeOpenAIServer({"value": 1}, latency=lambda request: 0.01) as server:
+        asyncio.run(run(server.base_url))
+
+    assert server.requests == 8
+    assert len(server.client_addresses) <= 2
+
+
+def test_from_openai_hedges_slow_server_requests() -> None:
+    async def run(base_url: str) -> LLMClient:
+        async with LLMClient.from_openai(
+            api_key="test", base_url=base_url, hedge=True, hedge_after=0.05
+        ) as client:
+            response = await client.create(
+                model="m", response_model=Answer, messages=MESSAGES
+            )
+            assert response.model_dump() == {"value": 1}
+            return client
+
+    with FakeOpenAIServer(
+        {"value": 1}, latency=lambda request: 1.0 if request == 0 else 0.0
+    ) as server:
+        client = asyncio.run(run(server.base_url))
+
+    assert client.stats.hedge_wins == 1
+
+
+def test_cached_prompt_tokens_are_counted() -> None:
+    async def run(base_url: str) -> LLMClient:
+        async with LLMClient.from_openai(api_key="test", base_url=base_url) as client:
+            for content in ["Answer the question.", "Answer the other question."]:
+                await client.create(
+                    model="m",
+                    response_model=Answer,
+                    messages=[{"role": "user", "content": content}],
+                )
+            return client
+
+    with FakeOpenAIServer({"value": 1}) as server:
+        client = asyncio.run(run(server.base_url))
+
+    # "Answer the " is served from the simulated cache for the second request
+    assert client.stats.prompt_tokens == 5 + 7
+    assert client.stats.cached_prompt_tokens == 2
+    assert client.stats.cached_token_ratio == 2 / 12
+
+
+def test_prompt_token_usage() -> None:
+    openai_usage = SimpleNamespace(
+        prompt_tokens=100, prompt_tokens_details=SimpleNamespace(cached_tokens=60)
+    )
+    anthropic_usage = SimpleNamespace(
+        input_tokens=30, cache_read_input_tokens=60, cache_creation_input_tokens=10
+    )
+
+    assert prompt_token_usage(openai_usage) == (100, 60)
+    assert prompt_token_usage(SimpleNamespace(prompt_tokens=100)) == (100, 0)
+    assert prompt_token_usage(anthropic_usage) == (100, 60)
+    assert LLMClientStats().cached_token_ratio == 0.0
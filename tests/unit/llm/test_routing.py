@@ -0,0 +1,191 @@
+import asyncio
+from typing import List
+
+import pandas as pd
+import pytest
+
+from graph_data_modeler_agent.agents.single_source_input.discovery_agent import (
+    create_discovery_agent,
+)
+from graph_data_modeler_agent.data_dictionary.column import Column
+from graph_data_modeler_agent.data_dictionary.table_schema import TableSchema
+from graph_data_modeler_agent.llm import (
+    LLMClient,
+    ModelRouter,
+    RoutingPolicy,
+    TableComplexity,
+    create_routed,
+    estimate_message_tokens,
+)
+from tests.unit.checkpointing.test_checkpointing import DISCOVERY
+from tests.unit.llm.fake_llm import (
+    FakeCompletions,
+    FakeOpenAIServer,
+    FakeStatusError,
+    fake_llm_client,
+)
+from tests.unit.llm.test_client import MESSAGES, Answer
+
+POLICY = RoutingPolicy(small_model="small", large_model="large", max_columns=3)
+
+
+def _table(name: str, columns: List[str]) -> TableSchema:
+    return TableSchema(name=name, columns=[Column(name=c) for c in columns])
+
+
+def test_policy_choose() -> None:
+    narrow = TableComplexity(column_count=2, prompt_tokens=100)
+
+    assert POLICY.choose("generate_data_model", narrow)[0] == "small"
+    assert POLICY.choose(
+        "generate_data_model", narrow.model_copy(update={"column_count": 4})
+    ) == ("large", "4 columns > 3")
+    assert (
+        POLICY.choose(
+            "generate_data_model", narrow.model_copy(update={"prompt_tokens": 9_000})
+        )[0]
+        == "large"
+    )
+    assert (
+        POLICY.choose(
+            "generate_data_model",
+            narrow.model_copy(update={"similar_table_errors": 1.0}),
+        )[0]
+        == "large"
+    )
+    # brainstorming always uses the small model
+    wide = narrow.model_copy(update={"column_count": 100})
+    assert POLICY.choose("brainstorm_updates", wide)[0] == "small"
+
+
+def test_router_learns_from_similar_tables() -> None:
+    router = ModelRouter(POLICY)
+    orders = _table("orders_2024.csv", ["order_id", "customer", "total"])
+
+    first = router.route("generate_data_model", orders, MESSAGES)
+    assert first.model == "small"
+    router.record_outcome(first, orders, validation_errors=2, failed=False)
+
+    # a similar table of the same stage uses the large model
+    similar = _table("orders_2025.csv", ["order_id", "customer", "amount"])
+    second = router.route("generate_data_model", similar, MESSAGES)
+    assert second.model == "large"
+    assert second.complexity.similar_tables == 1
+    assert second.complexity.similar_table_errors == 2.0
+
+    # other stages and unrelated tables are not affected
+    assert router.route("generate_nodes", similar, MESSAGES).model == "small"
+    other = _table("pets.csv", ["name", "pet"])
+    assert router.route("generate_data_model", other, MESSAGES).model == "small"
+
+    assert router.summary() == {
+        "generate_data_model": {"small": 2, "large": 1},
+        "generate_nodes": {"small": 1},
+    }
+
+
+def test_stage_policies() -> None:
+    router = ModelRouter(
+        POLICY,
+        stage_policies={
+            "generate_findings": POLICY.model_copy(
+                update={"large_model_stages": ["generate_findings"]}
+            )
+        },
+    )
+    table = _table("pets.csv", ["name"])
+
+    assert router.route("generate_findings", table, MESSAGES).model == "large"
+    assert router.route("generate_nodes", table, MESSAGES).model == "small"
+
+
+def test_create_routed_records_failures() -> None:
+    def fail(call: int) -> None:
+        raise FakeStatusError(400)
+
+    router = ModelRouter(POLICY)
+    client = LLMClient(fake_llm_client(FakeCompletions(None, fail=fail)))
+    table = _table("pets.csv", ["name"])
+
+    with pytest.raises(FakeStatusError):
+        asyncio.run(
+            create_routed(
+                client,
+                router,
+                "generate_nodes",
+                table,
+                MESSAGES,
+                response_model=Answer,
+            )
+        )
+
+    assert router.decisions[0].failed
+    # a failure counts as a validation error of similar tables
+    assert router.route("generate_nodes", table, MESSAGES).model == "large"
+
+
+def test_create_routed_with_model_name() -> None:
+    completions = FakeCompletions(Answer(value=1))
+    client = LLMClient(fake_llm_client(completions))
+
+    asyncio.run(
+        create_routed(
+            client,
+            "m",
+            "generate_nodes",
+            _table("pets.csv", ["name"]),
+            MESSAGES,
+            response_model=Answer,
+        )
+    )
+
+    assert completions.calls[0]["model"] == "m"
+
+
+def test_validation_errors_are_counted_per_call() -> None:
+    async def run(base_url: str) -> ModelRouter:
+        router = ModelRouter(POLICY)
+        async with LLMClient.from_openai(api_key="test", base_url=base_url) as client:
+            await create_routed(
+                client,
+                router,
+                "generate_nodes",
+                _table("pets.csv", ["name"]),
+                MESSAGES,
+                response_model=Answer,
+                max_retries=2,
+            )
+            return router
+
+    # the first response fails validation and is retried by instructor
+    with FakeOpenAIServer(
+        lambda request: {"value": "x"} if request == 0 else {"value": 1}
+    ) as server:
+        router = asyncio.run(run(server.base_url))
+
+    assert router.decisions[0].validation_errors == 1
+    assert router.decisions[0].failed is False
+
+
+def test_agent_routes_discovery() -> None:
+    completions = FakeCompletions(DISCOVERY)
+    router = ModelRouter(POLICY)
+    agent = create_discovery_agent(fake_llm_client(completions), router)
+    state = {
+        "data": pd.read_csv("tests/resources/data/pets.csv"),
+        "table_schema": _table("pets.csv", ["name", "age", "pet", "city"]),
+        "use_cases": ["Which pets live in Chicago?"],
+        "additional_context": "",
+    }
+
+    res = asyncio.run(agent.ainvoke(state))
+
+    assert res["discovery"] == DISCOVERY
+    assert completions.calls[0]["model"] == "large"
+    assert [(d.stage, d.reason) for d in router.decisions] == [
+        ("generate_findings", "4 columns > 3")
+    ]
+
+
+def test_estimate_message_tokens() -> None:
+    assert estimate_message_tokens([{"role": "user", "content": "a" * 10}]) == 3
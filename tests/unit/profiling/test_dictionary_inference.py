@@ -0,0 +1,125 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graph_data_modeler_agent.profiling.dictionary_inference import (
+    infer_data_dictionary,
+    list_data_files,
+    profile_file,
+)
+
+
+@pytest.fixture(scope="function")
+def store_dir(tmp_path) -> str:
+    rng = np.random.default_rng(0)
+    pd.DataFrame(
+        {
+            "customer_id": np.arange(500),
+            "customer_name": [f"customer_{i}" for i in range(500)],
+        }
+    ).to_csv(os.path.join(tmp_path, "customers.csv"), index=False)
+    pd.DataFrame(
+        {
+            "order_id": np.arange(10_000, 15_000),
+            "buyer": rng.integers(0, 500, 5_000),
+            "amount": rng.random(5_000) * 100,
+            "note": np.where(rng.random(5_000) < 0.5, None, "gift"),
+        }
+    ).to_csv(os.path.join(tmp_path, "orders.csv"), index=False)
+    pd.DataFrame(
+        {"order": rng.integers(10_000, 15_000, 300), "sku": rng.choice(["A", "B"], 300)}
+    ).to_json(os.path.join(tmp_path, "items.jsonl"), orient="records", lines=True)
+    with open(os.path.join(tmp_path, "notes.txt"), "w") as f:
+        f.write("not a data file")
+
+    return str(tmp_path)
+
+
+def test_list_data_files(store_dir: str) -> None:
+    assert [os.path.basename(f) for f in list_data_files(store_dir)] == [
+        "customers.csv",
+        "items.jsonl",
+        "orders.csv",
+    ]
+
+
+def test_profile_file_chunked(store_dir: str) -> None:
+    path = os.path.join(store_dir, "orders.csv")
+
+    chunked = profile_file(path, chunk_size=700)
+    whole = profile_file(path, chunk_size=100_000)
+
+    assert chunked.row_count == whole.row_count == 5_000
+    for a, b in zip(chunked.columns, whole.columns):
+        assert a.inferred_type.neo4j_type == b.inferred_type.neo4j_type
+        assert a.inferred_type.null_count == b.inferred_type.null_count
+        assert np.array_equal(a.sketch.signature, b.sketch.signature)
+        assert (a.min_value, a.max_value) == (b.min_value, b.max_value)
+
+
+def test_profile_file_empty() -> None:
+    profile = profile_file("tests/resources/data/test_dir/a.csv")
+
+    assert profile.row_count == 0
+    assert profile.columns == []
+
+
+def test_infer_data_dictionary(store_dir: str) -> None:
+    dd = infer_data_dictionary(store_dir, max_workers=1, chunk_size=1_000)
+
+    customers = dd.get_table_schema("customers.csv")
+    orders = dd.get_table_schema("orders.csv")
+    items = dd.get_table_schema("items.jsonl")
+
+    assert customers.primary_key is not None
+    assert customers.primary_key.name == "customer_id"
+    assert orders.primary_key is not None
+    assert orders.primary_key.name == "order_id"
+    assert items.primary_key is None
+
+    assert orders.get_column("amount").python_type == "float"
+    assert orders.get_column("note").nullable
+    assert not orders.get_column("buyer").nullable
+    assert "Range 0 to 499" in orders.get_description("buyer")
+
+    assert orders.get_column("buyer").aliases == ["customer_id"]
+    assert orders.get_column("buyer").foreign_key
+    assert items.get_column("order").foreign_key
+    assert not customers.get_column("customer_id").foreign_key
+    assert customers.get_column("customer_id").aliases == ["buyer"]
+    assert items.get_column("order").aliases == ["order_id"]
+    assert orders.get_column("amount").aliases is None
+
+
+def test_primary_key_is_named_like_an_identifier(tmp_path) -> None:
+    path = os.path.join(tmp_path, "payments.csv")
+    pd.DataFrame(
+        {
+            "paid": np.arange(100, 200),
+            "valid": np.arange(200, 300),
+            "paymentId": np.arange(100),
+        }
+    ).to_csv(path, index=False)
+
+    payments = infer_data_dictionary([path], max_workers=1).get_table_schema(
+        "payments.csv"
+    )
+
+    assert payments.primary_key is not None
+    assert payments.primary_key.name == "paymentId"
+
+
+def test_infer_data_dictionary_parallel_matches_sequential(store_dir: str) -> None:
+    files = list_data_files(store_dir)
+
+    assert infer_data_dictionary(files, max_workers=2) == infer_data_dictionary(
+        files, max_workers=1
+    )
+
+
+def test_infer_data_dictionary_empty_files() -> None:
+    dd = infer_data_dictionary("tests/resources/data/test_dir", max_workers=1)
+
+    assert [ts.name for ts in dd.table_schemas] == ["a.csv", "b.csv", "c.csv"]
@@ -0,0 +1,201 @@
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graph_data_modeler_agent.data_dictionary.column import Column
+from graph_data_modeler_agent.data_dictionary.data_dictionary import DataDictionary
+from graph_data_modeler_agent.data_dictionary.table_schema import TableSchema
+from graph_data_modeler_agent.profiling.dictionary_inference import (
+    ColumnProfile,
+    FileProfile,
+)
+from graph_data_modeler_agent.profiling.join_discovery import (
+    JoinCandidate,
+    apply_join_candidates,
+    discover_joins,
+)
+from graph_data_modeler_agent.profiling.sketches import ColumnSketch, hash_values
+from graph_data_modeler_agent.profiling.type_inference import InferredColumnType
+
+
+def _file_profile(name: str, columns: Dict[str, np.ndarray]) -> FileProfile:
+    profiles = list()
+    for column_name, values in columns.items():
+        series = pd.Series(values)
+        sketch = ColumnSketch()
+        sketch.update(hash_values(series))
+        profiles.append(
+            ColumnProfile(
+                inferred_type=InferredColumnType(
+                    name=column_name,
+                    neo4j_type="INTEGER" if series.dtype.kind == "i" else "STRING",
+                    python_type="int" if series.dtype.kind == "i" else "str",
+                    nullable=False,
+                    null_count=0,
+                    row_count=len(series),
+                    inference_seconds=0.0,
+                ),
+                sketch=sketch,
+                first_chunk_unique=bool(series.is_unique),
+            )
+        )
+    return FileProfile(
+        name=name,
+        file_path=name,
+        row_count=len(next(iter(columns.values()))),
+        columns=profiles,
+        profile_seconds=0.0,
+    )
+
+
+@pytest.fixture(scope="module")
+def profiles() -> list:
+    rng = np.random.default_rng(0)
+    return [
+        _file_profile(
+            "customers.csv",
+            {
+                "customer_id": np.arange(1_000),
+                "email": np.array([f"c{i}@example.com" for i in range(1_000)]),
+            },
+        ),
+        _file_profile(
+            "orders.csv",
+            {
+                "order_id": np.arange(50_000, 60_000),
+                "buyer": rng.integers(0, 1_000, 10_000),
+                "customer_id": rng.integers(0, 1_000, 10_000),
+                "contact": np.array(
+                    [f"c{i}@example.com" for i in rng.integers(0, 1_000, 10_000)]
+                ),
+            },
+        ),
+        _file_profile(
+            "unrelated.csv",
+            {
+                "code": np.arange(900_000, 903_000),
+                "label": np.array([f"label_{i % 7}" for i in range(3_000)]),
+            },
+        ),
+    ]
+
+
+def test_discover_joins(profiles: list) -> None:
+    joins = {
+        (j.source_table, j.source_column): (j.target_table, j.target_column)
+        for j in discover_joins(profiles)
+    }
+
+    assert joins[("orders.csv", "buyer")] == ("customers.csv", "customer_id")
+    assert joins[("orders.csv", "customer_id")] == ("customers.csv", "customer_id")
+    assert joins[("orders.csv", "contact")] == ("customers.csv", "email")
+    assert ("unrelated.csv", "code") not in joins
+    assert ("unrelated.csv", "label") not in joins
+    assert ("customers.csv", "customer_id") not in joins
+
+
+def test_discover_joins_estimates(profiles: list) -> None:
+    buyer = next(j for j in discover_joins(profiles) if j.source_column == "buyer")
+
+    assert buyer.containment == pytest.approx(1.0, abs=0.15)
+    assert 0.0 < buyer.jaccard <= 1.0
+
+
+def test_discover_joins_rows_per_band(profiles: list) -> None:
+    joins = discover_joins(profiles, rows_per_band=2)
+
+    assert {(j.source_column, j.target_column) for j in joins} >= {
+        ("buyer", "customer_id"),
+        ("contact", "email"),
+    }
+
+
+def test_discover_joins_empty() -> None:
+    assert discover_joins([]) == []
+
+
+def test_discover_joins_many_files() -> None:
+    rng = np.random.default_rng(1)
+    profiles = [
+        _file_profile(
+            f"table_{t}.csv",
+            {
+                f"table_{t}_id": np.arange(t * 10_000, t * 10_000 + 500),
+                **(
+                    {"parent": (t - 1) * 10_000 + rng.integers(0, 500, 500)}
+                    if t > 0
+                    else {}
+                ),
+                "payload": np.array([f"t{t}_{i}" for i in range(500)]),
+            },
+        )
+        for t in range(60)
+    ]
+
+    joins = discover_joins(profiles)
+
+    assert {(j.source_table, j.target_table) for j in joins} == {
+        (f"table_{t}.csv", f"table_{t - 1}.csv") for t in range(1, 60)
+    }
+
+
+def test_apply_join_candidates() -> None:
+    dd = DataDictionary(
+        table_schemas=[
+            TableSchema(
+                name="customers.csv",
+                columns=[Column(name="customer_id", primary_key=True)],
+            ),
+            TableSchema(
+                name="orders.csv",
+                columns=[
+                    Column(name="order_id", primary_key=True),
+                    Column(name="buyer", aliases=["client"]),
+                    Column(name="customer_id"),
+                ],
+            ),
+        ]
+    )
+    joins = [
+        JoinCandidate(
+            source_table="orders.csv",
+            source_column="buyer",
+            target_table="customers.csv",
+            target_column="customer_id",
+            containment=1.0,
+            jaccard=0.9,
+        ),
+        JoinCandidate(
+            source_table="orders.csv",
+            source_column="customer_id",
+            target_table="customers.csv",
+            target_column="customer_id",
+            containment=1.0,
+            jaccard=0.9,
+        ),
+        JoinCandidate(
+            source_table="customers.csv",
+            source_column="customer_id",
+            target_table="orders.csv",
+            target_column="order_id",
+            containment=1.0,
+            jaccard=0.9,
+        ),
+    ]
+
+    res = apply_join_candidates(dd, joins)
+    customers = res.get_table_schema("customers.csv")
+    orders = res.get_table_schema("orders.csv")
+
+    assert orders.get_column("buyer").foreign_key
+    assert orders.get_column("buyer").aliases == ["client", "customer_id"]
+    assert orders.get_column("customer_id").foreign_key
+    assert orders.get_column("customer_id").aliases is None
+    # primary keys are never marked as foreign keys
+    assert not customers.get_column("customer_id").foreign_key
+    assert customers.get_column("customer_id").aliases == ["buyer", "order_id"]
+    assert orders.get_column("order_id").aliases == ["customer_id"]
+    # the input is not modified
+    assert not dd.get_table_schema("orders.csv").get_column("buyer").foreign_key
@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from graph_data_modeler_agent.components.discovery.generate_findings_single_source.prompts import (
+    _format_key_profile,
+)
+from graph_data_modeler_agent.profiling.keys import profile_keys
+
+
+@pytest.fixture(scope="function")
+def shelter_dataframe() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    shelter_ids = rng.integers(0, 20, 1_000)
+    return pd.DataFrame(
+        {
+            "pet_id": np.arange(1_000),
+            "shelter_id": shelter_ids,
+            "shelter_name": [f"shelter_{i}" for i in shelter_ids],
+            "adoption_year": rng.integers(2000, 2024, 1_000),
+            "status": rng.choice(["adopted", "available"], 1_000),
+        }
+    )
+
+
+def test_profile_keys_single_column_key(shelter_dataframe: pd.DataFrame) -> None:
+    profile = profile_keys(shelter_dataframe)
+
+    assert profile.candidate_keys[0].columns == ["pet_id"]
+    assert profile.candidate_keys[0].is_unique
+    assert profile.row_count == 1_000
+    assert not profile.sampled
+
+
+def test_profile_keys_functional_dependencies(shelter_dataframe: pd.DataFrame) -> None:
+    profile = profile_keys(shelter_dataframe)
+    dependents = profile.dependents_by_determinant()
+
+    assert dependents["shelter_id"] == ["shelter_name"]
+    assert dependents["shelter_name"] == ["shelter_id"]
+    assert "adoption_year" not in dependents
+    # key columns are excluded from dependencies
+    assert "pet_id" not in dependents
+
+
+def test_profile_keys_approximate_functional_dependency() -> None:
+    df = pd.DataFrame(
+        {
+            "city": ["Chicago"] * 50 + ["Milwaukee"] * 50,
+            "state": ["IL"] * 49 + ["WI"] + ["WI"] * 50,
+            "other": list(range(50)) * 2,
+        }
+    )
+
+    strict = profile_keys(df, min_fd_confidence=1.0)
+    loose = profile_keys(df, min_fd_confidence=0.98)
+
+    assert "city" not in strict.dependents_by_determinant()
+    assert loose.dependents_by_determinant()["city"] == ["state"]
+    assert loose.functional_dependencies[0].confidence == pytest.approx(0.99)
+
+
+def test_profile_keys_functional_dependencies_order() -> None:
+    df = pd.DataFrame(
+        {
+            "city": ["Chicago"] * 50 + ["Milwaukee"] * 50,
+            "state": ["IL"] * 49 + ["WI"] + ["WI"] * 50,
+            "region": ["Cook"] * 50 + ["Milwaukee"] * 50,
+            "other": list(range(50)) * 2,
+        }
+    )
+
+    fds = profile_keys(df, min_fd_confidence=0.98).functional_dependencies
+
+    assert [(fd.determinant, fd.dependent) for fd in fds[:2]] == [
+        ("city", "region"),
+        ("city", "state"),
+    ]
+    assert fds[0].confidence > fds[1].confidence
+
+
+def test_profile_keys_composite_key() -> None:
+    df = pd.DataFrame(
+        {
+            "person": ["Bob", "Bob", "Ben", "Ben"],
+            "knows": ["Ben", "Chelsea", "Bob", "Chelsea"],
+            "age": [25, 25, 54, 54],
+        }
+    )
+
+    profile = profile_keys(df)
+    composite_keys = [k.columns for k in profile.candidate_keys]
+
+    assert ["person", "knows"] in composite_keys
+    # a superset of a key is not a minimal key
+    assert all(len(k) <= 2 for k in composite_keys)
+
+
+def test_profile_keys_sampled() -> None:
+    df = pd.DataFrame({"id": np.arange(10_000), "group": np.arange(10_000) % 7})
+
+    profile = profile_keys(df, sample_size=500)
+
+    assert profile.sampled
+    assert profile.row_count == 500
+    assert profile.candidate_keys[0].columns == ["id"]
+
+
+def test_profile_keys_unhashable_values() -> None:
+    df = pd.DataFrame({"id": [1, 2, 3], "tags": [["a"], ["b"], ["a"]]})
+
+    profile = profile_keys(df)
+
+    assert profile.candidate_keys[0].columns == ["id"]
+
+
+def test_format_key_profile(shelter_dataframe: pd.DataFrame) -> None:
+    res = _format_key_profile(profile_keys(shelter_dataframe))
+
+    assert "* pet_id: unique" in res
+    assert "* shelter_id -> shelter_name" in res
+    assert _format_key_profile(None) == "No key profile provided."
+
+
+def test_profile_keys_near_unique_determinant() -> None:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            # 98% distinct, below the key uniqueness
+            "email": [f"user_{i}" for i in [*range(980), *range(20)]],
+            "status": rng.choice(["adopted", "available"], 1_000),
+        }
+    )
+
+    uncapped = profile_keys(df, max_fd_determinant_uniqueness=1.0)
+
+    assert "email" in uncapped.dependents_by_determinant()
+    assert "email" not in profile_keys(df).dependents_by_determinant()
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from graph_data_modeler_agent.profiling.sketches import ColumnSketch, hash_values
+
+
+def _sketch(values) -> ColumnSketch:
+    sketch = ColumnSketch()
+    sketch.update(hash_values(pd.Series(values)))
+    return sketch
+
+
+def test_hash_values_integral_floats_match_integers() -> None:
+    ints = hash_values(pd.Series([1, 2, 3]))
+    floats = hash_values(pd.Series([1.0, None, 2.0, 3.0]))
+
+    assert np.array_equal(ints, floats)
+
+
+def test_hash_values_unhashable() -> None:
+    assert len(hash_values(pd.Series([["a"], ["b"], None]))) == 2
+
+
+@pytest.mark.parametrize("n", [10, 1_000, 100_000])
+def test_distinct_count(n: int) -> None:
+    sketch = _sketch(np.arange(n).repeat(2))
+
+    assert sketch.distinct_count() == pytest.approx(n, rel=0.05)
+    assert sketch.count == 2 * n
+
+
+def test_merge_matches_single_update() -> None:
+    values = np.arange(5_000)
+    single = _sketch(values)
+    merged = _sketch(values[:2_000])
+    merged.merge(_sketch(values[2_000:]))
+
+    assert np.array_equal(single.signature, merged.signature)
+    assert np.array_equal(single.registers, merged.registers)
+
+
+def test_merge_different_parameters() -> None:
+    with pytest.raises(ValueError):
+        ColumnSketch(num_perm=64).merge(ColumnSketch(num_perm=128))
+
+
+def test_jaccard_and_containment() -> None:
+    a = _sketch(np.arange(10_000))
+    b = _sketch(np.arange(5_000, 15_000))
+    subset = _sketch(np.arange(0, 10_000, 4))
+
+    assert a.jaccard(b) == pytest.approx(1 / 3, abs=0.1)
+    assert subset.containment(a) == pytest.approx(1.0, abs=0.1)
+    assert a.containment(subset) == pytest.approx(0.25, abs=0.1)
+    assert a.jaccard(ColumnSketch()) == 0.0
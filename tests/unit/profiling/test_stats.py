@@ -0,0 +1,115 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graph_data_modeler_agent.data_source.data_source import DataSource
+from graph_data_modeler_agent.profiling.stats import (
+    DEFAULT_PERCENTILES,
+    StatsAccumulator,
+    accumulate_stats,
+)
+
+PETS = DataSource(file_path="tests/resources/data/pets.csv")
+
+
+@pytest.mark.parametrize("chunk_size", [2, 4, 100])
+def test_descriptions_match_pandas(chunk_size: int) -> None:
+    df = PETS.read()
+    accumulator = accumulate_stats(PETS.iter_chunks(chunk_size=chunk_size))
+
+    buffer = io.StringIO()
+    df.info(buf=buffer, memory_usage=False, verbose=True)
+    assert accumulator.general_description() == buffer.getvalue()
+
+    pd.testing.assert_frame_equal(
+        accumulator.numerical_description(),
+        df.describe(percentiles=DEFAULT_PERCENTILES, include=[np.number]),
+    )
+
+    expected = df.describe(include=["object", "string"])
+    categorical = accumulator.categorical_description()
+    assert list(categorical.columns) == list(expected.columns)
+    for col in expected.columns:
+        assert categorical[col].tolist() == expected[col].tolist()
+
+
+def test_columns() -> None:
+    accumulator = accumulate_stats(
+        PETS.iter_chunks(chunk_size=4, columns=["age", "pet", "missing"])
+    )
+
+    assert list(accumulator.numerical_description().columns) == ["age"]
+    assert list(accumulator.categorical_description().columns) == ["pet"]
+    assert accumulator.row_count == len(PETS.read())
+
+
+def test_numeric_column_with_string_chunk() -> None:
+    accumulator = accumulate_stats(
+        [
+            pd.DataFrame({"code": [1, 2, 2]}),
+            pd.DataFrame({"code": ["2", "B-7", None]}),
+        ]
+    )
+
+    categorical = accumulator.categorical_description()
+    assert accumulator.numerical_description().empty
+    assert categorical["code"].tolist() == [5, 3, "2", 3]
+
+
+def test_nulls_and_unhashable_values() -> None:
+    accumulator = accumulate_stats(
+        [
+            pd.DataFrame({"tags": [["a"], ["a"], None], "x": [1.0, None, 3.0]}),
+            pd.DataFrame({"tags": [["b"], None, None], "x": [None, None, 5.0]}),
+        ]
+    )
+
+    tags = accumulator.categorical_description()["tags"]
+    x = accumulator.numerical_description()["x"]
+    assert tags.tolist() == [3, 2, "['a']", 2]
+    assert x["count"] == 3
+    assert x["mean"] == 3.0
+    assert "1 non-null" not in accumulator.general_description()
+    assert " 0   tags    3 non-null      object" in accumulator.general_description()
+
+
+def test_empty() -> None:
+    accumulator = StatsAccumulator()
+
+    assert accumulator.numerical_description().empty
+    assert accumulator.categorical_description().empty
+    assert "0 entries" in accumulator.general_description()
+
+
+def test_low_memory_options() -> None:
+    source = PETS.with_low_memory_options()
+
+    assert source.read_options["memory_map"]
+    assert PETS.read_options == {}
+    pd.testing.assert_frame_equal(
+        accumulate_stats(source.iter_chunks()).numerical_description(),
+        accumulate_stats(PETS.iter_chunks()).numerical_description(),
+    )
+    assert (
+        DataSource(
+            file_path=PETS.file_path, read_options={"memory_map": False}
+        ).with_low_memory_options()
+    ).read_options["memory_map"] is False
+
+
+def test_high_cardinality_column() -> None:
+    chunks = [
+        pd.DataFrame({"email": [f"user_{i}@example.com" for i in range(c, c + 1_000)]})
+        for c in range(0, 5_000, 1_000)
+    ]
+    chunks.append(pd.DataFrame({"email": ["user_7@example.com"] * 10}))
+
+    accumulator = accumulate_stats(chunks, max_distinct=500)
+    email = accumulator.categorical_description()["email"]
+
+    assert email["count"] == 5_010
+    assert email["unique"] == pytest.approx(5_000, rel=0.05)
+    assert email["top"] == "user_7@example.com"
+    assert len(accumulator._value_counts["email"]) <= 500
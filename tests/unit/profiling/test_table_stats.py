@@ -0,0 +1,99 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graph_data_modeler_agent.data_source.data_source import DataSource
+from graph_data_modeler_agent.profiling.stats import (
+    DEFAULT_PERCENTILES,
+    accumulate_stats,
+)
+from graph_data_modeler_agent.profiling.table_stats import TableStats
+
+PETS = DataSource(file_path="tests/resources/data/pets.csv")
+
+
+@pytest.fixture
+def stats() -> TableStats:
+    return accumulate_stats(PETS.iter_chunks(chunk_size=3)).to_table_stats()
+
+
+def test_descriptions_match_pandas(stats: TableStats) -> None:
+    df = PETS.read()
+
+    pd.testing.assert_frame_equal(
+        stats.numerical_description(),
+        df.describe(percentiles=DEFAULT_PERCENTILES, include=[np.number]),
+    )
+    expected = df.describe(include=["object", "string"])
+    categorical = stats.categorical_description()
+    assert list(categorical.columns) == list(expected.columns)
+    for col in expected.columns:
+        assert categorical[col].tolist() == expected[col].tolist()
+    assert [c.name for c in stats.columns] == list(df.columns)
+    assert stats.row_count == len(df)
+
+
+def test_bytes_round_trip(stats: TableStats) -> None:
+    res = TableStats.from_bytes(stats.to_bytes())
+
+    assert res == stats
+    assert res.to_bytes() == stats.to_bytes()
+
+
+def test_bytes_round_trip_missing_values() -> None:
+    stats = accumulate_stats(
+        [pd.DataFrame({"x": [1.0, None], "y": [np.nan, np.nan], "s": [None, None]})]
+    ).to_table_stats()
+
+    res = TableStats.from_bytes(stats.to_bytes())
+
+    assert res == stats
+    assert res.numeric[0].std is None
+    assert res.numeric[1].count == 0
+    assert res.numeric[1].mean is None
+    assert res.categorical[0].top is None
+    assert "* s: count 0, unique 0, top values: none" in res.to_prompt_text()
+
+
+def test_from_bytes_invalid() -> None:
+    with pytest.raises(ValueError):
+        TableStats.from_bytes(b"not stats")
+
+
+def test_bytes_smaller_than_pickled_descriptions(stats: TableStats) -> None:
+    df = PETS.read()
+    descriptions = {
+        "numerical_description": df.describe(percentiles=DEFAULT_PERCENTILES),
+        "categorical_description": df.describe(include=["object", "string"]),
+    }
+
+    assert len(stats.to_bytes()) < len(pickle.dumps(descriptions))
+
+
+def test_prompt_text(stats: TableStats) -> None:
+    text = stats.to_prompt_text()
+
+    assert text == TableStats.from_bytes(stats.to_bytes()).to_prompt_text()
+    assert text.startswith(f"Rows: {stats.row_count}\nColumns:\n")
+    assert "Numeric columns:\n* age: count" in text
+    assert "Categorical columns:" in text
+    assert "99%" in text
+
+
+def test_top_values_and_estimates() -> None:
+    chunks = [
+        pd.DataFrame({"id": [f"id_{i}" for i in range(c, c + 100)]})
+        for c in range(0, 1_000, 100)
+    ]
+    chunks.append(pd.DataFrame({"id": ["id_3", "id_3", "id_5"]}))
+
+    stats = accumulate_stats(chunks, max_distinct=50).to_table_stats(top_k=2)
+    column = stats.categorical[0]
+
+    assert column.unique_estimated
+    assert column.top_values == [("id_3", 3), ("id_5", 2)]
+    assert column.top == "id_3"
+    assert column.freq == 3
+    assert "unique ~" in stats.to_prompt_text()
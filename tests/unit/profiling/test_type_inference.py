@@ -0,0 +1,188 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from graph_data_modeler_agent.data_dictionary.column import Column
+from graph_data_modeler_agent.data_dictionary.table_schema import TableSchema
+from graph_data_modeler_agent.data_dictionary.utils import (
+    create_data_dictionary_from_pandas_dataframe,
+)
+from graph_data_modeler_agent.profiling.type_inference import (
+    apply_inferred_types,
+    infer_column_types,
+    infer_table_schema,
+    merge_neo4j_types,
+)
+
+
+@pytest.fixture(scope="function")
+def typed_dataframe() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "int_col": [1, 2, 3, 4],
+            "int_with_null": [1.0, np.nan, 3.0, 4.0],
+            "float_col": [1.5, 2.0, 3.25, 4.0],
+            "int_str": ["1", "2", "-3", "40"],
+            "float_str": ["1.5", "2", "3.25", "1e3"],
+            "code_str": ["001", "002", "010", "100"],
+            "bool_str": ["Yes", "no", "TRUE", "f"],
+            "bool_col": [True, False, True, True],
+            "date_str": ["2024-01-01", "2024-02-29", "2023-12-31", None],
+            "datetime_str": [
+                "2024-01-01T10:00:00",
+                "2024-01-01 11:30",
+                "2024-01-02T00:00:00.123",
+                "2024-01-03T23:59:59",
+            ],
+            "zoned_str": [
+                "2024-01-01T10:00:00Z",
+                "2024-01-01T10:00:00+01:00",
+                "2024-01-01T10:00:00-0500",
+                "2024-01-01T10:00:00Z",
+            ],
+            "bracket_list": ["[a, b]", "[c]", "[]", "[d, e, f]"],
+            "piped_list": ["a|b", "c|d", "e", "f|g|h"],
+            "point_str": [
+                "POINT(1.5 2.5)",
+                "point (3 4)",
+                "POINT(-1 -2.25)",
+                "POINT(0 0)",
+            ],
+            "lat_lon": [
+                "[41.88, -87.63]",
+                "(43.03,-87.90)",
+                "[-33.86, 151.20]",
+                "[0.0, 0.0]",
+            ],
+            "bare_pair": ["1.5, 2.5", "3.5, 4.5", "5.5, 6.5", "7.5, 8.5"],
+            "some_semicolons": ["a; b", "c", "d; e", "f"],
+            "text": ["Bob", "Ben", "", None],
+            "all_null": [None, None, None, None],
+            "datetime_col": pd.to_datetime(
+                ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]
+            ),
+        }
+    )
+
+
+def test_infer_column_types(typed_dataframe: pd.DataFrame) -> None:
+    res = {t.name: t for t in infer_column_types(typed_dataframe)}
+
+    assert res["int_col"].neo4j_type == "INTEGER"
+    assert res["int_with_null"].neo4j_type == "INTEGER"
+    assert res["int_with_null"].nullable
+    assert res["float_col"].neo4j_type == "FLOAT"
+    assert res["int_str"].neo4j_type == "INTEGER"
+    assert res["float_str"].neo4j_type == "FLOAT"
+    assert res["code_str"].neo4j_type == "STRING"
+    assert res["bool_str"].neo4j_type == "BOOLEAN"
+    assert res["bool_col"].neo4j_type == "BOOLEAN"
+    assert res["date_str"].neo4j_type == "DATE"
+    assert res["date_str"].null_count == 1
+    assert res["datetime_str"].neo4j_type == "LOCAL DATETIME"
+    assert res["zoned_str"].neo4j_type == "ZONED DATETIME"
+    assert res["bracket_list"].neo4j_type == "LIST"
+    assert res["bracket_list"].list_delimiter == ","
+    assert res["piped_list"].neo4j_type == "LIST"
+    assert res["piped_list"].list_delimiter == "|"
+    assert res["point_str"].neo4j_type == "POINT"
+    assert res["lat_lon"].neo4j_type == "POINT"
+    assert res["bare_pair"].neo4j_type == "STRING"
+    assert res["some_semicolons"].neo4j_type == "STRING"
+    assert res["text"].neo4j_type == "STRING"
+    assert res["text"].null_count == 2
+    assert res["all_null"].neo4j_type == "STRING"
+    assert res["datetime_col"].neo4j_type == "DATE"
+
+
+def test_infer_column_types_reports_timing(typed_dataframe: pd.DataFrame) -> None:
+    res = infer_column_types(typed_dataframe)
+
+    assert len(res) == len(typed_dataframe.columns)
+    assert all(t.inference_seconds >= 0 for t in res)
+    assert all(t.row_count == 4 for t in res)
+
+
+def test_infer_column_types_chunks_merge() -> None:
+    chunks = [
+        pd.DataFrame({"a": ["1", "2"], "b": ["2024-01-01", None], "c": [None, None]}),
+        pd.DataFrame(
+            {
+                "a": ["1.5", "3"],
+                "b": ["2024-01-01T10:00", "2024-01-02T10:00"],
+                "c": ["x", None],
+            }
+        ),
+    ]
+
+    res = {t.name: t for t in infer_column_types(iter(chunks))}
+
+    assert res["a"].neo4j_type == "FLOAT"
+    assert res["b"].neo4j_type == "LOCAL DATETIME"
+    assert res["c"].neo4j_type == "STRING"
+    assert res["c"].null_count == 3
+    assert res["a"].row_count == 4
+
+
+def test_infer_column_types_sample_size() -> None:
+    chunks = [pd.DataFrame({"a": ["1", "2"]}), pd.DataFrame({"a": ["x", "y"]})]
+
+    res = infer_column_types(iter(chunks), sample_size=2)
+
+    assert res[0].neo4j_type == "INTEGER"
+    assert res[0].row_count == 2
+
+
+@pytest.mark.parametrize(
+    "a,b,expected",
+    [
+        (None, "INTEGER", "INTEGER"),
+        ("INTEGER", None, "INTEGER"),
+        ("INTEGER", "FLOAT", "FLOAT"),
+        ("DATE", "LOCAL DATETIME", "LOCAL DATETIME"),
+        ("INTEGER", "BOOLEAN", "STRING"),
+    ],
+)
+def test_merge_neo4j_types(a, b, expected) -> None:
+    assert merge_neo4j_types(a, b) == expected
+
+
+def test_apply_inferred_types_keeps_declared_types(
+    typed_dataframe: pd.DataFrame,
+) -> None:
+    ts = TableSchema(
+        name="file",
+        columns=[
+            Column(name="int_col", python_type="str", primary_key=True),
+            Column(name="float_col", description="a float"),
+        ],
+    )
+
+    res = apply_inferred_types(ts, infer_column_types(typed_dataframe))
+
+    assert res.get_column("int_col").python_type == "str"
+    assert not res.get_column("int_col").nullable
+    assert res.get_column("float_col").python_type == "float"
+    assert res.get_column("float_col").description == "a float"
+    assert res.get_column("point_str").python_type == "point"
+    assert len(res.columns) == len(typed_dataframe.columns)
+
+
+def test_infer_table_schema_from_file() -> None:
+    df = pd.read_csv("tests/resources/data/people-pets.csv")
+
+    ts = infer_table_schema(df, name="people-pets.csv")
+
+    assert ts.get_column("age").python_type == "int"
+    assert ts.get_column("knows").python_type == "list"
+    assert ts.get_column("name").python_type == "str"
+
+
+def test_create_data_dictionary_from_pandas_dataframe_infer_types() -> None:
+    df = pd.read_csv("tests/resources/data/pets.csv")
+
+    dd = create_data_dictionary_from_pandas_dataframe(
+        df, name="pets.csv", infer_types=True
+    )
+
+    assert dd.get_table_schema("pets.csv").get_column("age").python_type == "int"